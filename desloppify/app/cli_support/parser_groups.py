@@ -57,6 +57,7 @@ examples:
   desloppify scan
   desloppify scan --skip-slow
   desloppify scan --profile ci
+  desloppify scan --trace
   desloppify scan --force-resolve""",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -76,6 +77,17 @@ examples:
         default=None,
         help="Scan profile: objective, full, or ci",
     )
+    p_scan.add_argument(
+        "--trace",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="PATH",
+        help=(
+            "Profile the scan: per-phase wall/process CPU time, peak RSS and cache counters. "
+            "Writes a Chrome trace (default: .desloppify/scan-trace.json) and prints a summary"
+        ),
+    )
     p_scan.add_argument(
         "--force-resolve",
         action="store_true",
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 
 from desloppify.base.discovery.file_paths import rel
 from desloppify.base.output.terminal import colorize
+from desloppify.engine._state.views import bump_revision
 from desloppify.languages.framework import FixResult
 
 if TYPE_CHECKING:
@@ -33,6 +34,8 @@ def _resolve_fixer_results(
                     f"auto-fixed by desloppify autofix {fixer_name}"
                 )
                 resolved_ids.append(issue_id)
+    if resolved_ids:
+        bump_revision(state)
     return resolved_ids
 
 
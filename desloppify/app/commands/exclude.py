@@ -14,6 +14,7 @@ from desloppify.base.discovery.file_paths import matches_exclusion
 from desloppify.base.exception_sets import PLAN_LOAD_EXCEPTIONS, CommandError
 from desloppify.base.output.terminal import colorize
 from desloppify.base.tooling import check_config_staleness
+from desloppify.engine._state.views import bump_revision
 from desloppify.engine.plan_ops import purge_ids
 from desloppify.engine.plan_state import load_plan, plan_path_for_state, save_plan
 
@@ -44,6 +45,7 @@ def _prune_excluded_issues(state: dict, pattern: str) -> list[str]:
     ]
     for issue_id in removed_ids:
         issues.pop(issue_id, None)
+    bump_revision(state)
     return removed_ids
 
 
@@ -32,6 +32,12 @@ def _rollback_move_target(dest_abs: str, source_abs: str, *, target_name: str) -
         warn_best_effort(f"Could not move {target_name} back to {rel(source_abs)}")
 
 
+def _rewrite(content: str, replacements: list[tuple[str, str]]) -> str:
+    for old_str, new_str in replacements:
+        content = content.replace(old_str, new_str)
+    return content
+
+
 def apply_file_move(
     source_abs: str,
     dest_abs: str,
@@ -41,16 +47,10 @@ def apply_file_move(
     """Move a file and apply import replacements with rollback on failure."""
     new_contents: dict[str, str] = {}
     if self_changes:
-        content = Path(source_abs).read_text()
-        for old_str, new_str in self_changes:
-            content = content.replace(old_str, new_str)
-        new_contents[dest_abs] = content
+        new_contents[dest_abs] = _rewrite(Path(source_abs).read_text(), self_changes)
 
     for filepath, replacements in importer_changes.items():
-        content = Path(filepath).read_text()
-        for old_str, new_str in replacements:
-            content = content.replace(old_str, new_str)
-        new_contents[filepath] = content
+        new_contents[filepath] = _rewrite(Path(filepath).read_text(), replacements)
 
     Path(dest_abs).parent.mkdir(parents=True, exist_ok=True)
     written_files: dict[str, str] = {}
@@ -81,28 +81,33 @@ def apply_directory_move(
     external_changes: dict[str, list[tuple[str, str]]],
     internal_changes: dict[str, list[tuple[str, str]]],
 ) -> None:
-    """Move a directory and apply external/internal import replacements."""
+    """Move a directory and apply external/internal import replacements.
+
+    Every rewritten file is read and transformed before anything on disk
+    changes, so read/decode failures abort the move untouched; write
+    failures after the move roll back every file written so far.
+    """
+    originals: dict[str, str] = {}
+    new_contents: dict[str, str] = {}
+    for src_file, changes in internal_changes.items():
+        dest_file = str(Path(dest_abs) / Path(src_file).relative_to(source_path))
+        original = Path(src_file).read_text()
+        originals[dest_file] = original
+        new_contents[dest_file] = _rewrite(original, changes)
+    for filepath, replacements in external_changes.items():
+        original = Path(filepath).read_text()
+        originals[filepath] = original
+        new_contents[filepath] = _rewrite(original, replacements)
+
     Path(dest_abs).parent.mkdir(parents=True, exist_ok=True)
     written_files: dict[str, str] = {}
     try:
         shutil.move(source_abs, dest_abs)
 
-        for src_file, changes in internal_changes.items():
-            rel_in_dir = Path(src_file).relative_to(source_path)
-            dest_file = Path(dest_abs) / rel_in_dir
-            original = dest_file.read_text()
-            content = original
-            for old_str, new_str in changes:
-                content = content.replace(old_str, new_str)
-            written_files[str(dest_file)] = original
-            safe_write_text(dest_file, content)
-
-        for filepath, replacements in external_changes.items():
-            original = Path(filepath).read_text()
-            content = original
-            for old_str, new_str in replacements:
-                content = content.replace(old_str, new_str)
-            written_files[filepath] = original
+        for filepath, content in new_contents.items():
+            if content == originals[filepath]:
+                continue
+            written_files[filepath] = originals[filepath]
             safe_write_text(filepath, content)
 
     except (OSError, UnicodeDecodeError, shutil.Error) as ex:
@@ -114,5 +119,4 @@ def apply_directory_move(
         _rollback_move_target(dest_abs, source_abs, target_name="directory")
         raise
 
-
 __all__ = ["apply_directory_move", "apply_file_move"]
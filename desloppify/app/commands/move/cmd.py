@@ -25,6 +25,7 @@ from desloppify.base.discovery.file_paths import (
 )
 from desloppify.base.exception_sets import CommandError
 from desloppify.base.output.terminal import colorize
+from desloppify.engine.detectors.graph_snapshot import graph_snapshot_scope
 
 
 def cmd_move(args: argparse.Namespace) -> None:
@@ -56,11 +57,13 @@ def cmd_move(args: argparse.Namespace) -> None:
     move_mod = load_lang_move_module(lang_name)
 
     scan_path = Path(resolve_path(lang.default_src))
+    with graph_snapshot_scope():
+        graph = lang.build_dep_graph(scan_path)
     importer_changes, self_changes = compute_replacements(
         move_mod,
         source_abs,
         dest_abs,
-        lang.build_dep_graph(scan_path),
+        graph,
     )
 
     print_file_move_plan(source_abs, dest_abs, importer_changes, self_changes)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
 
 from desloppify.languages import framework as lang_mod
@@ -18,10 +19,17 @@ from desloppify.app.commands.move.planning import (
     build_internal_directory_changes,
     collect_source_files,
 )
-from desloppify.app.commands.move.reporting import print_directory_move_plan
+from desloppify.app.commands.move.reporting import (
+    print_directory_move_plan,
+    print_move_timings,
+)
 from desloppify.base.discovery.file_paths import rel
 from desloppify.base.exception_sets import CommandError
 from desloppify.base.output.terminal import colorize
+from desloppify.engine.detectors.graph_snapshot import graph_snapshot_scope
+
+# Moves touching at least this many files report per-stage timings.
+LARGE_MOVE_FILES = 50
 
 
 def run_directory_move(args, source_abs: str, resolve_path_fn) -> None:
@@ -58,8 +66,14 @@ def run_directory_move(args, source_abs: str, resolve_path_fn) -> None:
     if not source_files:
         raise CommandError(f"No {lang_name} files found in {rel(source_abs)}")
 
+    timings: dict[str, float] = {}
+    started = time.perf_counter()
     scan_path = Path(resolve_path_fn(lang.default_src))
-    graph = lang.build_dep_graph(scan_path)
+    with graph_snapshot_scope():
+        graph = lang.build_dep_graph(scan_path)
+    timings["graph"] = time.perf_counter() - started
+
+    started = time.perf_counter()
     plan = build_directory_move_plan(
         source_abs=source_abs,
         source_path=source_path,
@@ -68,12 +82,17 @@ def run_directory_move(args, source_abs: str, resolve_path_fn) -> None:
         move_mod=move_mod,
         graph=graph,
     )
+    timings["plan"] = time.perf_counter() - started
+    report_timings = len(source_files) >= LARGE_MOVE_FILES
 
     print_directory_move_plan(source_abs, dest_abs, plan)
     if dry_run:
+        if report_timings:
+            print_move_timings(timings)
         print(colorize("  Dry run — no files modified.", "yellow"))
         return
 
+    started = time.perf_counter()
     apply_directory_move(
         source_abs=source_abs,
         dest_abs=dest_abs,
@@ -81,7 +100,10 @@ def run_directory_move(args, source_abs: str, resolve_path_fn) -> None:
         external_changes=plan.external_changes,
         internal_changes=build_internal_directory_changes(plan),
     )
+    timings["apply"] = time.perf_counter() - started
 
+    if report_timings:
+        print_move_timings(timings)
     print(colorize("  Done.", "green"))
     verify_hint = resolve_move_verify_hint(move_mod)
     if verify_hint:
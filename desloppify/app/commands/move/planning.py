@@ -110,18 +110,30 @@ def build_directory_move_plan(
         lambda _source, replacements, _moving: replacements,
     )
 
-    for src_file, dst_file in file_moves:
-        importer_changes, self_changes = compute_replacements(
-            move_mod, src_file, dst_file, graph
-        )
-
+    def _route_importer_changes(source_file: str, importer_changes: ReplacementMap) -> None:
         for filepath, replacements in importer_changes.items():
             if filepath in moving_files:
-                filtered = intra_filter(src_file, replacements, moving_files)
+                filtered = intra_filter(source_file, replacements, moving_files)
                 _merge_unique_changes(intra_pkg_changes, filepath, filtered)
             else:
                 _merge_unique_changes(all_importer_changes, filepath, replacements)
 
+    # Batch-capable move modules scan each importer once for the whole move;
+    # their intra-package filter receives the importer as the source file.
+    batch_find = getattr(move_mod, "find_batch_replacements", None)
+    if callable(batch_find):
+        for filepath, replacements in batch_find(file_moves, graph).items():
+            _route_importer_changes(filepath, {filepath: replacements})
+
+    for src_file, dst_file in file_moves:
+        if callable(batch_find):
+            self_changes = move_mod.find_self_replacements(src_file, dst_file, graph)
+        else:
+            importer_changes, self_changes = compute_replacements(
+                move_mod, src_file, dst_file, graph
+            )
+            _route_importer_changes(src_file, importer_changes)
+
         if self_changes:
             filtered_self = self_filter(src_file, self_changes, moving_files)
             if filtered_self:
@@ -113,4 +113,11 @@ def print_directory_move_plan(
         print()
 
 
-__all__ = ["print_directory_move_plan", "print_file_move_plan"]
+def print_move_timings(timings: dict[str, float]) -> None:
+    """Print per-stage wall time for a large move."""
+    stages = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items())
+    total = sum(timings.values())
+    print(colorize(f"  Timing: {stages} (total {total:.2f}s)", "dim"))
+
+
+__all__ = ["print_directory_move_plan", "print_file_move_plan", "print_move_timings"]
@@ -14,7 +14,7 @@ from desloppify.base.discovery.file_paths import safe_write_text
 from desloppify.base.exception_sets import CommandError
 from desloppify.base.output.terminal import colorize
 from desloppify.base.output.user_message import print_user_message
-from desloppify.engine._state.filtering import path_scoped_issues
+from desloppify.engine._state.views import scoped_issues
 from desloppify.engine._work_queue.context import queue_context
 from desloppify.engine._work_queue.core import QueueBuildOptions
 from desloppify.engine._work_queue.policy import explain_queue
@@ -23,6 +23,7 @@ from desloppify.engine._work_queue.plan_order import (
     collapse_clusters,
     filter_cluster_focus,
 )
+from desloppify.engine._work_queue.ranking import stamp_primary_commands
 from desloppify.engine.plan_state import load_plan
 from desloppify.engine.planning.queue_policy import (
     build_backlog_queue,
@@ -221,10 +222,7 @@ def _render_terminal_queue_view(
 ) -> None:
     """Render terminal output for a non-empty queue."""
     dim_scores = state.get("dimension_scores", {})
-    issues_scoped = path_scoped_issues(
-        (state.get("work_items") or state.get("issues", {})),
-        state.get("scan_path"),
-    )
+    issues_scoped = scoped_issues(state, state.get("scan_path"))
     plan_start_strict = None
     breakdown = None
     if show_plan_context:
@@ -287,6 +285,17 @@ def _plan_data_for_view(plan: dict, *, show_plan_context: bool) -> dict | None:
     return None
 
 
+def _view_transforms_reorder(plan_for_queue: dict, *, collapse_plan_clusters: bool) -> bool:
+    """Whether cluster focus/collapse can change which items lead the queue.
+
+    Both transforms are no-ops without plan clusters; otherwise the visible
+    window can only be cut after they run.
+    """
+    return bool(
+        collapse_plan_clusters and plan_for_queue and plan_for_queue.get("clusters")
+    )
+
+
 def _resolve_queue_items(
     *,
     state: dict,
@@ -295,6 +304,7 @@ def _resolve_queue_items(
     plan_for_queue: dict,
     target_strict: float,
     build_work_queue_fn,
+    collapse_plan_clusters: bool = False,
 ) -> tuple[object, dict, list[dict], str | None]:
     ctx = queue_context(
         state,
@@ -307,10 +317,14 @@ def _resolve_queue_items(
         cluster_arg=opts.cluster,
         scope=opts.scope,
     )
+    reorders = _view_transforms_reorder(
+        plan_for_queue, collapse_plan_clusters=collapse_plan_clusters
+    )
     queue = build_work_queue_fn(
         state,
         options=QueueBuildOptions(
-            count=None,
+            count=None if reorders else opts.count,
+            defer_primary_commands=reorders,
             scope=opts.scope,
             status=opts.status,
             include_subjective=True,
@@ -325,6 +339,7 @@ def _resolve_queue_items(
 
 def _apply_queue_view_transforms(
     *,
+    state: dict,
     items: list[dict],
     queue: dict,
     opts: NextOptions,
@@ -347,6 +362,17 @@ def _apply_queue_view_transforms(
         visible = visible[: opts.count]
         queue["items"] = visible
         queue["total"] = len(visible)
+    if _view_transforms_reorder(
+        plan_for_queue, collapse_plan_clusters=collapse_plan_clusters
+    ):
+        # The queue was built with deferred commands; stamp the window only.
+        stamp_primary_commands(
+            [
+                *visible,
+                *(member for item in visible for member in item.get("members", ())),
+            ],
+            state,
+        )
     return visible
 
 
@@ -429,8 +455,10 @@ def _build_and_render_queue_view(
         plan_for_queue=plan_for_queue,
         target_strict=target_strict,
         build_work_queue_fn=deps.build_work_queue_fn,
+        collapse_plan_clusters=view.collapse_plan_clusters,
     )
     items = _apply_queue_view_transforms(
+        state=state,
         items=items,
         queue=queue,
         opts=opts,
@@ -10,6 +10,7 @@ from desloppify.base.output.terminal import colorize
 from desloppify.engine._plan.triage.strategist_data import collect_strategist_input
 from desloppify.engine._state.progression import append_progression_event, load_progression
 from desloppify.engine._state.schema import utc_now
+from desloppify.engine._state.views import bump_revision
 
 from ..lifecycle import TriageLifecycleDeps, ensure_triage_started
 from ..services import TriageServices, default_triage_services
@@ -171,6 +172,7 @@ def _create_strategic_work_items(
         }
         if issue_id not in queue_order:
             new_ids.append(issue_id)
+    bump_revision(state)
 
     # Insert strategy IDs at the front of queue, before other non-synthetic items
     # but after workflow/triage synthetics
@@ -12,6 +12,7 @@ from desloppify.base.output.issues import issue_weight
 from desloppify.base.output.terminal import colorize
 from desloppify.engine._state.persistence import save_state
 from desloppify.engine._state.schema import StateModel, utc_now
+from desloppify.engine._state.views import bump_revision
 from desloppify.engine._state.schema_scores import (
     get_objective_score,
     get_overall_score,
@@ -284,6 +285,7 @@ def do_merge(args: argparse.Namespace) -> None:
         print(colorize("\n  Dry run only: no state changes written.\n", "yellow"))
         return
 
+    bump_revision(state)
     save_state(state, state_file)
     print(colorize("\n  State updated with merged issue groups.", "green"))
     show_score_with_plan_context(state, prev)
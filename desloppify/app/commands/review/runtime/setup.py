@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 
 from desloppify.base.discovery.file_paths import rel
 from desloppify.base.output.terminal import log
+from desloppify.engine.detectors.graph_snapshot import graph_snapshot_scope
 from desloppify.engine.policy.zones import FileZoneMap
 from desloppify.languages.framework import make_lang_run
 
@@ -38,7 +39,8 @@ def setup_lang(
 
     if lang_run.build_dep_graph and lang_run.dep_graph is None:
         try:
-            lang_run.dep_graph = lang_run.build_dep_graph(path)
+            with graph_snapshot_scope():
+                lang_run.dep_graph = lang_run.build_dep_graph(path)
         except (
             OSError,
             UnicodeDecodeError,
@@ -37,14 +37,16 @@ from desloppify.app.commands.scan.reporting.summary import (  # noqa: F401
 )
 from desloppify.app.commands.scan.workflow import (
     ScanStateContractError,
+    finish_scan_profile,
     merge_scan_results,
     persist_reminder_history,
     prepare_scan_runtime,
     resolve_noise_snapshot,
     run_scan_generation,
+    start_scan_profile,
 )
 from desloppify.base.exception_sets import CommandError
-from desloppify.base.output.terminal import colorize
+from desloppify.base.output.terminal import colorize, print_table
 from desloppify.base.search.query import write_query
 
 from . import preflight as scan_preflight_mod
@@ -64,6 +66,16 @@ def _print_scan_complete_banner() -> None:
     print("\n".join(lines))
 
 
+def _show_scan_profile(profiler, trace_path) -> None:
+    """Print the ``--trace`` per-span summary table."""
+    print(colorize("\n  Scan profile", "bold"))
+    print_table(
+        ["Span", "Wall ms", "Process CPU ms", "Peak RSS +MiB", "File reads", "Cache hits/misses"],
+        profiler.summary_rows(),
+    )
+    print(colorize(f"  Chrome trace: {trace_path} (open in chrome://tracing or Perfetto)", "dim"))
+
+
 def _show_scan_visibility(noise, effective_include_slow: bool) -> None:
     """Print fast-scan and noise budget visibility hints.
 
@@ -141,9 +153,19 @@ def cmd_scan(args: argparse.Namespace) -> None:
         )
     _show_coverage_preflight(runtime)
 
-    issues, potentials, codebase_metrics = orchestrator.generate()
-    merge = orchestrator.merge(issues, potentials, codebase_metrics)
+    trace = getattr(args, "trace", None)
+    profiler = start_scan_profile(runtime.lang) if trace is not None else None
+    try:
+        issues, potentials, codebase_metrics = orchestrator.generate()
+        merge = orchestrator.merge(issues, potentials, codebase_metrics)
+    finally:
+        if profiler is not None:
+            trace_path = finish_scan_profile(
+                profiler, trace=trace, state_path=runtime.state_path
+            )
     _print_scan_complete_banner()
+    if profiler is not None:
+        _show_scan_profile(profiler, trace_path)
 
     noise = orchestrator.noise_snapshot()
 
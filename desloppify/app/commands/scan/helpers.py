@@ -9,9 +9,9 @@ from desloppify.languages import framework as lang_api
 from desloppify import state as state_mod
 from desloppify.base.discovery.source import (
     DEFAULT_EXCLUSIONS,
+    file_loc,
     read_file_text,
 )
-from desloppify.base.discovery.file_paths import count_lines
 from desloppify.base.output.terminal import colorize
 
 logger = logging.getLogger(__name__)
@@ -95,11 +95,7 @@ def collect_codebase_metrics(
     for filepath in files:
         try:
             abs_path = _resolve_scan_file_path(filepath, project_root=scan_root)
-            content = read_file_text(abs_path)
-            if content is not None:
-                total_loc += len(content.splitlines())
-            else:
-                total_loc += count_lines(Path(abs_path))
+            total_loc += file_loc(abs_path)
             dirs.add(str(Path(filepath).parent))
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug(
@@ -422,11 +422,8 @@ def build_subjective_followup(
 
 
 def _subjective_coverage_global(state: dict) -> int:
-    all_issues = (state.get("work_items") or state.get("issues", {}))
-    if not isinstance(all_issues, dict):
-        all_issues = {}
     coverage_global, _reason_counts, _holistic_reasons = (
-        subjective_integrity_mod.subjective_review_open_breakdown(all_issues)
+        subjective_integrity_mod.state_subjective_review_open_breakdown(state)
     )
     return coverage_global
 
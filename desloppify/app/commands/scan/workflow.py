@@ -45,14 +45,25 @@ from desloppify.base.discovery.source import (
     get_exclusions,
 )
 from desloppify.base.discovery.paths import get_project_root
+from desloppify.base.parallel import disable_parallel_map, enable_parallel_map
+from desloppify.base.profiling import ScanProfiler, profile_span
+from desloppify.base.runtime_state import current_runtime_context
+from desloppify.engine._state.detector_cache import DetectorCacheStore, detector_cache_dir
 from desloppify.engine._state.filtering import path_scoped_issues
+from desloppify.engine._state.compaction import archive_path, compact_state
 from desloppify.engine._state.merge import MergeScanOptions, merge_scan
+from desloppify.engine._state.schema import get_state_dir, get_state_file
 from desloppify.engine._state.noise import (
     apply_issue_noise_budget,
     resolve_issue_noise_settings,
 )
 from desloppify.engine._work_queue.issues import mark_stale_holistic
 from desloppify.engine.planning.scan import PlanScanOptions, generate_issues as generate_plan_issues
+from desloppify.engine.detectors.graph_snapshot import (
+    disable_graph_snapshots,
+    enable_graph_snapshots,
+    graph_snapshot_dir,
+)
 from desloppify.base.subjective_dimensions import (
     resettable_default_dimensions,
 )
@@ -68,6 +79,7 @@ from desloppify.state_io import StateModel, ensure_state_defaults, save_state, u
 from desloppify.state_scoring import ScoreSnapshot, score_snapshot
 
 _WONTFIX_DECAY_SCANS_DEFAULT = 20
+_ARCHIVE_RESOLVED_AFTER_SCANS_DEFAULT = 10
 
 
 class ScanStateContractError(ValueError):
@@ -198,17 +210,24 @@ def _configure_lang_runtime(
     config: dict[str, object],
     state: StateModel,
     lang: LangRun | None,
+    *,
+    state_path: Path | None = None,
 ) -> LangRun | None:
     """Populate runtime context and threshold overrides for a selected language."""
     if not lang:
         return None
 
+    review_cache = _state_review_cache(state)
+    detector_caches = DetectorCacheStore(detector_cache_dir(state_path))
+    detector_caches.adopt_legacy(review_cache)
+
     lang_options = resolve_lang_runtime_options(args, lang)
     lang_settings = resolve_lang_settings(config, lang)
     runtime_lang = make_lang_run(
         lang,
         overrides=LangRunOverrides(
-            review_cache=_state_review_cache(state),
+            review_cache=review_cache,
+            detector_caches=detector_caches,
             review_max_age_days=config.get("review_max_age_days", 30),
             subjective_assessments=_state_subjective_assessments(state),
             runtime_settings=lang_settings,
@@ -300,7 +319,9 @@ def prepare_scan_runtime(args: argparse.Namespace) -> ScanRuntime:
     profile = resolve_scan_profile(getattr(args, "profile", None), lang_config)
     include_slow_effective = effective_include_slow(include_slow, profile)
 
-    lang = _configure_lang_runtime(args, config, state, lang_config)
+    lang = _configure_lang_runtime(
+        args, config, state, lang_config, state_path=state_file
+    )
     coverage_warnings = _seed_runtime_coverage_warnings(lang)
     zone_overrides_raw = config.get("zone_overrides")
     zone_overrides = zone_overrides_raw if isinstance(zone_overrides_raw, dict) else None
@@ -379,12 +400,68 @@ def _augment_with_stale_wontfix_issues(
     )
 
 
+def _archive_resolved_issues(runtime: ScanRuntime) -> None:
+    """Move long-resolved issues out of active state (config-controlled)."""
+    after_scans = _coerce_int(
+        runtime.config.get("archive_resolved_after_scans"),
+        default=_ARCHIVE_RESOLVED_AFTER_SCANS_DEFAULT,
+    )
+    if after_scans <= 0:
+        return
+    try:
+        compact_state(
+            runtime.state,
+            after_scans=after_scans,
+            archive_file=archive_path(runtime.state_path),
+        )
+    except OSError as exc:
+        print(colorize(f"  ⚠ Could not archive resolved issues: {exc}", "dim"))
+
+
+def _flush_detector_caches(lang: LangRun | None) -> None:
+    """Persist detector caches touched by this scan."""
+    store = getattr(lang, "detector_caches", None) if lang else None
+    if store is not None:
+        store.flush()
+
+
+def start_scan_profile(lang: LangRun | None) -> ScanProfiler:
+    """Install a scan profiler on the runtime context (``scan --trace``)."""
+    profiler = ScanProfiler()
+    store = getattr(lang, "detector_caches", None) if lang else None
+    if store is not None:
+        profiler.add_counters(
+            "detector_cache", lambda: {"hits": store.hits, "misses": store.misses}
+        )
+    current_runtime_context().profiler = profiler
+    return profiler
+
+
+def finish_scan_profile(
+    profiler: ScanProfiler,
+    *,
+    trace: str,
+    state_path: Path | None,
+) -> Path:
+    """Uninstall *profiler* and write its Chrome trace; returns the trace path."""
+    current_runtime_context().profiler = None
+    trace_path = (
+        Path(trace) if trace else (state_path or get_state_file()).parent / "scan-trace.json"
+    )
+    profiler.write_trace(trace_path)
+    return trace_path
+
+
 def run_scan_generation(
     runtime: ScanRuntime,
 ) -> tuple[list[dict[str, Any]], dict[str, object], dict[str, object] | None]:
     """Run detector pipeline and return issues, potentials, and codebase metrics."""
     enable_file_cache()
     enable_parse_cache()
+    state_path = getattr(runtime, "state_path", None)
+    state_dir = state_path.parent if state_path else get_state_dir()
+    enable_graph_snapshots(graph_snapshot_dir(state_dir))
+    enable_parallel_map(_coerce_int(runtime.config.get("scan_workers"), default=1))
     try:
         issues, potentials = generate_plan_issues(
             runtime.path,
@@ -395,12 +472,14 @@ def run_scan_generation(
                 profile=runtime.profile,
             ),
         )
+        _flush_detector_caches(runtime.lang)
         scanned_files = _resolve_scanned_files(runtime)
-        codebase_metrics = collect_codebase_metrics(
-            runtime.lang,
-            runtime.path,
-            files=scanned_files,
-        )
+        with profile_span("codebase metrics"):
+            codebase_metrics = collect_codebase_metrics(
+                runtime.lang,
+                runtime.path,
+                files=scanned_files,
+            )
         warn_explicit_lang_with_no_files(
             runtime.args, runtime.lang, runtime.path, codebase_metrics
         )
@@ -421,6 +500,8 @@ def run_scan_generation(
         potentials["stale_wontfix"] = monitored_wontfix
         return issues, potentials, codebase_metrics
     finally:
+        disable_parallel_map()
+        disable_graph_snapshots()
         disable_parse_cache()
         disable_file_cache()
 
@@ -451,32 +532,36 @@ def merge_scan_results(
     target_score = target_strict_score_from_config(runtime.config)
     runtime.prev_last_scan = str(runtime.state.get("last_scan", "") or "") or None
 
-    diff = merge_scan(
-        runtime.state,
-        issues,
-        options=MergeScanOptions(
-            lang=runtime.lang.name if runtime.lang else None,
-            scan_path=scan_path_rel,
-            force_resolve=getattr(runtime.args, "force_resolve", False),
-            exclude=get_exclusions(),
-            potentials=potentials,
-            codebase_metrics=codebase_metrics,
-            include_slow=runtime.effective_include_slow,
-            ignore=runtime.config.get("ignore", []),
-            subjective_integrity_target=target_score,
-            project_root=str(get_project_root()),
-            zone_map=runtime.lang.zone_map if runtime.lang else None,
-        ),
-    )
+    with profile_span("merge"):
+        diff = merge_scan(
+            runtime.state,
+            issues,
+            options=MergeScanOptions(
+                lang=runtime.lang.name if runtime.lang else None,
+                scan_path=scan_path_rel,
+                force_resolve=getattr(runtime.args, "force_resolve", False),
+                exclude=get_exclusions(),
+                potentials=potentials,
+                codebase_metrics=codebase_metrics,
+                include_slow=runtime.effective_include_slow,
+                ignore=runtime.config.get("ignore", []),
+                subjective_integrity_target=target_score,
+                project_root=str(get_project_root()),
+                zone_map=runtime.lang.zone_map if runtime.lang else None,
+                scanned_files=_resolve_scanned_files(runtime),
+            ),
+        )
 
     mark_stale_holistic(
         runtime.state, runtime.config.get("holistic_max_age_days", 30)
     )
-    save_state(
-        runtime.state,
-        runtime.state_path,
-        subjective_integrity_target=target_score,
-    )
+    _archive_resolved_issues(runtime)
+    with profile_span("save state"):
+        save_state(
+            runtime.state,
+            runtime.state_path,
+            subjective_integrity_target=target_score,
+        )
 
     _clear_needs_rescan_flag(runtime.config)
     runtime.scan_diff = diff
@@ -546,9 +631,11 @@ __all__ = [
     "ScanMergeResult",
     "ScanNoiseSnapshot",
     "ScanRuntime",
+    "finish_scan_profile",
     "merge_scan_results",
     "persist_reminder_history",
     "prepare_scan_runtime",
     "resolve_noise_snapshot",
     "run_scan_generation",
+    "start_scan_profile",
 ]
@@ -6,16 +6,14 @@ from collections import defaultdict
 
 from desloppify.base.output.terminal import colorize
 from desloppify.base.discovery.paths import get_area
-from desloppify.engine._state.filtering import path_scoped_issues
+from desloppify.engine._state.views import scoped_issues
 
 
 def collect_structural_areas(
     state: dict,
 ) -> list[tuple[str, list]] | None:
     """Collect T3/T4 structural issues grouped by area."""
-    issues = path_scoped_issues(
-        (state.get("work_items") or state.get("issues", {})), state.get("scan_path")
-    )
+    issues = scoped_issues(state, state.get("scan_path"))
     structural = [
         issue
         for issue in issues.values()
@@ -14,6 +14,7 @@ from desloppify.base.output.fallbacks import (
     log_best_effort_failure,
     warn_best_effort,
 )
+from desloppify.engine.detectors.graph_snapshot import graph_snapshot_scope
 
 logger = logging.getLogger(__name__)
 
@@ -185,7 +186,8 @@ def _build_dep_graph_for_path(path: Path, lang) -> dict:
     resolved_lang = _resolve_visualization_lang(path, lang)
     if resolved_lang and resolved_lang.build_dep_graph:
         try:
-            return resolved_lang.build_dep_graph(path)
+            with graph_snapshot_scope():
+                return resolved_lang.build_dep_graph(path)
         except (
             OSError,
             UnicodeDecodeError,
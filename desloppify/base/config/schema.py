@@ -75,6 +75,16 @@ CONFIG_SCHEMA: dict[str, ConfigKey] = {
     "execution_log_max_entries": ConfigKey(
         int, 10000, "Max execution log entries in plan.json (0 = unlimited)"
     ),
+    "archive_resolved_after_scans": ConfigKey(
+        int,
+        10,
+        "Scans after which resolved issues move to the state archive (0 = never)",
+    ),
+    "scan_workers": ConfigKey(
+        int,
+        1,
+        "Worker processes for per-file detectors (1 = serial, 0 = one per CPU)",
+    ),
     "needs_rescan": ConfigKey(
         bool, False, "Set when config changes may have invalidated cached scores"
     ),
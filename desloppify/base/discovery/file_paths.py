@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import fnmatch
 import os
+import re
 import tempfile
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 
 from desloppify.base.discovery.paths import get_project_root
+from desloppify.base.runtime_state import current_runtime_context
 
 
 def matches_exclusion(rel_path: str, exclusion: str) -> bool:
@@ -32,6 +36,109 @@ def matches_exclusion(rel_path: str, exclusion: str) -> bool:
     return False
 
 
+def _combined_glob_regex(patterns: list[str]) -> re.Pattern[str] | None:
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
+class ExclusionMatcher:
+    """Compiled form of an exclusion pattern list.
+
+    ``matcher.matches(path)`` is equivalent to
+    ``any(matches_exclusion(path, ex) for ex in patterns)`` but evaluates all
+    patterns at once: literal path parts via one set intersection, globs via
+    one combined regex, and directory prefixes via a component trie. Results
+    are memoized per path.
+    """
+
+    _TERMINAL = ""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns = tuple(patterns)
+        self._literal_parts = frozenset(self.patterns)
+        part_globs: list[str] = []
+        path_globs: list[str] = []
+        self._prefix_trie: dict = {}
+        self._sep_prefixes: tuple[str, ...] = ()
+        self._dir_globs = frozenset(
+            p[: -len(suffix)]
+            for p in self.patterns
+            for suffix in ("/**", "/*")
+            if p.endswith(suffix)
+        )
+        sep_prefixes: list[str] = []
+        for pattern in self.patterns:
+            has_sep = "/" in pattern or os.sep in pattern
+            if "*" in pattern:
+                part_globs.append(pattern)
+                if has_sep:
+                    path_globs.append(pattern)
+            if has_sep:
+                normalized = pattern.rstrip("/").rstrip(os.sep)
+                self._add_prefix(normalized)
+                if os.sep != "/":
+                    sep_prefixes.append(normalized + os.sep)
+        self._sep_prefixes = tuple(sep_prefixes)
+        self._part_glob_re = _combined_glob_regex(part_globs)
+        self._path_glob_re = _combined_glob_regex(path_globs)
+        self._memo: dict[str, bool] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def _add_prefix(self, normalized: str) -> None:
+        node = self._prefix_trie
+        for component in normalized.split("/"):
+            node = node.setdefault(component, {})
+        node[self._TERMINAL] = True
+
+    def _matches_prefix(self, rel_path: str) -> bool:
+        node = self._prefix_trie
+        for component in rel_path.split("/"):
+            node = node.get(component)
+            if node is None:
+                break
+            if self._TERMINAL in node:
+                return True
+        return bool(self._sep_prefixes) and rel_path.startswith(self._sep_prefixes)
+
+    def _evaluate(self, rel_path: str) -> bool:
+        parts = Path(rel_path).parts
+        if not self._literal_parts.isdisjoint(parts):
+            return True
+        part_re = self._part_glob_re
+        if part_re is not None and any(part_re.match(part) for part in parts):
+            return True
+        if self._path_glob_re is not None and self._path_glob_re.match(
+            rel_path.lstrip("./")
+        ):
+            return True
+        return bool(self._prefix_trie) and self._matches_prefix(rel_path)
+
+    def matches(self, rel_path: str) -> bool:
+        """Return True when *rel_path* matches any exclusion pattern."""
+        cached = self._memo.get(rel_path)
+        if cached is None:
+            cached = self._evaluate(rel_path) if self.patterns else False
+            self._memo[rel_path] = cached
+        return cached
+
+    def matches_dir(self, rel_path: str, name: str) -> bool:
+        """Directory pruning check: also honors ``name/**`` and ``name/*``."""
+        return name in self._dir_globs or self.matches(rel_path)
+
+
+@lru_cache(maxsize=64)
+def _compile_exclusions_cached(patterns: tuple[str, ...]) -> ExclusionMatcher:
+    return ExclusionMatcher(patterns)
+
+
+def compile_exclusions(patterns: Iterable[str]) -> ExclusionMatcher:
+    """Return a (shared, memoizing) compiled matcher for *patterns*."""
+    return _compile_exclusions_cached(tuple(patterns))
+
+
 def normalize_path_separators(path: str) -> str:
     return path.replace("\\", "/")
 
@@ -93,21 +200,39 @@ def resolve_scan_file(
 
 def safe_write_text(filepath: str | Path, content: str) -> None:
     """Atomically write text to a file using temp+rename."""
+    safe_write_chunks(filepath, (content,))
+
+
+def safe_write_chunks(filepath: str | Path, chunks: Iterable[str]) -> None:
+    """Atomically write streamed text chunks to a file using temp+rename.
+
+    The target is only replaced once every chunk has been written; any error
+    while producing or writing chunks leaves the existing file untouched.
+    """
     p = Path(filepath)
     p.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp = tempfile.mkstemp(dir=p.parent, suffix=".tmp")
     try:
         with os.fdopen(fd, "w", encoding="utf-8") as f:
-            f.write(content)
+            for chunk in chunks:
+                f.write(chunk)
         os.replace(tmp, str(p))
-    except OSError:
+    except BaseException:
         if os.path.exists(tmp):
             os.unlink(tmp)
         raise
 
 
 def count_lines(path: Path) -> int:
-    """Count lines in a file without loading full contents into memory."""
+    """Count newline-delimited lines in a file.
+
+    While the scan-scoped file-facts table is enabled, the count is served
+    from (and recorded in) that table, which reads the whole file once per
+    scan; otherwise the file is streamed without loading it into memory.
+    """
+    facts_table = current_runtime_context().file_facts
+    if facts_table.enabled:
+        return facts_table.loc(str(path))
     count = 0
     try:
         with path.open("rb") as handle:
@@ -119,6 +244,8 @@ def count_lines(path: Path) -> int:
 
 
 __all__ = [
+    "ExclusionMatcher",
+    "compile_exclusions",
     "count_lines",
     "matches_exclusion",
     "normalize_path_separators",
@@ -126,5 +253,6 @@ __all__ = [
     "resolve_path",
     "resolve_scan_file",
     "safe_relpath",
+    "safe_write_chunks",
     "safe_write_text",
 ]
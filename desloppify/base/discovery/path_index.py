@@ -0,0 +1,172 @@
+"""Scan-scoped path index for import resolvers.
+
+Import resolvers probe several candidate files per import (``.py`` vs
+``__init__.py``, ``.ts``/``.tsx``/``index.ts``, per-language layouts).  While
+the scan cache is enabled those probes are answered from directory listings
+held in memory: listings recorded by the discovery walk are reused, and any
+other directory is listed once on first use.  Resolution results are also
+memoized per (source directory, specifier) for the rest of the scan.
+
+Outside a scan the helpers fall through to the filesystem, so callers never
+need to branch on whether the index is active.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from typing import TypeVar
+
+from desloppify.base.runtime_state import (
+    RuntimeContext,
+    SourceFileCache,
+    resolve_runtime_context,
+)
+
+# (file names, directory names) for one directory.
+DirListing = tuple[frozenset[str], frozenset[str]]
+_T = TypeVar("_T")
+
+
+class PathIndex:
+    """Set-lookup existence checks over cached directory listings."""
+
+    def __init__(self, seed: Callable[[str], DirListing | None] | None = None) -> None:
+        self._seed = seed
+        self._listings: dict[str, DirListing | None] = {}
+        self.resolutions: dict[tuple, object] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def listing(self, directory: str) -> DirListing | None:
+        """Return the cached listing for an absolute, normalized *directory*."""
+        try:
+            return self._listings[directory]
+        except KeyError:
+            pass
+        listing = self._seed(directory) if self._seed is not None else None
+        if listing is None:
+            listing = _scan_listing(directory)
+        self._listings[directory] = listing
+        return listing
+
+    def is_file(self, path: str | os.PathLike[str]) -> bool:
+        parent, name = os.path.split(os.path.abspath(path))
+        if not name:
+            return False
+        listing = self.listing(parent)
+        return listing is not None and name in listing[0]
+
+    def is_dir(self, path: str | os.PathLike[str]) -> bool:
+        normalized = os.path.abspath(path)
+        parent, name = os.path.split(normalized)
+        if not name:
+            return os.path.isdir(normalized)
+        listing = self.listing(parent)
+        return listing is not None and name in listing[1]
+
+    def listdir(self, path: str | os.PathLike[str]) -> list[str]:
+        """Sorted entry names of *path*; raises ``FileNotFoundError`` like ``os.listdir``."""
+        normalized = os.path.abspath(path)
+        listing = self.listing(normalized)
+        if listing is None:
+            raise FileNotFoundError(f"No such directory: {normalized}")
+        return sorted(listing[0] | listing[1])
+
+
+def _scan_listing(directory: str) -> DirListing | None:
+    files: set[str] = set()
+    dirs: set[str] = set()
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        dirs.add(entry.name)
+                    elif entry.is_file():
+                        files.add(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        return None
+    return frozenset(files), frozenset(dirs)
+
+
+def _discovery_seed(cache: SourceFileCache) -> Callable[[str], DirListing | None]:
+    def seed(directory: str) -> DirListing | None:
+        for index in tuple(cache.indexes.values()):
+            listings = getattr(index, "listings", None)
+            if listings and directory in listings:
+                return listings[directory]
+        return None
+
+    return seed
+
+
+def active_path_index(*, runtime: RuntimeContext | None = None) -> PathIndex | None:
+    """Return the scan's path index, or ``None`` when the scan cache is off."""
+    resolved_runtime = resolve_runtime_context(runtime)
+    if not resolved_runtime.cache_enabled:
+        return None
+    index = resolved_runtime.path_index
+    if isinstance(index, PathIndex):
+        return index
+    owned_index = PathIndex(seed=_discovery_seed(resolved_runtime.source_file_cache))
+    resolved_runtime.path_index = owned_index
+    return owned_index
+
+
+def path_is_file(
+    path: str | os.PathLike[str], *, runtime: RuntimeContext | None = None
+) -> bool:
+    """``os.path.isfile`` answered from the scan's path index when active."""
+    index = active_path_index(runtime=runtime)
+    return index.is_file(path) if index is not None else os.path.isfile(path)
+
+
+def path_is_dir(
+    path: str | os.PathLike[str], *, runtime: RuntimeContext | None = None
+) -> bool:
+    """``os.path.isdir`` answered from the scan's path index when active."""
+    index = active_path_index(runtime=runtime)
+    return index.is_dir(path) if index is not None else os.path.isdir(path)
+
+
+def list_dir(
+    path: str | os.PathLike[str], *, runtime: RuntimeContext | None = None
+) -> list[str]:
+    """Sorted ``os.listdir`` answered from the scan's path index when active."""
+    index = active_path_index(runtime=runtime)
+    return index.listdir(path) if index is not None else sorted(os.listdir(path))
+
+
+def memoized_resolution(
+    key: tuple,
+    resolve: Callable[[], _T],
+    *,
+    runtime: RuntimeContext | None = None,
+) -> _T:
+    """Return ``resolve()``, memoized under *key* for the rest of the scan."""
+    index = active_path_index(runtime=runtime)
+    if index is None:
+        return resolve()
+    try:
+        value = index.resolutions[key]
+    except KeyError:
+        index.misses += 1
+        value = resolve()
+        index.resolutions[key] = value
+        return value
+    index.hits += 1
+    return value  # type: ignore[return-value]
+
+
+__all__ = [
+    "DirListing",
+    "PathIndex",
+    "active_path_index",
+    "list_dir",
+    "memoized_resolution",
+    "path_is_dir",
+    "path_is_file",
+]
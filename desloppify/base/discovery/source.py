@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import os
 from contextlib import contextmanager
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
-from desloppify.base.discovery.file_paths import matches_exclusion
+from desloppify.base.discovery.file_paths import ExclusionMatcher, compile_exclusions
 from desloppify.base.discovery.file_paths import (
     normalize_path_separators as _normalize_path_separators,
 )
@@ -17,6 +17,7 @@ from desloppify.base.discovery.file_paths import (
 )
 from desloppify.base.discovery.paths import get_project_root
 from desloppify.base.runtime_state import (
+    FileFacts,
     FileTextReadResult,
     RuntimeContext,
     SourceFileCache,
@@ -80,6 +81,8 @@ def enable_file_cache(*, runtime: RuntimeContext | None = None) -> None:
     """Enable scan-scoped file content cache."""
     resolved_runtime = resolve_runtime_context(runtime)
     resolved_runtime.file_text_cache.enable()
+    resolved_runtime.file_facts.enable()
+    resolved_runtime.path_index = None
     resolved_runtime.cache_enabled = True
 
 
@@ -87,6 +90,8 @@ def disable_file_cache(*, runtime: RuntimeContext | None = None) -> None:
     """Disable file content cache and free memory."""
     resolved_runtime = resolve_runtime_context(runtime)
     resolved_runtime.file_text_cache.disable()
+    resolved_runtime.file_facts.disable()
+    resolved_runtime.path_index = None
     resolved_runtime.cache_enabled = False
 
 
@@ -123,6 +128,77 @@ def read_file_text_result(
     return resolve_runtime_context(runtime).file_text_cache.read_result(filepath)
 
 
+def read_source_text(
+    filepath: str | Path,
+    *,
+    encoding: str | None = None,
+    errors: str | None = None,
+    runtime: RuntimeContext | None = None,
+) -> str:
+    """``Path.read_text`` routed through the scan-scoped reader.
+
+    Raises the same ``OSError``/``UnicodeDecodeError`` as ``Path.read_text``,
+    so detectors can swap it in without changing their error handling.
+    """
+    return resolve_runtime_context(runtime).file_text_cache.read_source(
+        filepath, encoding=encoding, errors=errors
+    )
+
+
+def read_source_bytes(
+    filepath: str | Path,
+    *,
+    pin: bool = False,
+    runtime: RuntimeContext | None = None,
+) -> bytes:
+    """``Path.read_bytes`` served from the same scan-scoped entry as the text.
+
+    Byte-level readers (tree-sitter) share the file's cached buffer instead
+    of holding a second copy; raises the same ``OSError`` as ``read_bytes``.
+    *pin* keeps the entry from being evicted (see ``FileTextCache``).
+    """
+    return resolve_runtime_context(runtime).file_text_cache.read_bytes(
+        filepath, pin=pin
+    )
+
+
+def prefetch_file_texts(
+    filepaths: Iterable[str | Path],
+    *,
+    project_root: Path | None = None,
+    runtime: RuntimeContext | None = None,
+) -> int:
+    """Start background reads of *filepaths* (no-op unless the cache is enabled).
+
+    Relative paths are resolved against *project_root* (default: the active
+    project root).  Returns the number of reads queued.
+    """
+    resolved_runtime = resolve_runtime_context(runtime)
+    if not resolved_runtime.cache_enabled:
+        return 0
+    root = project_root or get_project_root(runtime=resolved_runtime)
+    return resolved_runtime.file_text_cache.prefetch(
+        str(path if Path(path).is_absolute() else root / path) for path in filepaths
+    )
+
+
+def read_file_facts(
+    filepath: str | Path,
+    *,
+    runtime: RuntimeContext | None = None,
+) -> FileFacts | None:
+    """Return LOC/size/digest/line-start facts for a file (scan-cached)."""
+    return resolve_runtime_context(runtime).file_facts.get(str(filepath))
+
+
+def file_loc(filepath: str | Path, *, runtime: RuntimeContext | None = None) -> int:
+    """Return a file's ``str.splitlines`` line count from the facts table.
+
+    Returns 0 when the file is unreadable.
+    """
+    return resolve_runtime_context(runtime).file_facts.text_loc(str(filepath))
+
+
 def clear_source_file_cache_for_tests(*, runtime: RuntimeContext | None = None) -> None:
     resolve_runtime_context(runtime).source_file_cache.clear()
 
@@ -152,22 +228,143 @@ def collect_exclude_dirs(
     return [str(scan_root / p) for p in sorted(patterns) if p]
 
 
-def _is_excluded_dir(name: str, rel_path: str, extra: tuple[str, ...]) -> bool:
+def _is_excluded_dir(name: str, rel_path: str, extra: ExclusionMatcher) -> bool:
     in_default_exclusions = name in DEFAULT_EXCLUSIONS or name.endswith(".egg-info")
     is_virtualenv_dir = name.startswith(".venv") or name.startswith("venv")
-    matches_extra_exclusion = bool(
-        extra
-        and any(
-            matches_exclusion(rel_path, exclusion)
-            or exclusion == name
-            or exclusion == name + "/**"
-            or exclusion == name + "/*"
-            for exclusion in extra
-        )
-    )
+    matches_extra_exclusion = bool(extra) and extra.matches_dir(rel_path, name)
     return in_default_exclusions or is_virtualenv_dir or matches_extra_exclusion
 
 
+def _name_suffix(name: str) -> str:
+    dot = name.rfind(".")
+    return name[dot:] if dot >= 0 else ""
+
+
+def _is_simple_extension(ext: str) -> bool:
+    return ext.startswith(".") and ext.count(".") == 1 and "/" not in ext
+
+
+class SourceFileIndex:
+    """One pruned directory walk, with every kept file bucketed by extension.
+
+    Built once per (root, shared exclusions) and answered for any extension
+    set, so language plugins and language detection share a single traversal.
+    Plugin-specific exclusions are applied at query time by replaying the
+    walk's directory pruning over the recorded tree.  The raw listing of each
+    walked directory is kept too, for import resolvers' existence checks.
+    """
+
+    def __init__(self) -> None:
+        self.root_dir: str | None = None
+        # rel_dir -> (kept child directory names, [(file name, rel path)])
+        self.dirs: dict[str, tuple[list[str], list[tuple[str, str]]]] = {}
+        self.by_suffix: dict[str, list[str]] = {}
+        # absolute dir -> (all file names, all directory names), before exclusions
+        self.listings: dict[str, tuple[frozenset[str], frozenset[str]]] = {}
+
+    @classmethod
+    def build(
+        cls,
+        root: Path,
+        project_root: Path,
+        exclusions: ExclusionMatcher,
+    ) -> SourceFileIndex:
+        index = cls()
+        for dirpath, dirnames, filenames in os.walk(root):
+            rel_dir = _normalize_path_separators(_safe_relpath(dirpath, project_root))
+            index.listings[dirpath] = (frozenset(filenames), frozenset(dirnames))
+            dirnames[:] = sorted(
+                d
+                for d in dirnames
+                if not _is_excluded_dir(d, rel_dir + "/" + d, exclusions)
+            )
+            entries: list[tuple[str, str]] = []
+            for fname in filenames:
+                rel_file = fname if rel_dir == "." else f"{rel_dir}/{fname}"
+                if exclusions and exclusions.matches(rel_file):
+                    continue
+                entries.append((fname, rel_file))
+                index.by_suffix.setdefault(_name_suffix(fname), []).append(rel_file)
+            if index.root_dir is None:
+                index.root_dir = rel_dir
+            index.dirs[rel_dir] = (list(dirnames), entries)
+        return index
+
+    def _iter_entries(
+        self, exclusions: ExclusionMatcher | None
+    ) -> Iterator[tuple[str, str]]:
+        if self.root_dir is None:
+            return
+        pending = [self.root_dir]
+        while pending:
+            rel_dir = pending.pop()
+            children, entries = self.dirs[rel_dir]
+            for child in children:
+                if exclusions and exclusions.matches_dir(rel_dir + "/" + child, child):
+                    continue
+                pending.append(child if rel_dir == "." else f"{rel_dir}/{child}")
+            for fname, rel_file in entries:
+                if exclusions and exclusions.matches(rel_file):
+                    continue
+                yield fname, rel_file
+
+    def files_with_extensions(
+        self,
+        extensions: Iterable[str],
+        exclusions: ExclusionMatcher | None = None,
+    ) -> tuple[str, ...]:
+        """Return sorted rel paths whose name ends with any of *extensions*."""
+        ext_set = set(extensions)
+        if exclusions or not all(_is_simple_extension(ext) for ext in ext_set):
+            ext_tuple = tuple(ext_set)
+            found = {
+                rel_file
+                for fname, rel_file in self._iter_entries(exclusions or None)
+                if fname.endswith(ext_tuple)
+            }
+        else:
+            found = {
+                rel_file for ext in ext_set for rel_file in self.by_suffix.get(ext, ())
+            }
+        return tuple(sorted(found))
+
+
+def source_file_index(
+    path: str | Path,
+    options: SourceDiscoveryOptions | None = None,
+    *,
+    runtime: RuntimeContext | None = None,
+) -> SourceFileIndex:
+    """Return the (cached) single-walk file index for *path*.
+
+    Only the default and runtime exclusions prune the walk; per-plugin
+    ``options.exclusions`` are applied by :meth:`SourceFileIndex.files_with_extensions`.
+    """
+    resolved_runtime = resolve_runtime_context(runtime)
+    resolved_options = options or SourceDiscoveryOptions()
+    resolved_project_root = (
+        resolved_options.project_root.resolve()
+        if resolved_options.project_root is not None
+        else get_project_root(runtime=resolved_runtime)
+    )
+    cache = resolved_options.source_file_cache or resolved_runtime.source_file_cache
+    root = Path(path)
+    if not root.is_absolute():
+        root = resolved_project_root / root
+    root = Path(os.path.abspath(root))
+    cache_key = (str(root), resolved_options.extra_exclusions, str(resolved_project_root))
+    index = cache.get_index(cache_key)
+    if isinstance(index, SourceFileIndex):
+        return index
+    index = SourceFileIndex.build(
+        root,
+        resolved_project_root,
+        compile_exclusions(resolved_options.extra_exclusions),
+    )
+    cache.put_index(cache_key, index)
+    return index
+
+
 def _find_source_files_cached(
     path: str,
     extensions: tuple[str, ...],
@@ -175,7 +372,7 @@ def _find_source_files_cached(
     *,
     runtime: RuntimeContext | None = None,
 ) -> tuple[str, ...]:
-    """Cached file discovery using os.walk with traversal-time pruning."""
+    """Cached file discovery answered from the shared single-walk index."""
     resolved_runtime = resolve_runtime_context(runtime)
     resolved_options = options or SourceDiscoveryOptions()
     resolved_project_root = (
@@ -195,35 +392,11 @@ def _find_source_files_cached(
     if cached is not None:
         return cached
 
-    root = Path(path)
-    if not root.is_absolute():
-        root = resolved_project_root / root
-    all_exclusions = (
-        (resolved_options.exclusions or ()) + resolved_options.extra_exclusions
+    index = source_file_index(path, resolved_options, runtime=resolved_runtime)
+    result = index.files_with_extensions(
+        extensions,
+        compile_exclusions(resolved_options.exclusions or ()),
     )
-    ext_set = set(extensions)
-    files: list[str] = []
-    for dirpath, dirnames, filenames in os.walk(root):
-        rel_dir = _normalize_path_separators(
-            _safe_relpath(dirpath, resolved_project_root)
-        )
-        dirnames[:] = sorted(
-            d
-            for d in dirnames
-            if not _is_excluded_dir(d, rel_dir + "/" + d, all_exclusions)
-        )
-        for fname in filenames:
-            if any(fname.endswith(ext) for ext in ext_set):
-                full = os.path.join(dirpath, fname)
-                rel_file = _normalize_path_separators(
-                    _safe_relpath(full, resolved_project_root)
-                )
-                if all_exclusions and any(
-                    matches_exclusion(rel_file, ex) for ex in all_exclusions
-                ):
-                    continue
-                files.append(rel_file)
-    result = tuple(sorted(files))
     cache.put(cache_key, result)
     return result
 
@@ -319,6 +492,7 @@ def find_py_files(path: str | Path, *, runtime: RuntimeContext | None = None) ->
 __all__ = [
     "DEFAULT_EXCLUSIONS",
     "SourceDiscoveryOptions",
+    "SourceFileIndex",
     "collect_exclude_dirs",
     "set_exclusions",
     "get_exclusions",
@@ -326,10 +500,16 @@ __all__ = [
     "disable_file_cache",
     "file_cache_scope",
     "is_file_cache_enabled",
+    "prefetch_file_texts",
     "read_file_text",
     "read_file_text_result",
+    "read_source_bytes",
+    "read_source_text",
+    "read_file_facts",
+    "file_loc",
     "clear_source_file_cache_for_tests",
     "find_source_files",
+    "source_file_index",
     "find_ts_files",
     "find_ts_and_tsx_files",
     "find_tsx_files",
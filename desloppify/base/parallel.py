@@ -0,0 +1,206 @@
+"""Process-parallel map for pure per-file detector work.
+
+Per-file detectors (complexity signals, Python smells, ...) spend most of a
+phase in a Python loop over files.  :func:`map_files` runs such a loop across
+a pool of forked worker processes while returning results in input order, so
+output is identical to the serial loop.
+
+Only functions declared with :func:`per_file_task` are fanned out.  A task
+takes one file path plus keyword arguments and must be pure: its result may
+depend only on the file and the arguments, it must not mutate shared state,
+and it must return picklable values.  Everything else runs serially.
+
+Work units never carry file contents or detector configuration.  The task,
+the file list and the keyword arguments are published in a module global
+right before the pool forks, so workers inherit them (and the scan-scoped
+caches of the runtime context) copy-on-write; only ``(start, stop)`` index
+ranges into the file list travel to the workers, and results travel back.
+
+Parallelism is opt-in: scans stay serial unless ``scan_workers`` in the
+config asks for more than one worker.  Forking a process with live threads
+is deadlock-prone, so before the pool forks the file-text read-ahead pool is
+drained and every hook registered with :func:`register_before_fork` runs to
+finish other background threads (the review prewarm executor); fanning out
+therefore gives up overlapping those threads with the map.  Maps fall back
+to the serial loop for small inputs, on platforms without a safe ``fork``
+start method, inside workers and when another map is already running.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import multiprocessing
+import os
+import sys
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+from desloppify.base.output.fallbacks import log_best_effort_failure
+from desloppify.base.runtime_state import (
+    RuntimeContext,
+    current_runtime_context,
+    resolve_runtime_context,
+)
+
+logger = logging.getLogger(__name__)
+
+_R = TypeVar("_R")
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+MAX_DEFAULT_WORKERS = 8
+# Below this many files the pool start-up costs more than it saves.
+MIN_PARALLEL_FILES = 64
+_MIN_FILES_PER_WORKER = 16
+_CHUNKS_PER_WORKER = 4
+_PER_FILE_MARKER = "__desloppify_per_file_task__"
+
+_job: tuple[Callable[..., Any], list[str], dict[str, Any]] | None = None
+_job_lock = threading.Lock()
+_in_worker = False
+_before_fork_hooks: list[Callable[[], None]] = []
+
+
+def per_file_task(fn: _F) -> _F:
+    """Declare *fn* ``(filepath, **kwargs) -> result`` as a pure per-file task."""
+    setattr(fn, _PER_FILE_MARKER, True)
+    return fn
+
+
+def is_per_file_task(fn: Callable[..., Any]) -> bool:
+    return bool(getattr(fn, _PER_FILE_MARKER, False))
+
+
+def register_before_fork(hook: Callable[[], None]) -> None:
+    """Run *hook* before a worker pool forks, to finish background threads."""
+    if hook not in _before_fork_hooks:
+        _before_fork_hooks.append(hook)
+
+
+def default_worker_count() -> int:
+    """CPUs this process may run on, capped at :data:`MAX_DEFAULT_WORKERS`."""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return max(1, min(cpus, MAX_DEFAULT_WORKERS))
+
+
+def enable_parallel_map(
+    workers: int | None = None, *, runtime: RuntimeContext | None = None
+) -> None:
+    """Fan per-file tasks out to *workers* processes (default: CPU count, capped)."""
+    resolved = default_worker_count() if workers is None or workers <= 0 else workers
+    resolve_runtime_context(runtime).parallel_workers = resolved
+
+
+def disable_parallel_map(*, runtime: RuntimeContext | None = None) -> None:
+    resolve_runtime_context(runtime).parallel_workers = 0
+
+
+@contextmanager
+def parallel_map_scope(
+    workers: int | None = None, *, runtime: RuntimeContext | None = None
+) -> Iterator[None]:
+    """Temporarily enable parallel per-file maps, restoring the previous setting."""
+    resolved_runtime = resolve_runtime_context(runtime)
+    previous = resolved_runtime.parallel_workers
+    enable_parallel_map(workers, runtime=resolved_runtime)
+    try:
+        yield
+    finally:
+        resolved_runtime.parallel_workers = previous
+
+
+def _fork_context() -> multiprocessing.context.BaseContext | None:
+    # macOS system frameworks are not fork-safe; Windows has no fork.
+    if sys.platform == "darwin":
+        return None
+    try:
+        return multiprocessing.get_context("fork")
+    except ValueError:
+        return None
+
+
+def _init_worker() -> None:
+    global _in_worker
+    _in_worker = True
+    runtime = current_runtime_context()
+    runtime.file_text_cache.after_fork()
+    runtime.file_facts.after_fork()
+    # Spans recorded in a worker would never reach the parent's profiler.
+    runtime.profiler = None
+
+
+def _run_chunk(bounds: tuple[int, int]) -> list[Any]:
+    assert _job is not None
+    fn, files, kwargs = _job
+    start, stop = bounds
+    return [fn(files[index], **kwargs) for index in range(start, stop)]
+
+
+def _worker_count(fn: Callable[..., Any], file_count: int, runtime: RuntimeContext) -> int:
+    if _in_worker or not is_per_file_task(fn) or file_count < MIN_PARALLEL_FILES:
+        return 1
+    return min(runtime.parallel_workers, file_count // _MIN_FILES_PER_WORKER)
+
+
+def map_files(
+    fn: Callable[..., _R],
+    files: Iterable[str],
+    /,
+    *,
+    runtime: RuntimeContext | None = None,
+    **kwargs: Any,
+) -> list[_R]:
+    """Return ``[fn(file, **kwargs) for file in files]``, in parallel when enabled.
+
+    Exceptions raised by *fn* propagate to the caller as in the serial loop.
+    """
+    global _job
+    file_list = list(files)
+    resolved_runtime = resolve_runtime_context(runtime)
+    workers = _worker_count(fn, len(file_list), resolved_runtime)
+    context = _fork_context() if workers > 1 else None
+    if context is None or not _job_lock.acquire(blocking=False):
+        return [fn(filepath, **kwargs) for filepath in file_list]
+
+    try:
+        _job = (fn, file_list, kwargs)
+        chunk = max(1, math.ceil(len(file_list) / (workers * _CHUNKS_PER_WORKER)))
+        bounds = [
+            (start, min(start + chunk, len(file_list)))
+            for start in range(0, len(file_list), chunk)
+        ]
+        resolved_runtime.file_text_cache.drain_prefetch()
+        for hook in _before_fork_hooks:
+            hook()
+        try:
+            pool = context.Pool(workers, initializer=_init_worker)
+        except OSError as exc:
+            log_best_effort_failure(logger, "start per-file worker pool", exc)
+            return [fn(filepath, **kwargs) for filepath in file_list]
+        with pool:
+            results: list[_R] = []
+            for chunk_results in pool.imap(_run_chunk, bounds):
+                results.extend(chunk_results)
+        return results
+    finally:
+        _job = None
+        _job_lock.release()
+
+
+__all__ = [
+    "MAX_DEFAULT_WORKERS",
+    "MIN_PARALLEL_FILES",
+    "default_worker_count",
+    "disable_parallel_map",
+    "enable_parallel_map",
+    "is_per_file_task",
+    "map_files",
+    "parallel_map_scope",
+    "per_file_task",
+    "register_before_fork",
+]
@@ -0,0 +1,219 @@
+"""Opt-in scan profiling: per-span timing, memory and cache counters.
+
+``desloppify scan --trace`` installs a :class:`ScanProfiler` on the runtime
+context.  Scan stages, detector phases and external tool invocations are
+wrapped in :func:`profile_span`, which is a no-op unless a profiler is
+installed.  Each span records wall time, process CPU time, peak RSS growth
+and the change in cache hit/miss counters while it ran.  CPU time is
+process-wide, so a span that overlaps background work (prefetch threads)
+also counts that work's CPU.  The result is
+written as a Chrome trace (``chrome://tracing`` / Perfetto) and summarized as
+a table.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from desloppify.base.discovery.file_paths import safe_write_text
+from desloppify.base.runtime_state import RuntimeContext, resolve_runtime_context
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+CounterSource = Callable[[], Mapping[str, int]]
+
+
+def _peak_rss_kib() -> int | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def runtime_cache_counters(runtime: RuntimeContext) -> dict[str, int]:
+    """Hit/miss counters of the scan-scoped caches held by *runtime*."""
+    counters = {
+        "file_text.hits": runtime.file_text_cache.hits,
+        "file_text.misses": runtime.file_text_cache.misses,
+    }
+    for name, cache in (
+        ("parse_tree", runtime.treesitter_parse_cache),
+        ("import_resolution", runtime.path_index),
+    ):
+        if cache is not None:
+            counters[f"{name}.hits"] = getattr(cache, "hits", 0)
+            counters[f"{name}.misses"] = getattr(cache, "misses", 0)
+    return counters
+
+
+@dataclass
+class ProfileSpan:
+    """One timed region of a profiled scan."""
+
+    name: str
+    category: str
+    start: float
+    thread_id: int
+    wall_seconds: float = 0.0
+    process_cpu_seconds: float = 0.0
+    rss_growth_kib: int | None = None
+    counters: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def file_reads(self) -> int:
+        return self.counters.get("file_text.hits", 0) + self.counters.get(
+            "file_text.misses", 0
+        )
+
+
+class ScanProfiler:
+    """Collects :class:`ProfileSpan` records for one scan."""
+
+    def __init__(self, *, runtime: RuntimeContext | None = None) -> None:
+        self._runtime = resolve_runtime_context(runtime)
+        self._sources: dict[str, CounterSource] = {}
+        self._lock = threading.Lock()
+        self.origin = time.perf_counter()
+        self.spans: list[ProfileSpan] = []
+
+    def add_counters(self, prefix: str, source: CounterSource) -> None:
+        """Register extra counters, reported as ``<prefix>.<name>``."""
+        self._sources[prefix] = source
+
+    def counters(self) -> dict[str, int]:
+        values = runtime_cache_counters(self._runtime)
+        for prefix, source in self._sources.items():
+            for name, value in source().items():
+                values[f"{prefix}.{name}"] = value
+        return values
+
+    @contextmanager
+    def span(self, name: str, *, category: str = "stage") -> Iterator[ProfileSpan]:
+        record = ProfileSpan(
+            name=name,
+            category=category,
+            start=time.perf_counter(),
+            thread_id=threading.get_ident(),
+        )
+        counters_before = self.counters()
+        rss_before = _peak_rss_kib()
+        cpu_before = time.process_time()
+        try:
+            yield record
+        finally:
+            record.wall_seconds = time.perf_counter() - record.start
+            record.process_cpu_seconds = time.process_time() - cpu_before
+            rss_after = _peak_rss_kib()
+            if rss_before is not None and rss_after is not None:
+                record.rss_growth_kib = rss_after - rss_before
+            counters_after = self.counters()
+            record.counters = {
+                key: delta
+                for key, value in counters_after.items()
+                if (delta := value - counters_before.get(key, 0)) > 0
+            }
+            with self._lock:
+                self.spans.append(record)
+
+    def chrome_trace(self) -> dict[str, object]:
+        """Return the spans in Chrome trace-event format (complete events)."""
+        pid = os.getpid()
+        events = []
+        for record in sorted(self.spans, key=lambda span: span.start):
+            args: dict[str, object] = {
+                "process_cpu_ms": round(record.process_cpu_seconds * 1000, 3),
+                "file_reads": record.file_reads,
+                **record.counters,
+            }
+            if record.rss_growth_kib is not None:
+                args["peak_rss_growth_kib"] = record.rss_growth_kib
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.category,
+                    "ph": "X",
+                    "ts": round((record.start - self.origin) * 1_000_000, 1),
+                    "dur": round(record.wall_seconds * 1_000_000, 1),
+                    "pid": pid,
+                    "tid": record.thread_id,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path: Path) -> None:
+        safe_write_text(path, json.dumps(self.chrome_trace(), indent=1) + "\n")
+
+    def summary_rows(self) -> list[list[str]]:
+        """Rows for the ``--trace`` summary table, in start order."""
+        rows = []
+        for record in sorted(self.spans, key=lambda span: span.start):
+            rss = (
+                f"{record.rss_growth_kib / 1024:.1f}"
+                if record.rss_growth_kib is not None
+                else "-"
+            )
+            rows.append(
+                [
+                    record.name if record.category != "tool" else f"  $ {record.name}",
+                    f"{record.wall_seconds * 1000:.0f}",
+                    f"{record.process_cpu_seconds * 1000:.0f}",
+                    rss,
+                    str(record.file_reads),
+                    _format_cache_counters(record.counters),
+                ]
+            )
+        return rows
+
+
+def _format_cache_counters(counters: Mapping[str, int]) -> str:
+    caches = sorted(
+        {key.rsplit(".", 1)[0] for key in counters if key.endswith((".hits", ".misses"))}
+    )
+    return ", ".join(
+        f"{cache} {counters.get(f'{cache}.hits', 0)}/{counters.get(f'{cache}.misses', 0)}"
+        for cache in caches
+    )
+
+
+def active_profiler(*, runtime: RuntimeContext | None = None) -> ScanProfiler | None:
+    """Return the installed profiler, if profiling is on."""
+    profiler = resolve_runtime_context(runtime).profiler
+    return profiler if isinstance(profiler, ScanProfiler) else None
+
+
+@contextmanager
+def profile_span(
+    name: str,
+    *,
+    category: str = "stage",
+    runtime: RuntimeContext | None = None,
+) -> Iterator[ProfileSpan | None]:
+    """Time the enclosed block when a profiler is installed; otherwise no-op."""
+    profiler = active_profiler(runtime=runtime)
+    if profiler is None:
+        yield None
+        return
+    with profiler.span(name, category=category) as record:
+        yield record
+
+
+__all__ = [
+    "ProfileSpan",
+    "ScanProfiler",
+    "active_profiler",
+    "profile_span",
+    "runtime_cache_counters",
+]
@@ -2,6 +2,16 @@
 
 from __future__ import annotations
 
+import codecs
+import hashlib
+import locale
+import os
+import re
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass, field
@@ -20,59 +30,476 @@ class FileTextReadResult:
         return self.error_kind is None
 
 
-class FileTextCache:
-    """Optional read-through file-text cache used by scan/review passes."""
+@dataclass(frozen=True)
+class _TextEntry:
+    """One decoded file held by :class:`FileTextCache`.
 
-    def __init__(self) -> None:
+    ``ascii_text`` marks files whose bytes are exactly ``text.encode("ascii")``
+    (ASCII, no carriage returns); for those the text is the only copy kept.
+    Other files also keep the raw ``data`` the text was decoded from, so byte
+    readers see exactly what was decoded.
+    """
+
+    text: str | None
+    error_kind: str | None
+    strict_ok: bool
+    size: int
+    ascii_text: bool = False
+    data: bytes | None = None
+
+
+def _default_encoding() -> str:
+    return codecs.lookup(locale.getpreferredencoding(False)).name
+
+
+# Encodings that decode every ASCII byte to the same code point.
+_ASCII_COMPATIBLE = frozenset({"ascii", "utf-8", "iso8859-1", "cp1252"})
+
+
+def _decode_source(data: bytes, encoding: str) -> tuple[str, bool]:
+    """Decode like ``Path.read_text``: universal newlines, strict when possible."""
+    try:
+        text, strict_ok = data.decode(encoding), True
+    except UnicodeDecodeError:
+        text, strict_ok = data.decode(encoding, errors="replace"), False
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text, strict_ok
+
+
+class FileTextCache:
+    """Scan-scoped read-through file-text cache with parallel read-ahead.
+
+    While enabled, every file is read and decoded once and served from memory
+    afterwards, up to ``max_bytes`` of source (least recently used entries are
+    evicted beyond that).  ``prefetch`` queues discovered files on a small
+    thread pool so cold reads overlap instead of running serially; readers
+    that reach a file still in flight simply wait for it.  Keys are absolute
+    paths, so relative and absolute spellings share one entry.
+
+    It is also the shared source buffer for byte-level readers (tree-sitter):
+    ``read_bytes`` serves the same entry, rebuilding the bytes of plain ASCII
+    files from their text, so a file parsed and read as text is held once.
+    Readers that keep derived data (parse trees) pin the entry: pinned
+    entries still count toward ``cached_bytes`` but are never evicted, so
+    their bytes stay exactly what was parsed until the cache is reset.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = 256 * 1024 * 1024,
+        prefetch_workers: int = 8,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.prefetch_workers = prefetch_workers
+        self.facts: FileFactsTable | None = None
+        self.hits = 0
+        self.misses = 0
         self._enabled = False
-        self._values: dict[str, FileTextReadResult] = {}
+        self._lock = threading.Lock()
+        self._encoding = _default_encoding()
+        self._generation = 0
+        self._executor: ThreadPoolExecutor | None = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._entries: OrderedDict[str, _TextEntry] = OrderedDict()
+        # Pinned entries leave the LRU order so eviction never walks them.
+        self._pinned: dict[str, _TextEntry] = {}
+        self._pending: dict[str, Future[None]] = {}
+        self._bytes = 0
         self._last_result: tuple[str, FileTextReadResult] | None = None
 
+    def _shutdown(self) -> None:
+        with self._lock:
+            self._generation += 1
+            executor, self._executor = self._executor, None
+            self._reset()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def enable(self) -> None:
+        self._shutdown()
         self._enabled = True
-        self._values.clear()
-        self._last_result = None
 
     def disable(self) -> None:
         self._enabled = False
-        self._values.clear()
-        self._last_result = None
+        self._shutdown()
 
-    def read_result(self, filepath: str) -> FileTextReadResult:
-        if self._enabled and filepath in self._values:
-            result = self._values[filepath]
-            self._last_result = (filepath, result)
-            return result
+    def drain_prefetch(self) -> None:
+        """Finish queued read-ahead and stop its threads (e.g. before forking).
+
+        Later ``prefetch`` calls start a fresh pool.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def after_fork(self) -> None:
+        """Drop thread state inherited by a forked worker; cached entries stay."""
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pending = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def cached_bytes(self) -> int:
+        return self._bytes
+
+    def __contains__(self, filepath: object) -> bool:
+        if not isinstance(filepath, str):
+            return False
+        key = os.path.abspath(filepath)
+        return key in self._entries or key in self._pinned
+
+    def is_pinned(self, filepath: str | Path) -> bool:
+        return os.path.abspath(filepath) in self._pinned
+
+    def _cached(self, key: str) -> _TextEntry | None:
+        entry = self._entries.get(key)
+        return entry if entry is not None else self._pinned.get(key)
 
+    def _evict(self) -> None:
+        """Drop least recently used unpinned entries beyond the budget (locked)."""
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _evicted, old = self._entries.popitem(last=False)
+            self._bytes -= old.size + len(old.data or b"")
+
+    def _load(self, key: str) -> _TextEntry:
         try:
-            result = FileTextReadResult(
-                content=Path(filepath).read_text(errors="replace"),
-                error_kind=None,
-            )
+            data = Path(key).read_bytes()
         except OSError as exc:
-            result = FileTextReadResult(content=None, error_kind=exc.__class__.__name__)
+            return _TextEntry(None, exc.__class__.__name__, False, 0)
+        if self.facts is not None:
+            self.facts.prime(key, data)
+        text, strict_ok = _decode_source(data, self._encoding)
+        ascii_text = (
+            self._encoding in _ASCII_COMPATIBLE and data.isascii() and b"\r" not in data
+        )
+        return _TextEntry(
+            text, None, strict_ok, len(data), ascii_text, None if ascii_text else data
+        )
+
+    def _store(self, key: str, entry: _TextEntry, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation or self._cached(key) is not None:
+                return
+            self._entries[key] = entry
+            self._bytes += entry.size + len(entry.data or b"")
+            self._evict()
+
+    def _prefetch_one(self, key: str, generation: int) -> None:
+        try:
+            if self._bytes >= self.max_bytes:
+                return
+            self._store(key, self._load(key), generation)
+        finally:
+            with self._lock:
+                if generation == self._generation:
+                    self._pending.pop(key, None)
+
+    def prefetch(self, filepaths: Iterable[str]) -> int:
+        """Queue background reads for *filepaths*; returns how many were queued."""
+        if not self._enabled or self.prefetch_workers <= 0:
+            return 0
+        queued = 0
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.prefetch_workers,
+                    thread_name_prefix="desloppify-read",
+                )
+            generation = self._generation
+            for filepath in filepaths:
+                key = os.path.abspath(filepath)
+                if self._cached(key) is not None or key in self._pending:
+                    continue
+                self._pending[key] = self._executor.submit(
+                    self._prefetch_one, key, generation
+                )
+                queued += 1
+        return queued
+
+    def _entry(self, filepath: str) -> _TextEntry:
+        key = os.path.abspath(filepath)
+        if not self._enabled:
+            return self._load(key)
+        pending = self._pending.get(key)
+        if pending is not None:
+            pending.result()
+        with self._lock:
+            entry = self._cached(key)
+            if entry is not None:
+                self.hits += 1
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                return entry
+            self.misses += 1
+            generation = self._generation
+        entry = self._load(key)
+        self._store(key, entry, generation)
+        return entry
+
+    def read_result(self, filepath: str) -> FileTextReadResult:
+        entry = self._entry(filepath)
+        result = FileTextReadResult(content=entry.text, error_kind=entry.error_kind)
         self._last_result = (filepath, result)
-        if self._enabled:
-            self._values[filepath] = result
         return result
 
     def read(self, filepath: str) -> str | None:
         return self.read_result(filepath).content
 
+    def read_source(
+        self,
+        filepath: str | Path,
+        *,
+        encoding: str | None = None,
+        errors: str | None = None,
+    ) -> str:
+        """Drop-in for ``Path.read_text``: same result, same exceptions.
+
+        Served from the cached text when the requested decoding matches the
+        cached one (or the file is plain ASCII, which every ASCII-compatible
+        codec decodes alike); other encodings are decoded from the cached
+        bytes. Unreadable or undecodable files (in strict mode) are re-read
+        directly so callers see the original exception.
+        """
+        path = Path(filepath)
+        if not self._enabled or errors not in (None, "strict", "replace"):
+            return path.read_text(encoding=encoding, errors=errors)
+        codec = self._encoding if encoding is None else codecs.lookup(encoding).name
+        entry = self._entry(str(path))
+        if entry.text is not None and (
+            codec == self._encoding or (entry.ascii_text and codec in _ASCII_COMPATIBLE)
+        ):
+            if entry.strict_ok or errors == "replace":
+                return entry.text
+        elif entry.error_kind is None:
+            text, strict_ok = _decode_source(self.read_bytes(path), codec)
+            if strict_ok or errors == "replace":
+                return text
+        return path.read_text(encoding=encoding, errors=errors)
+
+    def read_bytes(self, filepath: str | Path, *, pin: bool = False) -> bytes:
+        """Drop-in for ``Path.read_bytes`` sharing the cached entry of *filepath*.
+
+        With *pin*, the entry is exempt from eviction until the cache is
+        reset, so later calls return the same bytes even if the file changes
+        on disk; ``is_pinned`` tells whether that succeeded.
+        """
+        path = Path(filepath)
+        if not self._enabled:
+            return path.read_bytes()
+        entry = self._entry(str(path))
+        if entry.error_kind is not None:
+            return path.read_bytes()
+        if entry.ascii_text and entry.text is not None:
+            data = entry.text.encode("ascii")
+        else:
+            assert entry.data is not None
+            data = entry.data
+        if pin:
+            with self._lock:
+                self._pin(os.path.abspath(path), entry)
+        return data
+
+    def _pin(self, key: str, entry: _TextEntry) -> None:
+        if self._entries.get(key) is entry:
+            self._pinned[key] = self._entries.pop(key)
+
     def last_error_kind(self, filepath: str) -> str | None:
         if self._last_result and self._last_result[0] == filepath:
             return self._last_result[1].error_kind
-        if self._enabled and filepath in self._values:
-            return self._values[filepath].error_kind
-        return None
+        entry = self._cached(os.path.abspath(filepath)) if self._enabled else None
+        return entry.error_kind if entry is not None else None
+
+
+@dataclass(frozen=True)
+class FileFacts:
+    """Cheap per-file facts shared by detectors within one scan."""
+
+    loc: int
+    size: int
+    digest: str
+    line_starts: array
+    text_loc: int
+
+    def line_start(self, line: int) -> int:
+        """Return the byte offset where 1-based *line* starts."""
+        return self.line_starts[line - 1]
+
+
+# Line boundaries ``str.splitlines`` honours besides ``\n`` (UTF-8 encoded).
+_EXTRA_LINE_BREAKS = re.compile(rb"[\r\x0b\x0c\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+
+
+def compute_file_facts(data: bytes) -> FileFacts:
+    """Compute LOC, size, digest and line-start offsets from raw bytes.
+
+    LOC counts newline-delimited lines, matching ``count_lines`` (a trailing
+    unterminated line counts as one line). ``text_loc`` is the line count
+    ``str.splitlines`` gives for the UTF-8 text, which differs only when the
+    file uses other line boundaries such as bare ``\r``.
+    """
+    starts = array("q", [0])
+    find = data.find
+    pos = find(b"\n")
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = find(b"\n", pos + 1)
+    if data and starts[-1] == len(data):
+        starts.pop()
+    loc = len(starts) if data else 0
+    if not data:
+        starts = array("q")
+    text_loc = loc
+    if _EXTRA_LINE_BREAKS.search(data):
+        text_loc = len(data.decode("utf-8", errors="replace").splitlines())
+    return FileFacts(
+        loc=loc,
+        size=len(data),
+        digest=hashlib.blake2b(data, digest_size=16).hexdigest(),
+        line_starts=starts,
+        text_loc=text_loc,
+    )
+
+
+class FileFactsTable:
+    """Scan-scoped, array-backed table of per-file facts.
+
+    Rows are filled once per file (on first access) while enabled and served
+    from flat arrays afterwards, so detectors that only need LOC/size/digest
+    do not re-read or re-split file contents. When disabled, facts are
+    computed on demand and not retained.
+    """
+
+    _DIGEST_SIZE = 16
+
+    def __init__(self) -> None:
+        self._enabled = False
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._missing: set[str] = set()
+        self._loc = array("q")
+        self._text_loc = array("q")
+        self._size = array("q")
+        self._digests = bytearray()
+        self._offset_index = array("q", [0])
+        self._offsets = array("q")
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def enable(self) -> None:
+        self._enabled = True
+        self._reset()
+
+    def disable(self) -> None:
+        self._enabled = False
+        self._reset()
+
+    def after_fork(self) -> None:
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, filepath: object) -> bool:
+        return isinstance(filepath, str) and os.path.abspath(filepath) in self._ids
+
+    def _row(self, file_id: int) -> FileFacts:
+        start = self._offset_index[file_id]
+        end = self._offset_index[file_id + 1]
+        digest_start = file_id * self._DIGEST_SIZE
+        return FileFacts(
+            loc=self._loc[file_id],
+            size=self._size[file_id],
+            digest=self._digests[
+                digest_start : digest_start + self._DIGEST_SIZE
+            ].hex(),
+            line_starts=self._offsets[start:end],
+            text_loc=self._text_loc[file_id],
+        )
+
+    def _store(self, filepath: str, facts: FileFacts) -> None:
+        # Rows are published (``_ids``) last so lock-free readers never see
+        # a half-written row while a prefetch thread is storing.
+        with self._lock:
+            if filepath in self._ids:
+                return
+            file_id = len(self._loc)
+            self._loc.append(facts.loc)
+            self._text_loc.append(facts.text_loc)
+            self._size.append(facts.size)
+            self._digests.extend(bytes.fromhex(facts.digest))
+            self._offsets.extend(facts.line_starts)
+            self._offset_index.append(len(self._offsets))
+            self._ids[filepath] = file_id
+
+    def prime(self, filepath: str, data: bytes) -> None:
+        """Record facts from bytes another reader already loaded."""
+        filepath = os.path.abspath(filepath)
+        if self._enabled and filepath not in self._ids:
+            self._store(filepath, compute_file_facts(data))
+
+    def get(self, filepath: str) -> FileFacts | None:
+        """Return facts for *filepath*, or ``None`` when it cannot be read."""
+        filepath = os.path.abspath(filepath)
+        file_id = self._ids.get(filepath)
+        if file_id is not None:
+            return self._row(file_id)
+        if filepath in self._missing:
+            return None
+        try:
+            data = Path(filepath).read_bytes()
+        except OSError:
+            if self._enabled:
+                self._missing.add(filepath)
+            return None
+        facts = compute_file_facts(data)
+        if self._enabled:
+            self._store(filepath, facts)
+        return facts
+
+    def loc(self, filepath: str) -> int:
+        """Return LOC for *filepath* (0 when unreadable)."""
+        file_id = self._ids.get(os.path.abspath(filepath))
+        if file_id is not None:
+            return self._loc[file_id]
+        facts = self.get(filepath)
+        return facts.loc if facts is not None else 0
+
+    def text_loc(self, filepath: str) -> int:
+        """Return the ``str.splitlines`` line count for *filepath* (0 when unreadable)."""
+        file_id = self._ids.get(os.path.abspath(filepath))
+        if file_id is not None:
+            return self._text_loc[file_id]
+        facts = self.get(filepath)
+        return facts.text_loc if facts is not None else 0
 
 
 class SourceFileCache:
-    """Small FIFO cache for source-file discovery results."""
+    """Small FIFO cache for source-file discovery results.
+
+    Alongside per-query results it keeps the directory walks they were
+    answered from (``SourceFileIndex`` objects, keyed by root and shared
+    exclusions), so queries for different extensions share one traversal.
+    """
 
-    def __init__(self, *, max_entries: int) -> None:
+    def __init__(self, *, max_entries: int, max_indexes: int = 4) -> None:
         self.max_entries = max_entries
+        self.max_indexes = max_indexes
         self.values: dict[tuple, tuple[str, ...]] = {}
+        self.indexes: dict[tuple, object] = {}
 
     def get(self, key: tuple) -> tuple[str, ...] | None:
         return self.values.get(key)
@@ -82,8 +509,17 @@ class SourceFileCache:
             self.values.pop(next(iter(self.values)))
         self.values[key] = value
 
+    def get_index(self, key: tuple) -> object | None:
+        return self.indexes.get(key)
+
+    def put_index(self, key: tuple, index: object) -> None:
+        if len(self.indexes) >= self.max_indexes:
+            self.indexes.pop(next(iter(self.indexes)))
+        self.indexes[key] = index
+
     def clear(self) -> None:
         self.values.clear()
+        self.indexes.clear()
 
 
 @dataclass
@@ -94,12 +530,20 @@ class RuntimeContext:
     project_root: Path | None = None
     query_file: Path | None = None
     file_text_cache: FileTextCache = field(default_factory=FileTextCache)
+    file_facts: FileFactsTable = field(default_factory=FileFactsTable)
     cache_enabled: bool = False
     treesitter_parse_cache: object | None = None
+    path_index: object | None = None
+    profiler: object | None = None
+    graph_snapshot_dir: Path | None = None
+    parallel_workers: int = 0
     source_file_cache: SourceFileCache = field(
         default_factory=lambda: SourceFileCache(max_entries=16)
     )
 
+    def __post_init__(self) -> None:
+        self.file_text_cache.facts = self.file_facts
+
 
 _PROCESS_RUNTIME_CONTEXT = RuntimeContext()
 _RUNTIME_CONTEXT: ContextVar[RuntimeContext | None] = ContextVar(
@@ -142,10 +586,13 @@ def runtime_scope(runtime: RuntimeContext | None = None):
 
 
 __all__ = [
+    "FileFacts",
+    "FileFactsTable",
     "FileTextReadResult",
     "FileTextCache",
     "RuntimeContext",
     "SourceFileCache",
+    "compute_file_facts",
     "current_runtime_context",
     "make_runtime_context",
     "resolve_runtime_context",
@@ -2,29 +2,20 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from typing import Any
 
 from desloppify.engine._state.schema import StateModel
+from desloppify.engine._state.views import open_issues, open_issues_by_file
 
 
 def _open_issues(state: StateModel) -> list[dict[str, Any]]:
-    """Return all open issues from state."""
-    issues = (state.get("work_items") or state.get("issues", {}))
-    return [
-        finding for finding in issues.values()
-        if isinstance(finding, dict) and finding.get("status") == "open"
-    ]
+    """Return all open issues from state (shared view; do not mutate)."""
+    return open_issues(state)
 
 
 def _group_by_file(state: StateModel) -> dict[str, list[dict[str, Any]]]:
     """Group open issues by file, excluding holistic (file='.') issues."""
-    by_file: dict[str, list[dict[str, Any]]] = defaultdict(list)
-    for finding in _open_issues(state):
-        file = finding.get("file", "")
-        if file and file != ".":
-            by_file[file].append(finding)
-    return dict(by_file)
+    return open_issues_by_file(state)
 
 
 __all__ = ["_group_by_file", "_open_issues"]
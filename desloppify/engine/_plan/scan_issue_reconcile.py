@@ -20,6 +20,7 @@ from desloppify.engine._plan.schema import (
 )
 from desloppify.engine._plan.skip_policy import skip_kind_state_status
 from desloppify.engine._state.schema import StateModel, ensure_state_defaults, utc_now
+from desloppify.engine._state.views import bump_revision
 
 SUPERSEDED_TTL_DAYS = 90
 
@@ -334,6 +335,7 @@ def _sync_skipped_issue_statuses(plan: PlanModel, state: StateModel) -> None:
         target_status = skip_kind_state_status(kind)
         if target_status and target_status != "open":
             issue["status"] = target_status
+    bump_revision(state)
 
 
 def reconcile_plan_after_scan(
@@ -393,6 +395,7 @@ def reconcile_plan_after_scan(
             issue = issues.get(fid)
             if issue and issue.get("status") == "deferred":
                 issue["status"] = "open"
+        bump_revision(state)
 
     # Prune old superseded entries
     pruned = _prune_old_superseded(plan, now_dt)
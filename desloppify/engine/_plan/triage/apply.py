@@ -15,6 +15,7 @@ from desloppify.engine._plan.schema import (
 from desloppify.engine._plan.skip_policy import skip_kind_state_status
 from desloppify.engine._state.issue_semantics import is_triage_finding
 from desloppify.engine._state.schema import StateModel, ensure_state_defaults, utc_now
+from desloppify.engine._state.views import bump_revision
 
 from .dismiss import dismiss_triage_issues
 from .prompt import AutoClusterDecision, TriageResult
@@ -340,6 +341,7 @@ def apply_triage_to_plan(
         if issue and issue.get("status") == "open" and triaged_out_status:
             issue["status"] = triaged_out_status
             issue["note"] = f"Triaged out by epic triage v{version}"
+    bump_revision(state)
 
     _reorder_queue_by_dependency(
         order=order,
@@ -22,7 +22,9 @@ from desloppify.engine._scoring.state_integration_subjective import (
 from desloppify.engine._scoring.state_coverage import (
     apply_scan_coverage_to_dimension_scores as _apply_scan_coverage_to_dimension_scores,
 )
+from desloppify.engine._state.compaction import scoring_issues
 from desloppify.engine._state.scope import path_scoped_issues
+from desloppify.engine._state.views import bump_revision, memoized_view
 from desloppify.engine._state.schema import StateModel, ensure_state_defaults
 
 _EMPTY_COUNTERS = tuple(sorted(issue_status_tokens()))
@@ -203,9 +205,20 @@ def recompute_stats(
     *,
     subjective_integrity_target: float | None = None,
 ) -> None:
-    """Recompute stats and canonical health scores from issues."""
+    """Recompute stats and canonical health scores from issues.
+
+    Tombstones of archived issues count alongside live work items, so
+    compaction never moves scores or status totals.  Every mutation path
+    ends here, so this also bumps the state revision: derived views built
+    afterwards are fresh and shared until the next mutation.
+    """
     ensure_state_defaults(state)
-    issues = path_scoped_issues(state.get("work_items") or state.get("issues", {}), scan_path)
+    bump_revision(state)
+    issues = memoized_view(
+        state,
+        ("scoring_issues", scan_path),
+        lambda: path_scoped_issues(scoring_issues(state), scan_path),
+    )
     counters, tier_stats = _count_issues(issues)
     state["stats"] = {
         "total": sum(counters.values()),
@@ -0,0 +1,176 @@
+"""Archival of long-resolved work items.
+
+``work_items`` used to keep every issue ever seen, so scoring, merges and
+saves paid for the whole project history.  :func:`compact_state` moves
+mechanical issues that were resolved (``fixed``, ``auto_resolved``,
+``false_positive``) more than N scans ago to an append-only archive file::
+
+    .desloppify/archive/<state-file-stem>.jsonl
+
+and leaves a small tombstone under ``state["tombstones"]``.  Tombstones keep
+the fields that scoring, stats and reopen handling read, so scores are
+unchanged by compaction and a reappearing issue is reopened with its history
+(``first_seen``, ``reopen_count``) intact.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any, cast
+
+from desloppify.engine._state.issue_semantics import is_objective_finding
+from desloppify.engine._state.schema import (
+    Issue,
+    StateModel,
+    get_state_file,
+    json_default,
+    utc_now,
+)
+from desloppify.engine._state.schema_types_issues import Tombstone
+from desloppify.engine._state.views import bump_revision
+
+ARCHIVABLE_STATUSES: frozenset[str] = frozenset(
+    {"fixed", "auto_resolved", "false_positive"}
+)
+_TOMBSTONE_FIELDS = (
+    "detector",
+    "file",
+    "status",
+    "tier",
+    "confidence",
+    "zone",
+    "lang",
+    "first_seen",
+    "resolved_at",
+    "reopen_count",
+)
+# Detail keys read by detector scoring (see ``_scoring.detection``).
+_TOMBSTONE_DETAIL_FIELDS = ("loc_weight",)
+
+
+def archive_path(state_path: Path | None = None) -> Path:
+    """Return the archive file paired with a state file."""
+    state_file = Path(state_path) if state_path is not None else get_state_file()
+    return state_file.parent / "archive" / f"{state_file.stem}.jsonl"
+
+
+def make_tombstone(issue: Mapping[str, Any]) -> Tombstone:
+    """Reduce a resolved issue to the fields scoring and reopening need."""
+    tombstone: dict[str, Any] = {
+        field: issue[field] for field in _TOMBSTONE_FIELDS if field in issue
+    }
+    if issue.get("suppressed"):
+        tombstone["suppressed"] = True
+    detail = issue.get("detail")
+    if isinstance(detail, Mapping):
+        kept = {key: detail[key] for key in _TOMBSTONE_DETAIL_FIELDS if key in detail}
+        if kept:
+            tombstone["detail"] = kept
+    return cast(Tombstone, tombstone)
+
+
+def scoring_issues(state: StateModel) -> dict[str, Any]:
+    """Return live work items plus tombstones, keyed by issue id."""
+    work_items = state.get("work_items") or state.get("issues", {})
+    tombstones = state.get("tombstones")
+    if not tombstones:
+        return work_items
+    return {**tombstones, **work_items}
+
+
+def _archive_cutoff(state: StateModel, after_scans: int) -> str | None:
+    """Timestamp of the scan ``after_scans`` scans back, if history reaches it."""
+    history = [
+        entry
+        for entry in state.get("scan_history", []) or []
+        if isinstance(entry, dict) and entry.get("timestamp")
+    ]
+    if after_scans <= 0 or len(history) < after_scans:
+        return None
+    return str(history[-after_scans]["timestamp"])
+
+
+def _archivable(issue: Mapping[str, Any], cutoff: str) -> bool:
+    if issue.get("status") not in ARCHIVABLE_STATUSES:
+        return False
+    resolved_at = issue.get("resolved_at")
+    if not isinstance(resolved_at, str) or not resolved_at or resolved_at >= cutoff:
+        return False
+    return is_objective_finding(issue)
+
+
+def compact_state(
+    state: StateModel,
+    *,
+    after_scans: int,
+    archive_file: Path,
+) -> list[str]:
+    """Archive issues resolved more than *after_scans* scans ago.
+
+    Full records are appended to *archive_file* before they leave
+    ``work_items``.  Returns the archived issue ids.
+    """
+    cutoff = _archive_cutoff(state, after_scans)
+    if cutoff is None:
+        return []
+    work_items = state["work_items"]
+    archived = [
+        issue_id for issue_id, issue in work_items.items() if _archivable(issue, cutoff)
+    ]
+    if not archived:
+        return []
+
+    archived_at = utc_now()
+    archive_file.parent.mkdir(parents=True, exist_ok=True)
+    with archive_file.open("a", encoding="utf-8") as handle:
+        for issue_id in archived:
+            record = {**work_items[issue_id], "archived_at": archived_at}
+            handle.write(
+                json.dumps(record, separators=(",", ":"), default=json_default) + "\n"
+            )
+
+    tombstones = state.setdefault("tombstones", {})
+    for issue_id in archived:
+        tombstones[issue_id] = make_tombstone(work_items.pop(issue_id))
+    bump_revision(state)
+    return archived
+
+
+def restore_tombstones(state: StateModel, current_issues: Iterable[dict]) -> int:
+    """Bring archived issues that reappeared back into ``work_items``.
+
+    The restored record keeps its resolved status and history so the normal
+    upsert path reopens it.  Returns how many issues were restored.
+    """
+    tombstones = state.get("tombstones")
+    if not tombstones:
+        return 0
+    work_items = state["work_items"]
+    restored = 0
+    for issue in current_issues:
+        issue_id = issue.get("id")
+        tombstone = tombstones.get(issue_id) if isinstance(issue_id, str) else None
+        if tombstone is None or issue_id in work_items:
+            continue
+        tombstones.pop(issue_id)
+        revived: dict[str, Any] = {**issue}
+        for field in ("status", "first_seen", "resolved_at", "reopen_count"):
+            if field in tombstone:
+                revived[field] = tombstone[field]
+        work_items[issue_id] = cast(Issue, revived)
+        restored += 1
+    if restored:
+        bump_revision(state)
+    return restored
+
+
+__all__ = [
+    "ARCHIVABLE_STATUSES",
+    "archive_path",
+    "compact_state",
+    "make_tombstone",
+    "restore_tombstones",
+    "scoring_issues",
+]
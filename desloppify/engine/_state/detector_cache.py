@@ -0,0 +1,135 @@
+"""On-disk store for per-detector scan caches.
+
+Detector caches (dupes near-pairs, boilerplate clusters and fingerprints,
+security results) used to live under ``state["review_cache"]["detectors"]``,
+so every ``save_state`` re-serialized and backed them up, even for commands
+that never touch them.  They now live next to the state file, one compact JSON
+file per detector::
+
+    .desloppify/cache/<state-file-stem>/<detector>.json
+
+A payload is only read when its detector asks for it, and only written back
+when it changed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+from pathlib import Path
+
+from desloppify.base.discovery.file_paths import safe_write_text
+from desloppify.engine._state.schema import get_state_file
+
+logger = logging.getLogger(__name__)
+
+LEGACY_REVIEW_CACHE_KEY = "detectors"
+_UNSAFE_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def detector_cache_dir(state_path: Path | None = None) -> Path:
+    """Return the detector cache directory paired with a state file."""
+    state_file = Path(state_path) if state_path is not None else get_state_file()
+    return state_file.parent / "cache" / state_file.stem
+
+
+def _dump(payload: dict[str, object]) -> str:
+    return json.dumps(payload, separators=(",", ":"), sort_keys=True)
+
+
+class DetectorCacheStore:
+    """Lazily loaded, write-on-change detector cache payloads."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = Path(cache_dir)
+        self._payloads: dict[str, dict[str, object]] = {}
+        self._loaded_text: dict[str, str | None] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def path_for(self, detector: str) -> Path:
+        return self.cache_dir / f"{_UNSAFE_NAME_RE.sub('_', detector)}.json"
+
+    def get(self, detector: str) -> dict[str, object]:
+        """Return the mutable payload for *detector*, loading it on first use."""
+        with self._lock:
+            payload = self._payloads.get(detector)
+            if payload is None:
+                payload, text = self._load(detector)
+                if text is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                self._payloads[detector] = payload
+                self._loaded_text[detector] = text
+            return payload
+
+    def _load(self, detector: str) -> tuple[dict[str, object], str | None]:
+        path = self.path_for(detector)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return {}, None
+        except OSError as exc:
+            logger.debug("Could not read detector cache %s: %s", path, exc)
+            return {}, None
+        try:
+            payload = json.loads(text)
+        except json.JSONDecodeError:
+            logger.debug("Discarding corrupt detector cache %s", path)
+            return {}, None
+        if not isinstance(payload, dict):
+            return {}, None
+        return payload, _dump(payload)
+
+    def adopt_legacy(self, review_cache: object) -> int:
+        """Move ``review_cache["detectors"]`` payloads into this store.
+
+        Payloads already on disk win over legacy copies.  Returns how many
+        payloads were adopted.
+        """
+        if not isinstance(review_cache, dict):
+            return 0
+        legacy = review_cache.pop(LEGACY_REVIEW_CACHE_KEY, None)
+        if not isinstance(legacy, dict):
+            return 0
+        adopted = 0
+        with self._lock:
+            for detector, payload in legacy.items():
+                if not isinstance(payload, dict) or detector in self._payloads:
+                    continue
+                if self.path_for(detector).exists():
+                    continue
+                self._payloads[detector] = payload
+                self._loaded_text[detector] = None
+                adopted += 1
+        return adopted
+
+    def flush(self) -> list[str]:
+        """Write every loaded payload that changed; return the detectors written."""
+        written: list[str] = []
+        with self._lock:
+            for detector, payload in self._payloads.items():
+                text = _dump(payload)
+                if text == self._loaded_text.get(detector):
+                    continue
+                if not payload and self._loaded_text.get(detector) is None:
+                    continue
+                try:
+                    safe_write_text(self.path_for(detector), text)
+                except OSError as exc:
+                    logger.debug("Could not write detector cache %s: %s", detector, exc)
+                    continue
+                self._loaded_text[detector] = text
+                written.append(detector)
+        return written
+
+
+__all__ = [
+    "DetectorCacheStore",
+    "LEGACY_REVIEW_CACHE_KEY",
+    "detector_cache_dir",
+]
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import fnmatch
+import os
 import re
+from collections.abc import Iterable
+from functools import lru_cache
 
 __all__ = [
+    "IgnoreMatcher",
+    "compile_ignore_patterns",
     "issue_in_scan_scope",
     "open_scope_breakdown",
     "path_scoped_issues",
@@ -17,6 +22,7 @@ __all__ = [
 ]
 
 from desloppify.base.discovery.file_paths import rel
+from desloppify.base.discovery.paths import get_project_root
 from desloppify.engine._state.issue_semantics import ensure_work_item_semantics
 from desloppify.engine._state.schema import (
     Issue,
@@ -77,6 +83,132 @@ def open_scope_breakdown(
     )
 
 
+class _IndexedLookup:
+    """First-index lookup for exact-prefix patterns grouped by length."""
+
+    def __init__(self) -> None:
+        self._by_length: dict[int, dict[str, int]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._by_length)
+
+    def add(self, key: str, index: int) -> None:
+        self._by_length.setdefault(len(key), {}).setdefault(key, index)
+
+    def first_prefix(self, value: str, *, boundary: str | None = None) -> int | None:
+        """Lowest index whose key is a prefix of *value*.
+
+        With *boundary*, the key must match all of *value* or be followed by
+        the boundary character.
+        """
+        best: int | None = None
+        value_len = len(value)
+        for length, keys in self._by_length.items():
+            if length > value_len:
+                continue
+            index = keys.get(value[:length])
+            if index is None:
+                continue
+            if boundary is not None and length < value_len and value[length] != boundary:
+                continue
+            if best is None or index < best:
+                best = index
+        return best
+
+
+def _first_glob_index(
+    regex: re.Pattern[str] | None, indexes: list[int], target: str
+) -> int | None:
+    if regex is None:
+        return None
+    match = regex.match(target)
+    if match is None:
+        return None
+    return indexes[match.lastindex - 1]
+
+
+class IgnoreMatcher:
+    """Compiled ignore-pattern list with the semantics of ``matched_ignore_pattern``.
+
+    Patterns are split into ID globs, file globs, ID prefixes and path
+    prefixes; globs are combined into a single regex per target and path
+    bases are resolved through ``rel()`` once at compile time. The first
+    matching pattern (in configured order) wins, and file-based lookups are
+    memoized per file.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns = tuple(patterns)
+        id_globs: list[tuple[int, str]] = []
+        file_globs: list[tuple[int, str]] = []
+        self._id_prefixes = _IndexedLookup()
+        self._path_bases = _IndexedLookup()
+        for index, pattern in enumerate(self.patterns):
+            if "*" in pattern:
+                (id_globs if "::" in pattern else file_globs).append((index, pattern))
+            elif "::" in pattern:
+                self._id_prefixes.add(pattern, index)
+            else:
+                for base in (pattern.rstrip("/"), rel(pattern).rstrip("/")):
+                    if base:
+                        self._path_bases.add(base, index)
+        self._id_glob_re, self._id_glob_indexes = self._compile_globs(id_globs)
+        self._file_glob_re, self._file_glob_indexes = self._compile_globs(file_globs)
+        self._file_memo: dict[str, int | None] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    @staticmethod
+    def _compile_globs(
+        globs: list[tuple[int, str]],
+    ) -> tuple[re.Pattern[str] | None, list[int]]:
+        if not globs:
+            return None, []
+        regex = re.compile(
+            "|".join(f"({fnmatch.translate(pattern)})" for _, pattern in globs)
+        )
+        return regex, [index for index, _ in globs]
+
+    def _first_file_index(self, file: str) -> int | None:
+        if file in self._file_memo:
+            return self._file_memo[file]
+        candidates = [
+            _first_glob_index(self._file_glob_re, self._file_glob_indexes, file),
+            self._path_bases.first_prefix(file, boundary="/") if self._path_bases else None,
+        ]
+        best = min((c for c in candidates if c is not None), default=None)
+        self._file_memo[file] = best
+        return best
+
+    def match(self, issue_id: str, file: str) -> str | None:
+        """Return the first configured pattern matching the issue, if any."""
+        if not self.patterns:
+            return None
+        candidates = [
+            self._first_file_index(file),
+            _first_glob_index(self._id_glob_re, self._id_glob_indexes, issue_id),
+            self._id_prefixes.first_prefix(issue_id) if self._id_prefixes else None,
+        ]
+        best = min((c for c in candidates if c is not None), default=None)
+        return None if best is None else self.patterns[best]
+
+
+@lru_cache(maxsize=32)
+def _compile_ignore_patterns_cached(
+    patterns: tuple[str, ...], project_root: str, cwd: str
+) -> IgnoreMatcher:
+    del project_root, cwd  # cache key only: rel() bases depend on both
+    return IgnoreMatcher(patterns)
+
+
+def compile_ignore_patterns(ignore_patterns: Iterable[str]) -> IgnoreMatcher:
+    """Return a shared compiled matcher for *ignore_patterns*."""
+    return _compile_ignore_patterns_cached(
+        tuple(ignore_patterns), str(get_project_root()), os.getcwd()
+    )
+
+
 def is_ignored(issue_id: str, file: str, ignore_patterns: list[str]) -> bool:
     """Check if a issue matches any ignore pattern (glob, ID prefix, or file path)."""
     return matched_ignore_pattern(issue_id, file, ignore_patterns) is not None
@@ -85,28 +217,14 @@ def is_ignored(issue_id: str, file: str, ignore_patterns: list[str]) -> bool:
 def matched_ignore_pattern(
     issue_id: str, file: str, ignore_patterns: list[str]
 ) -> str | None:
-    """Return the ignore pattern that matched, if any."""
-    for pattern in ignore_patterns:
-        if "*" in pattern:
-            target = issue_id if "::" in pattern else file
-            if fnmatch.fnmatch(target, pattern):
-                return pattern
-            continue
-
-        if "::" in pattern:
-            if issue_id.startswith(pattern):
-                return pattern
-            continue
-
-        raw_base = pattern.rstrip("/")
-        rel_base = rel(pattern).rstrip("/")
-        for base in (raw_base, rel_base):
-            if not base:
-                continue
-            if file == base or file.startswith(base + "/"):
-                return pattern
+    """Return the ignore pattern that matched, if any.
 
-    return None
+    Globs match the issue ID when they contain ``::`` and the file otherwise;
+    ``::`` patterns are ID prefixes; anything else is a file/directory path.
+    """
+    if not ignore_patterns:
+        return None
+    return compile_ignore_patterns(ignore_patterns).match(issue_id, file)
 
 
 def remove_ignored_issues(state: StateModel, pattern: str) -> int:
@@ -11,6 +11,7 @@ __all__ = [
 ]
 
 from desloppify.base.registry import DETECTORS
+from desloppify.engine._state.compaction import restore_tombstones
 from desloppify.engine._state.issue_semantics import ensure_work_item_semantics
 from desloppify.engine._state.merge_history import (
     _append_scan_history,
@@ -31,6 +32,7 @@ from desloppify.engine._state.schema import (
     utc_now,
     validate_state_invariants,
 )
+from desloppify.engine._state.views import bump_revision
 
 
 from desloppify.engine._state import _recompute_stats
@@ -148,6 +150,7 @@ class MergeScanOptions:
     subjective_integrity_target: float | None = None
     project_root: str | None = None
     zone_map: Any | None = None
+    scanned_files: list[str] | None = None
 
 
 def merge_scan(
@@ -179,6 +182,7 @@ def merge_scan(
         codebase_metrics=resolved_options.codebase_metrics,
     )
 
+    restore_tombstones(state, current_issues)
     existing = state["work_items"]
     ignore_patterns = (
         resolved_options.ignore
@@ -219,8 +223,11 @@ def merge_scan(
         exclude=resolved_options.exclude,
         project_root=resolved_options.project_root,
         zone_map=resolved_options.zone_map,
+        known_files=resolved_options.scanned_files,
     )
 
+    bump_revision(state)
+
     # Mark subjective assessments stale when mechanical issues changed.
     changed_detectors = upsert_changed | resolve_changed
     if changed_detectors:
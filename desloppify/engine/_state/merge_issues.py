@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterable
 
-from desloppify.base.discovery.file_paths import matches_exclusion
+from desloppify.base.discovery.file_paths import compile_exclusions
 from desloppify.engine.policy.zones import should_skip_issue
-from desloppify.engine._state.filtering import matched_ignore_pattern
+from desloppify.engine._state.filtering import compile_ignore_patterns
 from desloppify.engine._state.issue_semantics import (
     is_import_only_issue,
     is_assessment_request,
@@ -53,6 +54,33 @@ def find_suspect_detectors(
     return suspect
 
 
+class _FileExistence:
+    """Existence checks answered from the scan's own file set.
+
+    Paths the scan did not discover fall back to one cached directory listing
+    per parent directory instead of a ``stat`` per issue.
+    """
+
+    def __init__(self, project_root: str, known_files: Iterable[str] = ()) -> None:
+        self._root = project_root
+        self._known = frozenset(known_files)
+        self._listings: dict[str, frozenset[str]] = {}
+
+    def exists(self, file_path: str) -> bool:
+        file_path = file_path.rstrip("/")
+        if file_path in self._known:
+            return True
+        parent, name = os.path.split(file_path)
+        listing = self._listings.get(parent)
+        if listing is None:
+            try:
+                listing = frozenset(os.listdir(os.path.join(self._root, parent)))
+            except OSError:
+                listing = frozenset()
+            self._listings[parent] = listing
+        return name in listing
+
+
 def _mark_scan_verified(
     issue: dict,
     now: str,
@@ -85,6 +113,7 @@ def verify_disappeared(
     exclude: tuple[str, ...] = (),
     project_root: str | None = None,
     zone_map=None,
+    known_files: Iterable[str] | None = None,
 ) -> tuple[int, int, int, set[str]]:
     """Update scan corroboration for issues absent from scan.
 
@@ -93,9 +122,26 @@ def verify_disappeared(
     change an open issue to resolved — *unless* the source file no longer exists
     on disk, in which case the issue is auto-resolved.  Manually resolved items
     can be marked as scan-verified when they remain absent.
+
+    *known_files* is the scan's discovered file set (project-root relative);
+    when omitted, the zone map's classified files are used.
     """
     resolved = skipped_other_lang = resolved_out_of_scope = 0
     resolved_detectors: set[str] = set()
+    exclude_matcher = compile_exclusions(exclude)
+    if known_files is None and zone_map is not None and hasattr(zone_map, "all_files"):
+        known_files = zone_map.all_files()
+    existence = (
+        _FileExistence(project_root, known_files or ()) if project_root else None
+    )
+    zone_skips: dict[tuple[str, str], bool] = {}
+
+    def _zone_skips(file_path: str, detector: str) -> bool:
+        key = (file_path, detector)
+        skip = zone_skips.get(key)
+        if skip is None:
+            skip = zone_skips[key] = should_skip_issue(zone_map, file_path, detector)
+        return skip
 
     for issue_id, previous in existing.items():
         previous_status = previous.get("status")
@@ -136,7 +182,7 @@ def verify_disappeared(
                     resolved_out_of_scope += 1
                 continue
 
-        if exclude and any(matches_exclusion(previous["file"], ex) for ex in exclude):
+        if exclude_matcher and exclude_matcher.matches(previous["file"]):
             continue
 
         if previous_status == "open":
@@ -144,15 +190,13 @@ def verify_disappeared(
             # the issue cannot be actionable for a deleted file.
             file_path = previous.get("file", "")
             file_deleted = False
-            if project_root and file_path and file_path != ".":
-                file_deleted = not os.path.exists(
-                    os.path.join(project_root, file_path)
-                )
+            if existence is not None and file_path and file_path != ".":
+                file_deleted = not existence.exists(file_path)
             # Auto-resolve if zone policy now says this detector should be
             # skipped for this file's zone (e.g. test_coverage on test files).
             # Bug reported by @claytona500 in PR #478.
             detector = previous.get("detector", "")
-            if zone_map and file_path and should_skip_issue(zone_map, file_path, detector):
+            if zone_map and file_path and _zone_skips(file_path, detector):
                 previous["status"] = "auto_resolved"
                 previous["resolved_at"] = now
                 previous["note"] = f"Auto-resolved: zone policy now skips {detector} for this file"
@@ -201,13 +245,14 @@ def upsert_issues(
     new_count = reopened_count = ignored_count = 0
     by_detector: dict[str, int] = {}
     changed_detectors: set[str] = set()
+    ignore_matcher = compile_ignore_patterns(ignore)
 
     for issue in current_issues:
         issue_id = issue["id"]
         detector = issue.get("detector", "unknown")
         current_ids.add(issue_id)
         by_detector[detector] = by_detector.get(detector, 0) + 1
-        matched_ignore = matched_ignore_pattern(issue_id, issue["file"], ignore)
+        matched_ignore = ignore_matcher.match(issue_id, issue["file"])
         if matched_ignore:
             ignored_count += 1
 
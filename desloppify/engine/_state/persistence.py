@@ -26,7 +26,7 @@ __all__ = [
     "state_lock",
 ]
 
-from desloppify.base.discovery.file_paths import safe_write_text
+from desloppify.base.discovery.file_paths import safe_write_chunks
 from desloppify.base.text_utils import is_numeric
 from desloppify.engine._plan.persistence import load_plan as load_plan_state
 from desloppify.engine._plan.persistence import plan_path_for_state
@@ -41,10 +41,10 @@ from desloppify.engine._state.schema import (
     empty_state,
     ensure_state_defaults,
     get_state_file,
-    json_default,
     scan_source,
     validate_state_invariants,
 )
+from desloppify.engine._state.stream import iter_state_json, pretty_state_default
 
 logger = logging.getLogger(__name__)
 
@@ -276,8 +276,14 @@ def save_state(
     path: Path | None = None,
     *,
     subjective_integrity_target: float | None = None,
+    pretty: bool | None = None,
 ) -> None:
-    """Recompute stats/score and save to disk atomically."""
+    """Recompute stats/score and save to disk atomically.
+
+    The document is streamed to the temp file section by section. ``pretty``
+    selects indented output; by default it follows ``DESLOPPIFY_STATE_FORMAT``
+    (``compact`` disables indentation).
+    """
     ensure_state_defaults(state)
     _recompute_stats(
         state,
@@ -292,12 +298,6 @@ def save_state(
     state_path = path or _default_state_file()
     state_path.parent.mkdir(parents=True, exist_ok=True)
 
-    serialized_state = {
-        key: value for key, value in state.items() if key != "issues"
-    }
-    serialized_state["work_items"] = dict((state.get("work_items") or state.get("issues", {})))
-    content = json.dumps(serialized_state, indent=2, default=json_default) + "\n"
-
     if state_path.exists():
         backup = state_path.with_suffix(".json.bak")
         try:
@@ -309,8 +309,10 @@ def save_state(
                 backup_ex,
             )
 
+    if pretty is None:
+        pretty = pretty_state_default()
     try:
-        safe_write_text(state_path, content)
+        safe_write_chunks(state_path, iter_state_json(state, pretty=pretty))
     except OSError as ex:
         print(f"  Warning: Could not save state: {ex}", file=sys.stderr)
         raise
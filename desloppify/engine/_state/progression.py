@@ -3,6 +3,12 @@
 Records boundary events (marker flips, phase transitions, scan completions)
 to ``.desloppify/progression.jsonl``.  Each line is a self-contained JSON
 object with a discriminated ``event_type`` + ``payload``.
+
+A sidecar index (``progression.jsonl.idx``) maps each event type to the byte
+offset of its latest line so "latest event of type X" queries do not parse
+the log.  When the index is stale, queries fall back to reading the log
+backwards in blocks.  Trimming streams older lines into rotated segment
+files (``progression.<n>.jsonl``) instead of rewriting the log in memory.
 """
 
 from __future__ import annotations
@@ -11,10 +17,13 @@ import json
 import logging
 import os
 import sys
+import tempfile
 import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+from desloppify.base.discovery.file_paths import safe_write_text
 from desloppify.engine._plan.constants import is_synthetic_id
 from desloppify.engine._state.schema import get_state_dir, utc_now
 
@@ -22,7 +31,10 @@ logger = logging.getLogger(__name__)
 
 PROGRESSION_VERSION = 1
 _MAX_LINES = 2000
+_MAX_SEGMENTS = 3
 _LOCK_TIMEOUT = 2.0
+_REVERSE_BLOCK_SIZE = 64 * 1024
+_INDEX_VERSION = 1
 
 
 # ---------------------------------------------------------------------------
@@ -60,9 +72,146 @@ def load_progression(path: Path | None = None) -> list[dict[str, Any]]:
     return events
 
 
+def _iter_raw_lines_reversed(
+    path: Path,
+    *,
+    block_size: int = _REVERSE_BLOCK_SIZE,
+) -> Iterator[bytes]:
+    """Yield raw lines of *path* from last to first, reading fixed-size blocks."""
+    with open(path, "rb") as fh:
+        fh.seek(0, os.SEEK_END)
+        position = fh.tell()
+        tail = b""
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            fh.seek(position)
+            lines = (fh.read(read_size) + tail).split(b"\n")
+            tail = lines.pop(0)
+            yield from reversed(lines)
+        yield tail
+
+
+def iter_progression_reversed(path: Path | None = None) -> Iterator[dict[str, Any]]:
+    """Yield progression events newest-first without loading the whole log."""
+    target = path or progression_path()
+    try:
+        for raw_line in _iter_raw_lines_reversed(target):
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except (json.JSONDecodeError, ValueError):
+                continue
+            if isinstance(event, dict):
+                yield event
+    except FileNotFoundError:
+        return
+    except OSError as exc:
+        logger.warning("Could not read progression log: %s", exc)
+
+
+def _index_path(target: Path) -> Path:
+    return target.with_suffix(".jsonl.idx")
+
+
+def _load_index(target: Path) -> dict[str, Any] | None:
+    """Return the sidecar index when it still describes *target* exactly."""
+    try:
+        index = json.loads(_index_path(target).read_text(encoding="utf-8"))
+        size = target.stat().st_size
+    except (OSError, json.JSONDecodeError, ValueError):
+        return None
+    if (
+        not isinstance(index, dict)
+        or index.get("version") != _INDEX_VERSION
+        or index.get("size") != size
+        or not isinstance(index.get("last"), dict)
+    ):
+        return None
+    return index
+
+
+def _write_index(target: Path, *, size: int, last: dict[str, int]) -> None:
+    payload = {"version": _INDEX_VERSION, "size": size, "last": last}
+    try:
+        safe_write_text(
+            _index_path(target), json.dumps(payload, separators=(",", ":"))
+        )
+    except OSError as exc:
+        logger.debug("Could not write progression index: %s", exc)
+
+
+def _scan_index_offsets(target: Path) -> tuple[int, dict[str, int]]:
+    """Stream *target* forward and collect the last offset per event type."""
+    last: dict[str, int] = {}
+    offset = 0
+    with open(target, "rb") as fh:
+        for raw_line in fh:
+            event_type = _event_type_of(raw_line)
+            if event_type is not None:
+                last[event_type] = offset
+            offset += len(raw_line)
+    return offset, last
+
+
+def _event_type_of(raw_line: bytes) -> str | None:
+    try:
+        event = json.loads(raw_line)
+    except (json.JSONDecodeError, ValueError):
+        return None
+    event_type = event.get("event_type") if isinstance(event, dict) else None
+    return event_type if isinstance(event_type, str) else None
+
+
+def _rebuild_index(target: Path) -> None:
+    try:
+        size, last = _scan_index_offsets(target)
+    except OSError as exc:
+        logger.debug("Could not rebuild progression index: %s", exc)
+        return
+    _write_index(target, size=size, last=last)
+
+
+def _read_event_at(target: Path, offset: int) -> dict[str, Any] | None:
+    try:
+        with open(target, "rb") as fh:
+            fh.seek(offset)
+            event = json.loads(fh.readline())
+    except (OSError, json.JSONDecodeError, ValueError):
+        return None
+    return event if isinstance(event, dict) else None
+
+
+def latest_progression_event(
+    event_type: str,
+    path: Path | None = None,
+) -> dict[str, Any] | None:
+    """Return the newest event of *event_type* (O(1) with a fresh index)."""
+    target = path or progression_path()
+    index = _load_index(target)
+    if index is not None:
+        offset = index["last"].get(event_type)
+        if offset is None:
+            return None
+        event = _read_event_at(target, offset)
+        if event is not None and event.get("event_type") == event_type:
+            return event
+    for event in iter_progression_reversed(target):
+        if event.get("event_type") == event_type:
+            return event
+    return None
+
+
 def last_plan_checkpoint_timestamp(path: Path | None = None) -> str | None:
     """Return the most recent plan-checkpoint timestamp from the progression log."""
-    for event in reversed(load_progression(path)):
+    latest = latest_progression_event("plan_checkpoint", path)
+    if latest is None:
+        return None
+    if isinstance(latest.get("timestamp"), str):
+        return latest["timestamp"]
+    for event in iter_progression_reversed(path):
         if event.get("event_type") != "plan_checkpoint":
             continue
         timestamp = event.get("timestamp")
@@ -79,7 +228,9 @@ def append_progression_event(
     """Append a single event to the progression log with advisory file lock."""
     target = path or progression_path()
     target.parent.mkdir(parents=True, exist_ok=True)
-    line = json.dumps(event, separators=(",", ":"), default=str) + "\n"
+    line = (json.dumps(event, separators=(",", ":"), default=str) + "\n").encode(
+        "utf-8"
+    )
 
     lock_fd: int | None = None
     lock_path = target.with_suffix(".jsonl.lock")
@@ -96,8 +247,18 @@ def append_progression_event(
         )
 
     try:
-        with open(target, "a", encoding="utf-8") as fh:
+        index = _load_index(target) if target.exists() else None
+        with open(target, "ab") as fh:
+            offset = fh.tell()
             fh.write(line)
+        event_type = event.get("event_type")
+        if index is None and offset > 0:
+            _rebuild_index(target)
+        else:
+            last = index["last"] if index is not None else {}
+            if isinstance(event_type, str):
+                last[event_type] = offset
+            _write_index(target, size=offset + len(line), last=last)
     except OSError as exc:
         logger.warning("Failed to append progression event: %s", exc)
     finally:
@@ -111,16 +272,61 @@ def append_progression_event(
         _trim_if_needed(target)
 
 
+def _segment_path(path: Path, number: int) -> Path:
+    return path.with_name(f"{path.stem}.{number}{path.suffix}")
+
+
+def _next_segment_path(path: Path) -> Path:
+    """Return the next free segment path, dropping segments past retention."""
+    numbers = sorted(
+        int(candidate.name[len(path.stem) + 1 : -len(path.suffix)])
+        for candidate in path.parent.glob(f"{path.stem}.*{path.suffix}")
+        if candidate.name[len(path.stem) + 1 : -len(path.suffix)].isdigit()
+    )
+    for stale in numbers[: max(0, len(numbers) - _MAX_SEGMENTS + 1)]:
+        try:
+            _segment_path(path, stale).unlink()
+        except OSError:
+            pass
+    return _segment_path(path, (numbers[-1] + 1) if numbers else 1)
+
+
 def _trim_if_needed(path: Path, max_lines: int = _MAX_LINES) -> None:
-    """Keep the last *max_lines* when the file grows too large."""
+    """Keep the last *max_lines*, rotating older lines into a segment file.
+
+    Streams the log twice (count, then split) so memory stays constant
+    regardless of log size; the active log is replaced atomically.
+    """
     try:
-        with open(path, encoding="utf-8") as fh:
-            lines = fh.readlines()
-        if len(lines) <= max_lines:
+        with open(path, "rb") as fh:
+            total = sum(1 for _ in fh)
+        excess = total - max_lines
+        if excess <= 0:
             return
-        trimmed = lines[-max_lines:]
-        with open(path, "w", encoding="utf-8") as fh:
-            fh.writelines(trimmed)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        last: dict[str, int] = {}
+        offset = 0
+        try:
+            with (
+                open(path, "rb") as src,
+                open(_next_segment_path(path), "wb") as segment,
+                os.fdopen(fd, "wb") as kept,
+            ):
+                for lineno, raw_line in enumerate(src):
+                    if lineno < excess:
+                        segment.write(raw_line)
+                        continue
+                    kept.write(raw_line)
+                    event_type = _event_type_of(raw_line)
+                    if event_type is not None:
+                        last[event_type] = offset
+                    offset += len(raw_line)
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        _write_index(path, size=offset, last=last)
     except OSError as exc:
         logger.warning("Progression trim failed: %s", exc)
 
@@ -717,7 +923,9 @@ __all__ = [
     "build_scan_complete_event",
     "build_scan_preflight_event",
     "build_triage_complete_event",
+    "iter_progression_reversed",
     "last_plan_checkpoint_timestamp",
+    "latest_progression_event",
     "load_progression",
     "maybe_append_entered_planning",
     "maybe_append_execution_drain",
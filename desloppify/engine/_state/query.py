@@ -0,0 +1,231 @@
+"""In-memory issue query layer with secondary indexes.
+
+Interactive commands (``show``, ``next``, ``backlog``) only ever surface a
+small slice of ``work_items``.  ``IssueIndex`` builds lightweight secondary
+indexes (detector, status, zone, tier, ID head, file-path trie) in one pass
+so callers can narrow candidates with set operations before materializing
+queue items, instead of filtering every issue in Python.  ``for_state``
+shares one index per state revision (see ``views``), so repeated queue
+builds within a command reuse the indexes built by the first.
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+from collections.abc import Callable, Collection, Mapping
+from functools import cached_property
+from typing import Any, TypeVar
+
+from desloppify.engine._state.schema import Issue, StateModel
+from desloppify.engine._state.views import memoized_view
+
+_T = TypeVar("_T")
+_HEX_SCOPE_RE = re.compile(r"[0-9a-f]+")
+
+
+class _PathNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PathNode] = {}
+        self.ids: set[str] = set()
+
+
+class _PathTrie:
+    """File-path trie keyed by ``/``-separated components."""
+
+    def __init__(self) -> None:
+        self._root = _PathNode()
+
+    def add(self, file_path: str, issue_id: str) -> None:
+        node = self._root
+        for component in file_path.split("/"):
+            node = node.children.setdefault(component, _PathNode())
+        node.ids.add(issue_id)
+
+    def _node(self, path: str) -> _PathNode | None:
+        node: _PathNode | None = self._root
+        for component in path.split("/"):
+            node = node.children.get(component)
+            if node is None:
+                return None
+        return node
+
+    def exact(self, file_path: str) -> set[str]:
+        node = self._node(file_path)
+        return set(node.ids) if node is not None else set()
+
+    def below(self, prefix: str) -> set[str]:
+        """IDs whose file starts with ``prefix + "/"``."""
+        node = self._node(prefix)
+        found: set[str] = set()
+        if node is None:
+            return found
+        stack = list(node.children.values())
+        while stack:
+            current = stack.pop()
+            found.update(current.ids)
+            stack.extend(current.children.values())
+        return found
+
+
+class IssueIndex:
+    """Secondary indexes over a work-item map (read-only snapshot).
+
+    Each index is built on first use, so a status-only selection does not
+    pay for the path trie or the detector/zone/tier maps.
+    """
+
+    def __init__(self, issues: dict[str, Issue]) -> None:
+        self.issues = issues
+
+    def _group_by(self, key: Callable[[str, Issue], Any]) -> dict[Any, set[str]]:
+        groups: dict[Any, set[str]] = {}
+        for issue_id, issue in self.issues.items():
+            value = key(issue_id, issue)
+            if value is not None:
+                groups.setdefault(value, set()).add(issue_id)
+        return groups
+
+    @cached_property
+    def _position(self) -> dict[str, int]:
+        return {issue_id: position for position, issue_id in enumerate(self.issues)}
+
+    @cached_property
+    def by_detector(self) -> dict[str, set[str]]:
+        return self._group_by(lambda _id, issue: str(issue.get("detector", "")))
+
+    @cached_property
+    def by_status(self) -> dict[str, set[str]]:
+        return self._group_by(lambda _id, issue: str(issue.get("status", "open")))
+
+    @cached_property
+    def by_zone(self) -> dict[str, set[str]]:
+        return self._group_by(lambda _id, issue: str(issue.get("zone", "")))
+
+    @cached_property
+    def by_tier(self) -> dict[int, set[str]]:
+        return self._group_by(
+            lambda _id, issue: issue.get("tier")
+            if isinstance(issue.get("tier"), int)
+            else None
+        )
+
+    @cached_property
+    def by_id_head(self) -> dict[str, set[str]]:
+        return self._group_by(lambda issue_id, _issue: issue_id.split("::", 1)[0])
+
+    @cached_property
+    def _paths(self) -> _PathTrie:
+        trie = _PathTrie()
+        for issue_id, issue in self.issues.items():
+            trie.add(str(issue.get("file", "")), issue_id)
+        return trie
+
+    @classmethod
+    def from_state(cls, state: StateModel) -> IssueIndex:
+        return cls(state.get("work_items") or state.get("issues", {}))
+
+    @classmethod
+    def for_state(cls, state: StateModel) -> IssueIndex:
+        """Index over *state*, shared until its revision changes."""
+        return memoized_view(state, "issue_index", lambda: cls.from_state(state))
+
+    def __len__(self) -> int:
+        return len(self.issues)
+
+    def ids_in_scan_scope(self, scan_path: str | None) -> set[str] | None:
+        """IDs matching ``issue_in_scan_scope``; ``None`` means unrestricted."""
+        if not scan_path or scan_path == ".":
+            return None
+        return (
+            self._paths.below(scan_path.rstrip("/"))
+            | self._paths.exact(scan_path)
+            | self._paths.exact(".")
+        )
+
+    def ids_for_scope(self, scope: str | None) -> set[str] | None:
+        """Superset of issue IDs that ``scope_matches`` could accept.
+
+        Returns ``None`` when the pattern cannot be narrowed by an index
+        (globs and hash suffixes), in which case every issue is a candidate.
+        """
+        if not scope or "*" in scope:
+            return None
+        if "::" in scope:
+            return set(self.by_id_head.get(scope.split("::", 1)[0], ()))
+        lowered = scope.lower()
+        if len(lowered) >= 8 and _HEX_SCOPE_RE.fullmatch(lowered):
+            return None
+        return (
+            set(self.by_detector.get(scope, ()))
+            | self._paths.exact(scope)
+            | self._paths.below(scope.rstrip("/"))
+        )
+
+    def select(
+        self,
+        *,
+        status: str | None = None,
+        detector: str | None = None,
+        zone: str | None = None,
+        tier: int | None = None,
+        scope: str | None = None,
+        scan_path: str | None = None,
+    ) -> Mapping[str, Issue]:
+        """Return issues passing every given filter, in original map order.
+
+        ``status="all"`` (or ``None``) disables status filtering.  ``scope``
+        narrows to a candidate superset only; callers still apply their own
+        exact matching.  When nothing is filtered out the indexed map itself
+        is returned, so treat the result as read-only.
+        """
+        constraints: list[Collection[str]] = []
+        if status and status != "all":
+            constraints.append(self.by_status.get(status, ()))
+        if detector is not None:
+            constraints.append(self.by_detector.get(detector, ()))
+        if zone is not None:
+            constraints.append(self.by_zone.get(zone, ()))
+        if tier is not None:
+            constraints.append(self.by_tier.get(tier, ()))
+        for narrowed in (self.ids_for_scope(scope), self.ids_in_scan_scope(scan_path)):
+            if narrowed is not None:
+                constraints.append(narrowed)
+        if not constraints:
+            return self.issues
+        constraints.sort(key=len)
+        selected = set(constraints[0])
+        for ids in constraints[1:]:
+            selected.intersection_update(ids)
+            if not selected:
+                break
+        if len(selected) == len(self.issues):
+            return self.issues
+        if len(selected) * 8 > len(self.issues):
+            # Large selections: one ordered pass beats sorting by position.
+            return {
+                issue_id: issue
+                for issue_id, issue in self.issues.items()
+                if issue_id in selected
+            }
+        position = self._position
+        return {
+            issue_id: self.issues[issue_id]
+            for issue_id in sorted(selected, key=position.__getitem__)
+        }
+
+
+def top_k(items: list[_T], k: int | None, *, key: Callable[[_T], Any]) -> list[_T]:
+    """Return the *k* smallest items by *key* (stable), or all items sorted.
+
+    Uses a bounded heap when only a small prefix is needed, which avoids a
+    full sort of large queues for ``next``-style views.
+    """
+    if k is None or k <= 0 or k >= len(items):
+        return sorted(items, key=key)
+    return heapq.nsmallest(k, items, key=key)
+
+
+__all__ = ["IssueIndex", "top_k"]
@@ -19,6 +19,7 @@ from desloppify.engine._state.schema import (
     utc_now,
     validate_state_invariants,
 )
+from desloppify.engine._state.views import bump_revision
 
 
 from desloppify.engine._state import _recompute_stats
@@ -199,6 +200,7 @@ def resolve_issues(
         _refresh_original_wontfix(issue)
         resolved.append(issue["id"])
         resolved_issues.append(issue)
+    bump_revision(state)
 
     _mark_stale_assessments_on_review_resolve(
         state,
@@ -13,6 +13,7 @@ from desloppify.engine._state.schema_types_issues import (
     ScoreConfidenceModel,
     StateStats,
     TierStats,
+    Tombstone,
 )
 from desloppify.engine._state.schema_types_review import (
     AssessmentImportAuditEntry,
@@ -52,6 +53,7 @@ class StateModel(TypedDict, total=False):
     stats: Required[StateStats]
     work_items: Required[dict[str, WorkItem]]
     issues: NotRequired[dict[str, WorkItem]]
+    tombstones: dict[str, Tombstone]
     dimension_scores: dict[str, DimensionScore]
     scan_path: str | None
     tool_hash: str
@@ -105,6 +107,7 @@ __all__ = [
     "Issue",
     "WorkItem",
     "TierStats",
+    "Tombstone",
     "StateStats",
     "DimensionScore",
     "ScoreConfidenceDetector",
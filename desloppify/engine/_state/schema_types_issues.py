@@ -64,6 +64,27 @@ class WorkItem(TypedDict):
 Issue = WorkItem
 
 
+class Tombstone(TypedDict, total=False):
+    """Compact record of an archived resolved work item.
+
+    Keeps only the fields scoring, stats and reopen handling read; the full
+    record lives in the append-only archive file.
+    """
+
+    detector: str
+    file: str
+    status: Status
+    tier: int
+    confidence: str
+    zone: str
+    lang: str
+    suppressed: bool
+    detail: dict[str, Any]
+    first_seen: str
+    resolved_at: str
+    reopen_count: int
+
+
 class TierStats(TypedDict, total=False):
     open: int
     fixed: int
@@ -144,6 +165,7 @@ class ScanHistoryEntry(TypedDict, total=False):
 __all__ = [
     "WorkItem",
     "Issue",
+    "Tombstone",
     "TierStats",
     "StateStats",
     "DimensionScore",
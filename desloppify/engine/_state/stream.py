@@ -0,0 +1,94 @@
+"""Streaming JSON encoder for state files.
+
+``save_state`` used to build the whole document with one ``json.dumps`` call
+(plus a shallow copy of ``work_items``), which for large projects meant
+transient strings of hundreds of megabytes.  :func:`iter_state_json` yields
+the same document section by section and issue by issue instead, so only one
+issue is encoded at a time.
+
+Pretty mode is byte-for-byte identical to ``json.dumps(..., indent=2)``;
+compact mode uses ``(",", ":")`` separators and no newlines.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any
+
+from desloppify.engine._state.schema import json_default
+
+STATE_FORMAT_ENV = "DESLOPPIFY_STATE_FORMAT"
+_INDENT = "  "
+# Sections written one entry at a time; they grow with the issue count.
+_STREAMED_SECTIONS = frozenset({"work_items", "tombstones"})
+_PRETTY = json.JSONEncoder(indent=2, default=json_default)
+_COMPACT = json.JSONEncoder(separators=(",", ":"), default=json_default)
+
+
+def pretty_state_default() -> bool:
+    """Whether state files are written indented (``DESLOPPIFY_STATE_FORMAT``)."""
+    return os.getenv(STATE_FORMAT_ENV, "").strip().lower() != "compact"
+
+
+def _encode(value: Any, *, pretty: bool, depth: int) -> str:
+    if not pretty:
+        return _COMPACT.encode(value)
+    text = _PRETTY.encode(value)
+    # JSON escapes newlines inside strings, so every raw newline is layout.
+    return text.replace("\n", "\n" + _INDENT * depth) if depth else text
+
+
+def _iter_object(
+    items: Iterator[tuple[str, Any]],
+    encode_value: Callable[[str, Any], Iterator[str]],
+    *,
+    pretty: bool,
+    depth: int,
+) -> Iterator[str]:
+    """Yield a JSON object from ``(key, value)`` pairs, one member at a time."""
+    key_sep = ": " if pretty else ":"
+    member_prefix = "\n" + _INDENT * (depth + 1) if pretty else ""
+    first = True
+    for key, value in items:
+        yield ("{" if first else ",") + member_prefix
+        yield json.dumps(key) + key_sep
+        yield from encode_value(key, value)
+        first = False
+    if first:
+        yield "{}"
+        return
+    yield ("\n" + _INDENT * depth if pretty else "") + "}"
+
+
+def iter_state_json(state: Mapping[str, Any], *, pretty: bool = True) -> Iterator[str]:
+    """Yield the serialized state document in chunks.
+
+    ``issues`` is written as ``work_items`` (in place when ``work_items`` is
+    present, otherwise last), matching the persisted state layout.
+    """
+    work_items = state.get("work_items") or state.get("issues", {})
+
+    def _sections() -> Iterator[tuple[str, Any]]:
+        for key, value in state.items():
+            if key == "issues":
+                continue
+            yield key, work_items if key == "work_items" else value
+        if "work_items" not in state:
+            yield "work_items", work_items
+
+    def _issue(_issue_id: str, issue: Any) -> Iterator[str]:
+        yield _encode(issue, pretty=pretty, depth=2)
+
+    def _section(key: str, value: Any) -> Iterator[str]:
+        if key in _STREAMED_SECTIONS and isinstance(value, Mapping):
+            yield from _iter_object(iter(value.items()), _issue, pretty=pretty, depth=1)
+        else:
+            yield _encode(value, pretty=pretty, depth=1)
+
+    yield from _iter_object(_sections(), _section, pretty=pretty, depth=0)
+    yield "\n"
+
+
+__all__ = ["STATE_FORMAT_ENV", "iter_state_json", "pretty_state_default"]
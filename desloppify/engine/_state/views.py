@@ -0,0 +1,149 @@
+"""Revision-stamped, memoized derived views over the in-memory state.
+
+Several consumers within one command (score recompute, narrative, concern
+generation, queue snapshot, integrity breakdowns) derive the same views from
+``work_items``: open issues, open issues grouped by file, issues within the
+scan path.  Each state carries a monotonically increasing revision that
+mutators bump via :func:`bump_revision`; views are built once per revision
+and shared by every consumer in the process.
+
+The revision lives in a small side registry keyed by state identity rather
+than in the state dict, so it is never persisted.  As a guard against
+mutations that forget to bump, memoized views are also keyed by the identity
+and size of the issue maps, so replacing ``work_items`` or adding/removing
+issues always invalidates.
+
+Views are shared objects: callers must treat them as read-only.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+from desloppify.engine._state.schema import Issue, StateModel
+from desloppify.engine._state.scope import path_scoped_issues
+
+_T = TypeVar("_T")
+_MAX_TRACKED_STATES = 8
+
+
+class _StateViews:
+    __slots__ = ("state", "revision", "views")
+
+    def __init__(self, state: StateModel) -> None:
+        # Holding the state keeps its id() from being reused while tracked.
+        self.state = state
+        self.revision = 0
+        self.views: dict[Hashable, tuple[tuple, Any]] = {}
+
+
+_registry: OrderedDict[int, _StateViews] = OrderedDict()
+_lock = threading.Lock()
+
+
+def _entry(state: StateModel) -> _StateViews:
+    key = id(state)
+    entry = _registry.get(key)
+    if entry is None or entry.state is not state:
+        entry = _StateViews(state)
+        _registry[key] = entry
+        while len(_registry) > _MAX_TRACKED_STATES:
+            _registry.popitem(last=False)
+    else:
+        _registry.move_to_end(key)
+    return entry
+
+
+def _work_items(state: StateModel) -> dict[str, Issue]:
+    return state.get("work_items") or state.get("issues", {})
+
+
+def _fingerprint(state: StateModel, revision: int) -> tuple:
+    work_items = _work_items(state)
+    tombstones = state.get("tombstones")
+    return (
+        revision,
+        id(work_items),
+        len(work_items),
+        id(tombstones),
+        len(tombstones or ()),
+    )
+
+
+def state_revision(state: StateModel) -> int:
+    """Return the in-memory revision of *state* (0 until first bumped)."""
+    with _lock:
+        return _entry(state).revision
+
+
+def bump_revision(state: StateModel) -> int:
+    """Mark *state* as mutated, invalidating its derived views."""
+    with _lock:
+        entry = _entry(state)
+        entry.revision += 1
+        entry.views.clear()
+        return entry.revision
+
+
+def memoized_view(state: StateModel, key: Hashable, build: Callable[[], _T]) -> _T:
+    """Return ``build()`` memoized under *key* for the current revision."""
+    with _lock:
+        entry = _entry(state)
+        fingerprint = _fingerprint(state, entry.revision)
+        cached = entry.views.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+    value = build()
+    with _lock:
+        if entry.revision == fingerprint[0]:
+            entry.views[key] = (fingerprint, value)
+    return value
+
+
+def open_issues(state: StateModel) -> list[Issue]:
+    """Open work items, in map order."""
+    return memoized_view(
+        state,
+        "open_issues",
+        lambda: [
+            issue
+            for issue in _work_items(state).values()
+            if isinstance(issue, dict) and issue.get("status") == "open"
+        ],
+    )
+
+
+def open_issues_by_file(state: StateModel) -> dict[str, list[Issue]]:
+    """Open work items grouped by file, excluding holistic (file='.') issues."""
+
+    def build() -> dict[str, list[Issue]]:
+        by_file: dict[str, list[Issue]] = {}
+        for issue in open_issues(state):
+            file = issue.get("file", "")
+            if file and file != ".":
+                by_file.setdefault(file, []).append(issue)
+        return by_file
+
+    return memoized_view(state, "open_issues_by_file", build)
+
+
+def scoped_issues(state: StateModel, scan_path: str | None) -> dict[str, Issue]:
+    """Work items within *scan_path*."""
+    return memoized_view(
+        state,
+        ("scoped_issues", scan_path),
+        lambda: path_scoped_issues(_work_items(state), scan_path),
+    )
+
+
+__all__ = [
+    "bump_revision",
+    "memoized_view",
+    "open_issues",
+    "open_issues_by_file",
+    "scoped_issues",
+    "state_revision",
+]
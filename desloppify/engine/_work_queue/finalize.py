@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from desloppify.engine._state.query import top_k
 from desloppify.engine._work_queue.models import QueueBuildOptions, WorkQueueResult
 from desloppify.engine._work_queue.plan_order import (
     enrich_plan_metadata,
@@ -11,10 +12,12 @@ from desloppify.engine._work_queue.plan_order import (
 )
 from desloppify.engine._work_queue.plan_order import new_item_ids as _new_item_ids
 from desloppify.engine._work_queue.ranking import (
-    enrich_with_impact,
+    dimension_impact_table,
     group_queue_items,
     item_explain,
     item_sort_key,
+    stamp_impact,
+    stamp_primary_commands,
 )
 from desloppify.engine._work_queue.types import WorkQueueItem
 from desloppify.engine._state.schema import StateModel
@@ -27,16 +30,31 @@ def finalize_queue(
     plan: dict | None,
     opts: QueueBuildOptions,
 ) -> WorkQueueResult:
-    """Apply ranking, plan ordering, limits, and explain metadata."""
-    enrich_with_impact(items, state.get("dimension_scores", {}))
+    """Apply ranking, plan ordering, limits, and explain metadata.
+
+    Impact only feeds the natural ranking, so it is computed up front just for
+    items without a plan position; display-only fields (impact for planned
+    items, ``primary_command``) are stamped on the visible window afterwards.
+    """
+    dim_impact = dimension_impact_table(state.get("dimension_scores", {}))
 
     new_ids, skipped = _plan_presort(items, state, plan)
-    items.sort(key=item_sort_key)
+    ranked = [item for item in items if item.get("_plan_position") is None]
+    stamp_impact(ranked, dim_impact)
+    ranked_ids = {id(item) for item in ranked}
+    total = len(items)
+    limit = opts.count if opts.count is not None and opts.count > 0 else None
+    # Heap-select the visible window instead of sorting the whole queue.
+    items = top_k(items, limit, key=item_sort_key)
+    if plan and opts.include_skipped:
+        total += len(skipped)
     _plan_postsort(items, skipped, plan, opts)
 
-    total = len(items)
-    if opts.count is not None and opts.count > 0:
-        items = items[:opts.count]
+    if limit is not None:
+        items = items[:limit]
+    stamp_impact([item for item in items if id(item) not in ranked_ids], dim_impact)
+    if not opts.defer_primary_commands:
+        stamp_primary_commands(items, state)
     if opts.explain:
         for item in items:
             item["explain"] = item_explain(item)
@@ -32,6 +32,9 @@ class QueueBuildOptions:
     plan: dict | None = None
     include_skipped: bool = False
     context: QueueContext | None = None
+    # Leave ``primary_command`` to the caller, which stamps its own visible
+    # window (``next`` collapses clusters before cutting the window).
+    defer_primary_commands: bool = False
 
 
 class WorkQueueResult(TypedDict):
@@ -9,13 +9,16 @@ from desloppify.base.registry import DETECTORS
 from desloppify.engine._plan.constants import TRIAGE_STAGE_ORDER
 from desloppify.engine._scoring.results.health import compute_health_breakdown
 from desloppify.engine._scoring.results.impact import get_dimension_for_detector
-from desloppify.engine._state.filtering import path_scoped_issues
+from desloppify.engine._state.issue_semantics import (
+    ASSESSMENT_REQUEST,
+    REVIEW_DEFECT,
+    normalized_work_item_kind,
+)
+from desloppify.engine._state.query import IssueIndex
 from desloppify.engine._state.schema import StateModel
 from desloppify.engine._work_queue.helpers import (
     ACTION_TYPE_PRIORITY,
     detail_dict,
-    is_review_issue,
-    is_subjective_issue,
     primary_command_for_issue,
     review_issue_weight,
     scope_matches,
@@ -68,17 +71,19 @@ def enrich_with_impact(
     Impact = ``overall_per_point * headroom`` where headroom = ``100 - score``.
     Items in dimensions with more score headroom sort first.
     """
+    stamp_impact(items, dimension_impact_table(dimension_scores))
+
+
+def dimension_impact_table(
+    dimension_scores: dict[str, Any],
+) -> dict[str, dict[str, float]]:
+    """Build the normalized dimension -> ``{per_point, headroom}`` lookup once."""
     if not dimension_scores:
-        for item in items:
-            item["estimated_impact"] = 0.0
-        return
+        return {}
 
     breakdown = compute_health_breakdown(dimension_scores, score_key="strict")
-    entries = breakdown.get("entries", [])
-
-    # Build lookup: normalized dimension name -> {per_point, headroom}
     dim_impact: dict[str, dict[str, float]] = {}
-    for entry in entries:
+    for entry in breakdown.get("entries", []):
         name = str(entry.get("name", "")).strip()
         if not name:
             continue
@@ -86,10 +91,36 @@ def enrich_with_impact(
         score = float(entry.get("score", 0.0))
         headroom = 100.0 - score
         dim_impact[name.lower()] = {"per_point": per_point, "headroom": headroom}
+    return dim_impact
+
+
+def stamp_impact(
+    items: list[WorkQueueItem],
+    dim_impact: dict[str, dict[str, float]],
+) -> None:
+    """Stamp ``estimated_impact`` from a prebuilt :func:`dimension_impact_table`."""
+    for item in items:
+        if not dim_impact:
+            item["estimated_impact"] = 0.0
+            continue
+        item["estimated_impact"] = _compute_item_impact(
+            item, dim_impact, get_dimension_for_detector
+        )
+
+
+def stamp_primary_commands(items: list[WorkQueueItem], state: StateModel) -> None:
+    """Fill ``primary_command`` on issue items that do not carry one yet.
 
+    Issue items are materialized without a command; only the items that
+    reach the visible window need one.
+    """
     for item in items:
-        impact = _compute_item_impact(item, dim_impact, get_dimension_for_detector)
-        item["estimated_impact"] = impact
+        if item.get("kind", "issue") != "issue" or "primary_command" in item:
+            continue
+        item["primary_command"] = primary_command_for_issue(
+            item,
+            supported_fixers=supported_fixers_for_item(state, item),
+        )
 
 
 def _compute_item_impact(
@@ -130,7 +161,13 @@ def build_issue_items(
     chronic: bool,
     forced_ids: set[str] | None = None,
 ) -> list[WorkQueueItem]:
-    scoped = path_scoped_issues((state.get("work_items") or state.get("issues", {})), scan_path)
+    # Narrow by status/scope/scan path through secondary indexes before
+    # materializing queue items; exact matching still happens below.
+    scoped = IssueIndex.for_state(state).select(
+        status="open" if chronic else status_filter,
+        scope=scope,
+        scan_path=scan_path,
+    )
     subjective_scores = subjective_strict_scores(state)
     out: list[WorkQueueItem] = []
     forced_ids = forced_ids or set()
@@ -158,8 +195,9 @@ def build_issue_items(
         item["id"] = issue_id
         item["kind"] = "issue"
         item["action_type"] = meta.action_type if meta is not None else "manual_fix"
-        item["is_review"] = is_review_issue(item)
-        item["is_subjective"] = is_subjective_issue(item)
+        kind = normalized_work_item_kind(issue)
+        item["is_review"] = kind == REVIEW_DEFECT
+        item["is_subjective"] = kind == ASSESSMENT_REQUEST
         item["review_weight"] = (
             review_issue_weight(item) if item["is_review"] else None
         )
@@ -172,11 +210,6 @@ def build_issue_items(
                 dim_key, subjective_scores.get(dim_name.lower(), 100.0)
             )
         item["subjective_score"] = subjective_score
-        supported_fixers = supported_fixers_for_item(state, item)
-        item["primary_command"] = primary_command_for_issue(
-            item,
-            supported_fixers=supported_fixers,
-        )
 
         if not scope_matches(item, scope):
             continue
@@ -267,9 +300,12 @@ def item_sort_key(item: WorkQueueItem) -> tuple[Any, ...]:
 
 __all__ = [
     "build_issue_items",
+    "dimension_impact_table",
     "enrich_with_impact",
     "item_explain",
     "item_sort_key",
     "subjective_score_value",
     "group_queue_items",
+    "stamp_impact",
+    "stamp_primary_commands",
 ]
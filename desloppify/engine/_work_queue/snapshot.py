@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass
-from typing import Any, NamedTuple
+from functools import cached_property
+from typing import Any
 
 from desloppify.base.config import DEFAULT_TARGET_STRICT_SCORE
 from desloppify.engine._plan.cluster_semantics import (
@@ -30,13 +31,16 @@ from desloppify.engine._plan.refresh_lifecycle import (
     derive_display_phase,
 )
 from desloppify.engine._plan.triage.snapshot import build_triage_snapshot
-from desloppify.engine._state.filtering import path_scoped_issues
 from desloppify.engine._state.issue_semantics import (
+    ASSESSMENT_REQUEST,
+    MECHANICAL_DEFECT,
+    REVIEW_CONCERN,
+    REVIEW_DEFECT,
     counts_toward_objective_backlog,
-    is_assessment_request,
-    is_triage_finding,
+    normalized_work_item_kind,
 )
 from desloppify.engine._state.schema import StateModel
+from desloppify.engine._state.views import scoped_issues as state_scoped_issues
 from desloppify.engine._work_queue.ranking import build_issue_items
 from desloppify.engine._work_queue.synthetic import (
     build_subjective_items,
@@ -55,18 +59,22 @@ from desloppify.engine._work_queue.types import WorkQueueItem
 
 @dataclass(frozen=True)
 class QueueSnapshot:
-    """Canonical queue facts and partitions for one invocation."""
+    """Canonical queue facts and partitions for one invocation.
+
+    ``backlog_items`` and ``all_postflight_review_items`` may be deferred
+    sequences that materialize on first access.
+    """
 
     phase: str
     all_objective_items: tuple[WorkQueueItem, ...]
     all_initial_review_items: tuple[WorkQueueItem, ...]
     all_postflight_assessment_items: tuple[WorkQueueItem, ...]
-    all_postflight_review_items: tuple[WorkQueueItem, ...]
+    all_postflight_review_items: Sequence[WorkQueueItem]
     all_scan_items: tuple[WorkQueueItem, ...]
     all_postflight_workflow_items: tuple[WorkQueueItem, ...]
     all_postflight_triage_items: tuple[WorkQueueItem, ...]
     execution_items: tuple[WorkQueueItem, ...]
-    backlog_items: tuple[WorkQueueItem, ...]
+    backlog_items: Sequence[WorkQueueItem]
     objective_in_scope_count: int
     planned_objective_count: int
     objective_execution_count: int
@@ -109,20 +117,44 @@ def _is_fresh_boundary(plan: dict | None) -> bool:
     return isinstance(scores, dict) and bool(scores.get("reset"))
 
 
-def _is_objective_item(item: WorkQueueItem, *, skipped_ids: set[str]) -> bool:
-    return (
-        item.get("kind") in {"issue", "cluster"}
-        and counts_toward_objective_backlog(item)
-        and item.get("id", "") not in skipped_ids
-    )
+_DEFECT_KINDS = frozenset({MECHANICAL_DEFECT, REVIEW_DEFECT, REVIEW_CONCERN})
+
+
+class _DeferredItems(Sequence[WorkQueueItem]):
+    """Tuple-like partition that is only materialized on first access."""
+
+    __slots__ = ("_build", "_items")
+
+    def __init__(self, build: Callable[[], Iterable[WorkQueueItem]]) -> None:
+        self._build: Callable[[], Iterable[WorkQueueItem]] | None = build
+        self._items: tuple[WorkQueueItem, ...] | None = None
 
+    def _resolved(self) -> tuple[WorkQueueItem, ...]:
+        if self._items is None:
+            assert self._build is not None
+            self._items = tuple(self._build())
+            self._build = None
+        return self._items
 
-def _review_issue_items(items: Iterable[WorkQueueItem]) -> list[WorkQueueItem]:
-    return [item for item in items if is_triage_finding(item)]
+    def __getitem__(self, index):  # type: ignore[override]
+        return self._resolved()[index]
 
+    def __len__(self) -> int:
+        return len(self._resolved())
 
-def _assessment_request_items(items: Iterable[WorkQueueItem]) -> list[WorkQueueItem]:
-    return [item for item in items if is_assessment_request(item)]
+    def __iter__(self) -> Iterator[WorkQueueItem]:
+        return iter(self._resolved())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return self._resolved() == tuple(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._resolved())
+
+    def __repr__(self) -> str:
+        return repr(self._resolved())
 
 
 def _active_cluster_issue_ids(plan: dict | None) -> set[str]:
@@ -263,18 +295,11 @@ def _workflow_partitions(
 
 def _phase_for_snapshot(
     plan: dict | None,
+    p: _Partitions,
     *,
     fresh_boundary: bool,
-    initial_review_items: list[WorkQueueItem],
-    anchored_execution_items: list[WorkQueueItem],
-    explicit_queue_items: list[WorkQueueItem],
-    scan_items: list[WorkQueueItem],
-    postflight_assessment_items: list[WorkQueueItem],
-    postflight_review_items: list[WorkQueueItem],
-    postflight_workflow_items: list[WorkQueueItem],
-    triage_items: list[WorkQueueItem],
 ) -> str:
-    has_execution = bool(anchored_execution_items or explicit_queue_items)
+    has_execution = bool(p.anchored_execution_items or p.explicit_queue_items)
     raw_phase = current_lifecycle_phase(plan) if isinstance(plan, dict) else None
     # Suppress postflight signals (assessment/workflow/triage/review) when
     # execution work exists and we're either in execute mode or have no plan.
@@ -284,22 +309,31 @@ def _phase_for_snapshot(
     )
     prefer_scan = raw_phase == "execute" and not has_execution
     if suppress_postflight_signals:
-        postflight_assessment_items = []
-        postflight_review_items = []
-        postflight_workflow_items = []
-        triage_items = []
+        # Skip the (lazy) triage-gated review partition entirely.
+        return _derive_display_phase(
+            fresh_boundary=fresh_boundary,
+            initial_review_items=p.initial_review_items,
+            anchored_execution_items=p.anchored_execution_items,
+            explicit_queue_items=p.explicit_queue_items,
+            scan_items=p.scan_items,
+            prefer_scan=prefer_scan,
+            postflight_assessment_items=[],
+            postflight_review_items=[],
+            postflight_workflow_items=[],
+            triage_items=[],
+        )
 
     return _derive_display_phase(
         fresh_boundary=fresh_boundary,
-        initial_review_items=initial_review_items,
-        anchored_execution_items=anchored_execution_items,
-        explicit_queue_items=explicit_queue_items,
-        scan_items=scan_items,
+        initial_review_items=p.initial_review_items,
+        anchored_execution_items=p.anchored_execution_items,
+        explicit_queue_items=p.explicit_queue_items,
+        scan_items=p.scan_items,
         prefer_scan=prefer_scan,
-        postflight_assessment_items=postflight_assessment_items,
-        postflight_review_items=postflight_review_items,
-        postflight_workflow_items=postflight_workflow_items,
-        triage_items=triage_items,
+        postflight_assessment_items=p.postflight_assessment_items,
+        postflight_review_items=p.postflight_review_items,
+        postflight_workflow_items=p.postflight_workflow_items,
+        triage_items=p.triage_items,
     )
 
 
@@ -338,38 +372,44 @@ def _derive_display_phase(
 # ---------------------------------------------------------------------------
 
 
-def _execution_items_for_phase(
-    phase: str,
-    *,
-    explicit_queue_items: list[WorkQueueItem],
-    initial_review_items: list[WorkQueueItem],
-    scan_items: list[WorkQueueItem],
-    postflight_assessment_items: list[WorkQueueItem],
-    postflight_review_items: list[WorkQueueItem],
-    postflight_workflow_items: list[WorkQueueItem],
-    triage_items: list[WorkQueueItem],
-) -> list[WorkQueueItem]:
+def _objective_items_in_execution(
+    phase: str, p: _Partitions, execution_items: list[WorkQueueItem]
+) -> int:
+    """Count objective items among *execution_items* without scanning them.
+
+    Only the execute phase (plan queue) and the review postflight (every
+    defect, mechanical ones included, once triage is current) can surface
+    objective items.
+    """
+    if phase == LIFECYCLE_PHASE_EXECUTE:
+        return p.queued_objective_count
+    if phase == LIFECYCLE_PHASE_REVIEW_POSTFLIGHT and execution_items:
+        return len(p.objective_items)
+    return 0
+
+
+def _execution_items_for_phase(phase: str, p: _Partitions) -> list[WorkQueueItem]:
     if phase == LIFECYCLE_PHASE_REVIEW_INITIAL:
-        return initial_review_items
+        return p.initial_review_items
     if phase == LIFECYCLE_PHASE_EXECUTE:
-        return explicit_queue_items
+        return p.explicit_queue_items
     if phase == LIFECYCLE_PHASE_SCAN:
         deferred_items = [
             item
-            for item in scan_items
+            for item in p.scan_items
             if item.get("id") == WORKFLOW_DEFERRED_DISPOSITION_ID
         ]
         if deferred_items:
             return deferred_items
-        return [item for item in scan_items if item.get("id") == WORKFLOW_RUN_SCAN_ID]
+        return [item for item in p.scan_items if item.get("id") == WORKFLOW_RUN_SCAN_ID]
     if phase == LIFECYCLE_PHASE_ASSESSMENT_POSTFLIGHT:
-        return postflight_assessment_items
+        return p.postflight_assessment_items
     if phase == LIFECYCLE_PHASE_REVIEW_POSTFLIGHT:
-        return postflight_review_items
+        return p.postflight_review_items
     if phase == LIFECYCLE_PHASE_WORKFLOW_POSTFLIGHT:
-        return postflight_workflow_items
+        return p.postflight_workflow_items
     if phase == LIFECYCLE_PHASE_TRIAGE_POSTFLIGHT:
-        return triage_items
+        return p.triage_items
     return []
 
 
@@ -378,147 +418,146 @@ def _execution_items_for_phase(
 # ---------------------------------------------------------------------------
 
 
-class _Partitions(NamedTuple):
-    """All item lists computed from state + plan, before phase resolution."""
+class _Partitions:
+    """Item partitions computed from state + plan, before phase resolution.
 
-    objective_items: list[WorkQueueItem]
-    explicit_objective_items: list[WorkQueueItem]
-    review_issue_items: list[WorkQueueItem]
-    initial_review_items: list[WorkQueueItem]
-    subjective_postflight_items: list[WorkQueueItem]
-    postflight_assessment_items: list[WorkQueueItem]
-    postflight_review_items: list[WorkQueueItem]
-    scan_items: list[WorkQueueItem]
-    postflight_workflow_items: list[WorkQueueItem]
-    triage_items: list[WorkQueueItem]
-    explicit_queue_items: list[WorkQueueItem]
-    anchored_execution_items: list[WorkQueueItem]
-
-
-def _build_item_partitions(
-    state: StateModel,
-    *,
-    effective_plan: dict | None,
-    scan_path: str | None,
-    scope: object | None,
-    chronic: bool,
-    target_strict: float,
-) -> _Partitions:
-    """Build all item partitions from state and plan."""
-    skipped_ids = set((effective_plan or {}).get("skipped", {}).keys())
-    scoped_issues = path_scoped_issues(
-        (state.get("work_items") or state.get("issues", {})),
-        scan_path,
-    )
-
-    all_issue_items = build_issue_items(
-        state,
-        scan_path=scan_path,
-        status_filter="open",
-        scope=scope,
-        chronic=chronic,
-        forced_ids=_live_planned_queue_ids(effective_plan),
-    )
-    objective_items = [
-        item
-        for item in all_issue_items
-        if _is_objective_item(item, skipped_ids=skipped_ids)
-    ]
-    executable_objective_ids = _executable_objective_ids(
-        {item.get("id", "") for item in objective_items},
-        effective_plan,
-    )
-    all_clustered_ids = _all_cluster_issue_ids(effective_plan)
-    if (
-        isinstance(effective_plan, dict)
-        and not _live_planned_queue_ids(effective_plan)
-        and all_clustered_ids & executable_objective_ids
-    ):
-        executable_objective_ids -= all_clustered_ids
-    explicit_objective_items = [
-        item
-        for item in objective_items
-        if item.get("id", "") in executable_objective_ids
-    ]
+    Issue items are classified by work-item kind in a single pass.  The
+    partitions that only matter for some phases (triage-gated review
+    findings) are computed on first access and memoized.
+    """
 
-    review_issue_items = _review_issue_items(all_issue_items)
-    assessment_request_items_list = _assessment_request_items(all_issue_items)
-    executable_review_items = _executable_review_issue_items(
-        effective_plan,
-        state,
-        review_issue_items,
-    )
-    review_issue_ids = {item.get("id", "") for item in review_issue_items}
-    assessment_request_ids = {
-        item.get("id", "") for item in assessment_request_items_list
-    }
-
-    explicit_queue_items, anchored_execution_items = _merge_execution_candidates(
-        all_issue_items=all_issue_items,
-        explicit_objective_items=explicit_objective_items,
-        plan=effective_plan,
-        review_issue_ids=review_issue_ids,
-        assessment_request_ids=assessment_request_ids,
-    )
+    def __init__(
+        self,
+        state: StateModel,
+        *,
+        effective_plan: dict | None,
+        scan_path: str | None,
+        scope: object | None,
+        chronic: bool,
+        target_strict: float,
+    ) -> None:
+        self._state = state
+        self._plan = effective_plan
+        skipped_ids = set((effective_plan or {}).get("skipped", {}).keys())
+
+        all_issue_items = build_issue_items(
+            state,
+            scan_path=scan_path,
+            status_filter="open",
+            scope=scope,
+            chronic=chronic,
+            forced_ids=_live_planned_queue_ids(effective_plan),
+        )
+        self._kinds: dict[str, str] = {}
+        self.objective_items: list[WorkQueueItem] = []
+        self.review_issue_items: list[WorkQueueItem] = []
+        assessment_request_items: list[WorkQueueItem] = []
+        for item in all_issue_items:
+            item_id = item.get("id", "")
+            kind = normalized_work_item_kind(item)
+            self._kinds[item_id] = kind
+            if kind == MECHANICAL_DEFECT and item_id not in skipped_ids:
+                self.objective_items.append(item)
+            if kind in _DEFECT_KINDS:
+                self.review_issue_items.append(item)
+            elif kind == ASSESSMENT_REQUEST:
+                assessment_request_items.append(item)
+
+        objective_ids = {item.get("id", "") for item in self.objective_items}
+        executable_objective_ids = _executable_objective_ids(
+            objective_ids, effective_plan
+        )
+        all_clustered_ids = _all_cluster_issue_ids(effective_plan)
+        if (
+            isinstance(effective_plan, dict)
+            and not _live_planned_queue_ids(effective_plan)
+            and all_clustered_ids & executable_objective_ids
+        ):
+            executable_objective_ids -= all_clustered_ids
+        self.explicit_objective_items = [
+            item
+            for item in self.objective_items
+            if item.get("id", "") in executable_objective_ids
+        ]
 
-    initial_review_items, subjective_postflight_items = _subjective_partitions(
-        state,
-        scoped_issues=scoped_issues,
-        threshold=target_strict,
-        plan=effective_plan,
-    )
-    # Suppress subjective dimension items when review issues already cover
-    # the same dimension — the review issues are more actionable.
-    postflight_assessment_items = [
-        item
-        for item in subjective_postflight_items
-        if not (
-            item.get("kind") == "subjective_dimension"
-            and int((item.get("detail") or {}).get("open_review_issues", 0)) > 0
+        self.explicit_queue_items, self.anchored_execution_items = (
+            _merge_execution_candidates(
+                all_issue_items=all_issue_items,
+                explicit_objective_items=self.explicit_objective_items,
+                plan=effective_plan,
+                review_issue_ids={
+                    item.get("id", "") for item in self.review_issue_items
+                },
+                assessment_request_ids={
+                    item.get("id", "") for item in assessment_request_items
+                },
+            )
+        )
+        # Execution candidates list every explicit objective item first, then
+        # queued extras; only the (short) extras need an objective check.
+        self.queued_objective_count = len(self.explicit_objective_items) + sum(
+            1
+            for item in self.explicit_queue_items[len(self.explicit_objective_items):]
+            if item.get("id", "") in objective_ids
         )
-    ] + list(assessment_request_items_list)
-    postflight_review_items = list(executable_review_items)
 
-    scan_items, postflight_workflow_items, triage_items = _workflow_partitions(
-        effective_plan,
-        state,
-    )
+        self.initial_review_items, self.subjective_postflight_items = (
+            _subjective_partitions(
+                state,
+                scoped_issues=state_scoped_issues(state, scan_path),
+                threshold=target_strict,
+                plan=effective_plan,
+            )
+        )
+        # Suppress subjective dimension items when review issues already cover
+        # the same dimension — the review issues are more actionable.
+        self.postflight_assessment_items = [
+            item
+            for item in self.subjective_postflight_items
+            if not (
+                item.get("kind") == "subjective_dimension"
+                and int((item.get("detail") or {}).get("open_review_issues", 0)) > 0
+            )
+        ] + assessment_request_items
+
+        self.scan_items, self.postflight_workflow_items, self.triage_items = (
+            _workflow_partitions(effective_plan, state)
+        )
 
-    return _Partitions(
-        objective_items=objective_items,
-        explicit_objective_items=explicit_objective_items,
-        review_issue_items=review_issue_items,
-        initial_review_items=initial_review_items,
-        subjective_postflight_items=subjective_postflight_items,
-        postflight_assessment_items=postflight_assessment_items,
-        postflight_review_items=postflight_review_items,
-        scan_items=scan_items,
-        postflight_workflow_items=postflight_workflow_items,
-        triage_items=triage_items,
-        explicit_queue_items=explicit_queue_items,
-        anchored_execution_items=anchored_execution_items,
-    )
+    @cached_property
+    def postflight_review_items(self) -> list[WorkQueueItem]:
+        return list(
+            _executable_review_issue_items(
+                self._plan,
+                self._state,
+                self.review_issue_items,
+            )
+        )
 
+    def counts_toward_objective(self, item: WorkQueueItem) -> bool:
+        if item.get("kind") not in {"issue", "cluster"}:
+            return False
+        kind = self._kinds.get(item.get("id", ""))
+        if kind is None:
+            return counts_toward_objective_backlog(item)
+        return kind == MECHANICAL_DEFECT
 
-def _build_backlog(
-    p: _Partitions,
-    execution_ids: set[str],
-) -> list[WorkQueueItem]:
-    return [
-        item
-        for item in (
-            [
-                *p.objective_items,
-                *p.initial_review_items,
-                *p.postflight_assessment_items,
-                *p.review_issue_items,
-                *p.scan_items,
-                *p.postflight_workflow_items,
-                *p.triage_items,
-            ]
-        )
-        if item.get("id", "") not in execution_ids
-    ]
+    def backlog(self, execution_ids: set[str]) -> list[WorkQueueItem]:
+        return [
+            item
+            for item in (
+                [
+                    *self.objective_items,
+                    *self.initial_review_items,
+                    *self.postflight_assessment_items,
+                    *self.review_issue_items,
+                    *self.scan_items,
+                    *self.postflight_workflow_items,
+                    *self.triage_items,
+                ]
+            )
+            if item.get("id", "") not in execution_ids
+        ]
 
 
 # ---------------------------------------------------------------------------
@@ -541,7 +580,7 @@ def build_queue_snapshot(
         else (plan if plan is not None else _option_value(options, "plan", None))
     )
 
-    p = _build_item_partitions(
+    p = _Partitions(
         state,
         effective_plan=effective_plan,
         scan_path=_resolved_scan_path(options, state),
@@ -550,35 +589,17 @@ def build_queue_snapshot(
         target_strict=target_strict,
     )
 
-    fresh_boundary = _is_fresh_boundary(effective_plan)
-
     phase = _phase_for_snapshot(
         effective_plan,
-        fresh_boundary=fresh_boundary,
-        initial_review_items=p.initial_review_items,
-        anchored_execution_items=p.anchored_execution_items,
-        explicit_queue_items=p.explicit_queue_items,
-        scan_items=p.scan_items,
-        postflight_assessment_items=p.postflight_assessment_items,
-        postflight_review_items=p.postflight_review_items,
-        postflight_workflow_items=p.postflight_workflow_items,
-        triage_items=p.triage_items,
-    )
-    execution_items = _execution_items_for_phase(
-        phase,
-        explicit_queue_items=p.explicit_queue_items,
-        initial_review_items=p.initial_review_items,
-        scan_items=p.scan_items,
-        postflight_assessment_items=p.postflight_assessment_items,
-        postflight_review_items=p.postflight_review_items,
-        postflight_workflow_items=p.postflight_workflow_items,
-        triage_items=p.triage_items,
+        p,
+        fresh_boundary=_is_fresh_boundary(effective_plan),
     )
+    execution_items = _execution_items_for_phase(phase, p)
 
-    execution_ids = {item.get("id", "") for item in execution_items}
-    backlog_items = _build_backlog(p, execution_ids)
-    objective_backlog_count = sum(
-        1 for item in p.objective_items if item.get("id", "") not in execution_ids
+    # Counts come from counters; the backlog list itself is only built when
+    # a backlog view actually reads it.
+    objective_backlog_count = len(p.objective_items) - _objective_items_in_execution(
+        phase, p, execution_items
     )
 
     return QueueSnapshot(
@@ -586,19 +607,20 @@ def build_queue_snapshot(
         all_objective_items=tuple(p.objective_items),
         all_initial_review_items=tuple(p.initial_review_items),
         all_postflight_assessment_items=tuple(p.postflight_assessment_items),
-        all_postflight_review_items=tuple(p.postflight_review_items),
+        all_postflight_review_items=_DeferredItems(
+            lambda: p.postflight_review_items
+        ),
         all_scan_items=tuple(p.scan_items),
         all_postflight_workflow_items=tuple(p.postflight_workflow_items),
         all_postflight_triage_items=tuple(p.triage_items),
         execution_items=tuple(execution_items),
-        backlog_items=tuple(backlog_items),
+        backlog_items=_DeferredItems(
+            lambda: p.backlog({item.get("id", "") for item in execution_items})
+        ),
         objective_in_scope_count=len(p.objective_items),
         planned_objective_count=len(p.explicit_objective_items),
         objective_execution_count=sum(
-            1
-            for item in execution_items
-            if item.get("kind") in {"issue", "cluster"}
-            and counts_toward_objective_backlog(item)
+            1 for item in execution_items if p.counts_toward_objective(item)
         ),
         objective_backlog_count=objective_backlog_count,
         subjective_initial_count=len(p.initial_review_items),
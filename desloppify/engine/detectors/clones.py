@@ -0,0 +1,376 @@
+"""Native token-window clone detection for boilerplate duplication.
+
+An in-process alternative to the jscpd adapter: every file is tokenized
+(comments and whitespace dropped), hashed with a Rabin-Karp rolling hash over
+fixed-size token windows, and winnowed down to a sparse fingerprint set.
+Fingerprints shared across files are grouped into clone clusters with the
+same entry shape as :func:`desloppify.engine.detectors.jscpd_adapter.detect_with_jscpd`.
+
+Per-file fingerprints are cached by content digest, so warm rescans only
+retokenize files that changed.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import logging
+import re
+import zlib
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+
+from desloppify.base.discovery.file_paths import resolve_scan_file
+from desloppify.base.discovery.source import read_file_facts, read_file_text
+
+logger = logging.getLogger(__name__)
+
+CLONE_DETECTOR_VERSION = 1
+
+# Match jscpd's CLI thresholds (``--min-tokens 50 --min-lines 4``).
+MIN_TOKENS = 50
+MIN_LINES = 4
+# Winnowing window: any clone of at least MIN_TOKENS + WINNOW_WINDOW - 1
+# tokens is guaranteed to share at least one fingerprint.
+WINNOW_WINDOW = 16
+
+_ARTIFACT_PREFIXES = ("build/", "dist/", ".desloppify/", ".claude/")
+_BUILD_MIRROR_PREFIX = "build/lib/"
+
+_HASH_COMMENT_EXTS = frozenset(
+    {".py", ".pyi", ".rb", ".sh", ".bash", ".pl", ".r", ".jl", ".ex", ".exs", ".nim"}
+)
+_STRING = (
+    r'"""[\s\S]*?"""'
+    r"|'''[\s\S]*?'''"
+    r'|"(?:\\.|[^"\\\n])*"'
+    r"|'(?:\\.|[^'\\\n])*'"
+    r"|`(?:\\.|[^`\\])*`"
+)
+_TOKEN = r"[A-Za-z_$][\w$]*|\d[\w.]*|[^\s\w]"
+_HASH_COMMENT_TOKEN_RE = re.compile(rf"(#[^\n]*)|({_STRING})|({_TOKEN})")
+_C_COMMENT_TOKEN_RE = re.compile(rf"(//[^\n]*|/\*[\s\S]*?\*/)|({_STRING})|({_TOKEN})")
+
+_MOD = (1 << 61) - 1
+_BASE = 1_000_003
+
+
+@dataclass(frozen=True)
+class FileFingerprints:
+    """Winnowed window fingerprints for one file.
+
+    ``hashes[i]`` covers the token window starting on ``starts[i]`` and
+    ending on ``ends[i]`` (1-based line numbers).
+    """
+
+    hashes: array
+    starts: array
+    ends: array
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+
+def is_artifact_path(rel_path: str) -> bool:
+    return rel_path.startswith(_ARTIFACT_PREFIXES)
+
+
+def is_build_mirror_pair(first_rel: str, second_rel: str) -> bool:
+    if first_rel.startswith(_BUILD_MIRROR_PREFIX):
+        return first_rel[len(_BUILD_MIRROR_PREFIX):] == second_rel
+    if second_rel.startswith(_BUILD_MIRROR_PREFIX):
+        return second_rel[len(_BUILD_MIRROR_PREFIX):] == first_rel
+    return False
+
+
+def tokenize(text: str, *, suffix: str = "") -> tuple[list[str], list[int]]:
+    """Return ``(tokens, lines)`` with comments and whitespace removed."""
+    pattern = (
+        _HASH_COMMENT_TOKEN_RE
+        if suffix.lower() in _HASH_COMMENT_EXTS
+        else _C_COMMENT_TOKEN_RE
+    )
+    tokens: list[str] = []
+    lines: list[int] = []
+    line = 1
+    last = 0
+    for match in pattern.finditer(text):
+        line += text.count("\n", last, match.start())
+        last = match.start()
+        if match.group(1) is None:
+            tokens.append(match.group(0))
+            lines.append(line)
+    return tokens, lines
+
+
+def _rolling_hashes(tokens: list[str], k: int) -> list[int]:
+    """Rabin-Karp hashes of every *k*-token window."""
+    if len(tokens) < k:
+        return []
+    codes = [zlib.crc32(token.encode("utf-8", errors="replace")) for token in tokens]
+    drop = pow(_BASE, k - 1, _MOD)
+    value = 0
+    for code in codes[:k]:
+        value = (value * _BASE + code) % _MOD
+    hashes = [value]
+    for index in range(k, len(codes)):
+        value = ((value - codes[index - k] * drop) * _BASE + codes[index]) % _MOD
+        hashes.append(value)
+    return hashes
+
+
+def _winnow(hashes: list[int], window: int) -> list[int]:
+    """Return window indexes selected by winnowing (rightmost minimum)."""
+    if not hashes:
+        return []
+    if len(hashes) <= window:
+        low = min(hashes)
+        return [max(i for i, value in enumerate(hashes) if value == low)]
+    selected: list[int] = []
+    candidates: deque[int] = deque()
+    for index, value in enumerate(hashes):
+        while candidates and hashes[candidates[-1]] >= value:
+            candidates.pop()
+        candidates.append(index)
+        if candidates[0] <= index - window:
+            candidates.popleft()
+        if index >= window - 1 and (not selected or selected[-1] != candidates[0]):
+            selected.append(candidates[0])
+    return selected
+
+
+def fingerprint_text(
+    text: str,
+    *,
+    suffix: str = "",
+    min_tokens: int = MIN_TOKENS,
+    window: int = WINNOW_WINDOW,
+) -> FileFingerprints:
+    """Tokenize *text* and return its winnowed window fingerprints."""
+    tokens, lines = tokenize(text, suffix=suffix)
+    hashes = _rolling_hashes(tokens, min_tokens)
+    picked = _winnow(hashes, window)
+    return FileFingerprints(
+        hashes=array("Q", (hashes[i] for i in picked)),
+        starts=array("I", (lines[i] for i in picked)),
+        ends=array("I", (lines[i + min_tokens - 1] for i in picked)),
+    )
+
+
+def _encode(values: array) -> str:
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _decode(payload: object, typecode: str) -> array | None:
+    if not isinstance(payload, str):
+        return None
+    values = array(typecode)
+    try:
+        values.frombytes(base64.b64decode(payload.encode("ascii"), validate=True))
+    except (ValueError, TypeError):
+        return None
+    return values
+
+
+def _load_cached_fingerprints(record: object, digest: str) -> FileFingerprints | None:
+    if not isinstance(record, dict) or record.get("digest") != digest:
+        return None
+    hashes = _decode(record.get("hashes"), "Q")
+    starts = _decode(record.get("starts"), "I")
+    ends = _decode(record.get("ends"), "I")
+    if hashes is None or starts is None or ends is None:
+        return None
+    if not len(hashes) == len(starts) == len(ends):
+        return None
+    return FileFingerprints(hashes=hashes, starts=starts, ends=ends)
+
+
+def _file_fingerprints(
+    files: list[str],
+    scan_root: Path,
+    cache: dict[str, object] | None,
+) -> dict[str, FileFingerprints]:
+    """Fingerprint every file, reusing per-file cache rows by content digest."""
+    records: dict[str, object] = {}
+    if isinstance(cache, dict) and cache.get("version") == CLONE_DETECTOR_VERSION:
+        cached_files = cache.get("files")
+        if isinstance(cached_files, dict):
+            records = cached_files
+    fresh_records: dict[str, object] = {}
+    result: dict[str, FileFingerprints] = {}
+    reused = 0
+    for filepath in files:
+        resolved = resolve_scan_file(filepath, scan_root=scan_root)
+        facts = read_file_facts(resolved)
+        if facts is None:
+            continue
+        fingerprints = _load_cached_fingerprints(records.get(filepath), facts.digest)
+        if fingerprints is None:
+            text = read_file_text(str(resolved))
+            if text is None:
+                continue
+            fingerprints = fingerprint_text(text, suffix=resolved.suffix)
+        else:
+            reused += 1
+        result[filepath] = fingerprints
+        fresh_records[filepath] = {
+            "digest": facts.digest,
+            "hashes": _encode(fingerprints.hashes),
+            "starts": _encode(fingerprints.starts),
+            "ends": _encode(fingerprints.ends),
+        }
+    if isinstance(cache, dict):
+        cache.clear()
+        cache.update({"version": CLONE_DETECTOR_VERSION, "files": fresh_records})
+    logger.debug("clones: %d/%d files reused cached fingerprints", reused, len(result))
+    return result
+
+
+def _scan_relative(scan_root: Path, filepath: str) -> str:
+    resolved = resolve_scan_file(filepath, scan_root=scan_root)
+    try:
+        return str(resolved.relative_to(scan_root)).replace("\\", "/")
+    except ValueError:
+        return filepath.replace("\\", "/")
+
+
+class _UnionFind:
+    def __init__(self) -> None:
+        self._parent: dict[tuple[str, int], tuple[str, int]] = {}
+
+    def find(self, node: tuple[str, int]) -> tuple[str, int]:
+        parent = self._parent.setdefault(node, node)
+        while parent != node:
+            grandparent = self._parent.setdefault(parent, parent)
+            self._parent[node] = grandparent
+            node, parent = parent, grandparent
+        return node
+
+    def union(self, first: tuple[str, int], second: tuple[str, int]) -> None:
+        root_a, root_b = self.find(first), self.find(second)
+        if root_a != root_b:
+            self._parent[root_b] = root_a
+
+
+def _file_runs(
+    fingerprints: FileFingerprints,
+    shared: set[int],
+) -> list[tuple[int, int, list[int]]]:
+    """Group line-contiguous shared fingerprints into ``(start, end, hashes)`` runs."""
+    runs: list[tuple[int, int, list[int]]] = []
+    current: tuple[int, int, list[int]] | None = None
+    for value, start, end in zip(
+        fingerprints.hashes, fingerprints.starts, fingerprints.ends, strict=True
+    ):
+        if value not in shared:
+            continue
+        if current is not None and start <= current[1] + 1:
+            current = (current[0], max(current[1], end), current[2])
+            current[2].append(value)
+            continue
+        if current is not None:
+            runs.append(current)
+        current = (start, end, [value])
+    if current is not None:
+        runs.append(current)
+    return runs
+
+
+def _sample_lines(scan_root: Path, filepath: str, start: int) -> list[str]:
+    text = read_file_text(str(resolve_scan_file(filepath, scan_root=scan_root)))
+    if text is None:
+        return []
+    return text.splitlines()[start - 1 : start + 3]
+
+
+def detect_clones(
+    path: Path,
+    files: list[str],
+    *,
+    cache: dict[str, object] | None = None,
+    min_lines: int = MIN_LINES,
+) -> list[dict]:
+    """Return boilerplate clone clusters across *files* under *path*.
+
+    Entries match the jscpd adapter: ``id``, ``distinct_files``,
+    ``window_size`` (lines), ``locations`` (``file``/``line``) and ``sample``.
+    Location files use the same strings as *files*.
+    """
+    scan_root = path.resolve()
+    # Build output (including ``build/lib`` mirrors) never counts as a clone.
+    kept = [
+        filepath for filepath in files
+        if not is_artifact_path(_scan_relative(scan_root, filepath))
+    ]
+    per_file = _file_fingerprints(kept, scan_root, cache)
+
+    owners: dict[int, set[str]] = {}
+    for filepath, fingerprints in per_file.items():
+        for value in fingerprints.hashes:
+            owners.setdefault(value, set()).add(filepath)
+    shared = {value for value, owner_files in owners.items() if len(owner_files) > 1}
+    if not shared:
+        return []
+
+    union = _UnionFind()
+    runs: dict[tuple[str, int], tuple[int, int, list[int]]] = {}
+    first_run_for_hash: dict[int, tuple[str, int]] = {}
+    for filepath in sorted(per_file):
+        for index, run in enumerate(
+            _file_runs(per_file[filepath], shared)
+        ):
+            if run[1] - run[0] + 1 < min_lines:
+                continue
+            node = (filepath, index)
+            runs[node] = run
+            union.find(node)
+            for value in run[2]:
+                other = first_run_for_hash.setdefault(value, node)
+                union.union(other, node)
+
+    components: dict[tuple[str, int], list[tuple[str, int]]] = {}
+    for node in runs:
+        components.setdefault(union.find(node), []).append(node)
+
+    entries: list[dict] = []
+    for nodes in components.values():
+        by_file: dict[str, tuple[int, int, list[int]]] = {}
+        for filepath, index in sorted(nodes):
+            by_file.setdefault(filepath, runs[(filepath, index)])
+        distinct = sorted(by_file)
+        if len(distinct) < 2:
+            continue
+        hashes = sorted({value for filepath in distinct for value in by_file[filepath][2]})
+        cluster_id = hashlib.sha256(
+            ",".join(str(value) for value in hashes).encode("ascii")
+        ).hexdigest()[:16]
+        window_size = min(by_file[f][1] - by_file[f][0] + 1 for f in distinct)
+        first = distinct[0]
+        entries.append(
+            {
+                "id": cluster_id,
+                "distinct_files": len(distinct),
+                "window_size": window_size,
+                "locations": [
+                    {"file": filepath, "line": by_file[filepath][0]}
+                    for filepath in distinct
+                ],
+                "sample": _sample_lines(scan_root, first, by_file[first][0]),
+            }
+        )
+
+    entries.sort(key=lambda entry: (-entry["distinct_files"], entry["id"]))
+    return entries
+
+
+__all__ = [
+    "CLONE_DETECTOR_VERSION",
+    "FileFingerprints",
+    "detect_clones",
+    "fingerprint_text",
+    "is_artifact_path",
+    "is_build_mirror_pair",
+    "tokenize",
+]
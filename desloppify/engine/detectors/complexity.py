@@ -5,80 +5,182 @@ from __future__ import annotations
 import inspect
 import logging
 import re
+from collections import OrderedDict
+from collections.abc import Sequence
 from pathlib import Path
 
 from desloppify.base.output.fallbacks import log_best_effort_failure
+from desloppify.base.parallel import map_files, per_file_task
 from desloppify.base.discovery.file_paths import resolve_scan_file
+from desloppify.base.discovery.source import read_source_text
+from desloppify.engine.detectors.base import ComplexitySignal
+from desloppify.engine.detectors.patterns.multi import MultiPatternScanner
 
 logger = logging.getLogger(__name__)
 
+_MAX_COMPILED_SETS = 16
+
+
+class CompiledComplexitySignals:
+    """A language's complexity signals with per-signal setup done once.
+
+    Compute signals have their calling convention (whether they take
+    ``_filepath``) resolved up front.  Pattern signals are compiled into one
+    :class:`MultiPatternScanner`, so a file's text is checked once for the
+    literal anchors of every pattern and only patterns that can match are
+    counted.  Signals are evaluated in catalog order, so labels and scores
+    match the per-signal loop exactly.
+    """
+
+    def __init__(self, signals: Sequence[ComplexitySignal]) -> None:
+        self.signals = tuple(signals)
+        # (signal, accepts _filepath) for compute signals; (signal, None) for patterns.
+        self._steps: list[tuple[ComplexitySignal, bool | None]] = []
+        pattern_rules: list[tuple[int, re.Pattern[str]]] = []
+        for sig in self.signals:
+            try:
+                if sig.compute:
+                    accepts_filepath = (
+                        "_filepath" in inspect.signature(sig.compute).parameters
+                    )
+                    self._steps.append((sig, accepts_filepath))
+                elif sig.pattern:
+                    pattern_rules.append(
+                        (len(self._steps), re.compile(sig.pattern, re.MULTILINE))
+                    )
+                    self._steps.append((sig, None))
+            except (TypeError, ValueError, re.error) as exc:
+                log_best_effort_failure(
+                    logger, f"prepare complexity signal '{sig.name}'", exc
+                )
+        self._patterns = [pattern for _step, pattern in pattern_rules]
+        self._pattern_steps = [step for step, _pattern in pattern_rules]
+        self._scanner = MultiPatternScanner(pattern_rules)
+
+    def _pattern_counts(self, content: str) -> dict[int, int]:
+        """Match counts (as ``re.findall`` would) of patterns that can match."""
+        return {
+            self._pattern_steps[index]: sum(
+                1 for _match in self._patterns[index].finditer(content)
+            )
+            for index in self._scanner.active_rules(content)
+        }
+
+    def score(
+        self, filepath: str, content: str, lines: list[str]
+    ) -> tuple[int, list[str]]:
+        """Return ``(score, signal labels)`` for one file's contents."""
+        file_signals: list[str] = []
+        score = 0
+        pattern_counts = self._pattern_counts(content) if self._patterns else {}
+        for step, (sig, accepts_filepath) in enumerate(self._steps):
+            if accepts_filepath is None:
+                count = pattern_counts.get(step, 0)
+                if count > sig.threshold:
+                    file_signals.append(f"{count} {sig.name}")
+                    score += (count - sig.threshold) * sig.weight
+                continue
+            try:
+                if accepts_filepath:
+                    result = sig.compute(content, lines, _filepath=filepath)
+                else:
+                    result = sig.compute(content, lines)
+                if result:
+                    count, label = result
+                    file_signals.append(label)
+                    excess = max(0, count - sig.threshold) if sig.threshold else count
+                    score += excess * sig.weight
+            except (TypeError, ValueError, KeyError, AttributeError, re.error) as exc:
+                log_best_effort_failure(
+                    logger,
+                    f"compute complexity signal '{sig.name}' for {filepath}",
+                    exc,
+                )
+        return score, file_signals
+
+
+_compiled_sets: OrderedDict[tuple[int, ...], CompiledComplexitySignals] = OrderedDict()
+
+
+def compile_complexity_signals(
+    signals: Sequence[ComplexitySignal] | CompiledComplexitySignals,
+) -> CompiledComplexitySignals:
+    """Return the compiled set for *signals*, built once per signal catalog."""
+    if isinstance(signals, CompiledComplexitySignals):
+        return signals
+    key = tuple(map(id, signals))
+    compiled = _compiled_sets.get(key)
+    # The cached set holds its signals, so their ids cannot be reused while cached.
+    if compiled is None or any(
+        cached is not sig for cached, sig in zip(compiled.signals, signals, strict=True)
+    ):
+        compiled = CompiledComplexitySignals(signals)
+        _compiled_sets[key] = compiled
+        while len(_compiled_sets) > _MAX_COMPILED_SETS:
+            _compiled_sets.popitem(last=False)
+    else:
+        _compiled_sets.move_to_end(key)
+    return compiled
+
+
+@per_file_task
+def _complexity_entry(
+    filepath: str,
+    *,
+    path: Path,
+    signals: CompiledComplexitySignals,
+    threshold: int,
+    min_loc: int,
+) -> dict | None:
+    """Score one file's complexity signals; ``None`` when below thresholds."""
+    try:
+        p = resolve_scan_file(filepath, scan_root=path)
+        content = read_source_text(p, encoding="utf-8")
+        lines = content.splitlines()
+        loc = len(lines)
+        if loc < min_loc:
+            return None
+        score, file_signals = signals.score(filepath, content, lines)
+    except (OSError, UnicodeDecodeError) as exc:
+        log_best_effort_failure(
+            logger,
+            f"read complexity detector candidate {filepath}",
+            exc,
+        )
+        return None
+
+    if file_signals and score >= threshold:
+        return {
+            "file": filepath,
+            "loc": loc,
+            "score": score,
+            "signals": file_signals,
+        }
+    return None
+
 
 def detect_complexity(
     path: Path, signals, file_finder, threshold: int = 15, min_loc: int = 50
 ) -> tuple[list[dict], int]:
     """Detect files with complexity signals."""
     files = file_finder(path)
-    entries = []
-    for filepath in files:
-        try:
-            p = resolve_scan_file(filepath, scan_root=path)
-            content = p.read_text(encoding="utf-8")
-            lines = content.splitlines()
-            loc = len(lines)
-            if loc < min_loc:
-                continue
-
-            file_signals = []
-            score = 0
-
-            for sig in signals:
-                try:
-                    if sig.compute:
-                        # Pass filepath to compute fns that accept it (tree-sitter signals).
-                        accepts_filepath = "_filepath" in inspect.signature(
-                            sig.compute
-                        ).parameters
-                        if accepts_filepath:
-                            result = sig.compute(content, lines, _filepath=filepath)
-                        else:
-                            result = sig.compute(content, lines)
-                        if result:
-                            count, label = result
-                            file_signals.append(label)
-                            excess = (
-                                max(0, count - sig.threshold) if sig.threshold else count
-                            )
-                            score += excess * sig.weight
-                    elif sig.pattern:
-                        count = len(re.findall(sig.pattern, content, re.MULTILINE))
-                        if count > sig.threshold:
-                            file_signals.append(f"{count} {sig.name}")
-                            score += (count - sig.threshold) * sig.weight
-                except (TypeError, ValueError, KeyError, AttributeError, re.error) as exc:
-                    log_best_effort_failure(
-                        logger,
-                        f"compute complexity signal '{sig.name}' for {filepath}",
-                        exc,
-                    )
-                    continue
-
-            if file_signals and score >= threshold:
-                entries.append(
-                    {
-                        "file": filepath,
-                        "loc": loc,
-                        "score": score,
-                        "signals": file_signals,
-                    }
-                )
-        except (OSError, UnicodeDecodeError) as exc:
-            log_best_effort_failure(
-                logger,
-                f"read complexity detector candidate {filepath}",
-                exc,
-            )
-            continue
+    entries = [
+        entry
+        for entry in map_files(
+            _complexity_entry,
+            files,
+            path=path,
+            signals=compile_complexity_signals(signals),
+            threshold=threshold,
+            min_loc=min_loc,
+        )
+        if entry is not None
+    ]
     return sorted(entries, key=lambda e: -e["score"]), len(files)
 
 
-__all__ = ["detect_complexity"]
+__all__ = [
+    "CompiledComplexitySignals",
+    "compile_complexity_signals",
+    "detect_complexity",
+]
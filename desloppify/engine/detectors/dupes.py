@@ -10,14 +10,20 @@ import difflib
 import os
 import sys
 import time
+from collections.abc import Sequence
 from typing import TypeAlias, TypedDict
 
 from desloppify.engine.detectors.base import FunctionInfo
+from desloppify.engine.detectors.function_table import (
+    NORMALIZED_MIN_LOC,
+    FunctionRow,
+    FunctionTable,
+)
 
 PairKey: TypeAlias = tuple[str, str]
 MatchedPair: TypeAlias = tuple[int, int, float, str]
 
-_DUPES_CACHE_VERSION = 1
+_DUPES_CACHE_VERSION = 2
 _DUPES_CACHE_MAX_NEAR_PAIRS = 20_000
 _DUPES_AUTOJUNK_MIN_LINES = 80
 
@@ -39,7 +45,7 @@ class DuplicateEntry(TypedDict):
 
 
 class _CachedFunctionMeta(TypedDict):
-    body_hash: str
+    body_hash: int
     loc: int
 
 
@@ -93,21 +99,18 @@ def _dupes_debug_settings() -> tuple[bool, int]:
     return debug, debug_every
 
 
-def _pair_key(fn_a: FunctionInfo, fn_b: FunctionInfo) -> PairKey:
+def _pair_key(fn_a: FunctionRow, fn_b: FunctionRow) -> PairKey:
     """Build a stable pair key for duplicate tracking."""
     return (_function_identity(fn_a), _function_identity(fn_b))
 
 
-def _function_identity(fn: FunctionInfo) -> str:
+def _function_identity(fn: FunctionRow) -> str:
     """Build a stable identity token for one function."""
-    end_line = getattr(fn, "end_line", None)
-    if not isinstance(end_line, int):
-        end_line = int(getattr(fn, "line", 0)) + int(getattr(fn, "loc", 0))
-    return f"{fn.file}:{fn.name}:{fn.line}:{end_line}"
+    return f"{fn.file}:{fn.name}:{fn.line}:{fn.end_line}"
 
 
 def _build_function_cache_map(
-    functions: list[FunctionInfo],
+    functions: FunctionTable,
 ) -> tuple[dict[str, _CachedFunctionMeta], dict[str, int]]:
     """Build cache metadata and index map for function identities."""
     meta_by_id: dict[str, _CachedFunctionMeta] = {}
@@ -115,7 +118,7 @@ def _build_function_cache_map(
     for idx, fn in enumerate(functions):
         func_id = _function_identity(fn)
         meta_by_id[func_id] = {
-            "body_hash": fn.body_hash,
+            "body_hash": fn.hash_key,
             "loc": int(fn.loc),
         }
         index_by_id[func_id] = idx
@@ -126,7 +129,7 @@ def _load_cached_near_pairs(
     *,
     cache: dict[str, object],
     threshold: float,
-    functions: list[FunctionInfo],
+    functions: FunctionTable,
     function_meta: dict[str, _CachedFunctionMeta],
     index_by_id: dict[str, int],
     seen_pairs: set[PairKey],
@@ -188,7 +191,7 @@ def _load_cached_near_pairs(
 
         left_fn = functions[left_idx]
         right_fn = functions[right_idx]
-        if left_fn.body_hash == right_fn.body_hash:
+        if left_fn.hash_key == right_fn.hash_key:
             continue
         pair_key = _pair_key(left_fn, right_fn)
         if pair_key in seen_pairs:
@@ -203,7 +206,7 @@ def _store_dupes_cache(
     *,
     cache: dict[str, object],
     threshold: float,
-    functions: list[FunctionInfo],
+    functions: FunctionTable,
     function_meta: dict[str, _CachedFunctionMeta],
     pairs: list[MatchedPair],
 ) -> None:
@@ -238,13 +241,13 @@ def _store_dupes_cache(
 
 
 def _collect_exact_duplicate_pairs(
-    functions: list[FunctionInfo],
+    functions: FunctionTable,
     seen_pairs: set[PairKey],
 ) -> list[MatchedPair]:
     """Collect exact duplicate pairs (same normalized body hash)."""
-    by_hash: dict[str, list[int]] = {}
-    for idx, fn in enumerate(functions):
-        by_hash.setdefault(fn.body_hash, []).append(idx)
+    by_hash: dict[int, list[int]] = {}
+    for idx, key in enumerate(functions.hash_keys):
+        by_hash.setdefault(key, []).append(idx)
 
     exact_pairs: list[MatchedPair] = []
     for idxs in by_hash.values():
@@ -263,7 +266,7 @@ def _collect_exact_duplicate_pairs(
 
 
 def _collect_near_duplicate_pairs(
-    functions: list[FunctionInfo],
+    functions: FunctionTable,
     threshold: float,
     *,
     seen_pairs: set[PairKey],
@@ -274,10 +277,14 @@ def _collect_near_duplicate_pairs(
     """Collect near-duplicate pairs using SequenceMatcher with pruning."""
     if active_indices is not None and not active_indices:
         return []
-    large_idx = [(idx, fn) for idx, fn in enumerate(functions) if fn.loc >= 15]
+    large_idx = [
+        (idx, functions[idx])
+        for idx, loc in enumerate(functions.locs)
+        if loc >= NORMALIZED_MIN_LOC
+    ]
     large_idx.sort(key=lambda item: item[1].loc)
-    normalized_lines = [fn.normalized.splitlines() for fn in functions]
-    normalized_line_counts = [len(lines) for lines in normalized_lines]
+    normalized_lines = {idx: fn.normalized.splitlines() for idx, fn in large_idx}
+    normalized_line_counts = {idx: len(lines) for idx, lines in normalized_lines.items()}
 
     near_pairs: list[MatchedPair] = []
     near_candidates = 0
@@ -301,7 +308,7 @@ def _collect_near_duplicate_pairs(
             near_candidates += 1
 
             pair_key = _pair_key(fn_a, fn_b)
-            if pair_key in seen_pairs or fn_a.body_hash == fn_b.body_hash:
+            if pair_key in seen_pairs or fn_a.hash_key == fn_b.hash_key:
                 continue
             if active_indices is not None:
                 if idx_a not in active_indices and idx_b not in active_indices:
@@ -357,7 +364,7 @@ def _collect_near_duplicate_pairs(
 
 
 def _build_duplicate_entries(
-    functions: list[FunctionInfo],
+    functions: FunctionTable,
     pairs: list[MatchedPair],
     clusters: list[list[int]],
 ) -> list[DuplicateEntry]:
@@ -413,7 +420,7 @@ def _build_duplicate_entries(
 
 
 def detect_duplicates(
-    functions: list[FunctionInfo],
+    functions: FunctionTable | Sequence[FunctionInfo],
     threshold: float = 0.9,
     *,
     cache: dict[str, object] | None = None,
@@ -421,6 +428,7 @@ def detect_duplicates(
     """Find duplicate or near-duplicate functions clustered by similarity."""
     if not functions:
         return [], 0
+    functions = FunctionTable.coerce(functions)
     debug, debug_every = _dupes_debug_settings()
     seen_pairs: set[PairKey] = set()
 
@@ -0,0 +1,322 @@
+"""Columnar storage for extracted functions shared by review-phase detectors.
+
+Language extractors return one :class:`FunctionInfo` per function, each
+carrying the full body text, its normalized form, a hex digest and a params
+list.  Holding those objects for a whole scan keeps every function body alive
+twice.  :class:`FunctionTable` stores the same data column-wise instead:
+
+* files are interned once and referenced by a small integer id;
+* ``line``/``end_line``/``loc`` live in compact ``array`` columns;
+* body hashes are reduced to 64-bit integer keys;
+* bodies are ``(file id, start, end)`` offsets into the source text served by
+  the scan-scoped reader, and are only materialized on access;
+* normalized text is only retained for functions large enough to take part
+  in near-duplicate matching.
+
+Detectors read rows through :class:`FunctionRow`, a ``__slots__`` view with
+the same attribute names as :class:`FunctionInfo`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import overload
+
+from desloppify.base.discovery.paths import get_project_root
+from desloppify.base.discovery.source import read_source_text
+
+NORMALIZED_MIN_LOC = 15
+_NO_OFFSET = -1
+_EMPTY_PARAMS: tuple[str, ...] = ()
+
+SourceReader = Callable[[str], "str | None"]
+
+
+def hash_key(body_hash: str) -> int:
+    """Reduce a body digest to a stable unsigned 64-bit key."""
+    try:
+        return int(body_hash[:16], 16) if body_hash else 0
+    except ValueError:
+        digest = hashlib.blake2b(body_hash.encode("utf-8", "replace"), digest_size=8)
+        return int.from_bytes(digest.digest(), "big")
+
+
+def read_function_source(filepath: str) -> str | None:
+    """Read a function's source file through the scan reader, or None on error."""
+    path = Path(filepath)
+    if not path.is_absolute():
+        path = get_project_root() / path
+    try:
+        return read_source_text(path)
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _line_starts(text: str) -> array:
+    """Offsets of every line start in *text*."""
+    starts = array("q", [0])
+    offset = text.find("\n")
+    while offset != _NO_OFFSET:
+        starts.append(offset + 1)
+        offset = text.find("\n", offset + 1)
+    return starts
+
+
+class FunctionRow:
+    """Read-only view of one :class:`FunctionTable` row."""
+
+    __slots__ = ("_table", "index")
+
+    def __init__(self, table: FunctionTable, index: int) -> None:
+        self._table = table
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f"FunctionRow({self.file}:{self.line} {self.name})"
+
+    @property
+    def name(self) -> str:
+        return self._table.names[self.index]
+
+    @property
+    def file(self) -> str:
+        return self._table.file_of(self.index)
+
+    @property
+    def line(self) -> int:
+        return self._table.lines[self.index]
+
+    @property
+    def end_line(self) -> int:
+        return self._table.end_lines[self.index]
+
+    @property
+    def loc(self) -> int:
+        return self._table.locs[self.index]
+
+    @property
+    def hash_key(self) -> int:
+        return self._table.hash_keys[self.index]
+
+    @property
+    def body_hash(self) -> str:
+        return format(self._table.hash_keys[self.index], "016x")
+
+    @property
+    def body(self) -> str:
+        return self._table.body_of(self.index)
+
+    @property
+    def normalized(self) -> str:
+        return self._table.normalized.get(self.index, "")
+
+    @property
+    def params(self) -> tuple[str, ...]:
+        return self._table.params[self.index]
+
+    @property
+    def return_annotation(self) -> str | None:
+        return self._table.return_annotations[self.index]
+
+
+class FunctionTable(Sequence[FunctionRow]):
+    """Column-oriented table of extracted functions."""
+
+    def __init__(self) -> None:
+        self.files: list[str] = []
+        self._file_ids: dict[str, int] = {}
+        self.file_ids = array("I")
+        self.names: list[str] = []
+        self.lines = array("q")
+        self.end_lines = array("q")
+        self.locs = array("q")
+        self.hash_keys = array("Q")
+        self.body_starts = array("q")
+        self.body_ends = array("q")
+        self.params: list[tuple[str, ...]] = []
+        self.return_annotations: list[str | None] = []
+        self.normalized: dict[int, str] = {}
+        self.spilled_bodies: dict[int, str] = {}
+        self._source: SourceReader | None = None
+
+    @classmethod
+    def from_functions(
+        cls,
+        functions: Iterable[object],
+        *,
+        source: SourceReader | None = None,
+        normalized_min_loc: int = NORMALIZED_MIN_LOC,
+    ) -> FunctionTable:
+        """Build a table from ``FunctionInfo``-like objects.
+
+        With *source*, bodies found verbatim in their file's text are stored as
+        offsets; anything else (and every body when *source* is None) is kept
+        as a string.
+        """
+        table = cls()
+        table._source = source
+        current_file: str | None = None
+        current_text: str | None = None
+        line_starts: array | None = None
+        for fn in functions:
+            file = str(getattr(fn, "file", ""))
+            if source is not None and file != current_file:
+                current_file = file
+                current_text = source(file)
+                line_starts = _line_starts(current_text) if current_text else None
+            table._append(fn, file, current_text, line_starts, normalized_min_loc)
+        return table
+
+    @classmethod
+    def coerce(cls, functions: Iterable[object]) -> FunctionTable:
+        """Return *functions* as a table, building one without source offsets."""
+        if isinstance(functions, FunctionTable):
+            return functions
+        return cls.from_functions(functions)
+
+    def _intern_file(self, file: str) -> int:
+        file_id = self._file_ids.get(file)
+        if file_id is None:
+            file_id = len(self.files)
+            self._file_ids[file] = file_id
+            self.files.append(file)
+        return file_id
+
+    def _append(
+        self,
+        fn: object,
+        file: str,
+        text: str | None,
+        line_starts: array | None,
+        normalized_min_loc: int,
+    ) -> None:
+        index = len(self.names)
+        line = int(getattr(fn, "line", 0) or 0)
+        loc = int(getattr(fn, "loc", 0) or 0)
+        end_line = getattr(fn, "end_line", None)
+        if not isinstance(end_line, int):
+            end_line = line + loc
+        self.file_ids.append(self._intern_file(file))
+        self.names.append(sys.intern(str(getattr(fn, "name", ""))))
+        self.lines.append(line)
+        self.end_lines.append(end_line)
+        self.locs.append(loc)
+        key = getattr(fn, "hash_key", None)
+        if not isinstance(key, int):
+            key = hash_key(str(getattr(fn, "body_hash", "") or ""))
+        self.hash_keys.append(key)
+
+        params = getattr(fn, "params", None)
+        self.params.append(
+            tuple(sys.intern(str(p)) for p in params) if params else _EMPTY_PARAMS
+        )
+        self.return_annotations.append(getattr(fn, "return_annotation", None))
+        normalized = getattr(fn, "normalized", "")
+        if normalized and loc >= normalized_min_loc:
+            self.normalized[index] = normalized
+
+        body = str(getattr(fn, "body", "") or "")
+        start = self._locate_body(body, text, line_starts, line)
+        if start == _NO_OFFSET:
+            self.body_starts.append(_NO_OFFSET)
+            self.body_ends.append(_NO_OFFSET)
+            if body:
+                self.spilled_bodies[index] = body
+        else:
+            self.body_starts.append(start)
+            self.body_ends.append(start + len(body))
+
+    @staticmethod
+    def _locate_body(
+        body: str,
+        text: str | None,
+        line_starts: array | None,
+        line: int,
+    ) -> int:
+        if not body or not text or line_starts is None:
+            return _NO_OFFSET
+        if 1 <= line <= len(line_starts):
+            guess = line_starts[line - 1]
+            if text.startswith(body, guess):
+                return guess
+            found = text.find(body, guess)
+            if found != _NO_OFFSET:
+                return found
+        return text.find(body)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @overload
+    def __getitem__(self, index: int) -> FunctionRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> FunctionTable: ...
+
+    def __getitem__(self, index: int | slice) -> FunctionRow | FunctionTable:
+        if isinstance(index, slice):
+            return self.take(range(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("function table index out of range")
+        return FunctionRow(self, index)
+
+    def __iter__(self) -> Iterator[FunctionRow]:
+        for index in range(len(self.names)):
+            yield FunctionRow(self, index)
+
+    def file_of(self, index: int) -> str:
+        return self.files[self.file_ids[index]]
+
+    def body_of(self, index: int) -> str:
+        """Materialize the body text of row *index*."""
+        spilled = self.spilled_bodies.get(index)
+        if spilled is not None:
+            return spilled
+        start = self.body_starts[index]
+        if start == _NO_OFFSET or self._source is None:
+            return ""
+        text = self._source(self.file_of(index)) or ""
+        return text[start : self.body_ends[index]]
+
+    def take(self, indices: Iterable[int]) -> FunctionTable:
+        """Return a new table holding rows *indices*, sharing the source reader."""
+        sub = type(self)()
+        sub._source = self._source
+        for new_index, index in enumerate(indices):
+            sub.file_ids.append(sub._intern_file(self.file_of(index)))
+            sub.names.append(self.names[index])
+            sub.lines.append(self.lines[index])
+            sub.end_lines.append(self.end_lines[index])
+            sub.locs.append(self.locs[index])
+            sub.hash_keys.append(self.hash_keys[index])
+            sub.body_starts.append(self.body_starts[index])
+            sub.body_ends.append(self.body_ends[index])
+            sub.params.append(self.params[index])
+            sub.return_annotations.append(self.return_annotations[index])
+            if index in self.normalized:
+                sub.normalized[new_index] = self.normalized[index]
+            if index in self.spilled_bodies:
+                sub.spilled_bodies[new_index] = self.spilled_bodies[index]
+        return sub
+
+    def filter_files(self, keep: Callable[[str], bool]) -> FunctionTable:
+        """Return rows whose file satisfies *keep*, evaluated once per file."""
+        kept_ids = {file_id for file_id, file in enumerate(self.files) if keep(file)}
+        return self.take(
+            index for index, file_id in enumerate(self.file_ids) if file_id in kept_ids
+        )
+
+
+__all__ = [
+    "FunctionRow",
+    "FunctionTable",
+    "NORMALIZED_MIN_LOC",
+    "hash_key",
+    "read_function_source",
+]
@@ -11,7 +11,7 @@ from typing import Any
 
 from desloppify.base.discovery.file_paths import (
 
-    matches_exclusion,
+    compile_exclusions,
 
     rel,
 
@@ -36,13 +36,15 @@ def finalize_graph(graph: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]
     # when an exclude pattern (e.g. "Wan2GP") matches the project root
     # directory name (e.g. "Headless-Wan2GP").
     if exclusions:
+        exclusion_matcher = compile_exclusions(exclusions)
+        project_root = get_project_root()
         excluded_keys = set()
         for k in graph:
             try:
-                rel_k = str(Path(k).relative_to(get_project_root()))
+                rel_k = str(Path(k).relative_to(project_root))
             except ValueError:
                 rel_k = k
-            if any(matches_exclusion(rel_k, ex) for ex in exclusions):
+            if exclusion_matcher.matches(rel_k):
                 excluded_keys.add(k)
         for k in excluded_keys:
             del graph[k]
@@ -0,0 +1,273 @@
+"""Persisted import-graph snapshots with per-file incremental updates.
+
+Dependency-graph builders split their work into two steps: *extract* the raw
+import records of a file (parsing, the expensive part) and *resolve* those
+records to ``(kind, target)`` edges.  :func:`cached_file_edges` runs both
+through an on-disk snapshot, one file per builder and scan root::
+
+    <state dir>/cache/import_graph/<builder>-<root digest>.json
+
+The snapshot interns every path into a node table and stores, per source
+file, its stat signature, raw import records and resolved edges as a flat
+``[kind id, node id, ...]`` array.  On the next run:
+
+- files whose signature is unchanged are not read or parsed again;
+- when the scanned file set and resolution context are unchanged, their
+  stored edges are reused as-is, so an unchanged tree costs one ``stat`` per
+  file;
+- otherwise their stored records are re-resolved (resolution can depend on
+  which files exist), which is cheap next to parsing.
+
+Builders then assemble ``imports``/``importers`` from the per-file edges as
+before.  Snapshots are only used while enabled (scans and graph-dependent
+commands); everywhere else builders extract and resolve directly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from desloppify.base.discovery.file_paths import safe_write_text
+from desloppify.base.discovery.paths import get_project_root
+from desloppify.base.runtime_state import RuntimeContext, resolve_runtime_context
+from desloppify.engine._state.schema import get_state_dir
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+# Ordered (kind, target) edges of one source file.
+FileEdges = list[tuple[str, str]]
+# Raw per-file import records; must survive a JSON round trip.
+ImportRecords = list[Any]
+ExtractFn = Callable[[list[str]], Mapping[str, ImportRecords | None]]
+ResolveFn = Callable[[str, ImportRecords], FileEdges]
+
+
+def graph_snapshot_dir(state_dir: Path) -> Path:
+    """Return the snapshot directory inside a ``.desloppify`` state directory."""
+    return Path(state_dir) / "cache" / "import_graph"
+
+
+def enable_graph_snapshots(
+    directory: Path, *, runtime: RuntimeContext | None = None
+) -> None:
+    """Persist and reuse import-graph snapshots under *directory*."""
+    resolve_runtime_context(runtime).graph_snapshot_dir = Path(directory)
+
+
+def disable_graph_snapshots(*, runtime: RuntimeContext | None = None) -> None:
+    resolve_runtime_context(runtime).graph_snapshot_dir = None
+
+
+@contextmanager
+def graph_snapshot_scope(
+    directory: Path | None = None, *, runtime: RuntimeContext | None = None
+) -> Iterator[None]:
+    """Temporarily enable graph snapshots, restoring the previous setting.
+
+    *directory* defaults to the project's state directory, where scans keep
+    them, so graph-dependent commands reuse the scan's snapshot; projects
+    that were never scanned get no state directory created for them.
+    """
+    resolved_runtime = resolve_runtime_context(runtime)
+    previous = resolved_runtime.graph_snapshot_dir
+    if directory is None and previous is not None:
+        directory = previous
+    elif directory is None:
+        state_dir = get_state_dir()
+        directory = graph_snapshot_dir(state_dir) if state_dir.is_dir() else None
+    resolved_runtime.graph_snapshot_dir = directory
+    try:
+        yield
+    finally:
+        resolved_runtime.graph_snapshot_dir = previous
+
+
+def _digest(*parts: str) -> str:
+    hasher = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        hasher.update(part.encode("utf-8", errors="replace"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def _signature(filepath: str, project_root: Path) -> str | None:
+    abs_path = filepath if os.path.isabs(filepath) else str(project_root / filepath)
+    try:
+        stats = os.stat(abs_path)
+    except OSError:
+        return None
+    return f"{stats.st_size}:{stats.st_mtime_ns}"
+
+
+class _Snapshot:
+    """Decoded snapshot: per-file ``(signature, records, edges)``."""
+
+    def __init__(self, context: str = "") -> None:
+        self.context = context
+        self.files: dict[str, tuple[str | None, ImportRecords | None, FileEdges | None]] = {}
+
+    @classmethod
+    def load(cls, path: Path, *, name: str, root: str) -> _Snapshot:
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError) as exc:
+            logger.debug("Discarding unreadable import-graph snapshot %s: %s", path, exc)
+            return cls()
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != SNAPSHOT_VERSION
+            or payload.get("name") != name
+            or payload.get("root") != root
+        ):
+            return cls()
+        snapshot = cls(str(payload.get("context", "")))
+        nodes: list[str] = payload.get("nodes", [])
+        kinds: list[str] = payload.get("kinds", [])
+        try:
+            for node_id, signature, records, flat_edges in payload.get("files", []):
+                edges = (
+                    [
+                        (kinds[flat_edges[i]], nodes[flat_edges[i + 1]])
+                        for i in range(0, len(flat_edges), 2)
+                    ]
+                    if flat_edges is not None
+                    else None
+                )
+                snapshot.files[nodes[node_id]] = (signature, records, edges)
+        except (TypeError, ValueError, IndexError) as exc:
+            logger.debug("Discarding malformed import-graph snapshot %s: %s", path, exc)
+            return cls()
+        return snapshot
+
+    def dump(self, *, name: str, root: str) -> str:
+        node_ids: dict[str, int] = {}
+        kind_ids: dict[str, int] = {}
+
+        def intern(table: dict[str, int], value: str) -> int:
+            index = table.get(value)
+            if index is None:
+                index = table[value] = len(table)
+            return index
+
+        files = []
+        for filepath, (signature, records, edges) in self.files.items():
+            flat_edges = None
+            if edges is not None:
+                flat_edges = []
+                for kind, target in edges:
+                    flat_edges += [intern(kind_ids, kind), intern(node_ids, target)]
+            files.append([intern(node_ids, filepath), signature, records, flat_edges])
+        return json.dumps(
+            {
+                "version": SNAPSHOT_VERSION,
+                "name": name,
+                "root": root,
+                "context": self.context,
+                "nodes": list(node_ids),
+                "kinds": list(kind_ids),
+                "files": files,
+            },
+            separators=(",", ":"),
+        )
+
+
+def _extract_and_resolve(
+    files: list[str], extract: ExtractFn, resolve: ResolveFn
+) -> dict[str, tuple[ImportRecords | None, FileEdges | None]]:
+    records = extract(files) if files else {}
+    out: dict[str, tuple[ImportRecords | None, FileEdges | None]] = {}
+    for filepath in files:
+        file_records = records.get(filepath)
+        out[filepath] = (
+            file_records,
+            resolve(filepath, file_records) if file_records is not None else None,
+        )
+    return out
+
+
+def cached_file_edges(
+    name: str,
+    path: Path,
+    files: Sequence[str],
+    *,
+    extract: ExtractFn,
+    resolve: ResolveFn,
+    context: str = "",
+    runtime: RuntimeContext | None = None,
+) -> dict[str, FileEdges | None]:
+    """Return resolved edges per file, in *files* order.
+
+    ``extract(files)`` maps each file to its raw import records, or omits it
+    (``None``) when the file contributes no graph entry (unreadable,
+    unparseable).  ``resolve(file, records)`` turns records into ordered
+    ``(kind, target)`` edges.  *context* names anything besides the file set
+    that changes resolution (tsconfig paths, builder options).
+    """
+    file_list = list(files)
+    directory = resolve_runtime_context(runtime).graph_snapshot_dir
+    if directory is None:
+        return {
+            filepath: edges
+            for filepath, (_records, edges) in _extract_and_resolve(
+                file_list, extract, resolve
+            ).items()
+        }
+
+    project_root = get_project_root()
+    root = str(Path(path).resolve())
+    snapshot_path = Path(directory) / f"{name}-{_digest(root)[:12]}.json"
+    previous = _Snapshot.load(snapshot_path, name=name, root=root)
+    context_key = _digest(str(project_root), context, *sorted(file_list))
+    reuse_edges = previous.context == context_key
+
+    signatures = {filepath: _signature(filepath, project_root) for filepath in file_list}
+    changed = [
+        filepath
+        for filepath in file_list
+        if signatures[filepath] is None
+        or filepath not in previous.files
+        or previous.files[filepath][0] != signatures[filepath]
+    ]
+    fresh = _extract_and_resolve(changed, extract, resolve)
+
+    current = _Snapshot(context_key)
+    result: dict[str, FileEdges | None] = {}
+    for filepath in file_list:
+        if filepath in fresh:
+            records, edges = fresh[filepath]
+        else:
+            _, records, edges = previous.files[filepath]
+            if not reuse_edges:
+                edges = resolve(filepath, records) if records is not None else None
+        current.files[filepath] = (signatures[filepath], records, edges)
+        result[filepath] = edges
+
+    if changed or not reuse_edges or len(previous.files) != len(file_list):
+        try:
+            safe_write_text(snapshot_path, current.dump(name=name, root=root))
+        except OSError as exc:
+            logger.debug("Could not write import-graph snapshot %s: %s", snapshot_path, exc)
+    return result
+
+
+__all__ = [
+    "FileEdges",
+    "ImportRecords",
+    "SNAPSHOT_VERSION",
+    "cached_file_edges",
+    "disable_graph_snapshots",
+    "enable_graph_snapshots",
+    "graph_snapshot_dir",
+    "graph_snapshot_scope",
+]
@@ -4,7 +4,9 @@ Replaces boilerplate_duplication.py with a thin adapter around jscpd
 (https://github.com/kucherenko/jscpd), which uses proper per-language
 tokenisation and supports type-2 clones (renamed identifiers).
 
-Falls back gracefully to None when jscpd/npx is not installed.
+Falls back gracefully to None when jscpd/npx is not installed.  The scan
+pipeline uses the native detector in ``clones`` instead; this adapter is kept
+for comparison runs (see ``dev/benchmarks/bench_clones.py``).
 """
 
 from __future__ import annotations
@@ -18,13 +20,11 @@ import tempfile
 from pathlib import Path
 
 from desloppify.base.discovery.source import (
-
     collect_exclude_dirs,
-
     get_exclusions,
-
 )
 from desloppify.base.output.fallbacks import warn_best_effort
+from desloppify.engine.detectors.clones import is_artifact_path, is_build_mirror_pair
 
 logger = logging.getLogger(__name__)
 
@@ -38,9 +38,6 @@ _BASE_IGNORES = (
     "**/.claude/**",
 )
 
-_ARTIFACT_PREFIXES = ("build/", "dist/", ".desloppify/", ".claude/")
-_BUILD_MIRROR_PREFIX = "build/lib/"
-
 
 def _to_scan_relative(path_resolved: Path, name: str) -> str | None:
     """Return scan-relative path, or None when file is outside scan path."""
@@ -53,18 +50,6 @@ def _to_scan_relative(path_resolved: Path, name: str) -> str | None:
     return str(rel).replace("\\", "/")
 
 
-def _is_artifact_path(rel_path: str) -> bool:
-    return rel_path.startswith(_ARTIFACT_PREFIXES)
-
-
-def _is_build_mirror_pair(first_rel: str, second_rel: str) -> bool:
-    if first_rel.startswith(_BUILD_MIRROR_PREFIX):
-        return first_rel[len(_BUILD_MIRROR_PREFIX):] == second_rel
-    if second_rel.startswith(_BUILD_MIRROR_PREFIX):
-        return second_rel[len(_BUILD_MIRROR_PREFIX):] == first_rel
-    return False
-
-
 def _as_jscpd_globs(pattern: str) -> list[str]:
     raw = pattern.strip().replace("\\", "/").strip("/")
     if not raw:
@@ -123,9 +108,9 @@ def _parse_jscpd_report(report: dict, scan_path: Path) -> list[dict]:
             continue
         if (
             first_rel == second_rel
-            or _is_artifact_path(first_rel)
-            or _is_artifact_path(second_rel)
-            or _is_build_mirror_pair(first_rel, second_rel)
+            or is_artifact_path(first_rel)
+            or is_artifact_path(second_rel)
+            or is_build_mirror_pair(first_rel, second_rel)
         ):
             continue
 
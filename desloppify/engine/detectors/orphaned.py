@@ -9,6 +9,7 @@ from pathlib import Path
 
 from desloppify.base.discovery.file_paths import rel
 from desloppify.base.discovery.file_paths import count_lines
+from desloppify.base.discovery.source import read_file_text
 
 _DUNDER_ALL_RE = re.compile(r"^__all__\s*[:=]", re.MULTILINE)
 
@@ -25,9 +26,8 @@ class OrphanedDetectionOptions:
 
 def _has_dunder_all(filepath: str) -> bool:
     """Return True if the file defines ``__all__``, signaling a public API surface."""
-    try:
-        text = Path(filepath).read_text(encoding="utf-8", errors="replace")
-    except OSError:
+    text = read_file_text(filepath)
+    if text is None:
         return False
     return _DUNDER_ALL_RE.search(text) is not None
 
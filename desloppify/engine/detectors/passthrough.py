@@ -7,7 +7,7 @@ the shared core that classifies parameters as passthrough vs direct-use.
 from __future__ import annotations
 
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
 
 def classify_passthrough_tier(
@@ -32,12 +32,16 @@ def classify_passthrough_tier(
 
 
 def classify_params(
-    params: list[str],
+    params: Sequence[str],
     body: str,
     make_pattern: Callable[[str], str],
     occurrences_per_match: int = 2,
 ) -> tuple[list[str], list[str]]:
-    """Classify params as passthrough vs direct-use from body text matches."""
+    """Classify params as passthrough vs direct-use from body text matches.
+
+    Accepts ``FunctionTable`` rows directly: ``row.params`` is a tuple and
+    ``row.body`` is sliced from the shared source buffer on access.
+    """
     passthrough = []
     direct = []
     for name in params:
@@ -0,0 +1,194 @@
+"""Multi-pattern line scanner shared by regex rule catalogs.
+
+Line-based catalogs (Python/TypeScript smells, generic security rules) used
+to run every rule's regex over every line.  ``MultiPatternScanner`` derives
+*literal anchors* for each rule at compile time — a set of substrings one of
+which must occur in any match — and uses them as a prefilter:
+
+* once per file, rules whose anchors never occur in the text are dropped;
+* per line, a rule's regex only runs when one of its anchors is present.
+
+Anchors are compared against lower-cased text, which can only admit more
+candidates for case-sensitive rules.  ``re.IGNORECASE`` rules fold case the
+Unicode way (``s`` also matches ``ſ``, ``i`` matches ``ı``), so their anchors
+are only used on pure-ASCII text.  Rules without a usable anchor are always
+evaluated.
+A single combined alternation does not help here: the backtracking engine
+tries every branch at every position, so it costs about as much as the
+separate searches.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Container, Hashable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from re import _constants as _sre
+from re import _parser as _sre_parse
+from typing import Generic, TypeVar
+
+_K = TypeVar("_K", bound=Hashable)
+
+_REPEATS = (_sre.MAX_REPEAT, _sre.MIN_REPEAT, _sre.POSSESSIVE_REPEAT)
+
+
+@dataclass
+class ScanStats:
+    """Regex evaluations performed versus the naive one-search-per-rule cost."""
+
+    lines: int = 0
+    searches: int = 0
+    naive_searches: int = 0
+
+    @property
+    def passes_saved(self) -> int:
+        return self.naive_searches - self.searches
+
+
+def _best(candidates: list[frozenset[str]]) -> frozenset[str] | None:
+    if not candidates:
+        return None
+    return max(candidates, key=lambda options: (min(map(len, options)), -len(options)))
+
+
+def _required_literals(items: Iterable[tuple[object, object]]) -> frozenset[str] | None:
+    """Return substrings one of which every match of *items* must contain."""
+    candidates: list[frozenset[str]] = []
+    run: list[str] = []
+
+    def _flush() -> None:
+        if run:
+            candidates.append(frozenset({"".join(run).lower()}))
+            run.clear()
+
+    for op, arg in items:
+        if op is _sre.LITERAL:
+            run.append(chr(arg))
+            continue
+        _flush()
+        sub: frozenset[str] | None = None
+        if op is _sre.SUBPATTERN:
+            sub = _required_literals(arg[-1])
+        elif op is _sre.ATOMIC_GROUP:
+            sub = _required_literals(arg)
+        elif op in _REPEATS and arg[0] >= 1:
+            sub = _required_literals(arg[2])
+        elif op is _sre.BRANCH:
+            branches = [_required_literals(branch) for branch in arg[1]]
+            if all(branch is not None for branch in branches):
+                sub = frozenset().union(*branches)
+        if sub:
+            candidates.append(sub)
+    _flush()
+    return _best(candidates)
+
+
+def literal_anchors(
+    pattern: re.Pattern[str], *, ascii_text: bool = False
+) -> frozenset[str] | None:
+    """Lower-cased literal anchors for *pattern*, or None when none can be derived.
+
+    Unicode ``re.IGNORECASE`` patterns only get anchors when *ascii_text* says
+    the scanned text is pure ASCII (and the anchors are ASCII themselves).
+    """
+    try:
+        parsed = _sre_parse.parse(pattern.pattern, pattern.flags)
+    except (re.error, TypeError):
+        return None
+    anchors = _required_literals(parsed)
+    if not anchors or "" in anchors:
+        return None
+    if pattern.flags & re.IGNORECASE and not pattern.flags & re.ASCII:
+        if not ascii_text or not all(anchor.isascii() for anchor in anchors):
+            return None
+    return anchors
+
+
+class MultiPatternScanner(Generic[_K]):
+    """Match a catalog of ``(key, pattern)`` rules against lines.
+
+    ``search(line)`` returns ``(key, match)`` for every rule whose pattern
+    matches, in catalog order; each match is identical to
+    ``pattern.search(line)`` for that rule.
+    """
+
+    def __init__(self, rules: Iterable[tuple[_K, str | re.Pattern[str]]]) -> None:
+        self._rules: list[tuple[_K, re.Pattern[str]]] = [
+            (key, re.compile(pattern) if isinstance(pattern, str) else pattern)
+            for key, pattern in rules
+        ]
+        self._anchors: list[frozenset[str] | None] = [
+            literal_anchors(pattern) for _key, pattern in self._rules
+        ]
+        self._ascii_anchors: list[frozenset[str] | None] = [
+            literal_anchors(pattern, ascii_text=True) for _key, pattern in self._rules
+        ]
+        self._all = tuple(range(len(self._rules)))
+        self.stats = ScanStats()
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    @property
+    def rules(self) -> list[tuple[_K, re.Pattern[str]]]:
+        return list(self._rules)
+
+    def _anchors_for(self, text: str) -> list[frozenset[str] | None]:
+        return self._ascii_anchors if text.isascii() else self._anchors
+
+    def active_rules(self, text: str) -> tuple[int, ...]:
+        """Indexes of rules that can possibly match somewhere in *text*."""
+        lowered = text.lower()
+        return tuple(
+            index
+            for index, anchors in enumerate(self._anchors_for(text))
+            if anchors is None or any(anchor in lowered for anchor in anchors)
+        )
+
+    def search(
+        self,
+        line: str,
+        *,
+        active: Sequence[int] | None = None,
+    ) -> list[tuple[_K, re.Match[str]]]:
+        stats = self.stats
+        stats.lines += 1
+        stats.naive_searches += len(self._rules)
+        lowered = line.lower()
+        all_anchors = self._anchors_for(line)
+        found: list[tuple[_K, re.Match[str]]] = []
+        for index in self._all if active is None else active:
+            anchors = all_anchors[index]
+            if anchors is not None and not any(anchor in lowered for anchor in anchors):
+                continue
+            stats.searches += 1
+            key, pattern = self._rules[index]
+            match = pattern.search(line)
+            if match is not None:
+                found.append((key, match))
+        return found
+
+    def keys(self, line: str) -> set[_K]:
+        """Return the keys of every rule matching *line*."""
+        return {key for key, _match in self.search(line)}
+
+    def scan_lines(
+        self,
+        lines: Sequence[str],
+        *,
+        skip: Container[int] = (),
+    ) -> Iterator[tuple[int, _K, re.Match[str]]]:
+        """Yield ``(line_index, key, match)`` across *lines*, skipping indexes in *skip*."""
+        active = self.active_rules("\n".join(lines))
+        if not active:
+            self.stats.lines += len(lines)
+            self.stats.naive_searches += len(lines) * len(self._rules)
+            return
+        for index, line in enumerate(lines):
+            if index in skip:
+                continue
+            for key, match in self.search(line, active=active):
+                yield index, key, match
+
+
+__all__ = ["MultiPatternScanner", "ScanStats", "literal_anchors"]
@@ -31,6 +31,10 @@ from desloppify.engine.detectors.patterns.security import (
     is_placeholder as _is_placeholder,
 )
 
+# Bump whenever rule patterns or entry shapes change; per-file security cache
+# entries recorded under an older version are discarded.
+SECURITY_RULES_VERSION = 1
+
 
 @dataclass(frozen=True)
 class SecurityRule:
@@ -4,6 +4,15 @@ from __future__ import annotations
 
 from typing import Any
 
+from desloppify.engine.detectors.patterns.multi import MultiPatternScanner
+from desloppify.engine.detectors.patterns.security import (
+    LOG_CALLS,
+    RANDOM_CALLS,
+    SECRET_FORMAT_PATTERNS,
+    SECRET_NAMES,
+    WEAK_CRYPTO_PATTERNS,
+)
+
 from .rules import (
     _insecure_random_entries,
     _secret_format_entries,
@@ -12,6 +21,18 @@ from .rules import (
     _weak_crypto_entries,
 )
 
+# Each rule family is keyed by a pattern every reportable line must match, so
+# one combined search rejects lines before any rule builder runs.
+_LINE_SCANNER = MultiPatternScanner(
+    [
+        *(("secret_format", pattern) for _, pattern, _, _ in SECRET_FORMAT_PATTERNS),
+        ("secret_name", SECRET_NAMES),
+        ("insecure_random", RANDOM_CALLS),
+        *(("weak_crypto", pattern) for pattern, _, _, _ in WEAK_CRYPTO_PATTERNS),
+        ("log_sensitive", LOG_CALLS),
+    ]
+)
+
 
 def _scan_line_for_security_entries(
     *,
@@ -21,10 +42,18 @@ def _scan_line_for_security_entries(
     is_test: bool,
 ) -> list[dict[str, Any]]:
     """Evaluate one source line against all generic security checks."""
+    hits = _LINE_SCANNER.keys(line)
     entries: list[dict[str, Any]] = []
-    entries.extend(_secret_format_entries(filepath, line_num, line, is_test))
-    entries.extend(_secret_name_entries(filepath, line_num, line, is_test))
-    entries.extend(_insecure_random_entries(filepath, line_num, line))
-    entries.extend(_weak_crypto_entries(filepath, line_num, line))
-    entries.extend(_sensitive_log_entries(filepath, line_num, line))
+    if not hits:
+        return entries
+    if "secret_format" in hits:
+        entries.extend(_secret_format_entries(filepath, line_num, line, is_test))
+    if "secret_name" in hits:
+        entries.extend(_secret_name_entries(filepath, line_num, line, is_test))
+    if "insecure_random" in hits:
+        entries.extend(_insecure_random_entries(filepath, line_num, line))
+    if "weak_crypto" in hits:
+        entries.extend(_weak_crypto_entries(filepath, line_num, line))
+    if "log_sensitive" in hits:
+        entries.extend(_sensitive_log_entries(filepath, line_num, line))
     return entries
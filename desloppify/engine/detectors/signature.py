@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Sequence
 
 from desloppify.engine.detectors.base import FunctionInfo
+from desloppify.engine.detectors.function_table import FunctionRow, FunctionTable
 
 # Names that are legitimately polymorphic — skip them
 _ALLOWLIST = {
@@ -76,7 +78,7 @@ def _signature_group_keys(name: str) -> list[tuple[str, str]]:
 
 
 def detect_signature_variance(
-    functions: list[FunctionInfo],
+    functions: FunctionTable | Sequence[FunctionInfo],
     min_occurrences: int = 3,
 ) -> tuple[list[dict], int]:
     """Find function names appearing 3+ times across files with different signatures.
@@ -91,8 +93,9 @@ def detect_signature_variance(
         "variants": list[dict] # [{file, line, params, param_count}]
     }
     """
+    functions = FunctionTable.coerce(functions)
     # Group by exact function name and select naming-pattern groups.
-    by_group: dict[tuple[str, str], list[FunctionInfo]] = defaultdict(list)
+    by_group: dict[tuple[str, str], list[FunctionRow]] = defaultdict(list)
     for fn in functions:
         normalized_name = fn.name.lstrip("_")
         is_phase_pattern = normalized_name.startswith("phase_")
@@ -108,7 +111,7 @@ def detect_signature_variance(
     entries = []
     for (group_type, group_name), fns in by_group.items():
         # Need at least min_occurrences across different files
-        distinct_files = set(getattr(f, "file", "") for f in fns)
+        distinct_files = set(f.file for f in fns)
         if len(distinct_files) < min_occurrences:
             continue
 
@@ -118,11 +121,11 @@ def detect_signature_variance(
             params = [p for p in fn.params if p not in ("self", "cls")]
             variants.append(
                 {
-                    "file": getattr(fn, "file", ""),
+                    "file": fn.file,
                     "line": fn.line,
                     "params": params,
                     "param_count": len(params),
-                    "return_annotation": getattr(fn, "return_annotation", None),
+                    "return_annotation": fn.return_annotation,
                 }
             )
 
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 
+from desloppify.base.discovery.source import read_source_text
 from desloppify.base.output.fallbacks import log_best_effort_failure, warn_best_effort
 
 logger = logging.getLogger(__name__)
@@ -37,7 +38,7 @@ def read_coverage_file(
 ) -> CoverageFileReadResult:
     """Read a source file and emit one best-effort warning per context/path."""
     try:
-        return CoverageFileReadResult(ok=True, content=Path(filepath).read_text(encoding="utf-8"))
+        return CoverageFileReadResult(ok=True, content=read_source_text(Path(filepath), encoding="utf-8"))
     except (OSError, UnicodeDecodeError) as exc:
         log_best_effort_failure(logger, f"{context} read {filepath}", exc)
         _warn_read_failure_once(context, filepath, exc.__class__.__name__)
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import math
 
+from desloppify.base.discovery.source import read_file_facts
+
 from .io import read_coverage_file
 
 # Minimum LOC threshold — tiny files don't need dedicated tests
@@ -16,6 +18,9 @@ _COMPLEXITY_TIER_UPGRADE = 20
 
 def _file_loc(filepath: str) -> int:
     """Count lines in a file, returning 0 when unreadable."""
+    facts = read_file_facts(filepath)
+    if facts is not None:
+        return facts.text_loc
     read_result = read_coverage_file(filepath, context="loc_count")
     if not read_result.ok:
         return 0
@@ -9,6 +9,8 @@ from pathlib import Path
 from desloppify.base.discovery.file_paths import rel
 from desloppify.base.output.terminal import colorize
 from desloppify.base.discovery.paths import get_project_root
+from desloppify.base.discovery.source import prefetch_file_texts
+from desloppify.base.profiling import profile_span
 from desloppify.engine.planning.helpers import is_subjective_phase
 from desloppify.engine.policy.zones import ZONE_POLICIES, FileZoneMap
 from desloppify.languages.framework import (
@@ -21,6 +23,7 @@ from desloppify.languages.framework import (
     capability_report,
     get_lang,
     make_lang_run,
+    preparse_treesitter_sources,
     prewarm_review_phase_detectors,
 )
 from desloppify.state_io import Issue
@@ -77,6 +80,13 @@ def _build_zone_map(path: Path, lang: LangRun, zone_overrides: dict[str, str] |
             _stderr(f"  Not available: {', '.join(missing)}")
 
 
+def _prefetch_sources(path: Path, lang: LangRun) -> None:
+    """Start read-ahead of the language's files; no-op outside a file-cache scope."""
+    file_finder = getattr(lang, "file_finder", None)
+    if file_finder:
+        prefetch_file_texts(file_finder(path))
+
+
 def _select_phases(lang: LangRun, *, include_slow: bool, profile: str) -> list[DetectorPhase]:
     active_profile = profile if profile in {"objective", "full", "ci"} else "full"
     phases = lang.phases
@@ -94,7 +104,8 @@ def _run_phases(path: Path, lang: LangRun, phases: list[DetectorPhase]) -> tuple
     total = len(phases)
     for idx, phase in enumerate(phases, start=1):
         _stderr(f"  [{idx}/{total}] {phase.label}...")
-        phase_issues, phase_potentials = phase.run(path, lang)
+        with profile_span(phase.label, category="phase"):
+            phase_issues, phase_potentials = phase.run(path, lang)
         all_potentials.update(phase_potentials)
         issues.extend(phase_issues)
 
@@ -130,10 +141,15 @@ def _generate_issues_from_lang(
     profile: str = "full",
 ) -> tuple[list[Issue], dict[str, int]]:
     """Run detector phases from a LangRun."""
-    _build_zone_map(path, lang, zone_overrides)
+    with profile_span("discovery + zones"):
+        _build_zone_map(path, lang, zone_overrides)
+        _prefetch_sources(path, lang)
     phases = _select_phases(lang, include_slow=include_slow, profile=profile)
-    prewarm_review_phase_detectors(path, lang, phases)
+    with profile_span("review prewarm"):
+        prewarm_review_phase_detectors(path, lang, phases)
     try:
+        with profile_span("tree-sitter pre-parse"):
+            preparse_treesitter_sources(path, lang, phases)
         issues, all_potentials = _run_phases(path, lang, phases)
     finally:
         clear_review_phase_prefetch(lang)
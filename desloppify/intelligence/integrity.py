@@ -9,6 +9,8 @@ from __future__ import annotations
 from collections.abc import Iterable, Mapping
 
 from desloppify.engine._state.issue_semantics import is_assessment_request
+from desloppify.engine._state.schema import StateModel
+from desloppify.engine._state.views import memoized_view, open_issues
 from desloppify.engine._scoring.policy.core import (
     SUBJECTIVE_TARGET_MATCH_TOLERANCE,
     matches_target_score,
@@ -19,6 +21,7 @@ __all__ = [
     "is_holistic_subjective_issue",
     "is_subjective_review_open",
     "matches_target_score",
+    "state_subjective_review_open_breakdown",
     "subjective_review_open_breakdown",
     "unassessed_subjective_dimensions",
 ]
@@ -104,6 +107,17 @@ def subjective_review_open_breakdown(
     return total, reason_counts, dimension_counts
 
 
+def state_subjective_review_open_breakdown(
+    state: StateModel,
+) -> tuple[int, dict[str, int], dict[str, int]]:
+    """``subjective_review_open_breakdown`` over all of *state*, memoized per revision."""
+    return memoized_view(
+        state,
+        "subjective_review_open_breakdown",
+        lambda: subjective_review_open_breakdown(open_issues(state)),
+    )
+
+
 def unassessed_subjective_dimensions(dim_scores: dict | None) -> list[str]:
     """Return subjective dimension display names that are still 0% placeholders."""
     if not dim_scores:
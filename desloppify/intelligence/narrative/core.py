@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+from desloppify.engine._state.views import memoized_view
 from desloppify.intelligence.narrative.action_engine import compute_actions
 from desloppify.intelligence.narrative.action_models import (
     ActionContext,
@@ -85,7 +86,11 @@ def compute_narrative(
     strict_score, overall_score = _score_snapshot(state)
     issues = _scoped_issues(state)
 
-    by_detector = _count_open_by_detector(issues)
+    by_detector = memoized_view(
+        state,
+        ("narrative_open_by_detector", state.get("scan_path")),
+        lambda: _count_open_by_detector(issues),
+    )
     badge = _compute_badge_status()
 
     phase = detect_phase(history, strict_score)
@@ -8,7 +8,7 @@ from desloppify.engine._scoring.policy.core import (
     TIER_WEIGHTS,
 )
 from desloppify.engine._scoring.results.core import compute_score_impact
-from desloppify.engine._state.filtering import path_scoped_issues
+from desloppify.engine._state.views import scoped_issues
 from desloppify.intelligence.narrative._constants import STRUCTURAL_MERGE
 from desloppify.state_io import StateModel
 
@@ -63,9 +63,7 @@ def _lowest_dimensions(dim_scores: dict, potentials: dict) -> list[dict]:
 def _biggest_gap_dimensions(dim_scores: dict, state: StateModel) -> list[dict]:
     """Build summary entries for dimensions with the biggest strict gap."""
     biggest_gap = []
-    scoped = path_scoped_issues(
-        (state.get("work_items") or state.get("issues", {})), state.get("scan_path")
-    )
+    scoped = scoped_issues(state, state.get("scan_path"))
     for name, ds in dim_scores.items():
         lenient = ds["score"]
         strict = ds.get("strict", lenient)
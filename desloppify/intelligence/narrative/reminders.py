@@ -23,7 +23,7 @@ from desloppify.intelligence.narrative.reminders_rules_primary import (
     _wontfix_debt_reminders,
     _zone_classification_reminder,
 )
-from desloppify.engine._state.filtering import path_scoped_issues
+from desloppify.engine._state.views import scoped_issues as state_scoped_issues
 from desloppify.state_io import StateModel
 from desloppify.state_scoring import score_snapshot
 
@@ -44,9 +44,7 @@ def compute_reminders(
 
     strict_score = score_snapshot(state).strict
     reminder_history = state.get("reminder_history", {})
-    scoped_issues = path_scoped_issues(
-        (state.get("work_items") or state.get("issues", {})), state.get("scan_path")
-    )
+    scoped_issues = state_scoped_issues(state, state.get("scan_path"))
     fp_rates = _compute_fp_rates(scoped_issues)
 
     reminders: list[dict] = []
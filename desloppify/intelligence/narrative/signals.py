@@ -25,7 +25,7 @@ from desloppify.intelligence.narrative.types import (
     StrictTarget,
     VerificationStep,
 )
-from desloppify.engine._state.filtering import path_scoped_issues
+from desloppify.engine._state.views import scoped_issues as state_scoped_issues
 from desloppify.state_io import Issue, StateModel
 from desloppify.state_scoring import score_snapshot as state_score_snapshot
 
@@ -272,9 +272,7 @@ def history_for_lang(raw_history: list[dict], lang: str | None) -> list[dict]:
 
 
 def scoped_issues(state: StateModel) -> dict[str, Issue]:
-    return path_scoped_issues(
-        (state.get("work_items") or state.get("issues", {})), state.get("scan_path")
-    )
+    return state_scoped_issues(state, state.get("scan_path"))
 
 
 def score_snapshot(state: StateModel) -> tuple[float | None, float | None]:
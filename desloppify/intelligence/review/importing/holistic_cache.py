@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any
 
 from desloppify.engine._state.schema import StateModel, utc_now
+from desloppify.engine._state.views import bump_revision
 from desloppify.intelligence.review.dimensions.data import load_dimensions_for_lang
 from desloppify.intelligence.review.importing.cache import refresh_review_file_cache
 from desloppify.intelligence.review.selection import hash_file
@@ -154,6 +155,7 @@ def resolve_holistic_coverage_issues(
             "scan_verified": False,
         }
         diff["auto_resolved"] += 1
+    bump_revision(state)
 
 
 def resolve_reviewed_file_coverage_issues(
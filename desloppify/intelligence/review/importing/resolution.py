@@ -6,6 +6,7 @@ from collections.abc import Callable
 from typing import Any
 
 from desloppify.engine._state.schema import Issue, StateModel, utc_now
+from desloppify.engine._state.views import bump_revision
 
 
 def auto_resolve_review_issues(
@@ -38,3 +39,4 @@ def auto_resolve_review_issues(
             "scan_verified": False,
         }
         diff["auto_resolved"] += 1
+    bump_revision(state)
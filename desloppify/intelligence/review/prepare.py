@@ -16,6 +16,8 @@ from desloppify.base.discovery.source import (
 
     enable_file_cache,
 
+    file_loc,
+
     is_file_cache_enabled,
 
     read_file_text,
@@ -217,7 +219,7 @@ def _build_file_requests(files: list[str], lang: object, state: dict) -> list[di
                 "file": rpath,
                 "content": content,
                 "zone": zone,
-                "loc": len(content.splitlines()),
+                "loc": file_loc(abs_path(filepath)),
                 "neighbors": neighbors,
                 "existing_issues": get_file_issues(state, filepath),
             }
@@ -61,7 +61,7 @@ SHARED_PHASE_FACTORIES = {
     ),
     "boilerplate_duplication": _make_detector_phase_factory(
         "Boilerplate duplication", phase_boilerplate_duplication, slow=True,
-        exclusive_detector="desloppify.engine.detectors.jscpd_adapter",
+        exclusive_detector="desloppify.engine.detectors.clones",
     ),
 }
 
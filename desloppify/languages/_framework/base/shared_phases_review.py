@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import concurrent.futures
+import contextvars
 import hashlib
 import logging
 import os
@@ -12,13 +13,18 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
-from desloppify.base.discovery.file_paths import rel
+from desloppify.base.discovery.file_paths import rel, resolve_scan_file
+from desloppify.base.discovery.source import read_file_facts
 from desloppify.base.output.terminal import log
+from desloppify.base.parallel import register_before_fork
+from desloppify.base.profiling import profile_span
 from desloppify.engine.detectors.dupes import detect_duplicates
-from desloppify.engine.detectors.jscpd_adapter import detect_with_jscpd
+from desloppify.engine.detectors.clones import CLONE_DETECTOR_VERSION, detect_clones
+from desloppify.engine.detectors.function_table import FunctionTable, read_function_source
 from desloppify.engine.detectors.security.detector import (
     detect_security_issues as _detect_security_issues_default,
 )
+from desloppify.engine.detectors.security.rules import SECURITY_RULES_VERSION
 from desloppify.engine.detectors.test_coverage.detector import detect_test_coverage
 from desloppify.engine._state.filtering import make_issue
 from desloppify.engine.policy.zones import EXCLUDED_ZONES, filter_entries
@@ -45,6 +51,7 @@ from .shared_phases_helpers import (
 detect_security_issues = _detect_security_issues_default
 
 _DETECTOR_CACHE_VERSION = 1
+_SECURITY_CACHE_VERSION = 2
 _PREFETCH_ATTR = "_shared_review_prefetch_futures"
 _FUNCTION_CACHE_ATTR = "_shared_review_function_cache"
 _PREFETCH_BOILERPLATE_KEY = "boilerplate"
@@ -52,8 +59,29 @@ _PREFETCH_SECURITY_KEY = "security_lang"
 _PREFETCH_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=2)
 
 
-def _detector_cache(review_cache: object, detector: str) -> dict[str, object] | None:
-    """Return mutable detector cache payload from review cache."""
+def _drain_prefetch_executor() -> None:
+    """Finish prewarm work and stop its threads so a worker pool can fork."""
+    global _PREFETCH_EXECUTOR
+    executor = _PREFETCH_EXECUTOR
+    if not isinstance(executor, concurrent.futures.ThreadPoolExecutor):
+        return
+    executor.shutdown(wait=True)
+    _PREFETCH_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+
+register_before_fork(_drain_prefetch_executor)
+
+
+def _detector_cache(lang: object, detector: str) -> dict[str, object] | None:
+    """Return the mutable cache payload for one detector.
+
+    Scans attach a ``DetectorCacheStore`` (one file per detector beside the
+    state file); runtimes without one fall back to ``review_cache``.
+    """
+    store = getattr(lang, "detector_caches", None)
+    if store is not None:
+        return store.get(detector)
+    review_cache = getattr(lang, "review_cache", None)
     if not isinstance(review_cache, dict):
         return None
     detectors = review_cache.get("detectors")
@@ -67,16 +95,28 @@ def _detector_cache(review_cache: object, detector: str) -> dict[str, object] |
     return payload
 
 
-def _dupes_cache(review_cache: object) -> dict[str, object] | None:
-    return _detector_cache(review_cache, "dupes")
+def _dupes_cache(lang: object) -> dict[str, object] | None:
+    return _detector_cache(lang, "dupes")
+
 
+def _boilerplate_cache(lang: object) -> dict[str, object] | None:
+    return _detector_cache(lang, "boilerplate")
 
-def _boilerplate_cache(review_cache: object) -> dict[str, object] | None:
-    return _detector_cache(review_cache, "boilerplate")
+
+def _clone_fingerprint_cache(lang: object) -> dict[str, object] | None:
+    return _detector_cache(lang, "boilerplate_fingerprints")
+
+
+def _boilerplate_fingerprint(path: Path, lang: object, files: list[str]) -> str:
+    return _file_fingerprint(
+        scan_root=path,
+        files=files,
+        salt=f"boilerplate:{getattr(lang, 'name', '')}:{CLONE_DETECTOR_VERSION}",
+    )
 
 
-def _security_cache(review_cache: object) -> dict[str, object] | None:
-    return _detector_cache(review_cache, "security")
+def _security_cache(lang: object) -> dict[str, object] | None:
+    return _detector_cache(lang, "security")
 
 
 def _get_prefetch_futures(
@@ -152,19 +192,26 @@ def _has_phase(
     return False
 
 
-def _resolve_review_functions(path: Path, lang: LangRuntimeContract):
-    """Resolve language function extraction once per scan path."""
+def _resolve_review_functions(path: Path, lang: LangRuntimeContract) -> FunctionTable:
+    """Resolve language function extraction once per scan path.
+
+    The extracted ``FunctionInfo`` list is folded into a columnar table right
+    away so full bodies are not kept alive for the rest of the scan.
+    """
     cache = getattr(lang, _FUNCTION_CACHE_ATTR, None)
     if not isinstance(cache, dict):
         cache = {}
         setattr(lang, _FUNCTION_CACHE_ATTR, cache)
     cache_key = str(path.resolve())
     cached = cache.get(cache_key)
-    if isinstance(cached, list):
+    if isinstance(cached, FunctionTable):
         return cached
-    extracted = lang.extract_functions(path)
-    cache[cache_key] = extracted
-    return extracted
+    table = FunctionTable.from_functions(
+        lang.extract_functions(path),
+        source=read_function_source,
+    )
+    cache[cache_key] = table
+    return table
 
 
 def _resolve_detector_files(path: Path, lang: LangRuntimeContract) -> list[str]:
@@ -281,47 +328,137 @@ def _coverage_from_record(payload: object) -> DetectorCoverageStatus | None:
     )
 
 
-def _load_cached_security_result(
+def _security_salt(lang: object) -> str:
+    return f"{getattr(lang, 'name', '')}:{SECURITY_RULES_VERSION}"
+
+
+def _security_file_fingerprints(
+    scan_root: Path,
+    files: list[str],
+    zone_map,
+) -> dict[str, tuple[str, str]]:
+    """Map each file to ``(cache key, content digest + zone)``.
+
+    Unreadable files get an empty fingerprint so they are always rescanned.
+    """
+    fingerprints: dict[str, tuple[str, str]] = {}
+    for filepath in files:
+        resolved = _resolve_detector_file_path(scan_root, filepath)
+        facts = read_file_facts(resolved)
+        zone = zone_map.get(filepath) if zone_map is not None else None
+        zone_value = getattr(zone, "value", zone)
+        fingerprint = f"{facts.digest}:{zone_value or ''}" if facts is not None else ""
+        fingerprints[filepath] = (rel(resolved), fingerprint)
+    return fingerprints
+
+
+def _plan_security_rescan(
     cache: dict[str, object],
     *,
-    fingerprint: str,
-) -> LangSecurityResult | None:
-    """Load cached language-specific security result when unchanged."""
-    if cache.get("version") != _DETECTOR_CACHE_VERSION:
-        return None
-    if cache.get("fingerprint") != fingerprint:
-        return None
-    entries = cache.get("entries")
-    files_scanned = cache.get("files_scanned")
-    if not isinstance(entries, list) or not isinstance(files_scanned, int):
-        return None
-    normalized_entries = [entry for entry in entries if isinstance(entry, dict)]
-    return LangSecurityResult(
-        entries=normalized_entries,
-        files_scanned=max(0, files_scanned),
-        coverage=_coverage_from_record(cache.get("coverage")),
-    )
+    salt: str,
+    fingerprints: dict[str, tuple[str, str]],
+) -> tuple[dict[str, dict], list[str]]:
+    """Split files into reusable per-file cache records and files to rescan.
 
+    Entries that could not be attributed to a file are only trusted while no
+    file changed, so any change with such entries present rescans everything.
+    """
+    records = cache.get("files")
+    if (
+        cache.get("version") != _SECURITY_CACHE_VERSION
+        or cache.get("salt") != salt
+        or not isinstance(records, dict)
+    ):
+        records = {}
+    fresh: dict[str, dict] = {}
+    stale: list[str] = []
+    for filepath, (key, fingerprint) in fingerprints.items():
+        record = records.get(key)
+        if (
+            fingerprint
+            and isinstance(record, dict)
+            and record.get("fingerprint") == fingerprint
+        ):
+            fresh[key] = record
+        else:
+            stale.append(filepath)
+    removed = records.keys() - {key for key, _ in fingerprints.values()}
+    if (stale or removed) and _cached_unattributed(cache, "entries") + _cached_unattributed(
+        cache, "lang_entries"
+    ):
+        return {}, list(fingerprints)
+    return fresh, stale
 
-def _store_cached_security_result(
-    cache: dict[str, object],
+
+def _cached_unattributed(cache: dict[str, object], field: str) -> list[dict]:
+    payload = cache.get("unattributed")
+    entries = payload.get(field) if isinstance(payload, dict) else None
+    if not isinstance(entries, list):
+        return []
+    return [entry for entry in entries if isinstance(entry, dict)]
+
+
+def _attribute_entries(
+    entries: list[dict],
     *,
-    fingerprint: str,
-    result: LangSecurityResult,
-) -> None:
-    """Persist language-specific security results for unchanged scans."""
-    cache.clear()
-    cache.update(
-        {
-            "version": _DETECTOR_CACHE_VERSION,
-            "fingerprint": fingerprint,
-            "entries": [entry for entry in result.entries if isinstance(entry, dict)],
-            "files_scanned": max(0, int(result.files_scanned)),
-            "coverage": (
-                _coverage_to_dict(result.coverage) if result.coverage is not None else None
-            ),
-        }
-    )
+    scan_root: Path,
+    run_keys: dict[str, str],
+    fresh_keys: set[str],
+) -> tuple[dict[str, list[dict]], list[dict]]:
+    """Group detector entries by cache key for the files that were rescanned.
+
+    Entries for files served from cache are dropped (a tool run on a subset may
+    still report neighbours); entries for unknown files are returned apart.
+    """
+    by_key: dict[str, list[dict]] = {key: [] for key in run_keys.values()}
+    unattributed: list[dict] = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        raw_file = str(entry.get("file", ""))
+        key = run_keys.get(raw_file)
+        if key is None and raw_file:
+            key = rel(resolve_scan_file(raw_file, scan_root=scan_root))
+        if key in by_key:
+            by_key[key].append(entry)
+        elif key not in fresh_keys:
+            unattributed.append(entry)
+    return by_key, unattributed
+
+
+def _apportion(total: int, keys: list[str]) -> dict[str, int]:
+    """Spread a run-level scanned count over its files, preserving the sum."""
+    if not keys:
+        return {}
+    share, remainder = divmod(max(0, int(total)), len(keys))
+    return {
+        key: share + (1 if index < remainder else 0)
+        for index, key in enumerate(keys)
+    }
+
+
+def _coverage_record(coverage: DetectorCoverageStatus | None) -> dict[str, Any] | None:
+    return _coverage_to_dict(coverage) if coverage is not None else None
+
+
+def _run_lang_security(
+    lang: LangRuntimeContract,
+    files: list[str],
+    zone_map,
+) -> tuple[tuple[str, ...], LangSecurityResult]:
+    """Run language security on *files*, tagged with the file subset."""
+    return tuple(files), lang.detect_lang_security_detailed(files, zone_map)
+
+
+def _prefetch_clones(
+    path: Path,
+    files: list[str],
+    *,
+    cache: dict[str, object] | None,
+) -> list[dict]:
+    """Run the clone pass ahead of its phase, timed as its own trace span."""
+    with profile_span("boilerplate clones (prefetch)"):
+        return detect_clones(path, files, cache=cache)
 
 
 def prewarm_review_phase_detectors(
@@ -337,22 +474,23 @@ def prewarm_review_phase_detectors(
         labels={"boilerplate duplication"},
         run_names={"phase_boilerplate_duplication"},
     ):
-        boilerplate_cache = _boilerplate_cache(getattr(lang, "review_cache", None))
+        boilerplate_cache = _boilerplate_cache(lang)
         detector_files = _resolve_detector_files(path, lang)
-        fingerprint = _file_fingerprint(
-            scan_root=path,
-            files=detector_files,
-            salt=f"boilerplate:{getattr(lang, 'name', '')}",
-        )
+        fingerprint = _boilerplate_fingerprint(path, lang, detector_files)
         cached_entries = (
             _load_cached_boilerplate_entries(boilerplate_cache, fingerprint=fingerprint)
             if isinstance(boilerplate_cache, dict)
             else None
         )
         if cached_entries is None and _PREFETCH_BOILERPLATE_KEY not in futures:
+            # Run in a copy of the scan's context so the runtime (file caches,
+            # project root, profiler) resolves on the executor thread.
             futures[_PREFETCH_BOILERPLATE_KEY] = _PREFETCH_EXECUTOR.submit(
-                detect_with_jscpd,
+                contextvars.copy_context().run,
+                _prefetch_clones,
                 path,
+                detector_files,
+                cache=_clone_fingerprint_cache(lang),
             )
 
     if _has_phase(
@@ -363,23 +501,18 @@ def prewarm_review_phase_detectors(
         file_finder = getattr(lang, "file_finder", None)
         files = file_finder(path) if file_finder else []
         zone_map = getattr(lang, "zone_map", None)
-        security_cache = _security_cache(getattr(lang, "review_cache", None))
-        fingerprint = _file_fingerprint(
-            scan_root=path,
-            files=files,
-            zone_map=zone_map,
-            include_zone=True,
-            salt=f"security:{getattr(lang, 'name', '')}",
-        )
-        cached_result = (
-            _load_cached_security_result(security_cache, fingerprint=fingerprint)
-            if isinstance(security_cache, dict)
-            else None
+        security_cache = _security_cache(lang)
+        _fresh, stale = _plan_security_rescan(
+            security_cache if isinstance(security_cache, dict) else {},
+            salt=_security_salt(lang),
+            fingerprints=_security_file_fingerprints(path, files, zone_map),
         )
-        if cached_result is None and _PREFETCH_SECURITY_KEY not in futures:
+        if stale and _PREFETCH_SECURITY_KEY not in futures:
             futures[_PREFETCH_SECURITY_KEY] = _PREFETCH_EXECUTOR.submit(
-                lang.detect_lang_security_detailed,
-                files,
+                contextvars.copy_context().run,
+                _run_lang_security,
+                lang,
+                stale,
                 zone_map,
             )
 
@@ -408,18 +541,16 @@ def phase_dupes(path: Path, lang: LangRuntimeContract) -> tuple[list[Issue], dic
 
     if lang.zone_map is not None:
         before = len(functions)
-        functions = [
-            function
-            for function in functions
-            if lang.zone_map.get(getattr(function, "file", "")) not in EXCLUDED_ZONES
-        ]
+        functions = functions.filter_files(
+            lambda filepath: lang.zone_map.get(filepath) not in EXCLUDED_ZONES
+        )
         excluded = before - len(functions)
         if excluded:
             log(f"         zones: {excluded} functions excluded (non-production)")
 
     entries, total_functions = detect_duplicates(
         functions,
-        cache=_dupes_cache(getattr(lang, "review_cache", None)),
+        cache=_dupes_cache(lang),
     )
     issues = make_dupe_issues(entries, log)
     return issues, {"dupes": total_functions}
@@ -429,14 +560,10 @@ def phase_boilerplate_duplication(
     path: Path,
     lang: LangRuntimeContract,
 ) -> tuple[list[Issue], dict[str, int]]:
-    """Shared phase runner: detect repeated boilerplate code via jscpd."""
-    cache = _boilerplate_cache(getattr(lang, "review_cache", None))
+    """Shared phase runner: detect repeated boilerplate code via token-window clones."""
+    cache = _boilerplate_cache(lang)
     detector_files = _resolve_detector_files(path, lang)
-    fingerprint = _file_fingerprint(
-        scan_root=path,
-        files=detector_files,
-        salt=f"boilerplate:{getattr(lang, 'name', '')}",
-    )
+    fingerprint = _boilerplate_fingerprint(path, lang, detector_files)
     entries = (
         _load_cached_boilerplate_entries(cache, fingerprint=fingerprint)
         if isinstance(cache, dict)
@@ -446,7 +573,11 @@ def phase_boilerplate_duplication(
         prefetched = _consume_prefetch_result(lang, _PREFETCH_BOILERPLATE_KEY)
         entries = prefetched if isinstance(prefetched, list) else None
         if entries is None:
-            entries = detect_with_jscpd(path)
+            entries = detect_clones(
+                path,
+                detector_files,
+                cache=_clone_fingerprint_cache(lang),
+            )
         if isinstance(cache, dict) and entries is not None:
             _store_cached_boilerplate_entries(
                 cache,
@@ -500,47 +631,103 @@ def phase_security(
         _detect_security_issues_default
     ),
 ) -> tuple[list[Issue], dict[str, int]]:
-    """Shared phase: detect security issues (cross-language + lang-specific)."""
+    """Shared phase: detect security issues (cross-language + lang-specific).
+
+    Results are cached per file, keyed by content digest, zone and rules
+    version, so only changed files are rescanned and the rest are merged from
+    the detector cache.
+    """
     zone_map = lang.zone_map
     files = lang.file_finder(path) if lang.file_finder else []
-    entries, cross_lang_scanned = detect_security_issues(
-        files,
-        zone_map,
-        lang.name,
-        scan_root=path,
-    )
-    lang_scanned = 0
 
-    security_cache = _security_cache(getattr(lang, "review_cache", None))
-    security_fingerprint = _file_fingerprint(
-        scan_root=path,
-        files=files,
-        zone_map=zone_map,
-        include_zone=True,
-        salt=f"security:{getattr(lang, 'name', '')}",
+    security_cache = _security_cache(lang)
+    cache = security_cache if isinstance(security_cache, dict) else {}
+    fingerprints = _security_file_fingerprints(path, files, zone_map)
+    fresh, stale = _plan_security_rescan(
+        cache,
+        salt=_security_salt(lang),
+        fingerprints=fingerprints,
     )
-    lang_result = (
-        _load_cached_security_result(
-            security_cache,
-            fingerprint=security_fingerprint,
+
+    def _scan(targets: list[str], *, allow_prefetch: bool):
+        cross_entries, cross_scanned = detect_security_issues(
+            targets,
+            zone_map,
+            lang.name,
+            scan_root=path,
         )
-        if isinstance(security_cache, dict)
-        else None
-    )
-    if lang_result is None:
-        prefetched = _consume_prefetch_result(lang, _PREFETCH_SECURITY_KEY)
-        lang_result = prefetched if isinstance(prefetched, LangSecurityResult) else None
+        lang_result = None
+        if allow_prefetch:
+            prefetched = _consume_prefetch_result(lang, _PREFETCH_SECURITY_KEY)
+            if isinstance(prefetched, tuple) and prefetched[0] == tuple(targets):
+                lang_result = prefetched[1]
         if lang_result is None:
-            lang_result = lang.detect_lang_security_detailed(files, zone_map)
+            lang_result = lang.detect_lang_security_detailed(targets, zone_map)
+        return cross_entries, cross_scanned, lang_result
+
+    coverage = _coverage_from_record(cache.get("coverage"))
+    records = dict(fresh)
+    unattributed = {
+        "entries": _cached_unattributed(cache, "entries"),
+        "lang_entries": _cached_unattributed(cache, "lang_entries"),
+    }
+    if stale:
+        cross_entries, cross_scanned, lang_result = _scan(stale, allow_prefetch=True)
+        if fresh and _coverage_record(lang_result.coverage) != cache.get("coverage"):
+            # Tool availability changed, so cached language results are not
+            # comparable with this run; rescan everything.
+            fresh, stale, records = {}, list(files), {}
+            cross_entries, cross_scanned, lang_result = _scan(
+                stale, allow_prefetch=False
+            )
+        coverage = lang_result.coverage
+        run_keys = {filepath: fingerprints[filepath][0] for filepath in stale}
+        ordered_keys = list(dict.fromkeys(run_keys.values()))
+        cross_by_key, cross_unattributed = _attribute_entries(
+            cross_entries, scan_root=path, run_keys=run_keys, fresh_keys=set(fresh)
+        )
+        lang_by_key, lang_unattributed = _attribute_entries(
+            lang_result.entries, scan_root=path, run_keys=run_keys, fresh_keys=set(fresh)
+        )
+        cross_counts = _apportion(cross_scanned, ordered_keys)
+        lang_counts = _apportion(lang_result.files_scanned, ordered_keys)
+        for filepath in stale:
+            key, fingerprint = fingerprints[filepath]
+            records[key] = {
+                "fingerprint": fingerprint,
+                "entries": cross_by_key.get(key, []),
+                "scanned": cross_counts.get(key, 0),
+                "lang_entries": lang_by_key.get(key, []),
+                "lang_scanned": lang_counts.get(key, 0),
+            }
+        unattributed = {
+            "entries": cross_unattributed,
+            "lang_entries": lang_unattributed,
+        }
         if isinstance(security_cache, dict):
-            _store_cached_security_result(
-                security_cache,
-                fingerprint=security_fingerprint,
-                result=lang_result,
+            security_cache.clear()
+            security_cache.update(
+                {
+                    "version": _SECURITY_CACHE_VERSION,
+                    "salt": _security_salt(lang),
+                    "coverage": _coverage_record(coverage),
+                    "files": records,
+                    "unattributed": unattributed,
+                }
             )
-    lang_entries = lang_result.entries
-    lang_scanned = max(0, int(lang_result.files_scanned))
-    _record_detector_coverage(lang, lang_result.coverage)
+
+    entries: list[DetectorEntry] = []
+    lang_entries: list[DetectorEntry] = []
+    cross_lang_scanned = 0
+    lang_scanned = 0
+    for record in records.values():
+        entries.extend(record.get("entries") or [])
+        lang_entries.extend(record.get("lang_entries") or [])
+        cross_lang_scanned += int(record.get("scanned", 0) or 0)
+        lang_scanned += int(record.get("lang_scanned", 0) or 0)
+    entries.extend(unattributed["entries"])
+    lang_entries.extend(unattributed["lang_entries"])
+    _record_detector_coverage(lang, coverage)
     entries.extend(lang_entries)
 
     entries = filter_entries(zone_map, entries, "security")
@@ -50,6 +50,9 @@ class DetectorPhase:
     label: str
     run: Callable[[Path, LangRuntimeContract], tuple[list[DetectorEntry], dict[str, int]]]
     slow: bool = False
+    # Tree-sitter grammar this phase parses every language file with, so the
+    # scan can pre-parse them in parallel before the phases run.
+    parse_grammar: str | None = None
 
 
 class LangRuntimeContract(Protocol):
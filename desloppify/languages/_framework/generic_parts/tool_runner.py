@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
 
+from desloppify.base.profiling import profile_span
 from desloppify.languages._framework.generic_parts.parsers import ToolParserError
 
 SubprocessRun = Callable[..., subprocess.CompletedProcess[str]]
@@ -53,6 +54,12 @@ def resolve_command_argv(cmd: str) -> list[str]:
     return argv if argv else _shell_argv(cmd)
 
 
+def _tool_label(cmd: str) -> str:
+    """Short name of the executable in *cmd*, for profiling spans."""
+    words = cmd.split(maxsplit=1)
+    return os.path.basename(words[0]) if words else cmd
+
+
 def _output_preview(output: str, *, limit: int = 160) -> str:
     """Return a compact one-line preview of tool output for diagnostics."""
     text = " ".join(output.split())
@@ -71,14 +78,15 @@ def run_tool_result(
     """Run an external tool and parse its output with explicit failure status."""
     runner = run_subprocess or subprocess.run
     try:
-        result = runner(
-            resolve_command_argv(cmd),
-            shell=False,
-            cwd=str(path),
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
+        with profile_span(_tool_label(cmd), category="tool"):
+            result = runner(
+                resolve_command_argv(cmd),
+                shell=False,
+                cwd=str(path),
+                capture_output=True,
+                text=True,
+                timeout=120,
+            )
     except FileNotFoundError as exc:
         return ToolRunResult(
             entries=[],
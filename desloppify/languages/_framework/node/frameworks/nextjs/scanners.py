@@ -11,7 +11,7 @@ import re
 from pathlib import Path
 
 from desloppify.base.discovery.paths import get_project_root
-from desloppify.base.discovery.source import find_js_ts_and_tsx_files
+from desloppify.base.discovery.source import find_js_ts_and_tsx_files, read_source_text
 from desloppify.languages._framework.node.js_text import (
     code_text as _code_text,
     strip_js_ts_comments as _strip_ts_comments,
@@ -264,7 +264,7 @@ def scan_nextjs_error_files_missing_use_client(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -312,7 +312,7 @@ def scan_nextjs_use_server_not_first(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -345,7 +345,7 @@ def scan_nextjs_next_head_in_app_router(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -375,7 +375,7 @@ def scan_nextjs_use_client_not_first(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -403,7 +403,7 @@ def scan_nextjs_next_document_misuse(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -437,7 +437,7 @@ def scan_nextjs_server_navigation_apis_in_client(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -478,7 +478,7 @@ def scan_nextjs_browser_globals_missing_use_client(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -515,7 +515,7 @@ def scan_nextjs_client_layouts(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -539,7 +539,7 @@ def scan_nextjs_async_client_components(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -571,7 +571,7 @@ def scan_nextjs_use_server_in_client(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -616,7 +616,7 @@ def scan_nextjs_server_modules_in_pages_router(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -665,7 +665,7 @@ def scan_nextjs_pages_api_route_handlers(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -698,7 +698,7 @@ def scan_nextjs_app_router_exports_in_pages_router(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -740,7 +740,7 @@ def scan_rsc_missing_use_client(path: Path, info: NextjsFrameworkInfo) -> tuple[
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -784,7 +784,7 @@ def scan_nextjs_navigation_hooks_missing_use_client(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -819,7 +819,7 @@ def scan_nextjs_server_imports_in_client(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -865,7 +865,7 @@ def scan_next_router_imports_in_app_router(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -894,7 +894,7 @@ def scan_nextjs_server_exports_in_client(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -942,7 +942,7 @@ def scan_nextjs_pages_router_apis_in_app_router(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -984,7 +984,7 @@ def scan_nextjs_env_leaks_in_client(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
@@ -1057,7 +1057,7 @@ def scan_nextjs_route_handlers_and_middleware_misuse(
         scanned += 1
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable Next.js candidate %s: %s", filepath, exc)
             continue
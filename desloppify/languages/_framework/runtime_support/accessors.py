@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 from desloppify.languages._framework.base.types import DetectorCoverageRecord
 
 if TYPE_CHECKING:
+    from desloppify.engine._state.detector_cache import DetectorCacheStore
     from desloppify.engine.policy.zones import FileZoneMap
 
 
@@ -54,6 +55,14 @@ class LangRunStateAccessors:
     def review_cache(self, value: dict[str, Any]) -> None:
         self.state.review_cache = value
 
+    @property
+    def detector_caches(self) -> DetectorCacheStore | None:
+        return self.state.detector_caches
+
+    @detector_caches.setter
+    def detector_caches(self, value: DetectorCacheStore | None) -> None:
+        self.state.detector_caches = value
+
     @property
     def subjective_assessments(self) -> dict[str, Any]:
         return self.state.subjective_assessments
@@ -14,6 +14,7 @@ from desloppify.languages._framework.base.types import (
 from .accessors import LangRunStateAccessors
 
 if TYPE_CHECKING:
+    from desloppify.engine._state.detector_cache import DetectorCacheStore
     from desloppify.engine.policy.zones import FileZoneMap
 
 _UNSET = object()
@@ -28,6 +29,7 @@ class LangRuntimeState:
     complexity_map: dict[str, float] = field(default_factory=dict)
     runtime_cache: dict[str, Any] = field(default_factory=dict)
     review_cache: dict[str, Any] = field(default_factory=dict)
+    detector_caches: DetectorCacheStore | None = None
     review_max_age_days: int = 30
     subjective_assessments: dict[str, Any] = field(default_factory=dict)
     runtime_settings: dict[str, Any] = field(default_factory=dict)
@@ -47,6 +49,7 @@ class LangRunOverrides:
     complexity_map: dict[str, float] | None = _UNSET
     runtime_cache: dict[str, Any] | None = _UNSET
     review_cache: dict[str, Any] | None = _UNSET
+    detector_caches: DetectorCacheStore | None = _UNSET
     review_max_age_days: int | None = _UNSET
     subjective_assessments: dict[str, Any] | None = _UNSET
     runtime_settings: dict[str, Any] | None = _UNSET
@@ -2,25 +2,38 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import contextvars
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from desloppify.base.discovery.source import read_source_bytes
 from desloppify.base.runtime_state import resolve_runtime_context
 
 if TYPE_CHECKING:
-    from desloppify.base.runtime_state import RuntimeContext
+    from desloppify.base.runtime_state import FileTextCache, RuntimeContext
 
 
 class ParseTreeCache:
     """Cache parsed tree-sitter trees during a scan.
 
     Key: (filepath, grammar_name) -> (source_bytes, parsed_tree)
-    Stores source_bytes so callers can use them without re-reading.
+    Source bytes come from the runtime's shared file reader.  When that
+    reader pinned the file's entry it owns the only copy, which stays exactly
+    what was parsed, and only the tree is stored here (``None`` in place of
+    the bytes); otherwise the bytes are kept so callers can use them without
+    re-reading.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, runtime: RuntimeContext | None = None) -> None:
         self._enabled: bool = False
-        self._trees: dict[tuple[str, str], tuple[bytes, object]] = {}
+        self._runtime = runtime
+        self._trees: dict[tuple[str, str], tuple[bytes | None, object]] = {}
+        self.hits = 0
+        self.misses = 0
 
     def enable(self) -> None:
         self._enabled = True
@@ -35,19 +48,80 @@ class ParseTreeCache:
     ) -> tuple[bytes, object] | None:
         """Read file and parse, returning (source_bytes, tree). Uses cache if enabled."""
         key = (filepath, grammar)
-        if self._enabled and key in self._trees:
-            return self._trees[key]
+        cached = self._trees.get(key) if self._enabled else None
+        if (
+            cached is not None
+            and cached[0] is None
+            and not self._text_cache.is_pinned(filepath)
+        ):
+            # The shared reader was reset; its bytes may no longer match.
+            del self._trees[key]
+            cached = None
+        if cached is not None:
+            self.hits += 1
+        elif self._enabled:
+            self.misses += 1
 
         try:
-            source = Path(filepath).read_bytes()
+            source = (
+                cached[0]
+                if cached is not None and cached[0] is not None
+                else read_source_bytes(
+                    filepath, pin=self._enabled, runtime=self._runtime
+                )
+            )
         except (OSError, UnicodeDecodeError):
             return None
+        if cached is not None:
+            return source, cached[1]
 
         tree = parser.parse(source)
         if self._enabled:
-            self._trees[key] = (source, tree)
+            self._store(key, source, tree)
         return source, tree
 
+    @property
+    def _text_cache(self) -> FileTextCache:
+        return resolve_runtime_context(self._runtime).file_text_cache
+
+    def _store(self, key: tuple[str, str], source: bytes, tree: object) -> None:
+        shared = self._text_cache.is_pinned(key[0])
+        self._trees[key] = (None if shared else source, tree)
+
+    def prime(self, filepath: str, parser, grammar: str) -> int:
+        """Parse *filepath* into the cache ahead of use; returns bytes parsed.
+
+        Unlike ``get_or_parse`` this leaves the hit/miss counters alone, so
+        they keep describing what detectors asked for.
+        """
+        key = (filepath, grammar)
+        if not self._enabled or key in self._trees:
+            return 0
+        try:
+            source = read_source_bytes(filepath, pin=True, runtime=self._runtime)
+        except (OSError, UnicodeDecodeError):
+            return 0
+        self._store(key, source, parser.parse(source))
+        return len(source)
+
+
+@dataclass(frozen=True)
+class ParseThroughput:
+    """Outcome of one :func:`preparse_files` run."""
+
+    files: int
+    bytes: int
+    seconds: float
+    workers: int
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes / 1_000_000 / self.seconds if self.seconds > 0 else 0.0
+
 
 def current_parse_tree_cache(
     *, runtime: RuntimeContext | None = None
@@ -57,7 +131,7 @@ def current_parse_tree_cache(
     cache = resolved_runtime.treesitter_parse_cache
     if isinstance(cache, ParseTreeCache):
         return cache
-    owned_cache = ParseTreeCache()
+    owned_cache = ParseTreeCache(runtime=resolved_runtime)
     resolved_runtime.treesitter_parse_cache = owned_cache
     return owned_cache
 
@@ -77,6 +151,59 @@ def get_or_parse_tree(
     )
 
 
+def preparse_files(
+    filepaths: Iterable[str],
+    grammar: str,
+    *,
+    workers: int,
+    make_parser: Callable[[str], object],
+    runtime: RuntimeContext | None = None,
+) -> ParseThroughput | None:
+    """Parse *filepaths* into the enabled parse cache on a thread pool.
+
+    Each thread builds its own parser with ``make_parser(grammar)`` (parser
+    instances are not shared across threads); files already cached are
+    skipped.  The parsing itself runs in the tree-sitter C library, so
+    threads overlap as far as the bindings release the GIL.  Returns
+    ``None`` when the cache is disabled.
+    """
+    resolved_runtime = resolve_runtime_context(runtime)
+    cache = current_parse_tree_cache(runtime=resolved_runtime)
+    if not cache._enabled:
+        return None
+    pending = [
+        filepath
+        for filepath in dict.fromkeys(filepaths)
+        if (filepath, grammar) not in cache._trees
+    ]
+    workers = max(1, min(workers, len(pending)))
+    local = threading.local()
+
+    def parse_one(filepath: str) -> int:
+        parser = getattr(local, "parser", None)
+        if parser is None:
+            parser = local.parser = make_parser(grammar)
+        return cache.prime(filepath, parser, grammar)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="desloppify-parse"
+    ) as executor:
+        # Worker threads do not inherit context variables; run each task in
+        # a copy of the caller's context so the runtime context resolves.
+        futures = [
+            executor.submit(contextvars.copy_context().run, parse_one, filepath)
+            for filepath in pending
+        ]
+        parsed = sum(future.result() for future in futures)
+    return ParseThroughput(
+        files=len(pending),
+        bytes=parsed,
+        seconds=time.perf_counter() - start,
+        workers=workers,
+    )
+
+
 def enable_parse_cache(*, runtime: RuntimeContext | None = None) -> None:
     """Enable scan-scoped parse tree cache."""
     current_parse_tree_cache(runtime=runtime).enable()
@@ -93,10 +220,12 @@ def is_parse_cache_enabled(*, runtime: RuntimeContext | None = None) -> bool:
 
 
 __all__ = [
+    "ParseThroughput",
     "ParseTreeCache",
     "current_parse_tree_cache",
     "disable_parse_cache",
     "enable_parse_cache",
     "get_or_parse_tree",
     "is_parse_cache_enabled",
+    "preparse_files",
 ]
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from desloppify.base.discovery.path_index import memoized_resolution
+
 from .cache import get_or_parse_tree
 from ..analysis.extractors import _get_parser, _make_query, _run_query, _unwrap_node
 
@@ -71,7 +74,12 @@ def ts_build_dep_graph(
                 ).strip("\"'`")
                 import_text = f"{prefix_text}\\{import_text}"
 
-            resolved = spec.resolve_import(import_text, filepath, scan_path)
+            resolved = memoized_resolution(
+                (spec.resolve_import, os.path.dirname(filepath), import_text, scan_path),
+                functools.partial(
+                    spec.resolve_import, import_text, filepath, scan_path
+                ),
+            )
             if resolved is None:
                 continue
 
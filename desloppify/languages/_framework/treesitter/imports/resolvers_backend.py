@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import os
 
+from desloppify.base.discovery.path_index import list_dir, path_is_dir, path_is_file
+
 from .resolver_cache import read_go_module_path
 
 
@@ -20,8 +22,8 @@ def resolve_go_import(import_text: str, source_file: str, scan_path: str) -> str
 
     rel_path = import_text[len(module_path) :].lstrip("/")
     candidate_dir = os.path.join(scan_path, rel_path)
-    if os.path.isdir(candidate_dir):
-        for filename in sorted(os.listdir(candidate_dir)):
+    if path_is_dir(candidate_dir):
+        for filename in sorted(list_dir(candidate_dir)):
             if filename.endswith(".go") and not filename.endswith("_test.go"):
                 return os.path.join(candidate_dir, filename)
     return None
@@ -38,20 +40,20 @@ def resolve_rust_import(import_text: str, source_file: str, scan_path: str) -> s
         return None
 
     src_dir = os.path.join(scan_path, "src")
-    if not os.path.isdir(src_dir):
+    if not path_is_dir(src_dir):
         src_dir = scan_path
 
     path_parts = parts[:-1] if len(parts) > 1 else parts
     candidate = os.path.join(src_dir, *path_parts) + ".rs"
-    if os.path.isfile(candidate):
+    if path_is_file(candidate):
         return candidate
 
     candidate = os.path.join(src_dir, *path_parts, "mod.rs")
-    if os.path.isfile(candidate):
+    if path_is_file(candidate):
         return candidate
 
     candidate = os.path.join(src_dir, *parts) + ".rs"
-    if os.path.isfile(candidate):
+    if path_is_file(candidate):
         return candidate
     return None
 
@@ -69,7 +71,7 @@ def resolve_java_import(import_text: str, source_file: str, scan_path: str) -> s
     rel_path = os.path.join(*parts[:-1], parts[-1] + ".java")
     for src_root in ["src/main/java", "src", "app/src/main/java", "."]:
         candidate = os.path.join(scan_path, src_root, rel_path)
-        if os.path.isfile(candidate):
+        if path_is_file(candidate):
             return candidate
     return None
 
@@ -88,7 +90,7 @@ def resolve_kotlin_import(import_text: str, source_file: str, scan_path: str) ->
         rel_path = os.path.join(*parts[:-1], parts[-1] + ext)
         for src_root in ["src/main/kotlin", "src/main/java", "src", "app/src/main/kotlin", "."]:
             candidate = os.path.join(scan_path, src_root, rel_path)
-            if os.path.isfile(candidate):
+            if path_is_file(candidate):
                 return candidate
     return None
 
@@ -100,12 +102,12 @@ def resolve_cxx_include(import_text: str, source_file: str, scan_path: str) -> s
 
     base = os.path.dirname(source_file)
     candidate = os.path.normpath(os.path.join(base, import_text))
-    if os.path.isfile(candidate):
+    if path_is_file(candidate):
         return candidate
 
     for inc_dir in ["include", "src", "."]:
         candidate = os.path.join(scan_path, inc_dir, import_text)
-        if os.path.isfile(candidate):
+        if path_is_file(candidate):
             return candidate
     return None
 
@@ -121,10 +123,10 @@ def resolve_csharp_import(import_text: str, source_file: str, scan_path: str) ->
     for src_root in ["src", ".", "lib"]:
         rel_path = os.path.join(*parts[:-1], filename)
         candidate = os.path.join(scan_path, src_root, rel_path)
-        if os.path.isfile(candidate):
+        if path_is_file(candidate):
             return candidate
         candidate = os.path.join(scan_path, src_root, filename)
-        if os.path.isfile(candidate):
+        if path_is_file(candidate):
             return candidate
     return None
 
@@ -138,11 +140,11 @@ def resolve_dart_import(import_text: str, source_file: str, scan_path: str) -> s
         if len(parts) < 2:
             return None
         candidate = os.path.join(scan_path, "lib", parts[1])
-        return candidate if os.path.isfile(candidate) else None
+        return candidate if path_is_file(candidate) else None
 
     base = os.path.dirname(source_file)
     candidate = os.path.normpath(os.path.join(base, import_text))
-    return candidate if os.path.isfile(candidate) else None
+    return candidate if path_is_file(candidate) else None
 
 
 def resolve_scala_import(import_text: str, source_file: str, scan_path: str) -> str | None:
@@ -158,7 +160,7 @@ def resolve_scala_import(import_text: str, source_file: str, scan_path: str) ->
     rel_path = os.path.join(*parts[:-1], parts[-1] + ".scala")
     for src_root in ["src/main/scala", "src", "."]:
         candidate = os.path.join(scan_path, src_root, rel_path)
-        if os.path.isfile(candidate):
+        if path_is_file(candidate):
             return candidate
     return None
 
@@ -184,6 +186,6 @@ def resolve_swift_import(import_text: str, source_file: str, scan_path: str) ->
         if candidate in seen:
             continue
         seen.add(candidate)
-        if os.path.isfile(candidate):
+        if path_is_file(candidate):
             return candidate
     return None
@@ -5,6 +5,8 @@ from __future__ import annotations
 import os
 import re
 
+from desloppify.base.discovery.path_index import list_dir, path_is_dir, path_is_file
+
 
 def _camel_to_snake(name: str) -> str:
     """Convert CamelCase to snake_case."""
@@ -30,14 +32,14 @@ def resolve_elixir_import(import_text: str, source_file: str, scan_path: str) ->
     # 1. Direct path: lib/my_app/module/sub.ex
     rel_path = os.path.join(*snake_parts) + ".ex"
     candidate = os.path.join(scan_path, "lib", rel_path)
-    if os.path.isfile(candidate):
+    if path_is_file(candidate):
         return candidate
 
     # 2. Without the app-level prefix: lib/my_app/module/sub.ex
     if len(snake_parts) > 1:
         rel_path = os.path.join(*snake_parts[1:]) + ".ex"
         candidate = os.path.join(scan_path, "lib", snake_parts[0], rel_path)
-        if os.path.isfile(candidate):
+        if path_is_file(candidate):
             return candidate
 
     # 3. Phoenix Web convention: MyAppWeb.FooController → lib/my_app_web/controllers/foo_controller.ex
@@ -45,13 +47,13 @@ def resolve_elixir_import(import_text: str, source_file: str, scan_path: str) ->
 
     # 4. Umbrella apps: apps/<app>/lib/<app>/module.ex
     apps_dir = os.path.join(scan_path, "apps")
-    if os.path.isdir(apps_dir):
+    if path_is_dir(apps_dir):
         # Try each umbrella app
         rel_path = os.path.join(*snake_parts) + ".ex"
         try:
-            for app in os.listdir(apps_dir):
+            for app in list_dir(apps_dir):
                 candidate = os.path.join(apps_dir, app, "lib", rel_path)
-                if os.path.isfile(candidate):
+                if path_is_file(candidate):
                     return candidate
                 # Also try without top-level prefix inside app
                 if len(snake_parts) > 1:
@@ -59,7 +61,7 @@ def resolve_elixir_import(import_text: str, source_file: str, scan_path: str) ->
                     candidate = os.path.join(
                         apps_dir, app, "lib", snake_parts[0], inner_rel
                     )
-                    if os.path.isfile(candidate):
+                    if path_is_file(candidate):
                         return candidate
         except OSError:
             return None
@@ -79,9 +81,9 @@ def resolve_zig_import(import_text: str, source_file: str, scan_path: str) -> st
 
     base = os.path.dirname(source_file)
     candidate = os.path.normpath(os.path.join(base, text))
-    if os.path.isfile(candidate):
+    if path_is_file(candidate):
         return candidate
-    if not candidate.endswith(".zig") and os.path.isfile(candidate + ".zig"):
+    if not candidate.endswith(".zig") and path_is_file(candidate + ".zig"):
         return candidate + ".zig"
     return None
 
@@ -112,7 +114,7 @@ def resolve_haskell_import(import_text: str, source_file: str, scan_path: str) -
     rel_path = import_text.replace(".", os.sep) + ".hs"
     for base_dir in ["src", "lib", "app", "."]:
         candidate = os.path.join(scan_path, base_dir, rel_path)
-        if os.path.isfile(candidate):
+        if path_is_file(candidate):
             return candidate
     return None
 
@@ -125,15 +127,15 @@ def resolve_erlang_include(import_text: str, source_file: str, scan_path: str) -
     text = import_text.strip('"')
     base = os.path.dirname(source_file)
     candidate = os.path.normpath(os.path.join(base, text))
-    if os.path.isfile(candidate):
+    if path_is_file(candidate):
         return candidate
 
     candidate = os.path.join(scan_path, "include", text)
-    if os.path.isfile(candidate):
+    if path_is_file(candidate):
         return candidate
 
     candidate = os.path.join(scan_path, text)
-    return candidate if os.path.isfile(candidate) else None
+    return candidate if path_is_file(candidate) else None
 
 
 _OCAML_STDLIB_MODULES = frozenset(
@@ -190,7 +192,7 @@ def resolve_ocaml_import(import_text: str, source_file: str, scan_path: str) ->
     filename = import_text.split(".")[-1].lower() + ".ml"
     for base_dir in ["lib", "src", "."]:
         candidate = os.path.join(scan_path, base_dir, filename)
-        if os.path.isfile(candidate):
+        if path_is_file(candidate):
             return candidate
     return None
 
@@ -211,17 +213,17 @@ def resolve_julia_include(import_text: str, source_file: str, scan_path: str) ->
     # 1. Relative to the source file's directory.
     base = os.path.dirname(source_file)
     candidate = os.path.normpath(os.path.join(base, text))
-    if os.path.isfile(candidate):
+    if path_is_file(candidate):
         return candidate
 
     # 2. Relative to src/.
     candidate = os.path.join(scan_path, "src", text)
-    if os.path.isfile(candidate):
+    if path_is_file(candidate):
         return candidate
 
     # 3. Relative to scan root.
     candidate = os.path.join(scan_path, text)
-    return candidate if os.path.isfile(candidate) else None
+    return candidate if path_is_file(candidate) else None
 
 
 _FSHARP_STDLIB_PREFIXES = ("System", "Microsoft", "FSharp")
@@ -244,9 +246,9 @@ def resolve_fsharp_import(import_text: str, source_file: str, scan_path: str) ->
         if len(parts) > 1:
             rel_path = os.path.join(*parts[:-1], filename)
             candidate = os.path.join(scan_path, base_dir, rel_path)
-            if os.path.isfile(candidate):
+            if path_is_file(candidate):
                 return candidate
         candidate = os.path.join(scan_path, base_dir, filename)
-        if os.path.isfile(candidate):
+        if path_is_file(candidate):
             return candidate
     return None
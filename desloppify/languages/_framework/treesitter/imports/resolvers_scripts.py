@@ -5,6 +5,8 @@ from __future__ import annotations
 import json
 import os
 
+from desloppify.base.discovery.path_index import path_is_dir, path_is_file
+
 
 def resolve_ruby_import(import_text: str, source_file: str, scan_path: str) -> str | None:
     """Resolve Ruby require/require_relative to local files."""
@@ -13,13 +15,13 @@ def resolve_ruby_import(import_text: str, source_file: str, scan_path: str) -> s
         candidate = os.path.normpath(os.path.join(base, import_text))
         if not candidate.endswith(".rb"):
             candidate += ".rb"
-        return candidate if os.path.isfile(candidate) else None
+        return candidate if path_is_file(candidate) else None
 
     for base in [os.path.join(scan_path, "lib"), scan_path]:
         candidate = os.path.join(base, import_text.replace("/", os.sep))
         if not candidate.endswith(".rb"):
             candidate += ".rb"
-        if os.path.isfile(candidate):
+        if path_is_file(candidate):
             return candidate
     return None
 
@@ -51,7 +53,7 @@ def _find_php_file(filename: str, scan_path: str) -> str | None:
         return _PHP_FILE_CACHE[key]
     for root in ("app", "src", "lib"):
         root_dir = os.path.join(scan_path, root)
-        if not os.path.isdir(root_dir):
+        if not path_is_dir(root_dir):
             continue
         for dirpath, _dirs, files in os.walk(root_dir):
             if filename in files:
@@ -76,7 +78,7 @@ def _read_composer_psr4(scan_path: str) -> dict[str, str]:
 
     mappings: dict[str, str] = {}
     composer_path = os.path.join(normalized_scan_path, "composer.json")
-    if not os.path.isfile(composer_path):
+    if not path_is_file(composer_path):
         _PHP_COMPOSER_CACHE[normalized_scan_path] = mappings
         return mappings
     try:
@@ -135,7 +137,7 @@ def resolve_php_import(import_text: str, source_file: str, scan_path: str) -> st
                 rel_path = remainder.replace("\\", os.sep) + ".php"
                 candidate = os.path.join(scan_path, directory, rel_path)
                 candidate = os.path.normpath(candidate)
-                if os.path.isfile(candidate):
+                if path_is_file(candidate):
                     return candidate
 
     # Fallback: try common PSR-4 roots by stripping namespace prefixes.
@@ -143,7 +145,7 @@ def resolve_php_import(import_text: str, source_file: str, scan_path: str) -> st
         rel_path = os.path.join(*parts[prefix_len:]) + ".php"
         for src_root in ["src", "app", "lib", "."]:
             candidate = os.path.join(scan_path, src_root, rel_path)
-            if os.path.isfile(candidate):
+            if path_is_file(candidate):
                 return candidate
     return None
 
@@ -156,11 +158,11 @@ def resolve_lua_import(import_text: str, source_file: str, scan_path: str) -> st
 
     rel_path = import_text.replace(".", os.sep) + ".lua"
     candidate = os.path.join(scan_path, rel_path)
-    if os.path.isfile(candidate):
+    if path_is_file(candidate):
         return candidate
 
     candidate = os.path.join(scan_path, import_text.replace(".", os.sep), "init.lua")
-    if os.path.isfile(candidate):
+    if path_is_file(candidate):
         return candidate
     return None
 
@@ -175,7 +177,7 @@ def resolve_js_import(import_text: str, source_file: str, scan_path: str) -> str
     candidate = os.path.normpath(os.path.join(base, import_text))
     for ext in ("", ".js", ".jsx", ".mjs", ".cjs", "/index.js", "/index.jsx"):
         path = candidate + ext
-        if os.path.isfile(path):
+        if path_is_file(path):
             return path
     return None
 
@@ -188,13 +190,13 @@ def resolve_bash_source(import_text: str, source_file: str, scan_path: str) -> s
     text = import_text.strip("\"'")
     base = os.path.dirname(source_file)
     candidate = os.path.normpath(os.path.join(base, text))
-    if os.path.isfile(candidate):
+    if path_is_file(candidate):
         return candidate
-    if not candidate.endswith(".sh") and os.path.isfile(candidate + ".sh"):
+    if not candidate.endswith(".sh") and path_is_file(candidate + ".sh"):
         return candidate + ".sh"
 
     candidate = os.path.normpath(os.path.join(scan_path, text))
-    return candidate if os.path.isfile(candidate) else None
+    return candidate if path_is_file(candidate) else None
 
 
 _PERL_SKIP_MODULES = frozenset(
@@ -235,7 +237,7 @@ def resolve_perl_import(import_text: str, source_file: str, scan_path: str) -> s
     rel_path = import_text.replace("::", os.sep) + ".pm"
     for base in [os.path.join(scan_path, "lib"), scan_path]:
         candidate = os.path.join(base, rel_path)
-        if os.path.isfile(candidate):
+        if path_is_file(candidate):
             return candidate
     return None
 
@@ -251,11 +253,11 @@ def resolve_r_import(import_text: str, source_file: str, scan_path: str) -> str
 
     base = os.path.dirname(source_file)
     candidate = os.path.normpath(os.path.join(base, text))
-    if os.path.isfile(candidate):
+    if path_is_file(candidate):
         return candidate
 
     for src_root in [".", "R"]:
         candidate = os.path.join(scan_path, src_root, text)
-        if os.path.isfile(candidate):
+        if path_is_file(candidate):
             return candidate
     return None
@@ -10,6 +10,7 @@ duplicating the phase construction logic.
 
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -23,6 +24,8 @@ if TYPE_CHECKING:
     from desloppify.languages._framework.base.types import LangRuntimeContract
     from desloppify.languages._framework.treesitter import TreeSitterLangSpec
 
+logger = logging.getLogger(__name__)
+
 # ── Phase factories ────────────────────────────────────────
 
 
@@ -71,7 +74,7 @@ def make_ast_smells_phase(spec: TreeSitterLangSpec) -> DetectorPhase:
 
         return issues, potentials
 
-    return DetectorPhase("AST smells", run)
+    return DetectorPhase("AST smells", run, parse_grammar=spec.grammar)
 
 
 def make_cohesion_phase(spec: TreeSitterLangSpec) -> DetectorPhase:
@@ -109,7 +112,7 @@ def make_cohesion_phase(spec: TreeSitterLangSpec) -> DetectorPhase:
 
         return issues, potentials
 
-    return DetectorPhase("Responsibility cohesion", run)
+    return DetectorPhase("Responsibility cohesion", run, parse_grammar=spec.grammar)
 
 
 def make_unused_imports_phase(spec: TreeSitterLangSpec) -> DetectorPhase:
@@ -139,12 +142,61 @@ def make_unused_imports_phase(spec: TreeSitterLangSpec) -> DetectorPhase:
 
         return issues, potentials
 
-    return DetectorPhase("Unused imports", run)
+    return DetectorPhase("Unused imports", run, parse_grammar=spec.grammar)
 
 
 # ── Convenience: all tree-sitter phases for a named language ──
 
 
+def preparse_phase_sources(
+    path: Path,
+    lang: LangRuntimeContract,
+    phases: list[DetectorPhase],
+) -> None:
+    """Parse the language's files for every grammar *phases* use, in parallel.
+
+    Fills the scan-scoped parse cache on one parser per thread before the
+    phases run, then logs parse throughput.  A no-op when no phase declares
+    a grammar, the parse cache is disabled or only one CPU is available.
+    """
+    from desloppify.base.parallel import default_worker_count
+    from desloppify.base.runtime_state import current_runtime_context
+    from desloppify.languages._framework.treesitter import (
+        PARSE_INIT_ERRORS,
+        is_available,
+    )
+    from desloppify.languages._framework.treesitter.analysis.extractors import (
+        _get_parser,
+    )
+    from desloppify.languages._framework.treesitter.imports.cache import preparse_files
+
+    grammars = sorted({phase.parse_grammar for phase in phases if phase.parse_grammar})
+    # Parser threads share the process, so they do not wait for scan_workers.
+    workers = max(current_runtime_context().parallel_workers, default_worker_count())
+    if not grammars or workers <= 1 or not is_available():
+        return
+
+    file_list = lang.file_finder(path)
+    for grammar in grammars:
+        try:
+            throughput = preparse_files(
+                file_list,
+                grammar,
+                workers=workers,
+                make_parser=lambda name: _get_parser(name)[0],
+            )
+        except PARSE_INIT_ERRORS as exc:
+            logger.debug("tree-sitter pre-parse for %s failed: %s", grammar, exc)
+            continue
+        if throughput is None or not throughput.files:
+            continue
+        log(
+            f"  Parsed {throughput.files} {grammar} files on {throughput.workers} threads: "
+            f"{throughput.files_per_second:.0f} files/s, "
+            f"{throughput.megabytes_per_second:.1f} MB/s"
+        )
+
+
 def all_treesitter_phases(spec_name: str) -> list[DetectorPhase]:
     """Return all tree-sitter-powered phases for a language plugin.
 
@@ -177,4 +229,5 @@ __all__ = [
     "make_ast_smells_phase",
     "make_cohesion_phase",
     "make_unused_imports_phase",
+    "preparse_phase_sources",
 ]
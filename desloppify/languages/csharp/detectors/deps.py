@@ -12,6 +12,7 @@ from collections import defaultdict
 from pathlib import Path
 
 from desloppify.base.discovery.file_paths import resolve_path
+from desloppify.base.profiling import profile_span
 from desloppify.engine.detectors.graph import finalize_graph
 from desloppify.languages.csharp.detectors.deps_support_metadata import (
     expand_namespace_matches as _expand_namespace_matches,
@@ -147,14 +148,15 @@ def _build_dep_graph_roslyn(
     )
     try:
         # Roslyn command runs via fixed argv without shell expansion.
-        proc = subprocess.run(
-            cmd,
-            shell=False,
-            check=False,
-            capture_output=True,
-            text=False,
-            timeout=timeout_seconds,
-        )  # nosec B603
+        with profile_span(os.path.basename(cmd[0]), category="tool"):
+            proc = subprocess.run(
+                cmd,
+                shell=False,
+                check=False,
+                capture_output=True,
+                text=False,
+                timeout=timeout_seconds,
+            )  # nosec B603
     except (OSError, subprocess.TimeoutExpired):
         return None
     if proc.returncode != 0:
@@ -6,6 +6,7 @@ import re
 from pathlib import Path
 
 from desloppify.base.discovery.file_paths import rel, resolve_path
+from desloppify.base.discovery.source import read_source_text
 
 _USING_RE = re.compile(
     r"(?m)^\s*(?:global\s+)?using\s+([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)\s*;"
@@ -71,7 +72,7 @@ def parse_file_metadata(filepath: str) -> tuple[str | None, set[str], bool]:
     """Return (namespace, using_namespaces, is_entrypoint) for one C# file."""
     abs_path = Path(resolve_path(filepath))
     try:
-        content = abs_path.read_text()
+        content = read_source_text(abs_path)
     except (OSError, UnicodeDecodeError):
         return None, set(), False
 
@@ -6,6 +6,7 @@ import logging
 import re
 from pathlib import Path
 
+from desloppify.base.discovery.source import read_source_text
 from desloppify.engine.detectors.security import rules as security_detector_mod
 from desloppify.engine.policy.zones import FileZoneMap, Zone
 
@@ -50,7 +51,7 @@ def detect_csharp_security(
                 continue
 
         try:
-            content = Path(filepath).read_text(errors="replace")
+            content = read_source_text(Path(filepath), errors="replace")
         except OSError as exc:
             logger.debug(
                 "Skipping unreadable C# file %s in security detector: %s", filepath, exc
@@ -8,7 +8,11 @@ from pathlib import Path
 
 from desloppify.base.discovery.file_paths import resolve_path
 
-from desloppify.base.discovery.source import SourceDiscoveryOptions, find_source_files
+from desloppify.base.discovery.source import (
+    SourceDiscoveryOptions,
+    find_source_files,
+    read_source_text,
+)
 from desloppify.engine.detectors.base import ClassInfo, FunctionInfo
 from desloppify.languages.csharp._parse_helpers import (
     extract_csharp_params as _extract_csharp_params,
@@ -81,7 +85,7 @@ def _read_file(filepath: str) -> str | None:
     """Read file text, returning None on decode/IO errors."""
     p = Path(resolve_path(filepath))
     try:
-        return p.read_text()
+        return read_source_text(p)
     except (OSError, UnicodeDecodeError):
         return None
 
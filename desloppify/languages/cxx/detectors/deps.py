@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any
 
 from desloppify.base.discovery.file_paths import resolve_path
+from desloppify.base.discovery.source import read_source_text
 from desloppify.engine.detectors.graph import finalize_graph
 from desloppify.languages._framework.treesitter.imports.resolvers_backend import (
     resolve_cxx_include,
@@ -45,7 +46,7 @@ def _match_production_file(candidate: Path | str, file_index: dict[str, str]) ->
 
 def _read_include_specs(filepath: str) -> list[tuple[str, bool]]:
     try:
-        content = Path(filepath).read_text(errors="replace")
+        content = read_source_text(Path(filepath), errors="replace")
     except OSError:
         return []
     return [
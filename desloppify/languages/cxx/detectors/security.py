@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Literal
 
 from desloppify.base.discovery.file_paths import rel
+from desloppify.base.discovery.source import read_source_text
 from desloppify.engine.detectors.security import rules as security_detector_mod
 from desloppify.engine.policy.zones import FileZoneMap, Zone
 from desloppify.languages._framework.base.types import (
@@ -584,7 +585,7 @@ def _regex_fallback(files: list[str]) -> list[dict]:
     entries: list[dict] = []
     for filepath in files:
         try:
-            content = Path(filepath).read_text(errors="replace")
+            content = read_source_text(Path(filepath), errors="replace")
         except OSError as exc:
             logger.debug("Skipping unreadable C/C++ file %s in security detector: %s", filepath, exc)
             continue
@@ -8,7 +8,11 @@ import re
 from pathlib import Path
 
 from desloppify.base.discovery.file_paths import resolve_path
-from desloppify.base.discovery.source import SourceDiscoveryOptions, find_source_files
+from desloppify.base.discovery.source import (
+    SourceDiscoveryOptions,
+    find_source_files,
+    read_source_text,
+)
 from desloppify.engine.detectors.base import FunctionInfo
 from desloppify.languages.cxx._parse_helpers import find_matching_brace
 
@@ -94,7 +98,7 @@ def extract_cxx_functions(filepath: str) -> list[FunctionInfo]:
     """Extract C/C++ free and qualified function definitions from one file."""
     try:
         resolved = resolve_path(filepath)
-        content = Path(resolved).read_text(errors="replace")
+        content = read_source_text(Path(resolved), errors="replace")
     except OSError:
         return []
 
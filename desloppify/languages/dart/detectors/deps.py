@@ -8,6 +8,7 @@ from typing import Any
 
 from desloppify.base.discovery.file_paths import resolve_path
 from desloppify.base.discovery.paths import get_project_root
+from desloppify.base.discovery.source import read_source_text
 from desloppify.engine.detectors.graph import finalize_graph
 from desloppify.languages.dart.extractors import find_dart_files
 from desloppify.languages.dart.pubspec import read_package_name
@@ -88,7 +89,7 @@ def build_dep_graph(
 
     for filepath in abs_files:
         try:
-            content = Path(filepath).read_text(errors="replace")
+            content = read_source_text(Path(filepath), errors="replace")
         except OSError as exc:
             # Preserve context for troubleshooting while skipping unreadable files.
             _ = (filepath, exc)
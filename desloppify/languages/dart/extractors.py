@@ -8,7 +8,11 @@ from pathlib import Path
 
 from desloppify.base.discovery.file_paths import resolve_path
 
-from desloppify.base.discovery.source import SourceDiscoveryOptions, find_source_files
+from desloppify.base.discovery.source import (
+    SourceDiscoveryOptions,
+    find_source_files,
+    read_source_text,
+)
 from desloppify.base.text_utils import strip_c_style_comments
 from desloppify.engine.detectors.base import FunctionInfo
 from desloppify.languages.csharp._parse_helpers import (
@@ -93,7 +97,7 @@ def _normalize_body(body: str) -> str:
 def extract_dart_functions(filepath: str) -> list[FunctionInfo]:
     """Extract Dart functions/methods from one file."""
     try:
-        content = Path(resolve_path(filepath)).read_text(errors="replace")
+        content = read_source_text(Path(resolve_path(filepath)), errors="replace")
     except OSError:
         return []
 
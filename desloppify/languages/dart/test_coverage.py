@@ -8,6 +8,7 @@ from pathlib import Path
 
 from desloppify.base.discovery.paths import get_project_root
 
+from desloppify.base.discovery.source import read_source_text
 from desloppify.base.text_utils import strip_c_style_comments
 from desloppify.languages.dart.pubspec import read_package_name
 
@@ -95,7 +96,7 @@ def resolve_import_spec(
 def resolve_barrel_reexports(filepath: str, production_files: set[str]) -> set[str]:
     """Resolve exported modules from Dart barrel files."""
     try:
-        content = Path(filepath).read_text(errors="replace")
+        content = read_source_text(Path(filepath), errors="replace")
     except OSError:
         return set()
     out: set[str] = set()
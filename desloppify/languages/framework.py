@@ -84,6 +84,15 @@ def prewarm_review_phase_detectors(path, lang, phases) -> None:
     _prewarm_review_phase_detectors(path, lang, phases)
 
 
+def preparse_treesitter_sources(path, lang, phases) -> None:
+    """Pre-parse tree-sitter sources for the selected phases in parallel."""
+    from desloppify.languages._framework.treesitter.phases import (
+        preparse_phase_sources as _preparse_phase_sources,
+    )
+
+    _preparse_phase_sources(path, lang, phases)
+
+
 def clear_review_phase_prefetch(lang) -> None:
     """Clear in-memory shared review detector prefetch state."""
     from desloppify.languages._framework.base.shared_phases_review import (
@@ -115,6 +124,7 @@ __all__ = [
     "load_all",
     "make_lang_run",
     "make_lang_config",
+    "preparse_treesitter_sources",
     "prewarm_review_phase_detectors",
     "reset_script_import_caches",
     "registry_state",
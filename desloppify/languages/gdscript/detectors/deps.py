@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any
 
 from desloppify.base.discovery.file_paths import resolve_path
+from desloppify.base.discovery.source import read_source_text
 from desloppify.engine.detectors.graph import finalize_graph
 from desloppify.languages.gdscript.extractors import find_gdscript_files
 from desloppify.languages.gdscript.patterns import EXTENDS_RE, LOAD_PATH_RE
@@ -52,7 +53,7 @@ def build_dep_graph(
 
     for filepath in abs_files:
         try:
-            content = Path(filepath).read_text(errors="replace")
+            content = read_source_text(Path(filepath), errors="replace")
         except OSError as exc:
             # Preserve context for troubleshooting while skipping unreadable files.
             _ = (filepath, exc)
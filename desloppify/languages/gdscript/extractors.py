@@ -8,7 +8,11 @@ from pathlib import Path
 
 from desloppify.base.discovery.file_paths import resolve_path
 
-from desloppify.base.discovery.source import SourceDiscoveryOptions, find_source_files
+from desloppify.base.discovery.source import (
+    SourceDiscoveryOptions,
+    find_source_files,
+    read_source_text,
+)
 from desloppify.engine.detectors.base import FunctionInfo
 
 GDSCRIPT_FILE_EXCLUSIONS = [
@@ -66,7 +70,7 @@ def _block_end_line(lines: list[str], start_index: int, base_indent: int) -> int
 def extract_gdscript_functions(filepath: str) -> list[FunctionInfo]:
     """Extract GDScript functions from one file."""
     try:
-        content = Path(resolve_path(filepath)).read_text(errors="replace")
+        content = read_source_text(Path(resolve_path(filepath)), errors="replace")
     except OSError:
         return []
     lines = content.splitlines()
@@ -6,6 +6,7 @@ import os
 import re
 from pathlib import Path
 
+from desloppify.base.discovery.source import read_source_text
 from desloppify.languages.gdscript.patterns import EXTENDS_RE, LOAD_PATH_RE
 
 _GDS_LOGIC_RE = re.compile(r"(?m)^\s*(?:func|class_name|extends)\b")
@@ -52,7 +53,7 @@ def resolve_import_spec(
 
 def resolve_barrel_reexports(filepath: str, production_files: set[str]) -> set[str]:
     try:
-        content = Path(filepath).read_text(errors="replace")
+        content = read_source_text(Path(filepath), errors="replace")
     except OSError:
         return set()
     out: set[str] = set()
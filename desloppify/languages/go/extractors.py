@@ -11,7 +11,11 @@ from pathlib import Path
 
 from desloppify.base.discovery.file_paths import resolve_path
 
-from desloppify.base.discovery.source import SourceDiscoveryOptions, find_source_files
+from desloppify.base.discovery.source import (
+    SourceDiscoveryOptions,
+    find_source_files,
+    read_source_text,
+)
 from desloppify.engine.detectors.base import FunctionInfo
 
 GO_FILE_EXCLUSIONS = ["vendor", "testdata", ".git", "node_modules"]
@@ -222,7 +226,7 @@ def _extract_params(content: str, open_paren: int) -> list[str]:
 def extract_go_functions(filepath: str) -> list[FunctionInfo]:
     """Extract Go functions/methods from one file."""
     try:
-        content = Path(resolve_path(filepath)).read_text(errors="replace")
+        content = read_source_text(Path(resolve_path(filepath)), errors="replace")
     except OSError:
         return []
 
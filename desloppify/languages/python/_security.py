@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+from pathlib import Path
 
 from desloppify.base.config import load_config
 from desloppify.base.discovery.source import collect_exclude_dirs
@@ -11,6 +13,10 @@ from desloppify.languages.python.detectors.bandit_adapter import detect_with_ban
 from desloppify.languages.python._helpers import scan_root_from_files
 
 
+# Leave room under the Windows command-line limit (32767 characters).
+_MAX_TARGET_CHARS = 30_000 if os.name == "nt" else 1_000_000
+
+
 def missing_bandit_coverage() -> DetectorCoverageStatus:
     return DetectorCoverageStatus(
         detector="security",
@@ -44,6 +50,14 @@ def _load_bandit_skip_tests() -> list[str] | None:
     return None
 
 
+def _bandit_targets(files) -> list[str] | None:
+    """Absolute ``.py`` paths for bandit, or None when they overflow the command line."""
+    targets = [str(Path(f).resolve()) for f in files if f.endswith(".py")]
+    if sum(len(target) + 1 for target in targets) > _MAX_TARGET_CHARS:
+        return None
+    return targets
+
+
 def detect_python_security(files, zone_map) -> LangSecurityResult:
     scan_root = scan_root_from_files(files)
     if scan_root is None:
@@ -51,13 +65,24 @@ def detect_python_security(files, zone_map) -> LangSecurityResult:
 
     exclude_dirs = collect_exclude_dirs(scan_root)
     skip_tests = _load_bandit_skip_tests()
+    # Scan exactly *files* so incremental runs over a subset do not rescan
+    # (and count) their neighbours; very long lists fall back to recursing,
+    # counting at most the requested files.
+    targets = _bandit_targets(files)
     result = detect_with_bandit(
-        scan_root, zone_map, exclude_dirs=exclude_dirs, skip_tests=skip_tests,
+        scan_root,
+        zone_map,
+        exclude_dirs=exclude_dirs,
+        skip_tests=skip_tests,
+        targets=targets,
     )
+    files_scanned = result.files_scanned
+    if targets is None:
+        files_scanned = min(files_scanned, sum(1 for f in files if f.endswith(".py")))
     coverage = result.status.coverage()
     return LangSecurityResult(
         entries=result.entries,
-        files_scanned=result.files_scanned,
+        files_scanned=files_scanned,
         coverage=coverage,
     )
 
@@ -29,6 +29,7 @@ from typing import Literal
 
 from desloppify.base.discovery.file_paths import rel
 from desloppify.base.discovery.paths import get_project_root
+from desloppify.base.profiling import profile_span
 from desloppify.engine.policy.zones import FileZoneMap, Zone
 from desloppify.languages._framework.base.types import DetectorCoverageStatus
 
@@ -191,11 +192,15 @@ def detect_with_bandit(
     timeout: int = 120,
     exclude_dirs: list[str] | None = None,
     skip_tests: list[str] | None = None,
+    targets: list[str] | None = None,
 ) -> BanditScanResult:
     """Run bandit on *path* and return issues + typed execution status.
 
     Parameters
     ----------
+    targets:
+        Explicit file paths to scan instead of recursing into *path*, so a
+        run over a subset of files scans (and counts) only those files.
     exclude_dirs:
         Absolute directory paths to pass to bandit's ``--exclude`` flag.
         When non-empty, bandit will skip these directories during its
@@ -217,16 +222,20 @@ def detect_with_bandit(
         cmd.extend(["--exclude", ",".join(exclude_dirs)])
     if skip_tests:
         cmd.extend(["--skip", ",".join(skip_tests)])
-    cmd.append(str(path.resolve()))
+    if targets:
+        cmd.extend(targets)
+    else:
+        cmd.append(str(path.resolve()))
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=get_project_root(),
-            timeout=timeout,
-        )  # nosec B603
+        with profile_span("bandit", category="tool"):
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                cwd=get_project_root(),
+                timeout=timeout,
+            )  # nosec B603
     except FileNotFoundError:
         logger.debug("bandit: not installed — Python-specific security checks will be skipped")
         return BanditScanResult(
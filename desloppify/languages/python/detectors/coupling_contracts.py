@@ -5,7 +5,7 @@ from __future__ import annotations
 import ast
 from pathlib import Path
 
-from desloppify.base.discovery.source import find_py_files
+from desloppify.base.discovery.source import find_py_files, read_source_text
 from desloppify.base.discovery.paths import get_project_root
 
 _IGNORED_SELF_ATTRS = {"logger"}
@@ -78,7 +78,7 @@ def detect_implicit_mixin_contracts(
     for filepath in find_py_files(path):
         full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
         try:
-            content = full.read_text()
+            content = read_source_text(full)
             tree = ast.parse(content, filename=str(full))
         except (OSError, SyntaxError, UnicodeDecodeError) as exc:
             # Preserve parse/read context while intentionally skipping broken files.
@@ -10,9 +10,10 @@ from typing import Any
 
 from desloppify.base.discovery.file_paths import resolve_path
 
-from desloppify.base.discovery.source import find_py_files
+from desloppify.base.discovery.source import find_py_files, read_source_text
 from desloppify.base.discovery.paths import get_project_root
 from desloppify.engine.detectors.graph import finalize_graph
+from desloppify.engine.detectors.graph_snapshot import cached_file_edges
 from desloppify.languages.python.detectors.deps_dynamic import (
     find_python_dynamic_imports,
 )
@@ -43,6 +44,54 @@ def _is_type_checking_guard(node: ast.If) -> bool:
     return False
 
 
+def _import_records(abs_path: str, filepath: str) -> list[list[Any]] | None:
+    """Return ``[kind, module, names, deferred]`` records for one file.
+
+    ``None`` when the file cannot be read or parsed.
+    """
+    try:
+        content = read_source_text(Path(abs_path))
+        tree = ast.parse(content, filename=abs_path)
+    except (OSError, UnicodeDecodeError, SyntaxError) as exc:
+        logger.debug(
+            "Skipping unreadable/unparseable python file %s in deps detector: %s",
+            filepath,
+            exc,
+        )
+        return None
+
+    # Collect top-level function/class line ranges to detect deferred imports,
+    # plus `if TYPE_CHECKING:` blocks whose imports never run at runtime.
+    top_level_scopes: list[tuple[int, int]] = []
+    for node in ast.iter_child_nodes(tree):
+        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef):
+            end = getattr(node, "end_lineno", node.lineno)
+            top_level_scopes.append((node.lineno, end))
+        elif isinstance(node, ast.If) and _is_type_checking_guard(node):
+            end = getattr(node, "end_lineno", node.lineno)
+            top_level_scopes.append((node.lineno, end))
+
+    records: list[list[Any]] = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Import | ast.ImportFrom):
+            continue
+
+        is_deferred = any(
+            start <= node.lineno <= end for start, end in top_level_scopes
+        )
+
+        if isinstance(node, ast.ImportFrom):
+            # Build module_path from level (dots) + module name
+            dots = "." * (node.level or 0)
+            module_path = dots + (node.module or "")
+            import_names = ", ".join(a.name for a in node.names)
+            records.append(["from", module_path, import_names, is_deferred])
+        else:
+            for alias in node.names:
+                records.append(["import", alias.name, None, is_deferred])
+    return records
+
+
 def build_dep_graph(
     path: Path,
     roslyn_cmd: str | None = None,
@@ -50,12 +99,37 @@ def build_dep_graph(
     """Build a dependency graph for Python files.
 
     Uses ast.parse for reliable import extraction (handles multi-line imports,
-    parenthesized imports, aliases, etc.).
+    parenthesized imports, aliases, etc.).  Per-file import records and edges
+    go through the import-graph snapshot, so unchanged files are not re-parsed.
 
     Returns {resolved_path: {"imports": set, "importers": set, "import_count", "importer_count"}}
     """
     del roslyn_cmd
     py_files = find_py_files(path)
+    project_root = get_project_root()
+
+    def extract(files: list[str]) -> dict[str, list[list[Any]] | None]:
+        return {
+            filepath: _import_records(
+                filepath if Path(filepath).is_absolute() else str(project_root / filepath),
+                filepath,
+            )
+            for filepath in files
+        }
+
+    def resolve(filepath: str, records: list[list[Any]]) -> list[tuple[str, str]]:
+        edges: list[tuple[str, str]] = []
+        for kind, module_path, import_names, is_deferred in records:
+            if kind == "from":
+                targets = _resolve_python_from_import(
+                    module_path, import_names, filepath, path
+                )
+            else:
+                target = _resolve_python_import(module_path, filepath, path)
+                targets = [target] if target else []
+            edge_kind = "deferred" if is_deferred else "import"
+            edges.extend((edge_kind, target) for target in targets)
+        return edges
 
     graph: dict[str, dict] = defaultdict(
         lambda: {
@@ -64,69 +138,19 @@ def build_dep_graph(
             "deferred_imports": set(),
         }
     )
-
-    for filepath in py_files:
-        abs_path = (
-            filepath if Path(filepath).is_absolute() else str(get_project_root() / filepath)
-        )
-        try:
-            content = Path(abs_path).read_text()
-            tree = ast.parse(content, filename=abs_path)
-        except (OSError, UnicodeDecodeError, SyntaxError) as exc:
-            logger.debug(
-                "Skipping unreadable/unparseable python file %s in deps detector: %s",
-                filepath,
-                exc,
-            )
+    file_edges = cached_file_edges(
+        "python", path, py_files, extract=extract, resolve=resolve
+    )
+    for filepath, edges in file_edges.items():
+        if edges is None:
             continue
-
         source_resolved = resolve_path(filepath)
         graph[source_resolved]  # ensure entry
-
-        # Collect top-level function/class line ranges to detect deferred imports,
-        # plus `if TYPE_CHECKING:` blocks whose imports never run at runtime.
-        top_level_scopes: list[tuple[int, int]] = []
-        for node in ast.iter_child_nodes(tree):
-            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef):
-                end = getattr(node, "end_lineno", node.lineno)
-                top_level_scopes.append((node.lineno, end))
-            elif isinstance(node, ast.If) and _is_type_checking_guard(node):
-                end = getattr(node, "end_lineno", node.lineno)
-                top_level_scopes.append((node.lineno, end))
-
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Import | ast.ImportFrom):
-                continue
-
-            is_deferred = any(
-                start <= node.lineno <= end for start, end in top_level_scopes
-            )
-
-            if isinstance(node, ast.ImportFrom):
-                # Build module_path from level (dots) + module name
-                dots = "." * (node.level or 0)
-                module = node.module or ""
-                module_path = dots + module
-
-                import_names = ", ".join(a.name for a in node.names)
-                targets = _resolve_python_from_import(
-                    module_path, import_names, filepath, path
-                )
-
-                for target in targets:
-                    graph[source_resolved]["imports"].add(target)
-                    graph[target]["importers"].add(source_resolved)
-                    if is_deferred:
-                        graph[source_resolved]["deferred_imports"].add(target)
-
-            elif isinstance(node, ast.Import):
-                for alias in node.names:
-                    target = _resolve_python_import(alias.name, filepath, path)
-                    if target:
-                        graph[source_resolved]["imports"].add(target)
-                        graph[target]["importers"].add(source_resolved)
-                        if is_deferred:
-                            graph[source_resolved]["deferred_imports"].add(target)
+        for kind, target in edges:
+            graph[source_resolved]["imports"].add(target)
+            graph[target]["importers"].add(source_resolved)
+            if kind == "deferred":
+                graph[source_resolved]["deferred_imports"].add(target)
 
     return finalize_graph(dict(graph))
 
@@ -6,6 +6,8 @@ import ast
 import logging
 from pathlib import Path
 
+from desloppify.base.discovery.source import read_source_text
+
 from .deps_resolution import resolve_absolute_import
 
 logger = logging.getLogger(__name__)
@@ -17,7 +19,7 @@ def find_python_dynamic_imports(path: Path, extensions: list[str]) -> set[str]:
     targets: set[str] = set()
     for py_file in path.rglob("*.py"):
         try:
-            tree = ast.parse(py_file.read_text(), filename=str(py_file))
+            tree = ast.parse(read_source_text(py_file), filename=str(py_file))
         except (SyntaxError, UnicodeDecodeError, OSError) as exc:
             logger.debug(
                 "Skipping unreadable file %s in dynamic import scan: %s",
@@ -4,6 +4,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from desloppify.base.discovery.path_index import (
+    memoized_resolution,
+    path_is_dir,
+    path_is_file,
+)
 from desloppify.base.discovery.paths import get_project_root
 
 
@@ -81,8 +86,14 @@ def resolve_python_import(
     source_dir = source.parent
     scan_root_path = Path(scan_root) if not isinstance(scan_root, Path) else scan_root
     if module_path.startswith("."):
-        return resolve_relative_import(module_path, source_dir)
-    return resolve_absolute_import(module_path, scan_root_path)
+        return memoized_resolution(
+            ("python", str(source_dir), module_path),
+            lambda: resolve_relative_import(module_path, source_dir),
+        )
+    return memoized_resolution(
+        ("python", str(scan_root_path), str(get_project_root()), module_path),
+        lambda: resolve_absolute_import(module_path, scan_root_path),
+    )
 
 
 def resolve_relative_import(module_path: str, source_dir: Path) -> str | None:
@@ -125,16 +136,16 @@ def resolve_absolute_import(module_path: str, scan_root: Path) -> str | None:
 def try_resolve_path(target_base: Path) -> str | None:
     """Try to resolve module base to ``.py`` or package ``__init__.py`` path."""
     candidate = Path(str(target_base) + ".py")
-    if candidate.is_file():
+    if path_is_file(candidate):
         return str(candidate.resolve())
 
     candidate = target_base / "__init__.py"
-    if candidate.is_file():
+    if path_is_file(candidate):
         return str(candidate.resolve())
 
-    if target_base.is_dir():
+    if path_is_dir(target_base):
         init_path = target_base / "__init__.py"
-        if init_path.is_file():
+        if path_is_file(init_path):
             return str(init_path.resolve())
 
     return None
@@ -8,7 +8,7 @@ import logging
 from pathlib import Path
 
 from desloppify.base.discovery.paths import get_project_root
-from desloppify.base.discovery.source import find_py_files
+from desloppify.base.discovery.source import find_py_files, read_source_text
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +29,7 @@ def detect_dict_key_flow(path: Path) -> tuple[list[dict], int]:
             file_path = (
                 Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
             )
-            source = file_path.read_text()
+            source = read_source_text(file_path)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug(
                 "Skipping unreadable python file %s in dict-key pass: %s",
@@ -8,7 +8,7 @@ from collections import defaultdict
 from pathlib import Path
 
 from desloppify.base.discovery.paths import get_project_root
-from desloppify.base.discovery.source import find_py_files
+from desloppify.base.discovery.source import find_py_files, read_source_text
 
 from .shared import _is_singular_plural, _levenshtein
 
@@ -26,7 +26,7 @@ def _read_python_file(filepath: str) -> str | None:
         file_path = (
             Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
         )
-        return file_path.read_text()
+        return read_source_text(file_path)
     except (OSError, UnicodeDecodeError) as exc:
         logger.debug(
             "Skipping unreadable python file %s in schema-drift pass: %s",
@@ -6,6 +6,7 @@ import ast
 from pathlib import Path
 
 from desloppify.base.discovery.file_paths import count_lines
+from desloppify.base.discovery.source import read_source_text
 from desloppify.languages._framework.facade_common import (
     facade_tier_confidence,
     detect_reexport_facades_common,
@@ -15,7 +16,7 @@ from desloppify.languages._framework.facade_common import (
 def is_py_facade(filepath: str) -> dict | None:
     """Check if a Python file is a pure re-export facade."""
     try:
-        content = Path(filepath).read_text()
+        content = read_source_text(Path(filepath))
         tree = ast.parse(content, filename=filepath)
     except (OSError, SyntaxError, UnicodeDecodeError):
         return None
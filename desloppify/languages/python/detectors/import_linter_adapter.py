@@ -16,6 +16,8 @@ import shutil
 import subprocess  # nosec B404
 from pathlib import Path
 
+from desloppify.base.profiling import profile_span
+
 logger = logging.getLogger(__name__)
 
 _BROKEN_CONTRACT_RE = re.compile(r"Broken contract '([^']+)'")
@@ -62,13 +64,14 @@ def detect_with_import_linter(path: Path) -> list[dict] | None:
         return None
 
     try:
-        result = subprocess.run(
-            [lint_imports_path],
-            capture_output=True,
-            text=True,
-            cwd=config_dir,
-            timeout=60,
-        )  # nosec B603
+        with profile_span("lint-imports", category="tool"):
+            result = subprocess.run(
+                [lint_imports_path],
+                capture_output=True,
+                text=True,
+                cwd=config_dir,
+                timeout=60,
+            )  # nosec B603
     except FileNotFoundError:
         logger.debug("import-linter: lint-imports not found — skipping")
         return None
@@ -7,7 +7,7 @@ import logging
 from pathlib import Path
 
 from desloppify.base.discovery.paths import get_project_root
-from desloppify.base.discovery.source import find_py_files
+from desloppify.base.discovery.source import find_py_files, read_source_text
 from desloppify.languages.python.detectors.mutable_state_ast import (
     _collect_module_level_mutables,
     _detect_in_module,
@@ -26,7 +26,7 @@ def _resolve_python_path(filepath: str) -> Path:
 def _parse_python_file(filepath: str, *, log_context: str) -> ast.Module | None:
     """Read and parse a Python source file; return ``None`` on recoverable errors."""
     try:
-        content = _resolve_python_path(filepath).read_text()
+        content = read_source_text(_resolve_python_path(filepath))
     except (OSError, UnicodeDecodeError) as exc:
         logger.debug("Skipping unreadable python file %s in %s: %s", filepath, log_context, exc)
         return None
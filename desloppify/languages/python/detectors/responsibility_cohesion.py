@@ -5,7 +5,7 @@ from __future__ import annotations
 import ast
 from pathlib import Path
 
-from desloppify.base.discovery.source import find_py_files
+from desloppify.base.discovery.source import find_py_files, read_source_text
 from desloppify.base.discovery.paths import get_project_root
 
 
@@ -91,7 +91,7 @@ def detect_responsibility_cohesion(
     for filepath in find_py_files(path):
         full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
         try:
-            source = full.read_text()
+            source = read_source_text(full)
             tree = ast.parse(source, filename=str(full))
         except (OSError, UnicodeDecodeError, SyntaxError) as exc:
             # Preserve parse/read context while intentionally skipping broken files.
@@ -34,8 +34,9 @@ from pathlib import Path
 
 from desloppify.base.discovery.source import collect_exclude_dirs as _collect_exclude_dirs
 from desloppify.base.discovery.source import get_exclusions as _get_exclusions
-from desloppify.base.discovery.file_paths import matches_exclusion as _matches_exclusion
+from desloppify.base.discovery.file_paths import compile_exclusions
 from desloppify.base.discovery.paths import get_project_root
+from desloppify.base.profiling import profile_span
 
 logger = logging.getLogger(__name__)
 
@@ -88,13 +89,14 @@ def detect_with_ruff_smells(path: Path) -> list[dict] | None:
     cmd.append(str(path))
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=get_project_root(),
-            timeout=60,
-        )  # nosec B603
+        with profile_span("ruff", category="tool"):
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                cwd=get_project_root(),
+                timeout=60,
+            )  # nosec B603
     except FileNotFoundError:
         logger.debug("ruff smells: ruff not found — skipping supplemental smell detection")
         return None
@@ -115,7 +117,7 @@ def detect_with_ruff_smells(path: Path) -> list[dict] | None:
         logger.debug("ruff smells: JSON parse error: %s", exc)
         return None
 
-    exclusions = _get_exclusions()
+    exclusion_matcher = compile_exclusions(_get_exclusions())
 
     # Group diagnostics by (code, file) → list of matches.
     # Then convert to smell entry format.
@@ -127,7 +129,7 @@ def detect_with_ruff_smells(path: Path) -> list[dict] | None:
         filepath = diag.get("filename", "")
         if not filepath:
             continue
-        if exclusions and any(_matches_exclusion(filepath, ex) for ex in exclusions):
+        if exclusion_matcher and exclusion_matcher.matches(filepath):
             continue
         location = diag.get("location", {})
         line = location.get("row", 0) if isinstance(location, dict) else 0
@@ -7,6 +7,8 @@ import logging
 import re
 from pathlib import Path
 
+from desloppify.base.discovery.source import read_source_text
+
 logger = logging.getLogger(__name__)
 
 ConstantLocations = dict[tuple[str, str], list[tuple[str, int]]]
@@ -129,7 +131,7 @@ def detect_star_import_no_all(
 
         # Check if target defines __all__
         try:
-            target_content = target.read_text()
+            target_content = read_source_text(target)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug(
                 "Skipping unreadable import target %s referenced by %s: %s",
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
-from desloppify.base.discovery.source import find_py_files
+from desloppify.base.discovery.source import find_py_files, read_source_text
 from desloppify.base.discovery.paths import get_project_root
 from desloppify.base.output.fallbacks import log_best_effort_failure
+from desloppify.base.parallel import map_files, per_file_task
+from desloppify.engine.detectors.patterns.multi import MultiPatternScanner
 from desloppify.languages.python.detectors.smells_ast._dispatch import (
     detect_ast_smells,
 )
@@ -197,7 +200,7 @@ def _read_smell_source_file(
         file_path = (
             Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
         )
-        content = file_path.read_text()
+        content = read_source_text(file_path)
         return content, content.splitlines()
     except (OSError, UnicodeDecodeError) as exc:
         log_best_effort_failure(
@@ -208,6 +211,11 @@ def _read_smell_source_file(
         return None
 
 
+@lru_cache(maxsize=8)
+def _line_pattern_scanner(rules: tuple[tuple[str, str], ...]) -> MultiPatternScanner[str]:
+    return MultiPatternScanner(rules)
+
+
 def _scan_file_patterns(
     *,
     filepath: str,
@@ -215,30 +223,31 @@ def _scan_file_patterns(
     smell_checks: list[dict],
     smell_counts: dict[str, list[dict]],
 ) -> None:
-    """Run regex-based smell checks for one file."""
+    """Run regex-based smell checks for one file in a single pass over its lines."""
+    scanner = _line_pattern_scanner(
+        tuple(
+            (check["id"], check["pattern"])
+            for check in smell_checks
+            if check.get("pattern") is not None
+        )
+    )
     multiline_string_lines = build_string_line_set(lines)
-    for check in smell_checks:
-        pattern = check.get("pattern")
-        if pattern is None:
+    for i, smell_id, match in scanner.scan_lines(lines, skip=multiline_string_lines):
+        line = lines[i]
+        if match_is_in_string(line, match.start()):
             continue
-        for i, line in enumerate(lines):
-            if i in multiline_string_lines:
-                continue
-            match = re.search(pattern, line)
-            if not match or match_is_in_string(line, match.start()):
-                continue
-            if check["id"] == "hardcoded_url" and re.match(
-                r"^[A-Z_][A-Z0-9_]*\s*=",
-                line.strip(),
-            ):
-                continue
-            smell_counts[check["id"]].append(
-                {
-                    "file": filepath,
-                    "line": i + 1,
-                    "content": line.strip()[:100],
-                }
-            )
+        if smell_id == "hardcoded_url" and re.match(
+            r"^[A-Z_][A-Z0-9_]*\s*=",
+            line.strip(),
+        ):
+            continue
+        smell_counts[smell_id].append(
+            {
+                "file": filepath,
+                "line": i + 1,
+                "content": line.strip()[:100],
+            }
+        )
 
 
 def _run_semantic_detectors(
@@ -287,6 +296,38 @@ def _build_sorted_entries(
     return entries
 
 
+@per_file_task
+def _scan_smell_file(
+    filepath: str,
+    *,
+    smell_checks: list[dict],
+    project_path: Path,
+    logger,
+) -> tuple[dict[str, list[dict]], dict[tuple[str, str], list[tuple[str, int]]]] | None:
+    """Run all smell checks on one file; returns its matches and constants."""
+    loaded = _read_smell_source_file(filepath, logger=logger)
+    if loaded is None:
+        return None
+    content, lines = loaded
+    smell_counts: dict[str, list[dict]] = {smell["id"]: [] for smell in smell_checks}
+    constants_by_key: dict[tuple[str, str], list[tuple[str, int]]] = {}
+    _scan_file_patterns(
+        filepath=filepath,
+        lines=lines,
+        smell_checks=smell_checks,
+        smell_counts=smell_counts,
+    )
+    _run_semantic_detectors(
+        filepath=filepath,
+        content=content,
+        lines=lines,
+        project_path=project_path,
+        smell_counts=smell_counts,
+        constants_by_key=constants_by_key,
+    )
+    return {key: found for key, found in smell_counts.items() if found}, constants_by_key
+
+
 def detect_smells_runtime(
     path: Path,
     *,
@@ -299,27 +340,20 @@ def detect_smells_runtime(
     files = find_py_files(path)
     constants_by_key: dict[tuple[str, str], list[tuple[str, int]]] = {}
 
-    for filepath in files:
-        if is_test_path_fn(filepath):
-            continue
-        loaded = _read_smell_source_file(filepath, logger=logger)
-        if loaded is None:
+    for scanned in map_files(
+        _scan_smell_file,
+        [filepath for filepath in files if not is_test_path_fn(filepath)],
+        smell_checks=smell_checks,
+        project_path=path,
+        logger=logger,
+    ):
+        if scanned is None:
             continue
-        content, lines = loaded
-        _scan_file_patterns(
-            filepath=filepath,
-            lines=lines,
-            smell_checks=smell_checks,
-            smell_counts=smell_counts,
-        )
-        _run_semantic_detectors(
-            filepath=filepath,
-            content=content,
-            lines=lines,
-            project_path=path,
-            smell_counts=smell_counts,
-            constants_by_key=constants_by_key,
-        )
+        file_counts, file_constants = scanned
+        for smell_id, found in file_counts.items():
+            smell_counts.setdefault(smell_id, []).extend(found)
+        for key, locations in file_constants.items():
+            constants_by_key.setdefault(key, []).extend(locations)
 
     detect_duplicate_constants(constants_by_key, smell_counts)
     entries = _build_sorted_entries(
@@ -12,8 +12,9 @@ from pathlib import Path
 from desloppify.base.discovery.source import collect_exclude_dirs as _collect_exclude_dirs
 from desloppify.base.discovery.source import find_py_files
 from desloppify.base.discovery.source import get_exclusions as _get_exclusions
-from desloppify.base.discovery.file_paths import matches_exclusion as _matches_exclusion
+from desloppify.base.discovery.file_paths import compile_exclusions
 from desloppify.base.discovery.paths import get_project_root
+from desloppify.base.profiling import profile_span
 
 
 def _selected_codes(category: str) -> list[str]:
@@ -26,10 +27,7 @@ def _selected_codes(category: str) -> list[str]:
 
 
 def _is_excluded(filepath: str, exclusions: tuple[str, ...]) -> bool:
-    return bool(
-        exclusions
-        and any(_matches_exclusion(filepath, ex) for ex in exclusions)
-    )
+    return bool(exclusions) and compile_exclusions(exclusions).matches(filepath)
 
 
 def _extract_unused_name(message: str, *, name_re: re.Pattern[str]) -> str:
@@ -180,13 +178,14 @@ def _try_ruff(path: Path, category: str) -> list[dict] | None:
     cmd.append(str(path))
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=get_project_root(),
-            timeout=60,
-        )  # nosec B603
+        with profile_span("ruff", category="tool"):
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                cwd=get_project_root(),
+                timeout=60,
+            )  # nosec B603
     except (FileNotFoundError, subprocess.TimeoutExpired):
         return None
 
@@ -209,13 +208,14 @@ def _try_ruff(path: Path, category: str) -> list[dict] | None:
 def _try_pyflakes(path: Path, category: str) -> list[dict] | None:
     """Fallback: try pyflakes for unused detection."""
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pyflakes", str(path)],
-            capture_output=True,
-            text=True,
-            cwd=get_project_root(),
-            timeout=60,
-        )  # nosec B603
+        with profile_span("pyflakes", category="tool"):
+            result = subprocess.run(
+                [sys.executable, "-m", "pyflakes", str(path)],
+                capture_output=True,
+                text=True,
+                cwd=get_project_root(),
+                timeout=60,
+            )  # nosec B603
     except (FileNotFoundError, subprocess.TimeoutExpired):
         return None
 
@@ -8,7 +8,7 @@ from pathlib import Path
 
 from desloppify.base.discovery.file_paths import rel
 
-from desloppify.base.discovery.source import find_py_files
+from desloppify.base.discovery.source import find_py_files, read_source_text
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +29,7 @@ def detect_unused_enums(path: Path) -> tuple[list[dict], int]:
     for filepath in files:
         try:
             p = Path(filepath) if Path(filepath).is_absolute() else path / filepath
-            content = p.read_text()
+            content = read_source_text(p)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable python source %s: %s", filepath, exc)
             continue
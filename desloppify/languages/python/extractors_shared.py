@@ -5,13 +5,14 @@ from __future__ import annotations
 from pathlib import Path
 
 from desloppify.base.discovery.paths import get_project_root
+from desloppify.base.discovery.source import read_source_text
 
 
 def read_file(filepath: str) -> str | None:
     """Read a file, returning None on error."""
     path = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
     try:
-        return path.read_text()
+        return read_source_text(path)
     except (OSError, UnicodeDecodeError):
         return None
 
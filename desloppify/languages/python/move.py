@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import re
@@ -39,16 +40,6 @@ def _path_to_py_module(filepath: str, root: Path) -> str | None:
     return ".".join(parts) if parts else None
 
 
-def _has_exact_module(line: str, module: str) -> bool:
-    """Check whether an import line references this exact module."""
-    return bool(re.search(rf"(?<!\w){re.escape(module)}(?![\w.])", line))
-
-
-def _replace_exact_module(line: str, old_module: str, new_module: str) -> str:
-    """Replace an exact module reference in a Python import line."""
-    return re.sub(rf"(?<!\w){re.escape(old_module)}(?![\w.])", new_module, line)
-
-
 def _resolve_py_relative(source_dir: Path, dots: str, remainder: str) -> str | None:
     """Resolve a relative Python import to an absolute file path."""
     dot_count = len(dots)
@@ -102,28 +93,62 @@ def _compute_py_relative_import(from_file: str, to_file: str) -> str | None:
     return f"{dots}{remainder}"
 
 
-def find_replacements(
-    source_abs: str,
-    dest_abs: str,
+_RELATIVE_FROM_RE = re.compile(r"from\s+(\.+)(\w*(?:\.\w+)*)\s+import")
+
+
+def _module_matcher(modules: list[str]) -> re.Pattern[str]:
+    """Compile one exact-module matcher covering every moved module."""
+    alternation = "|".join(
+        re.escape(module) for module in sorted(modules, key=len, reverse=True)
+    )
+    return re.compile(rf"(?<!\w)(?:{alternation})(?![\w.])")
+
+
+def find_batch_replacements(
+    file_moves: list[tuple[str, str]],
     graph: dict,
 ) -> dict[str, list[tuple[str, str]]]:
-    """Compute all import string replacements needed for a Python file move."""
+    """Compute importer replacements for a set of Python file moves at once.
+
+    Builds the old→new module map up front and reads each affected importer
+    exactly once, matching every moved module with a single combined pattern.
+    """
     changes: dict[str, list[tuple[str, str]]] = {}
-    entry = graph.get(source_abs)
-    if not entry:
+    root = get_project_root()
+    dest_by_source: dict[str, str] = {}
+    new_module_by_old: dict[str, str] = {}
+    source_by_old: dict[str, str] = {}
+    sources_by_importer: dict[str, set[str]] = {}
+
+    for source_abs, dest_abs in file_moves:
+        entry = graph.get(source_abs)
+        if not entry:
+            continue
+        old_module = _path_to_py_module(source_abs, root)
+        new_module = _path_to_py_module(dest_abs, root)
+        if not old_module or not new_module:
+            continue
+        dest_by_source[source_abs] = dest_abs
+        new_module_by_old[old_module] = new_module
+        source_by_old[old_module] = source_abs
+        for importer in entry.get("importers", set()):
+            if importer != source_abs:
+                sources_by_importer.setdefault(importer, set()).add(source_abs)
+
+    if not sources_by_importer:
         return changes
 
-    old_module = _path_to_py_module(source_abs, get_project_root())
-    new_module = _path_to_py_module(dest_abs, get_project_root())
-    if not old_module or not new_module:
-        return changes
+    matcher = _module_matcher(list(new_module_by_old))
 
-    importers = entry.get("importers", set())
+    def _rename(sources: set[str], match: re.Match[str]) -> str:
+        module = match.group(0)
+        if source_by_old[module] in sources:
+            return new_module_by_old[module]
+        return module
 
-    for importer in importers:
-        if importer == source_abs:
-            continue
+    resolved_relative: dict[tuple[Path, str, str], str | None] = {}
 
+    for importer, sources in sources_by_importer.items():
         try:
             content = Path(importer).read_text()
         except (OSError, UnicodeDecodeError) as exc:
@@ -132,6 +157,7 @@ def find_replacements(
             )
             continue
 
+        rename = functools.partial(_rename, sources)
         replacements = []
         importer_dir = Path(importer).parent
 
@@ -140,23 +166,28 @@ def find_replacements(
             if not (stripped.startswith("from ") or stripped.startswith("import ")):
                 continue
 
-            if _has_exact_module(stripped, old_module):
-                new_line = _replace_exact_module(stripped, old_module, new_module)
-                if new_line != stripped:
-                    replacements.append((stripped, new_line))
-                    continue
+            new_line = matcher.sub(rename, stripped)
+            if new_line != stripped:
+                replacements.append((stripped, new_line))
+                continue
 
-            m = re.match(r"from\s+(\.+)(\w*(?:\.\w+)*)\s+import", stripped)
-            if m:
-                dots = m.group(1)
-                remainder = m.group(2)
+            m = _RELATIVE_FROM_RE.match(stripped)
+            if not m:
+                continue
+            dots = m.group(1)
+            remainder = m.group(2)
+            key = (importer_dir, dots, remainder)
+            if key not in resolved_relative:
                 resolved = _resolve_py_relative(importer_dir, dots, remainder)
-                if resolved and str(Path(resolved).resolve()) == source_abs:
-                    new_rel = _compute_py_relative_import(importer, dest_abs)
-                    if new_rel:
-                        old_from = f"from {dots}{remainder}"
-                        new_from = f"from {new_rel}"
-                        replacements.append((old_from, new_from))
+                resolved_relative[key] = (
+                    str(Path(resolved).resolve()) if resolved else None
+                )
+            target = resolved_relative[key]
+            if target not in sources:
+                continue
+            new_rel = _compute_py_relative_import(importer, dest_by_source[target])
+            if new_rel:
+                replacements.append((f"from {dots}{remainder}", f"from {new_rel}"))
 
         if replacements:
             changes[importer] = _dedup(replacements)
@@ -164,6 +195,15 @@ def find_replacements(
     return changes
 
 
+def find_replacements(
+    source_abs: str,
+    dest_abs: str,
+    graph: dict,
+) -> dict[str, list[tuple[str, str]]]:
+    """Compute all import string replacements needed for a Python file move."""
+    return find_batch_replacements([(source_abs, dest_abs)], graph)
+
+
 def find_self_replacements(
     source_abs: str,
     dest_abs: str,
@@ -185,7 +225,7 @@ def find_self_replacements(
 
     for line in content.splitlines():
         stripped = line.strip()
-        m = re.match(r"from\s+(\.+)(\w*(?:\.\w+)*)\s+import", stripped)
+        m = _RELATIVE_FROM_RE.match(stripped)
         if not m:
             continue
 
@@ -97,3 +97,26 @@ def test_detect_with_bandit_uses_absolute_scan_path(monkeypatch):
     cmd = captured["cmd"]
     assert isinstance(cmd, list)
     assert Path(cmd[-1]).is_absolute()
+
+
+def test_detect_with_bandit_scans_explicit_targets(monkeypatch):
+    captured: dict[str, object] = {}
+
+    class _FakeCompleted:
+        stdout = '{"results": [], "metrics": {"/p/a.py": {}, "_totals": {}}}'
+
+    def _fake_run(cmd, **kwargs):
+        captured["cmd"] = cmd
+        return _FakeCompleted()
+
+    monkeypatch.setattr(adapter_mod.subprocess, "run", _fake_run)
+
+    result = adapter_mod.detect_with_bandit(
+        Path("/p"),
+        zone_map=None,
+        targets=["/p/a.py"],
+    )
+
+    assert result.files_scanned == 1
+    assert captured["cmd"][-1] == "/p/a.py"
+    assert "/p" not in captured["cmd"]
@@ -3,6 +3,9 @@
 import textwrap
 from pathlib import Path
 
+import desloppify.languages.python.detectors.deps as deps_mod
+from desloppify.base.discovery.source import clear_source_file_cache_for_tests
+from desloppify.engine.detectors.graph_snapshot import graph_snapshot_scope
 from desloppify.languages.python.detectors.deps import (
     build_dep_graph,
     find_python_dynamic_imports,
@@ -434,3 +437,49 @@ class TestDotsOnlyImport:
                 main_key = k
         assert main_key is not None
         assert graph[main_key]["import_count"] >= 1
+
+
+class TestGraphSnapshot:
+    @staticmethod
+    def _edges(graph: dict) -> dict:
+        return {
+            Path(k).name: sorted(Path(t).name for t in entry["imports"])
+            for k, entry in graph.items()
+        }
+
+    def test_unchanged_files_are_not_reparsed(self, tmp_path, monkeypatch):
+        pkg = _make_pkg(
+            tmp_path,
+            {
+                "__init__.py": "",
+                "shared.py": "VAL = 1\n",
+                "a.py": "from .shared import VAL\n",
+                "b.py": "from .shared import VAL\n",
+            },
+        )
+        parsed: list[str] = []
+        real_records = deps_mod._import_records
+
+        def counting_records(abs_path, filepath):
+            parsed.append(Path(filepath).name)
+            return real_records(abs_path, filepath)
+
+        monkeypatch.setattr(deps_mod, "_import_records", counting_records)
+        snapshot_dir = tmp_path / "snapshots"
+        with graph_snapshot_scope(snapshot_dir):
+            first = self._edges(build_dep_graph(pkg))
+            assert list(snapshot_dir.glob("python-*.json"))
+
+            parsed.clear()
+            assert self._edges(build_dep_graph(pkg)) == first
+            assert parsed == []
+
+            (pkg / "b.py").write_text("from .a import x\nfrom .shared import VAL\n")
+            (pkg / "c.py").write_text("from .b import y\n")
+            clear_source_file_cache_for_tests()
+            parsed.clear()
+            updated = build_dep_graph(pkg)
+
+        assert sorted(parsed) == ["b.py", "c.py"]
+        assert self._edges(updated) == self._edges(build_dep_graph(pkg))
+        assert self._edges(updated)["b.py"] == ["a.py", "shared.py"]
@@ -25,21 +25,26 @@ class TestMovePyHelpers:
         root = Path("/project")
         assert py_move._path_to_py_module("/other/foo.py", root) is None
 
-    def test_has_exact_module(self):
-        assert py_move._has_exact_module("from foo.bar import baz", "foo.bar")
-        assert not py_move._has_exact_module("from foo.bar.child import baz", "foo.bar")
-        assert py_move._has_exact_module("import foo.bar", "foo.bar")
-        assert not py_move._has_exact_module("import foo.barx", "foo.bar")
-
-    def test_replace_exact_module(self):
-        line = "from foo.bar import baz"
-        result = py_move._replace_exact_module(line, "foo.bar", "qux.quux")
+    def test_module_matcher_matches_exact_module(self):
+        matcher = py_move._module_matcher(["foo.bar"])
+        assert matcher.search("from foo.bar import baz")
+        assert not matcher.search("from foo.bar.child import baz")
+        assert matcher.search("import foo.bar")
+        assert not matcher.search("import foo.barx")
+
+    def test_module_matcher_replaces_exact_module(self):
+        matcher = py_move._module_matcher(["foo.bar"])
+        result = matcher.sub("qux.quux", "from foo.bar import baz")
         assert result == "from qux.quux import baz"
 
-    def test_replace_exact_module_no_child(self):
+    def test_module_matcher_replace_skips_child(self):
+        matcher = py_move._module_matcher(["foo.bar"])
         line = "from foo.bar.child import baz"
-        result = py_move._replace_exact_module(line, "foo.bar", "qux.quux")
-        assert result == "from foo.bar.child import baz"
+        assert matcher.sub("qux.quux", line) == line
+
+    def test_module_matcher_picks_nested_module_over_parent(self):
+        matcher = py_move._module_matcher(["foo", "foo.bar"])
+        assert matcher.search("import foo.bar").group(0) == "foo.bar"
 
     def test_compute_py_relative_import(self):
         result = py_move._compute_py_relative_import(
@@ -70,3 +75,71 @@ class TestMovePyHelpers:
     def test_resolve_py_relative_not_found(self, tmp_path):
         result = py_move._resolve_py_relative(tmp_path, ".", "nonexistent")
         assert result is None
+
+
+class TestBatchReplacements:
+    def _project(self, tmp_path: Path) -> tuple[Path, dict]:
+        pkg = tmp_path / "pkg"
+        (pkg / "sub").mkdir(parents=True)
+        (pkg / "__init__.py").write_text("")
+        (pkg / "a.py").write_text("A = 1\n")
+        (pkg / "b.py").write_text("B = 2\n")
+        (pkg / "sub" / "c.py").write_text("from ..a import A\n")
+        (tmp_path / "app.py").write_text(
+            "import pkg.a, pkg.b\nfrom pkg.a import A\nfrom pkg.abc import X\n"
+        )
+        (tmp_path / "sibling.py").write_text("from .pkg.b import B\n")
+        a, b = str((pkg / "a.py").resolve()), str((pkg / "b.py").resolve())
+        app = str((tmp_path / "app.py").resolve())
+        sibling = str((tmp_path / "sibling.py").resolve())
+        c = str((pkg / "sub" / "c.py").resolve())
+        graph = {
+            a: {"importers": {app, c}},
+            b: {"importers": {app, sibling}},
+        }
+        return tmp_path, graph
+
+    def test_each_importer_read_once_with_all_modules_rewritten(self, tmp_path, monkeypatch):
+        root, graph = self._project(tmp_path)
+        monkeypatch.setattr(py_move, "get_project_root", lambda: root)
+        reads: list[str] = []
+        real_read_text = Path.read_text
+
+        def _tracking_read_text(self, *args, **kwargs):
+            reads.append(str(self))
+            return real_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", _tracking_read_text)
+        moves = [
+            (str((root / "pkg" / name).resolve()), str((root / "lib" / name).resolve()))
+            for name in ("a.py", "b.py")
+        ]
+
+        changes = py_move.find_batch_replacements(moves, graph)
+
+        app = str((root / "app.py").resolve())
+        assert changes[app] == [
+            ("import pkg.a, pkg.b", "import lib.a, lib.b"),
+            ("from pkg.a import A", "from lib.a import A"),
+        ]
+        assert changes[str((root / "sibling.py").resolve())] == [
+            ("from .pkg.b import B", "from .lib.b import B")
+        ]
+        assert changes[str((root / "pkg" / "sub" / "c.py").resolve())] == [
+            ("from ..a", "from ...lib.a")
+        ]
+        assert sorted(reads) == sorted(changes)
+
+    def test_find_replacements_only_rewrites_the_moved_module(self, tmp_path, monkeypatch):
+        root, graph = self._project(tmp_path)
+        monkeypatch.setattr(py_move, "get_project_root", lambda: root)
+        source = str((root / "pkg" / "a.py").resolve())
+
+        changes = py_move.find_replacements(
+            source, str((root / "lib" / "a.py").resolve()), graph
+        )
+
+        assert changes[str((root / "app.py").resolve())] == [
+            ("import pkg.a, pkg.b", "import lib.a, pkg.b"),
+            ("from pkg.a import A", "from lib.a import A"),
+        ]
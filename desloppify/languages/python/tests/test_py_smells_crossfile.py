@@ -198,3 +198,17 @@ class TestOutputStructure:
         order = {"high": 0, "medium": 1, "low": 2}
         ranks = [order[s] for s in severities]
         assert ranks == sorted(ranks)
+
+    def test_ast_only_smell_ids_are_merged(self, tmp_path):
+        """Smells added by AST detectors but absent from the regex catalog merge."""
+        path = _write_py(
+            tmp_path,
+            """\
+            def f(a, b):
+                del b
+                return a
+        """,
+        )
+        entries, total = detect_smells(path)
+        assert total == 1
+        assert entries == []
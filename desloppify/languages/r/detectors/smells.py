@@ -6,7 +6,7 @@ import logging
 import re
 from pathlib import Path
 
-from desloppify.base.discovery.source import find_source_files
+from desloppify.base.discovery.source import find_source_files, read_source_text
 from .smells_catalog import R_SMELL_CHECKS, SEVERITY_ORDER
 
 logger = logging.getLogger(__name__)
@@ -336,7 +336,7 @@ def _find_r_files(path: Path) -> list[str]:
 def _read_file(filepath: str) -> str | None:
     """Read file content, returning None on error."""
     try:
-        return Path(filepath).read_text(encoding="utf-8")
+        return read_source_text(Path(filepath), encoding="utf-8")
     except (OSError, UnicodeDecodeError):
         return None
 
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any
 
 from desloppify.engine.detectors.graph import finalize_graph
+from desloppify.engine.detectors.graph_snapshot import cached_file_edges
 from desloppify.languages.rust.support import (
     build_production_file_index,
     build_workspace_package_index,
@@ -18,6 +19,33 @@ from desloppify.languages.rust.support import (
 )
 
 
+def _import_records(files: list[str]) -> dict[str, list[list[str | None]]]:
+    """Return ``["mod", name, path]`` / ``["use", spec]`` records per readable file."""
+    records: dict[str, list[list[str | None]]] = {}
+    for filepath in files:
+        content = read_text_or_none(filepath)
+        if content is None:
+            continue
+        records[filepath] = [
+            ["mod", module_name, declared_path]
+            for module_name, declared_path in iter_mod_targets(content)
+        ] + [["use", spec] for spec in iter_use_specs(content)]
+    return records
+
+
+def _manifest_context(package_index: dict[str, Path]) -> str:
+    """Crate names plus manifest signatures, which steer `use` resolution."""
+    entries = []
+    for name, manifest_dir in sorted(package_index.items()):
+        try:
+            stats = (manifest_dir / "Cargo.toml").stat()
+            signature = f"{stats.st_size}:{stats.st_mtime_ns}"
+        except OSError:
+            signature = ""
+        entries.append(f"{name}={manifest_dir}:{signature}")
+    return "\n".join(entries)
+
+
 def build_dep_graph(
     path: Path,
     roslyn_cmd: str | None = None,
@@ -34,36 +62,45 @@ def build_dep_graph(
     file_set = set(graph.keys())
     production_index = build_production_file_index(file_set)
     package_index = build_workspace_package_index()
-    for filepath in files:
-        content = read_text_or_none(filepath)
-        if content is None:
-            continue
 
-        if include_mod_declarations:
-            for module_name, declared_path in iter_mod_targets(content):
+    def resolve(filepath: str, records: list[list[str | None]]) -> list[tuple[str, str]]:
+        edges: list[tuple[str, str]] = []
+        for record in records:
+            if record[0] == "mod":
+                if not include_mod_declarations:
+                    continue
                 resolved = resolve_mod_declaration(
-                    module_name,
+                    record[1],
                     filepath,
                     file_set,
-                    declared_path=declared_path,
+                    declared_path=record[2],
+                    production_index=production_index,
+                )
+            else:
+                resolved = resolve_use_spec(
+                    record[1],
+                    filepath,
+                    file_set,
+                    package_index,
+                    allow_crate_root_fallback=False,
                     production_index=production_index,
                 )
-                if resolved and resolved != filepath:
-                    graph[filepath]["imports"].add(resolved)
-                    graph[resolved]["importers"].add(filepath)
-
-        for spec in iter_use_specs(content):
-            resolved = resolve_use_spec(
-                spec,
-                filepath,
-                file_set,
-                package_index,
-                allow_crate_root_fallback=False,
-                production_index=production_index,
-            )
             if resolved and resolved != filepath:
-                graph[filepath]["imports"].add(resolved)
-                graph[resolved]["importers"].add(filepath)
+                edges.append(("import", resolved))
+        return edges
+
+    file_edges = cached_file_edges(
+        "rust" if include_mod_declarations else "rust-use",
+        path,
+        files,
+        extract=_import_records,
+        resolve=resolve,
+        context=_manifest_context(package_index),
+    )
+    for filepath, edges in file_edges.items():
+        for _kind, resolved in edges or ():
+            graph[filepath]["imports"].add(resolved)
+            graph[resolved]["importers"].add(filepath)
 
     return finalize_graph(graph)
 
@@ -11,7 +11,11 @@ from typing import Any
 
 from desloppify.base.discovery.file_paths import rel, resolve_path
 from desloppify.base.discovery.paths import get_project_root
-from desloppify.base.discovery.source import SourceDiscoveryOptions, find_source_files
+from desloppify.base.discovery.source import (
+    SourceDiscoveryOptions,
+    find_source_files,
+    read_source_text,
+)
 RUST_FILE_EXCLUSIONS = ["target", ".git", "node_modules", "vendor"]
 USE_STATEMENT_RE = re.compile(r"(?m)^\s*(?:pub(?:\([^)]*\))?\s+)?use\s+([^;]+);")
 PUB_USE_STATEMENT_RE = re.compile(r"(?m)^\s*pub(?:\([^)]*\))?\s+use\s+([^;]+);")
@@ -95,7 +99,7 @@ def build_production_file_index(
 def read_text_or_none(path: Path | str, *, errors: str = "replace") -> str | None:
     """Read a file as text, returning ``None`` when the file is unavailable."""
     try:
-        return Path(resolve_path(str(path))).read_text(errors=errors)
+        return read_source_text(Path(resolve_path(str(path))), errors=errors)
     except OSError:
         return None
 
@@ -761,7 +765,7 @@ def resolve_barrel_targets(
 ) -> set[str]:
     """Resolve `pub use` / `pub mod` targets from a Rust facade file."""
     try:
-        content = Path(resolve_path(str(filepath))).read_text(errors="replace")
+        content = read_source_text(Path(resolve_path(str(filepath))), errors="replace")
     except OSError:
         return set()
 
@@ -10,6 +10,8 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+from desloppify.base.discovery.source import read_source_text
+from desloppify.base.profiling import profile_span
 from desloppify.languages._framework.generic_parts.tool_runner import (
     SubprocessRun,
     ToolRunResult,
@@ -166,7 +168,7 @@ def _resolve_rust_source_file(scan_path: Path, filename: str) -> Path | None:
 
 def _read_source_text(path: Path) -> str | None:
     try:
-        return path.read_text(errors="replace")
+        return read_source_text(path, errors="replace")
     except OSError:
         return None
 
@@ -626,14 +628,15 @@ def _run_cargo_metadata(
     runner: Callable[..., subprocess.CompletedProcess[str]] = run_subprocess or subprocess.run
     workspace_root = find_workspace_root(scan_path)
     try:
-        result = runner(
-            resolve_command_argv(_CARGO_METADATA_CMD),
-            shell=False,
-            cwd=str(workspace_root),
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
+        with profile_span("cargo metadata", category="tool"):
+            result = runner(
+                resolve_command_argv(_CARGO_METADATA_CMD),
+                shell=False,
+                cwd=str(workspace_root),
+                capture_output=True,
+                text=True,
+                timeout=120,
+            )
     except FileNotFoundError as exc:
         return (
             ToolRunResult(
@@ -10,7 +10,7 @@ from typing import Any
 
 from desloppify.base.discovery.file_paths import rel
 
-from desloppify.base.discovery.source import find_tsx_files
+from desloppify.base.discovery.source import find_tsx_files, read_source_text
 from desloppify.base.output.fallbacks import log_best_effort_failure
 from desloppify.base.output.terminal import colorize, print_table
 from desloppify.base.discovery.paths import get_project_root
@@ -35,7 +35,7 @@ def detect_mixed_concerns(path: Path) -> tuple[list[dict[str, Any]], int]:
                 if Path(filepath).is_absolute()
                 else get_project_root() / filepath
             )
-            content = p.read_text()
+            content = read_source_text(p)
             loc = len(content.splitlines())
             if loc < 100:
                 continue
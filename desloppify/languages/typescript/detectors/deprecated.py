@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from desloppify.base.discovery.file_paths import rel, resolve_path
-from desloppify.base.discovery.source import find_ts_and_tsx_files
+from desloppify.base.discovery.source import find_ts_and_tsx_files, read_source_text
 from desloppify.base.output.terminal import colorize, print_table
 from desloppify.base.output.fallbacks import log_best_effort_failure
 from desloppify.base.search.grep import grep_count_files, grep_files
@@ -82,7 +82,7 @@ def _extract_deprecated_symbol(
     """Extract the deprecated symbol name and its deprecation kind."""
     try:
         p = _resolve_source_file(filepath, scan_root=scan_root)
-        lines = p.read_text().splitlines()
+        lines = read_source_text(p).splitlines()
         content_stripped = content.strip()
 
         if "/**" in content_stripped and "*/" in content_stripped:
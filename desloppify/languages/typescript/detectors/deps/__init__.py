@@ -21,6 +21,7 @@ from desloppify.engine.detectors.graph import (
     finalize_graph,
     get_coupling_score,
 )
+from desloppify.engine.detectors.graph_snapshot import cached_file_edges
 from desloppify.languages.typescript.detectors.deps.resolve import (
     find_tsconfig_root as _find_tsconfig_root,
 )
@@ -49,12 +50,24 @@ def _extract_module_specifiers(line: str) -> list[str]:
     return [match.group(1) for match in _IMPORT_SPEC_RE.finditer(line)]
 
 
+def _module_specifier_records(files: list[str]) -> dict[str, list[str]]:
+    """Return the import/export specifiers of each file that has any."""
+    records: dict[str, list[str]] = {}
+    hits = grep_files(r"""(?:\bfrom\s+['"]|\bimport\s+['"])""", files)
+    for filepath, _lineno, content in hits:
+        records.setdefault(filepath, []).extend(_extract_module_specifiers(content))
+    return records
+
+
 def build_dep_graph(
     path: Path,
     roslyn_cmd: str | None = None,
 ) -> dict[str, dict[str, Any]]:
     """Build a dependency graph: for each file, who it imports and who imports it.
 
+    Specifiers and their resolved edges go through the import-graph snapshot,
+    so unchanged files are not re-read.
+
     Returns {resolved_path: {"imports": set[str], "importers": set[str], "import_count": int, "importer_count": int}}
     """
     del roslyn_cmd
@@ -65,43 +78,48 @@ def build_dep_graph(
     tsconfig_root = _find_tsconfig_root(path, project_root)
     tsconfig_paths = _load_tsconfig_paths(tsconfig_root)
 
-    ts_files = find_ts_and_tsx_files(path)
-    hits = grep_files(r"""(?:\bfrom\s+['"]|\bimport\s+['"])""", ts_files)
-
-    for filepath, _lineno, content in hits:
-        source_resolved = resolve_path(filepath)
-        graph[source_resolved]  # ensure entry exists
-        for module_path in _extract_module_specifiers(content):
+    def resolve(filepath: str, specifiers: list[str]) -> list[tuple[str, str]]:
+        edges: list[tuple[str, str]] = []
+        for module_path in specifiers:
             if module_path.startswith(_DENO_EXTERNAL_PREFIXES):
-                graph[source_resolved]["external_imports"].add(module_path)
+                edges.append(("external", module_path))
                 continue
+            scratch: dict[str, dict[str, Any]] = defaultdict(
+                lambda: {"imports": set(), "importers": set()}
+            )
             _resolve_module(
                 module_path,
                 filepath,
                 tsconfig_paths,
                 tsconfig_root,
-                graph,
-                source_resolved,
+                scratch,
+                filepath,
             )
+            edges.extend(("import", target) for target in scratch[filepath]["imports"])
+        return edges
 
-    fw_files = find_source_files(path, list(_FRAMEWORK_EXTENSIONS))
-    if fw_files:
-        fw_hits = grep_files(r"""(?:\bfrom\s+['"]|\bimport\s+['"])""", fw_files)
-        for filepath, _lineno, content in fw_hits:
-            source_resolved = resolve_path(filepath)
-            graph[source_resolved]  # ensure entry exists
-            for module_path in _extract_module_specifiers(content):
-                if module_path.startswith(_DENO_EXTERNAL_PREFIXES):
-                    graph[source_resolved]["external_imports"].add(module_path)
-                    continue
-                _resolve_module(
-                    module_path,
-                    filepath,
-                    tsconfig_paths,
-                    tsconfig_root,
-                    graph,
-                    source_resolved,
-                )
+    source_files = find_ts_and_tsx_files(path) + find_source_files(
+        path, list(_FRAMEWORK_EXTENSIONS)
+    )
+    file_edges = cached_file_edges(
+        "typescript",
+        path,
+        source_files,
+        extract=_module_specifier_records,
+        resolve=resolve,
+        context=json.dumps([str(tsconfig_root), sorted(tsconfig_paths.items())]),
+    )
+    for filepath, edges in file_edges.items():
+        if edges is None:
+            continue
+        source_resolved = resolve_path(filepath)
+        graph[source_resolved]  # ensure entry exists
+        for kind, target in edges:
+            if kind == "external":
+                graph[source_resolved]["external_imports"].add(target)
+                continue
+            graph[source_resolved]["imports"].add(target)
+            graph[target]["importers"].add(source_resolved)
 
     return finalize_graph(dict(graph))
 
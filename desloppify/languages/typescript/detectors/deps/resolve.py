@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 from collections.abc import Iterator
 
+from desloppify.base.discovery.path_index import memoized_resolution, path_is_file
 from desloppify.base.output.fallbacks import log_best_effort_failure
 
 _RESOLVE_EXTENSIONS = ("", ".ts", ".tsx", "/index.ts", "/index.tsx")
@@ -173,23 +174,39 @@ def resolve_module(
     source_resolved: str,
 ) -> None:
     """Resolve an import specifier and add edges to the graph."""
-    target: Path | None = None
     if module_path.startswith("."):
         source_dir = (
             Path(filepath).parent
             if Path(filepath).is_absolute()
             else (project_root / filepath).parent
         )
-        target = (source_dir / module_path).resolve()
+        target_resolved = memoized_resolution(
+            ("typescript", str(source_dir), module_path),
+            lambda: _resolve_target((source_dir / module_path).resolve()),
+        )
     else:
-        target = resolve_alias(module_path, tsconfig_paths, project_root)
+        target_resolved = memoized_resolution(
+            (
+                "typescript-alias",
+                str(project_root),
+                frozenset(tsconfig_paths.items()),
+                module_path,
+            ),
+            lambda: _resolve_target(
+                resolve_alias(module_path, tsconfig_paths, project_root)
+            ),
+        )
+
+    if target_resolved is not None:
+        graph[source_resolved]["imports"].add(target_resolved)
+        graph[target_resolved]["importers"].add(source_resolved)
 
-    if target is None:
-        return
 
+def _resolve_target(target: Path | None) -> str | None:
+    """Return the first existing candidate file for *target*."""
+    if target is None:
+        return None
     for candidate in iter_resolve_candidates(target):
-        if candidate.is_file():
-            target_resolved = str(candidate)
-            graph[source_resolved]["imports"].add(target_resolved)
-            graph[target_resolved]["importers"].add(source_resolved)
-            break
+        if path_is_file(candidate):
+            return str(candidate)
+    return None
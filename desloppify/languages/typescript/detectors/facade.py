@@ -5,13 +5,14 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
+from desloppify.base.discovery.source import read_source_text
 from desloppify.languages._framework.facade_common import detect_reexport_facades_common
 
 
 def is_ts_facade(filepath: str) -> dict | None:
     """Check if a TypeScript file is a pure re-export facade."""
     try:
-        content = Path(filepath).read_text()
+        content = read_source_text(Path(filepath))
         lines = content.splitlines()
     except (OSError, UnicodeDecodeError):
         return None
@@ -19,6 +19,7 @@ import subprocess  # nosec B404
 from pathlib import Path
 
 from desloppify.base.discovery.file_paths import rel
+from desloppify.base.profiling import profile_span
 
 logger = logging.getLogger(__name__)
 
@@ -35,21 +36,22 @@ def _run_knip(path: Path, timeout: int = 120) -> dict | None:
         logger.debug("knip: not installed in node_modules, skipping")
         return None
     try:
-        result = subprocess.run(
-            [
-                npx_path,
-                "--yes",
-                "knip",
-                "--reporter",
-                "json",
-                "--no-gitignore",
-            ],
-            capture_output=True,
-            text=True,
-            stdin=subprocess.DEVNULL,
-            cwd=str(path),
-            timeout=timeout,
-        )  # nosec B603
+        with profile_span("knip", category="tool"):
+            result = subprocess.run(
+                [
+                    npx_path,
+                    "--yes",
+                    "knip",
+                    "--reporter",
+                    "json",
+                    "--no-gitignore",
+                ],
+                capture_output=True,
+                text=True,
+                stdin=subprocess.DEVNULL,
+                cwd=str(path),
+                timeout=timeout,
+            )  # nosec B603
     except FileNotFoundError:
         logger.debug("knip: npx not found")
         return None
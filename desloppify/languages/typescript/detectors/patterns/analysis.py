@@ -9,7 +9,7 @@ from pathlib import Path
 
 from desloppify.base.discovery.file_paths import rel, resolve_path
 from desloppify.base.discovery.paths import get_area
-from desloppify.base.discovery.source import find_ts_and_tsx_files
+from desloppify.base.discovery.source import find_ts_and_tsx_files, read_source_text
 from desloppify.base.output.fallbacks import log_best_effort_failure
 from desloppify.languages.typescript.detectors.contracts import DetectorResult
 from .catalog import PATTERN_FAMILIES
@@ -39,7 +39,7 @@ def _build_census(
         try:
             area = get_area(filepath)
             p = Path(filepath) if Path(filepath).is_absolute() else Path(resolve_path(filepath))
-            content = p.read_text()
+            content = read_source_text(p)
         except (OSError, UnicodeDecodeError) as exc:
             log_best_effort_failure(logger, f"read TypeScript pattern candidate {filepath}", exc)
             continue
@@ -8,7 +8,7 @@ from pathlib import Path
 
 from desloppify.base.discovery.file_paths import rel
 
-from desloppify.base.discovery.source import find_ts_and_tsx_files
+from desloppify.base.discovery.source import find_ts_and_tsx_files, read_source_text
 from desloppify.base.output.fallbacks import log_best_effort_failure
 from desloppify.base.output.terminal import colorize, print_table
 from desloppify.base.discovery.paths import get_project_root
@@ -39,7 +39,7 @@ def detect_prop_interface_bloat(
                 if Path(filepath).is_absolute()
                 else get_project_root() / filepath
             )
-            content = p.read_text()
+            content = read_source_text(p)
             for m in interface_re.finditer(content):
                 total_interfaces += 1
                 name = m.group(1)
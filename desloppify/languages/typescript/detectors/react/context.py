@@ -7,7 +7,7 @@ import re
 from pathlib import Path
 
 from desloppify.base.discovery.paths import get_project_root
-from desloppify.base.discovery.source import find_tsx_files
+from desloppify.base.discovery.source import find_tsx_files, read_source_text
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +23,7 @@ def detect_context_nesting(path: Path) -> tuple[list[dict], int]:
         total_files += 1
         try:
             p = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = p.read_text()
+            content = read_source_text(p)
             lines = content.splitlines()
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug(
@@ -7,7 +7,7 @@ import re
 from pathlib import Path
 
 from desloppify.base.discovery.paths import get_project_root
-from desloppify.base.discovery.source import find_tsx_files
+from desloppify.base.discovery.source import find_tsx_files, read_source_text
 from desloppify.languages.typescript.detectors.smells.helpers import scan_code
 
 MAX_FUNC_SCAN = 2000
@@ -23,7 +23,7 @@ def detect_hook_return_bloat(path: Path) -> tuple[list[dict], int]:
     for filepath in find_tsx_files(path):
         try:
             p = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = p.read_text()
+            content = read_source_text(p)
             lines = content.splitlines()
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable TSX file %s in hook-bloat pass: %s", filepath, exc)
@@ -154,7 +154,7 @@ def detect_boolean_state_explosion(path: Path) -> tuple[list[dict], int]:
     for filepath in find_tsx_files(path):
         try:
             p = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = p.read_text()
+            content = read_source_text(p)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug(
                 "Skipping unreadable TSX file %s in boolean-state pass: %s",
@@ -7,7 +7,7 @@ import re
 from pathlib import Path
 
 from desloppify.base.discovery.paths import get_project_root
-from desloppify.base.discovery.source import find_tsx_files
+from desloppify.base.discovery.source import find_tsx_files, read_source_text
 from desloppify.languages.typescript.detectors.smells.helpers import (
     _strip_ts_comments,
     scan_code,
@@ -25,7 +25,7 @@ def detect_state_sync(path: Path) -> tuple[list[dict], int]:
     for filepath in find_tsx_files(path):
         try:
             p = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = p.read_text()
+            content = read_source_text(p)
             lines = content.splitlines()
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping unreadable TSX file %s in state-sync pass: %s", filepath, exc)
@@ -6,7 +6,9 @@ import logging
 import re
 from pathlib import Path
 
+from desloppify.base.discovery.source import read_source_text
 from desloppify.base.output.fallbacks import log_best_effort_failure
+from desloppify.engine.detectors.patterns.multi import MultiPatternScanner
 from .detector_flow import (
     _detect_async_no_await,
     _detect_empty_if_chains,
@@ -42,6 +44,13 @@ from desloppify.languages.typescript.detectors.io import (
 
 logger = logging.getLogger(__name__)
 
+# One combined pass per line over every pattern-based catalog entry.
+_LINE_SCANNER = MultiPatternScanner(
+    (check["id"], check["pattern"])
+    for check in TS_SMELL_CHECKS
+    if check["pattern"] is not None
+)
+
 _MULTI_LINE_DETECTORS = (
     _detect_async_no_await,
     _detect_catch_return_default,
@@ -67,7 +76,7 @@ def detect_smells(path: Path) -> tuple[list[dict], int]:
     for filepath in files:
         try:
             p = resolve_typescript_source(filepath)
-            content = p.read_text()
+            content = read_source_text(p)
             lines = content.splitlines()
         except (OSError, UnicodeDecodeError) as exc:
             log_best_effort_failure(logger, f"read TypeScript smell candidate {filepath}", exc)
@@ -76,29 +85,22 @@ def detect_smells(path: Path) -> tuple[list[dict], int]:
         line_state = _build_ts_line_state(lines)
         ctx = _FileContext(filepath, content, lines, line_state)
 
-        for check in checks:
-            if check["pattern"] is None:
+        for i, smell_id, m in _LINE_SCANNER.scan_lines(lines, skip=line_state):
+            line = lines[i]
+            if _ts_match_is_in_string(line, m.start()):
+                continue
+            if smell_id == "hardcoded_url" and re.match(
+                r"^(?:export\s+)?(?:const|let|var)\s+[A-Z_][A-Z0-9_]*\s*=",
+                line.strip(),
+            ):
                 continue
-            for i, line in enumerate(lines):
-                if i in line_state:
-                    continue
-                m = re.search(check["pattern"], line)
-                if not m:
-                    continue
-                if _ts_match_is_in_string(line, m.start()):
-                    continue
-                if check["id"] == "hardcoded_url" and re.match(
-                    r"^(?:export\s+)?(?:const|let|var)\s+[A-Z_][A-Z0-9_]*\s*=",
-                    line.strip(),
-                ):
-                    continue
-                smell_counts[check["id"]].append(
-                    {
-                        "file": filepath,
-                        "line": i + 1,
-                        "content": line.strip()[:100],
-                    }
-                )
+            smell_counts[smell_id].append(
+                {
+                    "file": filepath,
+                    "line": i + 1,
+                    "content": line.strip()[:100],
+                }
+            )
 
         for detector in _MULTI_LINE_DETECTORS:
             detector(ctx, smell_counts)
@@ -8,7 +8,7 @@ import re
 from pathlib import Path
 
 from desloppify.base.discovery.paths import get_project_root
-from desloppify.base.discovery.source import find_source_files
+from desloppify.base.discovery.source import find_source_files, read_source_text
 from desloppify.base.output.fallbacks import log_best_effort_failure
 
 logger = logging.getLogger(__name__)
@@ -36,7 +36,7 @@ def detect_non_ts_asset_smells(path: Path, smell_counts: dict[str, list[dict]])
     for filepath in css_files:
         try:
             full = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-            content = full.read_text()
+            content = read_source_text(full)
             lines = content.splitlines()
         except (OSError, UnicodeDecodeError) as exc:
             log_best_effort_failure(logger, f"read stylesheet smell candidate {filepath}", exc)
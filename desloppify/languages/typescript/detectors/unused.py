@@ -17,7 +17,7 @@ from pathlib import Path
 
 from desloppify.base.discovery.file_paths import rel, resolve_path, safe_write_text
 from desloppify.base.discovery.paths import get_project_root
-from desloppify.base.discovery.source import find_ts_and_tsx_files
+from desloppify.base.discovery.source import find_ts_and_tsx_files, read_source_text
 from desloppify.base.output.terminal import colorize, print_table
 from desloppify.languages.typescript.detectors.unused_fallback import (
     _contains_deno_markers,
@@ -147,7 +147,7 @@ def detect_unused(path: Path, category: str = "all") -> tuple[list[dict], int]:
 def _categorize_unused(filepath: str, lineno: int) -> str:
     try:
         p = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
-        lines = p.read_text().splitlines()
+        lines = read_source_text(p).splitlines()
         if lineno <= len(lines):
             src_line = lines[lineno - 1].strip()
             if src_line.startswith("import ") or "from '" in src_line or 'from "' in src_line:
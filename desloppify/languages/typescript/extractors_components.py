@@ -6,7 +6,7 @@ import logging
 import re
 from pathlib import Path
 
-from desloppify.base.discovery.source import find_tsx_files
+from desloppify.base.discovery.source import find_tsx_files, read_source_text
 from desloppify.base.discovery.paths import get_project_root
 from desloppify.engine.detectors.base import ClassInfo
 from desloppify.engine.detectors.passthrough import (
@@ -40,7 +40,7 @@ def extract_ts_components(path: Path) -> list[ClassInfo]:
                 if Path(filepath).is_absolute()
                 else get_project_root() / filepath
             )
-            content = p.read_text()
+            content = read_source_text(p)
             lines = content.splitlines()
             loc = len(lines)
             if loc < 100:
@@ -125,7 +125,7 @@ def detect_passthrough_components(path: Path) -> list[dict]:
                 if Path(filepath).is_absolute()
                 else get_project_root() / filepath
             )
-            content = p.read_text()
+            content = read_source_text(p)
         except (OSError, UnicodeDecodeError) as exc:
             logger.debug(
                 "Skipping unreadable TSX file %s in passthrough detection: %s",
@@ -8,6 +8,7 @@ import re
 from pathlib import Path
 
 from desloppify.base.discovery.paths import get_project_root
+from desloppify.base.discovery.source import read_source_text
 from desloppify.engine.detectors.base import FunctionInfo
 
 logger = logging.getLogger(__name__)
@@ -130,7 +131,7 @@ def extract_ts_functions(filepath: str) -> list[FunctionInfo]:
     """Extract function/component bodies from a TS/TSX file."""
     p = Path(filepath) if Path(filepath).is_absolute() else get_project_root() / filepath
     try:
-        content = p.read_text()
+        content = read_source_text(p)
     except (OSError, UnicodeDecodeError) as exc:
         logger.debug("Skipping unreadable TS file %s in function extraction: %s", filepath, exc)
         return []
@@ -7,6 +7,7 @@ import os
 import re
 from pathlib import Path
 
+from desloppify.base.discovery.source import read_source_text
 from desloppify.base.output.fallbacks import log_best_effort_failure
 from desloppify.base.discovery.paths import get_project_root, get_src_path
 from desloppify.base.text_utils import strip_c_style_comments
@@ -197,7 +198,7 @@ def parse_test_import_specs(content: str) -> list[str]:
 def resolve_barrel_reexports(filepath: str, production_files: set[str]) -> set[str]:
     """Resolve one-hop TypeScript barrel re-exports to concrete production files."""
     try:
-        content = Path(filepath).read_text()
+        content = read_source_text(Path(filepath))
     except (OSError, UnicodeDecodeError) as exc:
         log_best_effort_failure(logger, f"read barrel re-export source {filepath}", exc)
         return set()
@@ -544,6 +544,17 @@ class TestCollectCodebaseMetrics:
         assert result["total_files"] == 1
         assert result["total_loc"] == 2
 
+    def test_counts_lines_like_splitlines(self, tmp_path):
+        file_path = tmp_path / "a.py"
+        file_path.write_bytes(b"a\rb\x0cc")
+
+        class FakeLang:
+            file_finder = None
+
+        result = collect_codebase_metrics(FakeLang(), tmp_path, files=[str(file_path)])
+        assert result is not None
+        assert result["total_loc"] == 3
+
 
 # ---------------------------------------------------------------------------
 # warn_explicit_lang_with_no_files
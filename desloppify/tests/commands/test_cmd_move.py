@@ -6,6 +6,7 @@ from types import SimpleNamespace
 import pytest
 
 import desloppify.app.commands.move.cmd as move_mod
+from desloppify.app.commands.move.apply import apply_directory_move
 from desloppify.app.commands.move.cmd import _cmd_move_dir
 from desloppify.app.commands.move.language import (
     detect_lang_from_dir,
@@ -14,7 +15,11 @@ from desloppify.app.commands.move.language import (
     resolve_lang_for_file_move,
     resolve_move_verify_hint,
 )
-from desloppify.app.commands.move.planning import dedup_replacements, resolve_dest
+from desloppify.app.commands.move.planning import (
+    build_directory_move_plan,
+    dedup_replacements,
+    resolve_dest,
+)
 from desloppify.base.exception_sets import CommandError
 from desloppify.base.discovery.file_paths import resolve_path
 from desloppify.base.discovery.file_paths import safe_write_text as safe_write
@@ -344,3 +349,74 @@ class TestSafeWrite:
         target = tmp_path / "path_obj.txt"
         safe_write(target, "content")
         assert target.read_text() == "content"
+
+
+class TestDirectoryMoveBatching:
+    """Directory moves plan importer rewrites in one batch and apply atomically."""
+
+    def test_plan_uses_batch_hook_once(self, tmp_path):
+        source_dir = tmp_path / "pkg"
+        source_dir.mkdir()
+        files = [str(source_dir / name) for name in ("a.py", "b.py")]
+        external = str(tmp_path / "app.py")
+        calls: list[list[tuple[str, str]]] = []
+
+        class BatchMoveMod:
+            @staticmethod
+            def find_batch_replacements(file_moves, _graph):
+                calls.append(list(file_moves))
+                return {
+                    external: [("import pkg.a", "import lib.a")],
+                    files[1]: [
+                        ("from .a import A", "from .a import A"),
+                        ("import pkg.a", "import lib.a"),
+                    ],
+                }
+
+            @staticmethod
+            def find_replacements(_source, _dest, _graph):
+                raise AssertionError("per-file importer scan should not run")
+
+            @staticmethod
+            def find_self_replacements(_source, _dest, _graph):
+                return []
+
+            @staticmethod
+            def filter_intra_package_importer_changes(_source, replacements, _moving):
+                return [pair for pair in replacements if not pair[0].startswith("from .")]
+
+        plan = build_directory_move_plan(
+            source_abs=str(source_dir),
+            source_path=source_dir,
+            dest_abs=str(tmp_path / "lib"),
+            source_files=files,
+            move_mod=BatchMoveMod(),
+            graph={},
+        )
+
+        assert len(calls) == 1
+        assert plan.external_changes == {external: [("import pkg.a", "import lib.a")]}
+        assert plan.intra_package_changes == {files[1]: [("import pkg.a", "import lib.a")]}
+
+    def test_unreadable_importer_aborts_before_moving(self, tmp_path):
+        source_dir = tmp_path / "pkg"
+        source_dir.mkdir()
+        (source_dir / "a.py").write_text("A = 1\n")
+        importer = tmp_path / "app.py"
+        importer.write_text("import pkg.a\n")
+        dest_dir = tmp_path / "lib"
+
+        with pytest.raises(OSError):
+            apply_directory_move(
+                source_abs=str(source_dir),
+                dest_abs=str(dest_dir),
+                source_path=source_dir,
+                external_changes={
+                    str(importer): [("import pkg.a", "import lib.a")],
+                    str(tmp_path / "missing.py"): [("import pkg.a", "import lib.a")],
+                },
+                internal_changes={},
+            )
+
+        assert source_dir.is_dir() and not dest_dir.exists()
+        assert importer.read_text() == "import pkg.a\n"
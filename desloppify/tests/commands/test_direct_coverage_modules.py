@@ -202,7 +202,7 @@ def test_work_queue_split_modules_have_direct_behavior(monkeypatch):
     items = [{"id": "issue::1", "kind": "issue"}]
     monkeypatch.setattr(
         work_queue_finalize_mod,
-        "enrich_with_impact",
+        "stamp_impact",
         lambda *_a, **_k: None,
     )
     monkeypatch.setattr(
@@ -9,6 +9,7 @@ import pytest
 
 import desloppify.app.commands.next.queue_flow as queue_flow_mod
 from desloppify.engine._plan.schema import empty_plan
+from desloppify.engine.planning.queue_policy import build_execution_queue
 
 
 def _args(**overrides):
@@ -194,6 +195,93 @@ def test_build_and_render_execution_queue_renders_real_issue_and_payload(capsys)
     assert written[0]["items"][0]["file"] == "a.py"
 
 
+@pytest.mark.parametrize(
+    ("plan", "expected_count"),
+    [
+        ({}, 3),
+        ({"queue_order": ["x"]}, 3),
+        ({"clusters": {"auto/smells": {"issue_ids": ["x", "y"]}}}, None),
+    ],
+)
+def test_execution_queue_builds_only_the_window_when_clusters_cannot_reorder(
+    plan, expected_count, capsys
+) -> None:
+    requested: list[int | None] = []
+
+    def _build_queue(_state, *, options):
+        requested.append(options.count)
+        return {"items": [], "total": 0}
+
+    queue_flow_mod.build_and_render_execution_queue(
+        _args(count=3),
+        state={
+            "issues": {},
+            "dimension_scores": {},
+            "scan_path": ".",
+            "potentials": {},
+            "scan_count": 0,
+        },
+        config={},
+        deps=queue_flow_mod.QueueRenderDeps(
+            resolve_lang_fn=lambda _args: SimpleNamespace(name="python"),
+            load_plan_fn=lambda: plan,
+            build_work_queue_fn=_build_queue,
+            write_query_fn=lambda _payload: None,
+        ),
+    )
+    capsys.readouterr()
+
+    assert requested == [expected_count]
+
+
+def test_clustered_execution_queue_stamps_commands_on_visible_window_only(capsys) -> None:
+    ids = [f"unused::src/m{i}.py::n{i}" for i in range(5)]
+    issues = {issue_id: _issue(issue_id, detector="unused") for issue_id in ids}
+    plan = empty_plan()
+    plan["queue_order"] = ids
+    plan["clusters"] = {
+        "auto/unused": {"name": "auto/unused", "auto": True, "issue_ids": ids[:3]}
+    }
+    built: list[list[dict]] = []
+    written: list[dict] = []
+
+    def _build_queue(state, *, options):
+        assert options.count is None and options.defer_primary_commands
+        queue = build_execution_queue(state, options=options)
+        built.append(list(queue["items"]))
+        return queue
+
+    queue_flow_mod.build_and_render_execution_queue(
+        _args(count=2),
+        state={
+            "issues": issues,
+            "dimension_scores": {},
+            "scan_path": ".",
+            "potentials": {},
+            "scan_count": 1,
+        },
+        config={},
+        deps=queue_flow_mod.QueueRenderDeps(
+            resolve_lang_fn=lambda _args: SimpleNamespace(name="python"),
+            load_plan_fn=lambda: plan,
+            build_work_queue_fn=_build_queue,
+            write_query_fn=lambda payload: written.append(payload),
+        ),
+    )
+    capsys.readouterr()
+
+    cluster, single = written[0]["items"]
+    assert cluster["kind"] == "cluster"
+    assert all(
+        member["primary_command"].startswith("desloppify plan resolve")
+        for member in cluster["members"]
+    )
+    assert single["id"] == ids[3]
+    assert single["primary_command"].startswith("desloppify plan resolve")
+    (hidden,) = [item for item in built[0] if item["id"] == ids[4]]
+    assert "primary_command" not in hidden
+
+
 def test_build_and_render_execution_queue_uses_real_execution_policy(capsys) -> None:
     written: list[dict] = []
     planned = _issue(
@@ -0,0 +1,82 @@
+"""Tests for the process-parallel per-file map."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from desloppify.base import parallel
+from desloppify.base.parallel import (
+    MIN_PARALLEL_FILES,
+    map_files,
+    parallel_map_scope,
+    per_file_task,
+    register_before_fork,
+)
+from desloppify.base.runtime_state import make_runtime_context, runtime_scope
+
+needs_fork = pytest.mark.skipif(
+    parallel._fork_context() is None, reason="fork start method unavailable"
+)
+
+
+@per_file_task
+def _tagged(filepath: str, *, suffix: str) -> tuple[str, int]:
+    return filepath + suffix, os.getpid()
+
+
+def _untagged(filepath: str, *, suffix: str) -> tuple[str, int]:
+    return filepath + suffix, os.getpid()
+
+
+@per_file_task
+def _fail_on(filepath: str, *, bad: str) -> str:
+    if filepath == bad:
+        raise ValueError(filepath)
+    return filepath
+
+
+FILES = [f"src/mod_{index}.py" for index in range(MIN_PARALLEL_FILES * 2)]
+
+
+def test_map_is_serial_unless_enabled():
+    with runtime_scope(make_runtime_context()):
+        results = map_files(_tagged, FILES, suffix="!")
+    assert [name for name, _pid in results] == [f + "!" for f in FILES]
+    assert {pid for _name, pid in results} == {os.getpid()}
+
+
+@needs_fork
+def test_declared_tasks_fan_out_in_input_order():
+    with runtime_scope(make_runtime_context()), parallel_map_scope(2):
+        results = map_files(_tagged, FILES, suffix="!")
+        undeclared = map_files(_untagged, FILES, suffix="!")
+        small = map_files(_tagged, FILES[:3], suffix="!")
+
+    assert [name for name, _pid in results] == [f + "!" for f in FILES]
+    assert os.getpid() not in {pid for _name, pid in results}
+    assert {pid for _name, pid in undeclared} == {os.getpid()}
+    assert {pid for _name, pid in small} == {os.getpid()}
+
+
+@needs_fork
+def test_worker_exceptions_propagate():
+    with runtime_scope(make_runtime_context()), parallel_map_scope(2):
+        with pytest.raises(ValueError, match="mod_7"):
+            map_files(_fail_on, FILES, bad=FILES[7])
+        assert map_files(_fail_on, FILES, bad="") == FILES
+
+
+@needs_fork
+def test_before_fork_hooks_run_only_when_the_pool_forks(monkeypatch):
+    monkeypatch.setattr(parallel, "_before_fork_hooks", [])
+    calls: list[str] = []
+    register_before_fork(lambda: calls.append("drain"))
+
+    with runtime_scope(make_runtime_context()):
+        map_files(_tagged, FILES, suffix="!")
+        assert calls == []
+        with parallel_map_scope(2):
+            map_files(_tagged, FILES, suffix="!")
+    assert calls == ["drain"]
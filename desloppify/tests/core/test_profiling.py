@@ -0,0 +1,102 @@
+"""Tests for opt-in scan profiling spans and trace output."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import desloppify.languages._framework.base.shared_phases_review as review_mod
+from desloppify.base.profiling import ScanProfiler, active_profiler, profile_span
+from desloppify.base.runtime_state import make_runtime_context, runtime_scope
+from desloppify.languages._framework.base.types import LangSecurityResult
+
+
+def test_profile_span_is_noop_without_profiler():
+    with runtime_scope(make_runtime_context()):
+        assert active_profiler() is None
+        with profile_span("phase") as record:
+            assert record is None
+
+
+def test_spans_record_timing_and_counter_deltas(tmp_path):
+    source = tmp_path / "a.py"
+    source.write_text("x = 1\n")
+    runtime = make_runtime_context()
+    runtime.file_text_cache.enable()
+    runtime.cache_enabled = True
+    profiler = ScanProfiler(runtime=runtime)
+    runtime.profiler = profiler
+    detector_cache = {"hits": 0, "misses": 0}
+    profiler.add_counters("detector_cache", lambda: dict(detector_cache))
+
+    with runtime_scope(runtime):
+        runtime.file_text_cache.read(str(source))
+        with profile_span("Code smells", category="phase"):
+            runtime.file_text_cache.read(str(source))
+            detector_cache["misses"] += 1
+            with profile_span("ruff", category="tool"):
+                pass
+
+    tool, phase = profiler.spans
+    assert (phase.name, tool.name) == ("Code smells", "ruff")
+    assert phase.counters == {"file_text.hits": 1, "detector_cache.misses": 1}
+    assert phase.file_reads == 1
+    assert tool.counters == {}
+    assert phase.wall_seconds >= tool.wall_seconds >= 0
+
+    trace_file = tmp_path / "trace.json"
+    profiler.write_trace(trace_file)
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    assert [(event["name"], event["cat"], event["ph"]) for event in events] == [
+        ("Code smells", "phase", "X"),
+        ("ruff", "tool", "X"),
+    ]
+    assert events[0]["args"]["file_text.hits"] == 1
+    assert "process_cpu_ms" in events[0]["args"]
+
+    rows = profiler.summary_rows()
+    assert rows[0][0] == "Code smells"
+    assert rows[0][-1] == "detector_cache 0/1, file_text 1/0"
+    assert rows[1][0] == "  $ ruff"
+
+
+def test_prefetched_review_detectors_record_spans(monkeypatch, tmp_path):
+    (tmp_path / "a.py").write_text("x = 1\n")
+
+    def _lang_detect(files, _zones):
+        with profile_span("bandit", category="tool"):
+            return LangSecurityResult(entries=[], files_scanned=len(files))
+
+    lang = SimpleNamespace(
+        zone_map=None,
+        file_finder=lambda _path: ["a.py"],
+        name="python",
+        review_cache={},
+        detector_coverage={},
+        detect_lang_security_detailed=_lang_detect,
+    )
+    monkeypatch.setattr(review_mod, "detect_clones", lambda _path, _files, **_kw: [])
+    runtime = make_runtime_context()
+    profiler = ScanProfiler(runtime=runtime)
+    runtime.profiler = profiler
+
+    with runtime_scope(runtime):
+        review_mod.prewarm_review_phase_detectors(
+            tmp_path,
+            lang,
+            [
+                SimpleNamespace(label="Security", run=review_mod.phase_security),
+                SimpleNamespace(
+                    label="Boilerplate duplication",
+                    run=review_mod.phase_boilerplate_duplication,
+                ),
+            ],
+        )
+        for future in getattr(lang, review_mod._PREFETCH_ATTR).values():
+            future.result()
+
+    events = profiler.chrome_trace()["traceEvents"]
+    assert sorted((event["name"], event["cat"]) for event in events) == [
+        ("bandit", "tool"),
+        ("boilerplate clones (prefetch)", "stage"),
+    ]
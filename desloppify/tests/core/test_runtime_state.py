@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 import desloppify.base.runtime_state as runtime_state
 from desloppify.base.discovery.source import (
     disable_file_cache,
@@ -93,3 +95,240 @@ def test_file_text_cache_read_result_tracks_error_kind(tmp_path):
     assert result.content is None
     assert result.error_kind == "FileNotFoundError"
     assert cache.last_error_kind(str(missing_path)) == "FileNotFoundError"
+
+
+def test_compute_file_facts_matches_line_counting():
+    facts = runtime_state.compute_file_facts(b"a\nbb\nccc")
+    assert facts.loc == 3
+    assert facts.size == 8
+    assert list(facts.line_starts) == [0, 2, 5]
+    assert facts.line_start(3) == 5
+
+    terminated = runtime_state.compute_file_facts(b"a\nbb\n")
+    assert terminated.loc == 2
+    assert list(terminated.line_starts) == [0, 2]
+
+    empty = runtime_state.compute_file_facts(b"")
+    assert empty.loc == 0
+    assert list(empty.line_starts) == []
+
+    assert facts.text_loc == 3
+    carriage_returns = runtime_state.compute_file_facts(b"x = 1\ry = 2\r")
+    assert carriage_returns.loc == 1
+    assert carriage_returns.text_loc == 2
+    mixed = runtime_state.compute_file_facts("a\r\nb\u2028c\n".encode())
+    assert mixed.loc == 2
+    assert mixed.text_loc == 3
+
+
+def test_file_facts_table_caches_rows_only_when_enabled(tmp_path):
+    file_path = tmp_path / "mod.py"
+    file_path.write_text("x = 1\ny = 2\n")
+    table = runtime_state.FileFactsTable()
+
+    assert table.loc(str(file_path)) == 2
+    assert len(table) == 0
+
+    table.enable()
+    first = table.get(str(file_path))
+    file_path.write_text("changed\n")
+    second = table.get(str(file_path))
+    assert len(table) == 1
+    assert first == second
+    assert second.loc == 2
+    assert second.digest == runtime_state.compute_file_facts(b"x = 1\ny = 2\n").digest
+
+    assert table.get(str(tmp_path / "missing.py")) is None
+    assert table.loc(str(tmp_path / "missing.py")) == 0
+
+    table.disable()
+    assert len(table) == 0
+    assert table.loc(str(file_path)) == 1
+
+
+def test_enable_file_cache_scopes_file_facts(tmp_path):
+    from desloppify.base.discovery.source import file_loc, read_file_facts
+
+    file_path = tmp_path / "a.py"
+    file_path.write_text("one\ntwo\nthree\n")
+
+    with runtime_state.runtime_scope(runtime_state.make_runtime_context()):
+        enable_file_cache()
+        assert file_loc(file_path) == 3
+        facts = read_file_facts(file_path)
+        assert facts is not None and facts.size == len("one\ntwo\nthree\n")
+        assert runtime_state.current_runtime_context().file_facts.enabled
+        disable_file_cache()
+        assert not runtime_state.current_runtime_context().file_facts.enabled
+
+
+def test_read_source_matches_path_read_text(tmp_path):
+    crlf = tmp_path / "crlf.ts"
+    crlf.write_bytes(b"a\r\nb\rc\n")
+    binary = tmp_path / "blob.py"
+    binary.write_bytes(b"ok \xff\n")
+    cache = runtime_state.FileTextCache()
+    cache.enable()
+
+    assert cache.read_source(crlf) == crlf.read_text()
+    assert cache.read_source(binary, errors="replace") == binary.read_text(errors="replace")
+    with pytest.raises(UnicodeDecodeError):
+        cache.read_source(binary)
+    with pytest.raises(FileNotFoundError):
+        cache.read_source(tmp_path / "missing.py")
+
+
+def test_read_source_serves_other_encodings_from_the_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(runtime_state, "_default_encoding", lambda: "iso8859-1")
+    plain = tmp_path / "plain.py"
+    plain.write_bytes(b"x = 1\n")
+    utf8 = tmp_path / "utf8.py"
+    utf8.write_bytes("s = 'caf\u00e9'\r\n".encode())
+    latin1 = tmp_path / "latin1.py"
+    latin1.write_bytes(b"s = 'caf\xe9'\n")
+    cache = runtime_state.FileTextCache()
+    cache.enable()
+
+    for path in (plain, utf8):
+        expected = path.read_text(encoding="utf-8")
+        assert cache.read_source(path) == path.read_text(encoding="iso8859-1")
+        path.write_bytes(b"rewritten\n")
+        assert cache.read_source(path, encoding="utf-8") == expected
+        assert cache.read_source(path, encoding="UTF8") == expected
+    assert cache.misses == 2
+    with pytest.raises(UnicodeDecodeError):
+        cache.read_source(latin1, encoding="utf-8")
+    assert cache.read_source(latin1, encoding="utf-8", errors="replace") == (
+        latin1.read_text(encoding="utf-8", errors="replace")
+    )
+
+
+def test_read_bytes_shares_the_text_entry(tmp_path):
+    plain = tmp_path / "plain.py"
+    plain.write_bytes(b"x = 1\ny = 2\n")
+    crlf = tmp_path / "crlf.ts"
+    crlf.write_bytes(b"a\r\nb\n")
+    utf8 = tmp_path / "utf8.py"
+    utf8.write_bytes("s = 'caf\u00e9'\n".encode())
+    cache = runtime_state.FileTextCache()
+    cache.enable()
+
+    for path in (plain, crlf, utf8):
+        original = path.read_bytes()
+        cache.read(str(path))
+        path.write_bytes(b"rewritten\n")
+        assert cache.read_bytes(path) == original
+        path.write_bytes(b"rewritten again\n")
+        assert cache.read_bytes(path) == original
+    with pytest.raises(FileNotFoundError):
+        cache.read_bytes(tmp_path / "missing.py")
+
+
+def test_pinned_entries_survive_eviction_and_keep_their_bytes(tmp_path):
+    files = []
+    for index, content in enumerate((b"a = 1\n", "b = '\u00e9'\n".encode(), b"c = 3\n")):
+        path = tmp_path / f"m{index}.py"
+        path.write_bytes(content)
+        files.append(path)
+    cache = runtime_state.FileTextCache(max_bytes=12)
+    cache.enable()
+
+    ascii_bytes = cache.read_bytes(files[0], pin=True)
+    utf8_bytes = cache.read_bytes(files[1], pin=True)
+    cache.read(str(files[2]))
+    for path in files:
+        path.write_bytes(b"changed\n")
+
+    assert cache.is_pinned(files[0]) and cache.is_pinned(files[1])
+    assert not cache.is_pinned(files[2])
+    assert cache.read_bytes(files[0]) == ascii_bytes == b"a = 1\n"
+    assert cache.read_bytes(files[1]) is utf8_bytes
+    assert cache.cached_bytes > cache.max_bytes  # pinned entries are never evicted
+    cache.disable()
+    assert not cache.is_pinned(files[0])
+
+
+def test_non_ascii_entries_keep_the_bytes_they_were_decoded_from(tmp_path):
+    old, utf8 = tmp_path / "old.py", tmp_path / "utf8.py"
+    old.write_bytes(b"123456\n")
+    original = "s = '\u00e9'\n".encode()
+    utf8.write_bytes(original)
+    cache = runtime_state.FileTextCache(max_bytes=20)
+    cache.enable()
+    cache.read(str(old))
+    cache.read(str(utf8))
+
+    assert str(old) not in cache
+    assert cache.cached_bytes == 2 * len(original)
+    utf8.write_bytes(b"changed\n")
+    assert cache.read_bytes(utf8) == original
+
+
+def test_file_text_cache_serves_relative_and_absolute_from_one_entry(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "mod.py").write_text("x = 1\n")
+    cache = runtime_state.FileTextCache()
+    cache.enable()
+
+    assert cache.read("mod.py") == "x = 1\n"
+    (tmp_path / "mod.py").write_text("changed\n")
+    assert cache.read(str(tmp_path / "mod.py")) == "x = 1\n"
+    assert cache.read_source(tmp_path / "mod.py") == "x = 1\n"
+
+    cache.disable()
+    assert cache.read("mod.py") == "changed\n"
+
+
+def test_file_text_cache_prefetch_fills_text_and_facts(tmp_path):
+    from desloppify.base.discovery.source import prefetch_file_texts, read_source_text
+
+    files = []
+    for index in range(20):
+        path = tmp_path / f"m{index}.py"
+        path.write_text(f"value = {index}\n")
+        files.append(path)
+
+    with runtime_state.runtime_scope(runtime_state.make_runtime_context()) as runtime:
+        assert prefetch_file_texts(files) == 0  # cache disabled: no read-ahead
+        enable_file_cache()
+        assert prefetch_file_texts(files) == 20
+        assert prefetch_file_texts(files) == 0
+        runtime.file_text_cache.drain_prefetch()
+        for index, path in enumerate(files):
+            path.write_text("rewritten\n")
+            assert read_source_text(path) == f"value = {index}\n"
+            assert str(path) in runtime.file_facts
+        disable_file_cache()
+
+
+def test_file_text_cache_drain_prefetch_finishes_reads_and_stops_threads(tmp_path):
+    files = []
+    for index in range(10):
+        path = tmp_path / f"m{index}.py"
+        path.write_text(f"value = {index}\n")
+        files.append(str(path))
+    cache = runtime_state.FileTextCache()
+    cache.enable()
+    assert cache.prefetch(files) == 10
+
+    cache.drain_prefetch()
+
+    assert all(filepath in cache for filepath in files)
+    assert cache._executor is None
+    assert cache.prefetch([str(tmp_path / "late.py")]) == 1
+    cache.disable()
+
+
+def test_file_text_cache_evicts_beyond_byte_budget(tmp_path):
+    cache = runtime_state.FileTextCache(max_bytes=10)
+    cache.enable()
+    first, second = tmp_path / "a.py", tmp_path / "b.py"
+    first.write_text("123456\n")
+    second.write_text("abcdef\n")
+
+    cache.read(str(first))
+    cache.read(str(second))
+
+    assert str(second) in cache
+    assert str(first) not in cache
+    assert cache.cached_bytes == 7
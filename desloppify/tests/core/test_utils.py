@@ -7,15 +7,25 @@ import pytest
 
 import desloppify.base.text_utils as utils_text_mod
 import desloppify.base.discovery.paths as paths_api_mod
+import desloppify.base.discovery.source as source_mod
 import desloppify.base.tooling as tooling_mod
 from desloppify.base.discovery.file_paths import (
+    ExclusionMatcher,
+    compile_exclusions,
     matches_exclusion,
     rel,
     resolve_path,
 )
+from desloppify.base.discovery.path_index import (
+    list_dir,
+    memoized_resolution,
+    path_is_dir,
+    path_is_file,
+)
 from desloppify.base.discovery.source import (
     SourceDiscoveryOptions,
     clear_source_file_cache_for_tests,
+    file_cache_scope,
     find_source_files,
     get_exclusions,
     set_exclusions,
@@ -140,6 +150,42 @@ def test_matches_exclusion_exact_directory_path():
     assert matches_exclusion(".claude/worktrees", ".claude/worktrees") is True
 
 
+# ── ExclusionMatcher ─────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "test/foo.py",
+        "src/test/bar.py",
+        "testimony.py",
+        "Wan2GP/models/rf.py",
+        "Wan2GPx/foo.py",
+        "src/vendor/sub/bar.py",
+        "src/other/foo.py",
+        "pkg/generated_pb2.py",
+        "./Wan2GP/x.py",
+        ".claude/worktrees",
+    ],
+)
+def test_exclusion_matcher_agrees_with_matches_exclusion(path):
+    patterns = ["test", "Wan2GP/**", "src/vendor", "*_pb2.py", ".claude/worktrees"]
+    matcher = ExclusionMatcher(patterns)
+    expected = any(matches_exclusion(path, pattern) for pattern in patterns)
+    assert matcher.matches(path) is expected
+    # Memoized second lookup returns the same answer.
+    assert matcher.matches(path) is expected
+
+
+def test_exclusion_matcher_dir_globs_and_empty():
+    matcher = compile_exclusions(["generated/**"])
+    assert matcher.matches_dir("src/generated", "generated") is True
+    assert matcher.matches_dir("src/other", "other") is False
+    assert not compile_exclusions([])
+    assert compile_exclusions([]).matches("anything.py") is False
+    assert compile_exclusions(("a", "b")) is compile_exclusions(["a", "b"])
+
+
 # ── find_source_files() ─────────────────────────────────────
 
 
@@ -220,6 +266,76 @@ def test_find_source_files_excludes_prefixed_virtualenv_dirs(tmp_path, patch_pro
     assert files == ["src/keep.py"]
 
 
+def test_find_source_files_shares_one_walk_across_extensions(
+    tmp_path, patch_project_root, monkeypatch
+):
+    """Different extension sets and plugin exclusions reuse one traversal."""
+    patch_project_root(tmp_path)
+    src = tmp_path / "src"
+    (src / "vendor" / "lib").mkdir(parents=True)
+    (src / "app.py").write_text("x = 1")
+    (src / "view.tsx").write_text("x")
+    (src / "types.d.ts").write_text("x")
+    (src / "vendor" / "lib" / "dep.py").write_text("x = 1")
+    walks: list[str] = []
+    real_walk = os.walk
+    monkeypatch.setattr(
+        source_mod.os, "walk", lambda root: walks.append(str(root)) or real_walk(root)
+    )
+
+    assert find_source_files(str(src), [".py"]) == ["src/app.py", "src/vendor/lib/dep.py"]
+    assert find_source_files(str(src), [".ts", ".tsx"]) == ["src/types.d.ts", "src/view.tsx"]
+    assert find_source_files(str(src), [".d.ts"]) == ["src/types.d.ts"]
+    assert find_source_files(
+        str(src), [".py"], SourceDiscoveryOptions(exclusions=("vendor/**",))
+    ) == ["src/app.py"]
+    assert len(walks) == 1
+
+
+# ── path index ───────────────────────────────────────────────
+
+
+def test_path_index_answers_probes_from_discovery_walk(tmp_path, patch_project_root, monkeypatch):
+    """During a scan, resolver probes reuse the discovery walk's listings."""
+    patch_project_root(tmp_path)
+    pkg = tmp_path / "src" / "pkg"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("")
+    (pkg / "mod.py").write_text("")
+    (tmp_path / "src" / "node_modules").mkdir()
+
+    with file_cache_scope():
+        find_source_files(str(tmp_path / "src"), [".py"])
+        monkeypatch.setattr(
+            "desloppify.base.discovery.path_index.os.scandir",
+            lambda path: pytest.fail(f"unexpected listing of {path}"),
+        )
+        assert path_is_file(pkg / "mod.py")
+        assert path_is_file(str(pkg / "sub" / ".." / "__init__.py"))
+        assert not path_is_file(pkg / "missing.py")
+        assert not path_is_file(pkg)
+        assert path_is_dir(tmp_path / "src" / "node_modules")
+        assert list_dir(pkg) == ["__init__.py", "mod.py"]
+    monkeypatch.undo()
+
+    (pkg / "late.py").write_text("")
+    assert path_is_file(pkg / "late.py")
+
+
+def test_memoized_resolution_is_scan_scoped():
+    calls = []
+
+    def resolve():
+        calls.append(1)
+        return "a.py"
+
+    with file_cache_scope():
+        assert memoized_resolution(("t", "src", "./a"), resolve) == "a.py"
+        assert memoized_resolution(("t", "src", "./a"), resolve) == "a.py"
+    assert memoized_resolution(("t", "src", "./a"), resolve) == "a.py"
+    assert len(calls) == 2
+
+
 # ── set_exclusions() ─────────────────────────────────────────
 
 
@@ -0,0 +1,106 @@
+"""Tests for the native token-window clone detector."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import desloppify.engine.detectors.clones as clones_mod
+from desloppify.engine.detectors.clones import (
+    detect_clones,
+    fingerprint_text,
+    is_build_mirror_pair,
+    tokenize,
+)
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "clones"
+
+
+def _corpus(tmp_path: Path) -> tuple[Path, list[str]]:
+    root = tmp_path / "corpus"
+    shutil.copytree(FIXTURES, root)
+    return root, sorted(str(p) for p in root.glob("*.py"))
+
+
+def test_tokenize_drops_comments_and_tracks_lines():
+    tokens, lines = tokenize("a = 1  # note\n// keep\nb = 'x # y'\n", suffix=".py")
+    assert tokens == ["a", "=", "1", "/", "/", "keep", "b", "=", "'x # y'"]
+    assert lines == [1, 1, 1, 2, 2, 2, 3, 3, 3]
+
+    c_tokens, _ = tokenize("x = 1; // note\n/* block\n */ y = 2;", suffix=".ts")
+    assert c_tokens == ["x", "=", "1", ";", "y", "=", "2", ";"]
+
+
+def test_fingerprints_ignore_comments_and_whitespace():
+    body = "\n".join(f"value_{i} = compute(value_{i - 1}, {i})" for i in range(1, 20))
+    noisy = "\n\n".join(
+        f"value_{i}   =  compute(value_{i - 1}, {i})  # step {i}" for i in range(1, 20)
+    )
+    assert list(fingerprint_text(body, suffix=".py").hashes) == list(
+        fingerprint_text(noisy, suffix=".py").hashes
+    )
+
+
+def test_detect_clones_reports_shared_block(tmp_path):
+    root, files = _corpus(tmp_path)
+
+    entries = detect_clones(root, files)
+
+    assert len(entries) == 1
+    entry = entries[0]
+    assert entry["distinct_files"] == 2
+    assert entry["window_size"] >= 4
+    assert {Path(loc["file"]).name for loc in entry["locations"]} == {
+        "invoices.py",
+        "orders.py",
+    }
+    assert all(loc["file"] in files for loc in entry["locations"])
+    assert entry["sample"] and entry["sample"][0].startswith("def export_")
+    assert detect_clones(root, files) == entries
+
+
+def test_detect_clones_skips_build_artifacts(tmp_path):
+    root, files = _corpus(tmp_path)
+    mirror = root / "build" / "lib" / "orders.py"
+    mirror.parent.mkdir(parents=True)
+    shutil.copy(root / "orders.py", mirror)
+    unique_only = [f for f in files if Path(f).name != "invoices.py"]
+
+    assert detect_clones(root, [*unique_only, str(mirror)]) == []
+    assert is_build_mirror_pair("build/lib/orders.py", "orders.py")
+    assert not is_build_mirror_pair("build/lib/orders.py", "invoices.py")
+
+
+def test_cached_fingerprints_skip_unchanged_files(tmp_path, monkeypatch):
+    root, files = _corpus(tmp_path)
+    cache: dict[str, object] = {}
+    first = detect_clones(root, files, cache=cache)
+    assert set(cache["files"]) == set(files)
+
+    fingerprinted: list[str] = []
+    real_fingerprint = clones_mod.fingerprint_text
+
+    def _tracking(text, *, suffix=""):
+        fingerprinted.append(text)
+        return real_fingerprint(text, suffix=suffix)
+
+    monkeypatch.setattr(clones_mod, "fingerprint_text", _tracking)
+    assert detect_clones(root, files, cache=cache) == first
+    assert fingerprinted == []
+
+    unique = root / "unique.py"
+    unique.write_text(unique.read_text() + "\n\nEXTRA = 1\n")
+    detect_clones(root, files, cache=cache)
+    assert len(fingerprinted) == 1
+    assert "EXTRA = 1" in fingerprinted[0]
+
+
+def test_stale_cache_version_is_rebuilt(tmp_path):
+    root, files = _corpus(tmp_path)
+    cache: dict[str, object] = {"version": -1, "files": {files[0]: {"digest": "x"}}}
+
+    entries = detect_clones(root, files, cache=cache)
+
+    assert entries
+    assert cache["version"] == clones_mod.CLONE_DETECTOR_VERSION
+    assert set(cache["files"]) == set(files)
@@ -5,7 +5,10 @@ import textwrap
 import pytest
 
 from desloppify.engine.detectors.base import ComplexitySignal
-from desloppify.engine.detectors.complexity import detect_complexity
+from desloppify.engine.detectors.complexity import (
+    compile_complexity_signals,
+    detect_complexity,
+)
 
 
 def _write_file(tmp_path, name, content):
@@ -290,3 +293,48 @@ def test_entry_contains_loc(tmp_path):
 
     entries, _ = detect_complexity(tmp_path, signals, finder, threshold=1, min_loc=10)
     assert entries[0]["loc"] == 60
+
+
+def test_carriage_return_only_file_counts_all_lines(tmp_path):
+    """Bare ``\\r`` line endings count as lines, as ``str.splitlines`` does."""
+    p = tmp_path / "cr.py"
+    p.write_bytes(b"if True:\r" * 60)
+
+    signals = [ComplexitySignal(name="ifs", pattern=r"^if\b", weight=1, threshold=0)]
+    finder = _file_finder_for(str(p))
+
+    entries, _ = detect_complexity(tmp_path, signals, finder, threshold=1, min_loc=10)
+    assert len(entries) == 1
+    assert entries[0]["loc"] == 60
+
+
+# ── Compiled signal sets ─────────────────────────────────────
+
+
+def test_compiled_signal_set_is_built_once_per_catalog(tmp_path):
+    """Calling conventions are resolved once; labels keep catalog order."""
+    fp = _write_file(tmp_path, "mixed.py", "if True:\n" * 30 + "# TODO later\n" * 30)
+    seen_paths = []
+
+    def with_path(content, lines, _filepath=None):
+        seen_paths.append(_filepath)
+        return 7, "7 things"
+
+    signals = [
+        ComplexitySignal(name="ifs", pattern=r"^if\b", weight=1, threshold=0),
+        ComplexitySignal(name="things", compute=with_path, weight=1, threshold=0),
+        ComplexitySignal(name="loops", pattern=r"^while\b", weight=1, threshold=0),
+        ComplexitySignal(name="TODOs", pattern=r"#\s*TODO", weight=2, threshold=10),
+    ]
+
+    compiled = compile_complexity_signals(signals)
+    assert compile_complexity_signals(signals) is compiled
+    assert compile_complexity_signals(compiled) is compiled
+    assert compile_complexity_signals(list(signals[:2])) is not compiled
+
+    entries, _ = detect_complexity(
+        tmp_path, signals, _file_finder_for(fp), threshold=1, min_loc=10
+    )
+    assert seen_paths == [fp]
+    assert entries[0]["signals"] == ["30 ifs", "7 things", "30 TODOs"]
+    assert entries[0]["score"] == 30 + 7 + (30 - 10) * 2
@@ -0,0 +1,126 @@
+"""Tests for the columnar function table used by review-phase detectors."""
+
+from __future__ import annotations
+
+import hashlib
+
+from desloppify.engine.detectors.base import FunctionInfo
+from desloppify.engine.detectors.dupes import detect_duplicates
+from desloppify.engine.detectors.function_table import (
+    NORMALIZED_MIN_LOC,
+    FunctionTable,
+    hash_key,
+)
+from desloppify.engine.detectors.signature import detect_signature_variance
+
+_SOURCE = """\
+import os
+
+
+def load(path, mode, encoding, errors):
+    return open(path, mode=mode, encoding=encoding, errors=errors)
+
+
+def size(path):
+    return os.path.getsize(path)
+"""
+
+
+def _fn(name: str, file: str, body: str, line: int, **kwargs) -> FunctionInfo:
+    normalized = "\n".join(part.strip() for part in body.splitlines())
+    loc = kwargs.pop("loc", len(body.splitlines()))
+    return FunctionInfo(
+        name=name,
+        file=file,
+        line=line,
+        end_line=line + loc - 1,
+        loc=loc,
+        body=body,
+        normalized=normalized,
+        body_hash=hashlib.md5(normalized.encode()).hexdigest(),
+        **kwargs,
+    )
+
+
+def _source_functions(file: str) -> list[FunctionInfo]:
+    lines = _SOURCE.splitlines()
+    return [
+        _fn("load", file, "\n".join(lines[3:5]), 4, params=["path", "mode", "encoding", "errors"]),
+        _fn("size", file, "\n".join(lines[7:9]), 8, params=["path"]),
+        _fn("ghost", file, "def ghost():\n    pass", 20),
+    ]
+
+
+def test_bodies_are_offsets_into_source_and_spill_when_missing(tmp_path):
+    source = tmp_path / "io_utils.py"
+    source.write_text(_SOURCE)
+    reads: list[str] = []
+
+    def _reader(filepath: str) -> str:
+        reads.append(filepath)
+        return source.read_text()
+
+    functions = _source_functions(str(source))
+    table = FunctionTable.from_functions(functions, source=_reader)
+
+    assert len(table) == 3
+    assert table.files == [str(source)]
+    assert list(table.body_starts[:2]) == [_SOURCE.index("def load"), _SOURCE.index("def size")]
+    assert table.spilled_bodies == {2: "def ghost():\n    pass"}
+    assert [row.body for row in table] == [fn.body for fn in functions]
+    assert table[0].params == ("path", "mode", "encoding", "errors")
+    assert table[1].hash_key == hash_key(functions[1].body_hash)
+    assert table[-1].name == "ghost"
+    assert reads == [str(source)] * 3
+
+
+def test_normalized_text_only_kept_for_near_duplicate_candidates():
+    small = _fn("small", "a.py", "x = 1\ny = 2\nreturn x", 1)
+    large_body = "\n".join(f"v{i} = {i}" for i in range(NORMALIZED_MIN_LOC))
+    large = _fn("large", "a.py", large_body, 10)
+
+    table = FunctionTable.coerce([small, large])
+
+    assert table[0].normalized == ""
+    assert table[1].normalized == large.normalized
+    assert table[0].body == small.body
+    assert FunctionTable.coerce(table) is table
+
+
+def test_filter_files_and_slices_keep_row_data():
+    functions = [
+        _fn("run", "src/a.py", "a = 1\nb = 2\nreturn a", 1, params=["x"]),
+        _fn("run", "tests/test_a.py", "a = 1\nb = 2\nreturn a", 1, params=["y"]),
+        _fn("run", "src/b.py", "c = 3\nd = 4\nreturn c", 5, params=["z"]),
+    ]
+    table = FunctionTable.coerce(functions)
+    calls: list[str] = []
+
+    def _keep(filepath: str) -> bool:
+        calls.append(filepath)
+        return not filepath.startswith("tests/")
+
+    kept = table.filter_files(_keep)
+
+    assert calls == ["src/a.py", "tests/test_a.py", "src/b.py"]
+    assert [(row.file, row.params) for row in kept] == [
+        ("src/a.py", ("x",)),
+        ("src/b.py", ("z",)),
+    ]
+    assert [row.body for row in kept] == [functions[0].body, functions[2].body]
+    assert [row.line for row in table[1:]] == [1, 5]
+
+
+def test_detectors_accept_tables_and_lists_alike():
+    body = "\n".join(f"total += item_{i}" for i in range(16))
+    functions = [
+        _fn("merge", "a.py", body, 1, params=["left", "right"]),
+        _fn("merge", "b.py", body, 1, params=["left"]),
+        _fn("merge", "c.py", body + "\nreturn total", 1, params=["items"]),
+    ]
+    table = FunctionTable.coerce(functions)
+
+    assert detect_duplicates(table) == detect_duplicates(functions)
+    assert detect_signature_variance(table) == detect_signature_variance(functions)
+    entries, _total = detect_signature_variance(table)
+    assert entries[0]["variants"][0]["params"] == ["left", "right"]
@@ -0,0 +1,106 @@
+"""Tests for the combined multi-pattern line scanner."""
+
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from desloppify.engine.detectors.patterns.multi import (
+    MultiPatternScanner,
+    literal_anchors,
+)
+from desloppify.engine.detectors.patterns.security import SECRET_NAME_RE, SECRET_NAMES
+from desloppify.languages.python.detectors.smells import SMELL_CHECKS
+from desloppify.languages.typescript.detectors.smells import TS_SMELL_CHECKS
+
+_LINES = [
+    "x = eval(data)  # TODO: remove",
+    "if count > 10000: print('[DEBUG] done')",
+    "url = 'https://example.com/api'",
+    "const value: any = items.sort();",
+    "password = 'hunter2hunter2'",
+    "API_KEY: str = \"abcdefghijkl\"",
+    "traceback.print_exc()",
+    "nothing to see here",
+    "",
+]
+
+
+@pytest.mark.parametrize("catalog", [SMELL_CHECKS, TS_SMELL_CHECKS], ids=["py", "ts"])
+def test_search_matches_individual_patterns(catalog):
+    rules = [(c["id"], c["pattern"]) for c in catalog if c["pattern"] is not None]
+    scanner = MultiPatternScanner(rules)
+
+    for line in _LINES:
+        expected = [
+            (key, m.span())
+            for key, pattern in rules
+            if (m := re.search(pattern, line)) is not None
+        ]
+        assert [(key, m.span()) for key, m in scanner.search(line)] == expected
+
+
+def test_literal_anchors_cover_branches_and_case():
+    assert literal_anchors(re.compile(r"traceback\.print_exc\s*\(")) == {
+        "traceback.print_exc"
+    }
+    folded = re.compile(r"(?i)(?:Token|secret)_\w+")
+    assert literal_anchors(folded) is None
+    assert literal_anchors(folded, ascii_text=True) == {"token", "secret"}
+    assert literal_anchors(re.compile("(?i)\u017fecret"), ascii_text=True) is None
+    assert literal_anchors(re.compile(r"(?:==|[+-])\s*\d{4,}")) is None
+    assert literal_anchors(re.compile(r"a?b*")) is None
+
+
+def test_flagged_and_backreference_patterns_keep_their_semantics():
+    scanner = MultiPatternScanner(
+        [
+            ("names", SECRET_NAMES),
+            ("assign", SECRET_NAME_RE),
+            ("ci", re.compile("hello", re.IGNORECASE)),
+            ("anchored", r"^\s*return\b"),
+        ]
+    )
+
+    assert scanner.keys("HELLO there") == {"ci"}
+    assert scanner.keys("token = 'abc'") == {"names", "assign"}
+    assert scanner.keys("token = 'abc\"") == {"names"}
+    assert scanner.keys("x = 1; return y") == set()
+    assert scanner.keys("    return y") == {"anchored"}
+
+
+def test_ignorecase_rules_follow_unicode_case_folding():
+    rules = [
+        ("s", re.compile("s", re.IGNORECASE)),
+        ("i", re.compile("i", re.IGNORECASE)),
+        ("long_s", re.compile("\u017fecret", re.IGNORECASE)),
+    ]
+    scanner = MultiPatternScanner(rules)
+
+    for line in ("\u017f", "\u0131", "secret", "SECRET \u00e9"):
+        expected = [key for key, pattern in rules if pattern.search(line)]
+        assert [key for key, _match in scanner.search(line)] == expected
+    hits = {key for _index, key, _match in scanner.scan_lines(["x \u017f", "\u0131"])}
+    assert hits == {"s", "i"}
+
+
+def test_scan_lines_skips_indexes_and_tracks_search_counts():
+    scanner = MultiPatternScanner([("a", r"alpha"), ("b", r"beta")])
+    lines = ["alpha beta", "gamma", "beta", "alpha"]
+
+    hits = [(i, key) for i, key, _m in scanner.scan_lines(lines, skip={3})]
+
+    assert hits == [(0, "a"), (0, "b"), (2, "b")]
+    assert scanner.stats.lines == 3
+    assert scanner.stats.naive_searches == 6
+    # Regexes only run on lines containing one of the rule's anchors.
+    assert scanner.stats.searches == 2 + 0 + 1
+
+
+def test_scan_lines_drops_rules_absent_from_file():
+    scanner = MultiPatternScanner([("a", r"alpha"), ("b", r"beta")])
+
+    assert list(scanner.scan_lines(["gamma", "delta"])) == []
+    assert scanner.stats.searches == 0
+    assert scanner.stats.naive_searches == 4
@@ -0,0 +1,49 @@
+"""Tests for deferred queue snapshot partitions and window-only enrichment."""
+
+from __future__ import annotations
+
+from desloppify.engine._work_queue.core import build_work_queue
+from desloppify.engine._work_queue.models import QueueBuildOptions
+from desloppify.engine._work_queue.snapshot import build_queue_snapshot
+
+
+def _state(count: int) -> dict:
+    issues = {}
+    for index in range(count):
+        issue_id = f"unused::src/m{index}.py::name{index}"
+        issues[issue_id] = {
+            "id": issue_id,
+            "detector": "unused",
+            "status": "open",
+            "file": f"src/m{index}.py",
+            "tier": 2,
+            "confidence": "high",
+            "summary": "unused import",
+            "detail": {"count": index},
+        }
+    return {"issues": issues, "scan_count": 3}
+
+
+def test_backlog_partition_is_deferred_but_tuple_like():
+    plan = {"queue_order": ["unused::src/m0.py::name0"], "skipped": {}}
+    snapshot = build_queue_snapshot(_state(4), plan=plan)
+
+    assert snapshot.objective_backlog_count == 3
+    backlog_ids = [item["id"] for item in snapshot.backlog_items]
+    assert "unused::src/m0.py::name0" not in backlog_ids
+    assert {f"unused::src/m{i}.py::name{i}" for i in (1, 2, 3)} <= set(backlog_ids)
+    assert snapshot.backlog_items == tuple(snapshot.backlog_items)
+    assert snapshot.all_postflight_review_items == ()
+
+
+def test_display_fields_are_stamped_on_visible_window_only():
+    state = _state(5)
+    queue = build_work_queue(state, options=QueueBuildOptions(count=2))
+
+    assert queue["total"] == 5
+    assert len(queue["items"]) == 2
+    for item in queue["items"]:
+        assert item["primary_command"].startswith("desloppify plan resolve")
+        assert item["estimated_impact"] == 0.0
+    # Highest detail.count sorts first among equal-confidence issues.
+    assert queue["items"][0]["id"] == "unused::src/m4.py::name4"
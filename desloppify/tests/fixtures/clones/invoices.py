@@ -0,0 +1,19 @@
+"""Invoice export helpers."""
+
+
+def export_invoices(rows, writer, *, include_header=True):
+    if include_header:
+        writer.writerow(["id", "customer", "amount", "currency", "status"])
+    total = 0
+    for row in rows:
+        # Amounts are rounded to cents before writing.
+        amount = round(float(row.get("amount", 0)), 2)
+        currency = str(row.get("currency", "USD")).upper()
+        status = row.get("status") or "pending"
+        writer.writerow([row["id"], row["customer"], amount, currency, status])
+        total += amount
+    return {"count": len(rows), "total": round(total, 2)}
+
+
+def invoice_due_days(invoice):
+    return int(invoice.get("terms", 30))
@@ -0,0 +1,19 @@
+"""Order export helpers."""
+
+
+def export_orders(rows, writer, *, include_header=True):
+    # Serialize every order row with normalized currency fields.
+    if include_header:
+        writer.writerow(["id", "customer", "amount", "currency", "status"])
+    total = 0
+    for row in rows:
+        amount = round(float(row.get("amount", 0)), 2)
+        currency = str(row.get("currency", "USD")).upper()
+        status = row.get("status") or "pending"
+        writer.writerow([row["id"], row["customer"], amount, currency, status])
+        total += amount
+    return {"count": len(rows), "total": round(total, 2)}
+
+
+def order_label(order):
+    return f"order-{order['id']}"
@@ -0,0 +1,11 @@
+"""Unrelated helper with no duplicated blocks."""
+
+
+def merge_settings(defaults, overrides):
+    merged = dict(defaults)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_settings(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
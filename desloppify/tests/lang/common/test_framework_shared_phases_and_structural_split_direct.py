@@ -3,14 +3,24 @@
 from __future__ import annotations
 
 import concurrent.futures
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 
+import desloppify.base.parallel as parallel_mod
 import desloppify.languages._framework.base.shared_phases_review as review_mod
 import desloppify.languages._framework.base.shared_phases_structural as structural_mod
 import desloppify.languages._framework.generic_support.structural as generic_structural_mod
+from desloppify.base.runtime_state import (
+    current_runtime_context,
+    make_runtime_context,
+    runtime_scope,
+)
 from desloppify.engine.policy.zones import Zone
-from desloppify.languages._framework.base.types import LangSecurityResult
+from desloppify.languages._framework.base.types import (
+    DetectorCoverageStatus,
+    LangSecurityResult,
+)
 
 
 def test_phase_dupes_filters_non_production_functions(monkeypatch) -> None:
@@ -49,7 +59,7 @@ def test_phase_dupes_filters_non_production_functions(monkeypatch) -> None:
 
 def test_phase_boilerplate_duplication_handles_none_and_entries(monkeypatch) -> None:
     lang = SimpleNamespace(zone_map=None)
-    monkeypatch.setattr(review_mod, "detect_with_jscpd", lambda _path: None)
+    monkeypatch.setattr(review_mod, "detect_clones", lambda _path, _files, **_kw: None)
     issues, potentials = review_mod.phase_boilerplate_duplication(Path("."), lang)
     assert issues == []
     assert potentials == {}
@@ -66,7 +76,7 @@ def test_phase_boilerplate_duplication_handles_none_and_entries(monkeypatch) ->
             ],
         }
     ]
-    monkeypatch.setattr(review_mod, "detect_with_jscpd", lambda _path: entries)
+    monkeypatch.setattr(review_mod, "detect_clones", lambda _path, _files, **_kw: entries)
     monkeypatch.setattr(review_mod, "_filter_boilerplate_entries_by_zone", lambda items, _zone: items)
 
     issues, potentials = review_mod.phase_boilerplate_duplication(Path("."), lang)
@@ -100,11 +110,11 @@ def test_phase_boilerplate_duplication_reuses_cached_entries(monkeypatch, tmp_pa
         file_finder=lambda _path: ["src/a.py"],
     )
 
-    def _fake_detect(_path):
+    def _fake_detect(_path, _files, **_kwargs):
         calls["count"] += 1
         return entries
 
-    monkeypatch.setattr(review_mod, "detect_with_jscpd", _fake_detect)
+    monkeypatch.setattr(review_mod, "detect_clones", _fake_detect)
     monkeypatch.setattr(review_mod, "_filter_boilerplate_entries_by_zone", lambda items, _zone: items)
 
     first_issues, first_potentials = review_mod.phase_boilerplate_duplication(tmp_path, lang)
@@ -149,8 +159,8 @@ def test_phase_boilerplate_duplication_uses_prefetched_result(monkeypatch, tmp_p
     monkeypatch.setattr(review_mod, "_PREFETCH_EXECUTOR", _ImmediateExecutor())
     monkeypatch.setattr(
         review_mod,
-        "detect_with_jscpd",
-        lambda _path: (calls.__setitem__("count", calls["count"] + 1), entries)[1],
+        "detect_clones",
+        lambda _path, _files, **_kw: (calls.__setitem__("count", calls["count"] + 1), entries)[1],
     )
     monkeypatch.setattr(review_mod, "_filter_boilerplate_entries_by_zone", lambda items, _zone: items)
 
@@ -339,6 +349,157 @@ def test_phase_security_uses_prefetched_lang_result(monkeypatch, tmp_path) -> No
     assert potentials == {"security": 4}
 
 
+
+def test_prewarm_runs_prefetch_in_the_scan_runtime_context(monkeypatch, tmp_path) -> None:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("print('a')\n")
+    seen: dict[str, object] = {}
+
+    def _lang_detect(files, _zones):
+        seen["security"] = current_runtime_context()
+        return LangSecurityResult(entries=[], files_scanned=len(files))
+
+    def _detect_clones(_path, _files, **_kw):
+        seen["clones"] = current_runtime_context()
+        return []
+
+    lang = SimpleNamespace(
+        zone_map=None,
+        file_finder=lambda _path: ["src/a.py"],
+        name="python",
+        review_cache={},
+        detector_coverage={},
+        detect_lang_security_detailed=_lang_detect,
+    )
+    monkeypatch.setattr(review_mod, "detect_clones", _detect_clones)
+
+    runtime = make_runtime_context()
+    with runtime_scope(runtime):
+        review_mod.prewarm_review_phase_detectors(
+            tmp_path,
+            lang,
+            [
+                SimpleNamespace(label="Security", run=review_mod.phase_security),
+                SimpleNamespace(
+                    label="Boilerplate duplication",
+                    run=review_mod.phase_boilerplate_duplication,
+                ),
+            ],
+        )
+        for future in getattr(lang, review_mod._PREFETCH_ATTR).values():
+            future.result()
+
+    assert seen == {"security": runtime, "clones": runtime}
+
+
+def test_drain_prefetch_executor_finishes_prewarm_work_and_stops_threads(
+    monkeypatch,
+) -> None:
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(review_mod, "_PREFETCH_EXECUTOR", executor)
+    release = threading.Event()
+    future = executor.submit(release.wait, 5)
+    threading.Timer(0.05, release.set).start()
+
+    review_mod._drain_prefetch_executor()
+
+    assert future.done() and future.result() is True
+    assert not any(thread.is_alive() for thread in executor._threads)
+    assert review_mod._PREFETCH_EXECUTOR is not executor
+    assert review_mod._drain_prefetch_executor in parallel_mod._before_fork_hooks
+
+
+def _per_file_security_lang(calls: list[tuple[str, list[str]]], *, coverage=None):
+    def _entry(filepath: str, name: str) -> dict:
+        return {
+            "file": filepath,
+            "tier": 2,
+            "confidence": "medium",
+            "summary": f"{name} issue",
+            "name": f"{name}::{filepath}",
+        }
+
+    def _lang_detect(files, _zones):
+        calls.append(("lang", list(files)))
+        return LangSecurityResult(
+            entries=[_entry(filepath, "lang") for filepath in files],
+            files_scanned=len(files),
+            coverage=coverage["value"] if coverage else None,
+        )
+
+    def _cross_detect(files, _zones, _name, **_kwargs):
+        calls.append(("cross", list(files)))
+        return [_entry(filepath, "cross") for filepath in files], len(files)
+
+    lang = SimpleNamespace(
+        zone_map=None,
+        file_finder=lambda _path: ["src/a.py", "src/b.py"],
+        name="python",
+        review_cache={},
+        detector_coverage={},
+        detect_lang_security_detailed=_lang_detect,
+    )
+    return lang, _cross_detect
+
+
+def test_phase_security_rescans_only_changed_files(monkeypatch, tmp_path) -> None:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("print('a')\n")
+    (tmp_path / "src" / "b.py").write_text("print('b')\n")
+    calls: list[tuple[str, list[str]]] = []
+    lang, cross_detect = _per_file_security_lang(calls)
+
+    monkeypatch.setattr(review_mod, "filter_entries", lambda _zones, entries, _detector: entries)
+    monkeypatch.setattr(
+        review_mod,
+        "_entries_to_issues",
+        lambda _detector, entries, **_kwargs: [entry["name"] for entry in entries],
+    )
+    monkeypatch.setattr(review_mod, "_log_phase_summary", lambda *_args, **_kwargs: None)
+
+    first, first_potentials = review_mod.phase_security(
+        tmp_path, lang, detect_security_issues=cross_detect
+    )
+    (tmp_path / "src" / "b.py").write_text("print('changed')\n")
+    calls.clear()
+    second, second_potentials = review_mod.phase_security(
+        tmp_path, lang, detect_security_issues=cross_detect
+    )
+    calls_after_edit = list(calls)
+    calls.clear()
+    review_mod.phase_security(tmp_path, lang, detect_security_issues=cross_detect)
+
+    assert calls_after_edit == [("cross", ["src/b.py"]), ("lang", ["src/b.py"])]
+    assert calls == []
+    assert sorted(first) == sorted(second)
+    assert len(second) == 4
+    assert first_potentials == second_potentials == {"security": 2}
+
+
+def test_phase_security_coverage_change_rescans_everything(monkeypatch, tmp_path) -> None:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("print('a')\n")
+    (tmp_path / "src" / "b.py").write_text("print('b')\n")
+    calls: list[tuple[str, list[str]]] = []
+    coverage = {"value": None}
+    lang, cross_detect = _per_file_security_lang(calls, coverage=coverage)
+
+    monkeypatch.setattr(review_mod, "filter_entries", lambda _zones, entries, _detector: entries)
+    monkeypatch.setattr(review_mod, "_entries_to_issues", lambda *_a, **_k: [])
+    monkeypatch.setattr(review_mod, "_log_phase_summary", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(review_mod, "_record_detector_coverage", lambda *_a, **_k: None)
+
+    review_mod.phase_security(tmp_path, lang, detect_security_issues=cross_detect)
+    (tmp_path / "src" / "a.py").write_text("print('changed')\n")
+    coverage["value"] = DetectorCoverageStatus(
+        detector="security", status="reduced", confidence=0.6, tool="bandit"
+    )
+    calls.clear()
+    review_mod.phase_security(tmp_path, lang, detect_security_issues=cross_detect)
+
+    assert ("lang", ["src/a.py", "src/b.py"]) in calls
+    assert lang.review_cache["detectors"]["security"]["coverage"]["status"] == "reduced"
+
 def test_review_function_extraction_cached_across_signature_and_dupes(monkeypatch, tmp_path) -> None:
     calls = {"count": 0}
     functions = [SimpleNamespace(file="src/a.py", name="foo")]
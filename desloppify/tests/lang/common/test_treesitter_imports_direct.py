@@ -13,6 +13,12 @@ import desloppify.languages._framework.treesitter.imports.resolver_cache as reso
 import desloppify.languages._framework.treesitter.imports.resolvers_backend as backend_mod
 import desloppify.languages._framework.treesitter.imports.resolvers_functional as functional_mod
 import desloppify.languages._framework.treesitter.imports.resolvers_scripts as scripts_mod
+from desloppify.base.runtime_state import make_runtime_context, runtime_scope
+from desloppify.languages._framework.treesitter.imports.cache import (
+    ParseTreeCache,
+    current_parse_tree_cache,
+    preparse_files,
+)
 
 
 class FakeNode:
@@ -82,6 +88,80 @@ def test_graph_helpers_build_internal_edges_and_builder(monkeypatch, tmp_path: P
     ) == {}
 
 
+def test_parse_cache_keeps_only_trees_while_the_shared_reader_is_enabled(
+    tmp_path: Path,
+) -> None:
+    source_file = tmp_path / "main.go"
+    source_file.write_bytes(b"package main\n")
+    parser = SimpleNamespace(parse=lambda source: ("tree", bytes(source)))
+
+    other_file = tmp_path / "other.go"
+    other_file.write_bytes(b"package other\n")
+
+    runtime = make_runtime_context()
+    with runtime_scope(runtime):
+        runtime.file_text_cache.enable()
+        runtime.file_text_cache.max_bytes = 1
+        cache = ParseTreeCache(runtime=runtime)
+        cache.enable()
+        first = cache.get_or_parse(str(source_file), parser, "go")
+        source_file.write_bytes(b"package changed\n")
+        runtime.file_text_cache.read(str(other_file))  # over budget: evicts unpinned
+        second = cache.get_or_parse(str(source_file), parser, "go")
+
+        assert first == second == (b"package main\n", ("tree", b"package main\n"))
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache._trees[(str(source_file), "go")][0] is None
+
+        # A reset reader lost the pinned bytes: the stale tree is reparsed.
+        runtime.file_text_cache.enable()
+        assert cache.get_or_parse(str(source_file), parser, "go") == (
+            b"package changed\n",
+            ("tree", b"package changed\n"),
+        )
+        assert cache.misses == 2
+
+        runtime.file_text_cache.disable()
+        cache.enable()
+        source, _tree = cache.get_or_parse(str(source_file), parser, "go")
+        assert cache._trees[(str(source_file), "go")][0] == source == b"package changed\n"
+
+
+def test_preparse_files_fills_the_parse_cache_with_one_parser_per_thread(
+    tmp_path: Path,
+) -> None:
+    files = []
+    for index in range(12):
+        path = tmp_path / f"m{index}.go"
+        path.write_bytes(b"package m\n" * (index + 1))
+        files.append(str(path))
+    parsers: list[object] = []
+
+    def make_parser(grammar: str) -> SimpleNamespace:
+        parser = SimpleNamespace(parse=lambda source: (grammar, len(source)))
+        parsers.append(parser)
+        return parser
+
+    with runtime_scope(make_runtime_context()):
+        assert preparse_files(files, "go", workers=3, make_parser=make_parser) is None
+
+        cache = current_parse_tree_cache()
+        cache.enable()
+        cache.get_or_parse(files[0], make_parser("go"), "go")
+        parsers.clear()
+        throughput = preparse_files(
+            files + files[:2], "go", workers=3, make_parser=make_parser
+        )
+
+        assert throughput is not None
+        assert (throughput.files, throughput.workers) == (11, 3)
+        assert throughput.bytes == sum(len(b"package m\n") * n for n in range(2, 13))
+        assert 1 <= len(parsers) <= 3
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert cache.get_or_parse(files[5], None, "go")[1] == ("go", 60)
+        assert cache.hits == 1
+
+
 def test_import_normalize_helpers_strip_comments_and_log_lines() -> None:
     cached = normalize_mod._get_log_patterns((r"logger\.",))
     assert cached is normalize_mod._get_log_patterns((r"logger\.",))
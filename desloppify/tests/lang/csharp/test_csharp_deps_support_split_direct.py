@@ -51,9 +51,9 @@ def test_metadata_entrypoint_and_parsing_helpers(monkeypatch, tmp_path) -> None:
     assert metadata_mod.is_entrypoint_file(helper, helper.read_text(encoding="utf-8")) is False
 
     monkeypatch.setattr(
-        Path,
-        "read_text",
-        lambda self: (_ for _ in ()).throw(UnicodeDecodeError("utf-8", b"x", 0, 1, "bad")),
+        metadata_mod,
+        "read_source_text",
+        lambda _path: (_ for _ in ()).throw(UnicodeDecodeError("utf-8", b"x", 0, 1, "bad")),
     )
     assert metadata_mod.parse_file_metadata(str(source)) == (None, set(), False)
 
@@ -6,6 +6,7 @@ import ast
 from pathlib import Path
 from types import SimpleNamespace
 
+import desloppify.languages._framework.base.shared_phases_review as review_mod
 import desloppify.languages.python._security as py_security_mod
 import desloppify.languages.python.detectors.dict_keys.schema as schema_mod
 import desloppify.languages.python.detectors.dict_keys.shared as shared_mod
@@ -41,7 +42,7 @@ def test_python_security_prerequisites_and_detection_flow(monkeypatch, tmp_path)
     monkeypatch.setattr(
         py_security_mod,
         "detect_with_bandit",
-        lambda _root, _zone_map, *, exclude_dirs, skip_tests=None: SimpleNamespace(
+        lambda _root, _zone_map, *, exclude_dirs, skip_tests=None, targets=None: SimpleNamespace(
             entries=[{"file": "a.py", "line": 1}],
             files_scanned=3,
             status=_Status(),
@@ -55,6 +56,57 @@ def test_python_security_prerequisites_and_detection_flow(monkeypatch, tmp_path)
     assert result.coverage["status"] == "full"
 
 
+def test_python_security_potential_is_stable_across_incremental_rescans(
+    monkeypatch, tmp_path
+) -> None:
+    from desloppify.languages.python.detectors.bandit_adapter import (
+        BanditRunStatus,
+        BanditScanResult,
+    )
+
+    src = tmp_path / "src"
+    src.mkdir()
+    files = []
+    for index in range(5):
+        (src / f"m{index}.py").write_text(f"x = {index}\n")
+        files.append(str(src / f"m{index}.py"))
+
+    def _fake_bandit(root, _zone_map, *, targets=None, **_kwargs):
+        # Like bandit: explicit targets are scanned as given, a bare root recursively.
+        scanned = targets if targets is not None else sorted(root.rglob("*.py"))
+        return BanditScanResult(
+            entries=[], files_scanned=len(scanned), status=BanditRunStatus(state="ok")
+        )
+
+    monkeypatch.setattr(py_security_mod, "detect_with_bandit", _fake_bandit)
+    monkeypatch.setattr(py_security_mod, "collect_exclude_dirs", lambda _root: [])
+    monkeypatch.setattr(review_mod, "_log_phase_summary", lambda *_args, **_kwargs: None)
+    lang = SimpleNamespace(
+        zone_map=None,
+        file_finder=lambda _path: list(files),
+        name="python",
+        review_cache={},
+        detector_coverage={},
+        detect_lang_security_detailed=py_security_mod.detect_python_security,
+    )
+
+    def _scan() -> dict[str, int]:
+        return review_mod.phase_security(
+            tmp_path,
+            lang,
+            detect_security_issues=lambda targets, _zones, _name, **_kw: ([], 0),
+        )[1]
+
+    first = _scan()
+    (src / "m2.py").write_text("x = 'changed'\n")
+    second = _scan()
+    monkeypatch.setattr(py_security_mod, "_MAX_TARGET_CHARS", 0)
+    (src / "m3.py").write_text("x = 'changed'\n")
+    recursive = _scan()
+
+    assert first == second == recursive == {"security": 5}
+
+
 def test_dict_key_shared_helpers_cover_names_keys_and_distance() -> None:
     assert shared_mod._levenshtein("kitten", "sitting") == 3
     assert shared_mod._is_singular_plural("user", "users") is True
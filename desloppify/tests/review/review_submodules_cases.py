@@ -250,6 +250,7 @@ class TestBuildFileRequests:
             patch(
                 "desloppify.intelligence.review.prepare.read_file_text", return_value="line1\nline2"
             ),
+            patch("desloppify.intelligence.review.prepare.file_loc", return_value=2),
             patch("desloppify.intelligence.review.prepare.rel", return_value="src/a.ts"),
             patch("desloppify.intelligence.review.prepare.abs_path", side_effect=lambda x: x),
         ):
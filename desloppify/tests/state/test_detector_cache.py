@@ -0,0 +1,72 @@
+"""Tests for the on-disk detector cache store."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import desloppify.languages._framework.base.shared_phases_review as review_mod
+from desloppify.engine._state.detector_cache import (
+    DetectorCacheStore,
+    detector_cache_dir,
+)
+
+
+def test_cache_dir_is_paired_with_state_file(tmp_path):
+    state_file = tmp_path / ".desloppify" / "state-python.json"
+    assert detector_cache_dir(state_file) == tmp_path / ".desloppify" / "cache" / "state-python"
+
+
+def test_payloads_load_lazily_and_write_only_when_changed(tmp_path):
+    store = DetectorCacheStore(tmp_path / "cache")
+    store.get("dupes")["version"] = 2
+    store.get("security")
+
+    assert store.flush() == ["dupes"]
+    assert json.loads((tmp_path / "cache" / "dupes.json").read_text()) == {"version": 2}
+    assert not (tmp_path / "cache" / "security.json").exists()
+    assert store.flush() == []
+
+    reloaded = DetectorCacheStore(tmp_path / "cache")
+    assert reloaded.get("dupes") == {"version": 2}
+    assert reloaded.flush() == []
+    reloaded.get("dupes")["version"] = 3
+    assert reloaded.flush() == ["dupes"]
+
+
+def test_corrupt_payload_is_discarded(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / "dupes.json").write_text("{not json")
+
+    assert DetectorCacheStore(cache_dir).get("dupes") == {}
+
+
+def test_legacy_review_cache_payloads_move_to_store(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / "security.json").write_text('{"files": {}}')
+    review_cache = {
+        "files": {"a.py": {}},
+        "detectors": {"dupes": {"version": 1}, "security": {"files": {"stale": 1}}},
+    }
+    store = DetectorCacheStore(cache_dir)
+
+    assert store.adopt_legacy(review_cache) == 1
+    assert review_cache == {"files": {"a.py": {}}}
+    assert store.get("dupes") == {"version": 1}
+    assert store.get("security") == {"files": {}}
+    assert store.flush() == ["dupes"]
+
+
+def test_shared_phases_prefer_store_over_review_cache(tmp_path):
+    store = DetectorCacheStore(tmp_path / "cache")
+    lang = SimpleNamespace(detector_caches=store, review_cache={})
+
+    payload = review_mod._dupes_cache(lang)
+    payload["near_pairs"] = []
+
+    assert lang.review_cache == {}
+    assert store.flush() == ["dupes"]
+    assert Path(store.path_for("dupes")).exists()
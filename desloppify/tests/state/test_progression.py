@@ -11,6 +11,8 @@ import pytest
 
 from desloppify.engine._state.progression import (
     PROGRESSION_VERSION,
+    _index_path,
+    _iter_raw_lines_reversed,
     _queue_summary,
     _trim_if_needed,
     append_progression_event,
@@ -21,7 +23,9 @@ from desloppify.engine._state.progression import (
     build_scan_complete_event,
     build_scan_preflight_event,
     build_triage_complete_event,
+    iter_progression_reversed,
     last_plan_checkpoint_timestamp,
+    latest_progression_event,
     load_progression,
     maybe_append_entered_planning,
     maybe_append_execution_drain,
@@ -210,6 +214,64 @@ class TestTrim:
         _trim_if_needed(progression_file, max_lines=2000)
         assert len(load_progression(progression_file)) == 100
 
+    def test_trim_rotates_excess_into_segment(self, progression_file: Path) -> None:
+        lines = [
+            json.dumps({"event_type": "e", "n": i}) + "\n"
+            for i in range(10)
+        ]
+        progression_file.write_text("".join(lines))
+        _trim_if_needed(progression_file, max_lines=4)
+
+        segment = progression_file.with_name("progression.1.jsonl")
+        assert [json.loads(line)["n"] for line in segment.read_text().splitlines()] == [
+            0, 1, 2, 3, 4, 5,
+        ]
+        assert [e["n"] for e in load_progression(progression_file)] == [6, 7, 8, 9]
+        assert latest_progression_event("e", progression_file)["n"] == 9
+
+
+class TestReverseQueries:
+    def test_reverse_reader_spans_block_boundaries(self, progression_file: Path) -> None:
+        progression_file.write_bytes(b"alpha\nbeta\ngamma-delta\n")
+        lines = [
+            line
+            for line in _iter_raw_lines_reversed(progression_file, block_size=4)
+            if line
+        ]
+        assert lines == [b"gamma-delta", b"beta", b"alpha"]
+
+    def test_iter_reversed_skips_corrupt_lines(self, progression_file: Path) -> None:
+        progression_file.write_text(
+            '{"event_type":"a"}\nnot json\n{"event_type":"b"}\n'
+        )
+        assert [e["event_type"] for e in iter_progression_reversed(progression_file)] == [
+            "b",
+            "a",
+        ]
+
+    def test_append_maintains_sidecar_index(self, progression_file: Path) -> None:
+        append_progression_event({"event_type": "a", "n": 1}, path=progression_file)
+        append_progression_event({"event_type": "b", "n": 2}, path=progression_file)
+        append_progression_event({"event_type": "a", "n": 3}, path=progression_file)
+
+        index = json.loads(_index_path(progression_file).read_text())
+        assert index["size"] == progression_file.stat().st_size
+        assert set(index["last"]) == {"a", "b"}
+        assert latest_progression_event("a", progression_file)["n"] == 3
+        assert latest_progression_event("b", progression_file)["n"] == 2
+        assert latest_progression_event("missing", progression_file) is None
+
+    def test_stale_index_falls_back_to_reverse_scan(self, progression_file: Path) -> None:
+        append_progression_event({"event_type": "a", "n": 1}, path=progression_file)
+        with open(progression_file, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps({"event_type": "a", "n": 2}) + "\n")
+
+        assert latest_progression_event("a", progression_file)["n"] == 2
+        append_progression_event({"event_type": "b", "n": 3}, path=progression_file)
+        index = json.loads(_index_path(progression_file).read_text())
+        assert index["size"] == progression_file.stat().st_size
+        assert latest_progression_event("a", progression_file)["n"] == 2
+
 
 class TestBuilders:
     def test_scan_preflight(self) -> None:
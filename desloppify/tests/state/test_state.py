@@ -520,6 +520,12 @@ class TestUpsertIssues:
         assert existing["det::a.py::fn"]["status"] == "open"
         assert ignored == 1
 
+    def test_first_configured_ignore_pattern_is_recorded(self):
+        existing = {}
+        f = _make_raw_issue("det::src/a.py::fn", detector="det", file="src/a.py")
+        self._call(existing, [f], ignore=["other::*", "src", "*.py", "det::*"])
+        assert existing["det::src/a.py::fn"]["suppression_pattern"] == "src"
+
     # -- lang tagging --
 
     def test_lang_set_on_new_issue(self):
@@ -647,6 +653,46 @@ class TestMissingIssuesResolved:
         assert st["issues"]["det::a.py::fn"]["status"] == "auto_resolved"
         assert "no longer exists" in st["issues"]["det::a.py::fn"]["note"]
 
+    def test_existence_uses_scanned_files_then_one_listing_per_dir(self, tmp_path, monkeypatch):
+        """Scanned files skip the disk; others share one listing per directory."""
+        import desloppify.engine._state.merge_issues as merge_issues_mod
+
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "kept.py").write_text("# exists")
+        st = empty_state()
+        for name in ("scanned", "kept", "gone", "gone2"):
+            issue = _make_raw_issue(f"det::pkg/{name}.py::fn", detector="det", file=f"pkg/{name}.py")
+            issue["lang"] = "python"
+            st["issues"][issue["id"]] = issue
+        listed: list[str] = []
+        real_listdir = merge_issues_mod.os.listdir
+        monkeypatch.setattr(
+            merge_issues_mod.os,
+            "listdir",
+            lambda path: listed.append(path) or real_listdir(path),
+        )
+
+        diff = merge_scan(
+            st,
+            [],
+            MergeScanOptions(
+                lang="python",
+                force_resolve=True,
+                project_root=str(tmp_path),
+                scanned_files=["pkg/scanned.py"],
+            ),
+        )
+
+        statuses = {issue_id.split("/")[1]: issue["status"] for issue_id, issue in st["issues"].items()}
+        assert statuses == {
+            "scanned.py::fn": "open",
+            "kept.py::fn": "open",
+            "gone.py::fn": "auto_resolved",
+            "gone2.py::fn": "auto_resolved",
+        }
+        assert diff["auto_resolved"] == 2
+        assert len(listed) == 1
+
     def test_missing_fixed_issue_gets_scan_verified(self):
         """A manually fixed issue stays fixed and gains scan corroboration."""
         st = empty_state()
@@ -0,0 +1,140 @@
+"""Tests for archiving long-resolved issues behind tombstones."""
+
+from __future__ import annotations
+
+import json
+
+from desloppify.engine._scoring.state_integration import recompute_stats
+from desloppify.engine._state.compaction import (
+    archive_path,
+    compact_state,
+    restore_tombstones,
+)
+from desloppify.engine._state.merge import MergeScanOptions, merge_scan
+from desloppify.engine._state.schema import empty_state
+
+
+def _issue(issue_id: str, *, status: str, resolved_at: str | None, **extra) -> dict:
+    return {
+        "id": issue_id,
+        "detector": "smells",
+        "file": "src/a.py",
+        "tier": 2,
+        "confidence": "high",
+        "summary": f"issue {issue_id}",
+        "detail": {"line": 3},
+        "status": status,
+        "note": None,
+        "first_seen": "2026-01-01T00:00:00+00:00",
+        "last_seen": "2026-01-01T00:00:00+00:00",
+        "resolved_at": resolved_at,
+        "reopen_count": 1,
+        **extra,
+    }
+
+
+def _state_with_history(scans: int) -> dict:
+    state = empty_state()
+    state["potentials"] = {"python": {"smells": 50}}
+    state["scan_history"] = [
+        {"timestamp": f"2026-02-{day:02d}T00:00:00+00:00"} for day in range(1, scans + 1)
+    ]
+    state["work_items"].update(
+        {
+            "old_fixed": _issue("old_fixed", status="fixed", resolved_at="2026-01-15T00:00:00+00:00"),
+            "old_auto": _issue("old_auto", status="auto_resolved", resolved_at="2026-01-20T00:00:00+00:00"),
+            "recent_fixed": _issue("recent_fixed", status="fixed", resolved_at="2026-02-04T12:00:00+00:00"),
+            "open": _issue("open", status="open", resolved_at=None),
+            "old_wontfix": _issue("old_wontfix", status="wontfix", resolved_at="2026-01-10T00:00:00+00:00"),
+            "old_review": _issue(
+                "old_review",
+                status="fixed",
+                resolved_at="2026-01-10T00:00:00+00:00",
+                detector="review",
+            ),
+        }
+    )
+    return state
+
+
+def test_archive_path_is_paired_with_state_file(tmp_path):
+    state_file = tmp_path / ".desloppify" / "state-python.json"
+    assert archive_path(state_file) == tmp_path / ".desloppify" / "archive" / "state-python.jsonl"
+
+
+def test_compaction_archives_old_resolved_mechanical_issues(tmp_path):
+    state = _state_with_history(5)
+    archive = tmp_path / "archive" / "state.jsonl"
+
+    archived = compact_state(state, after_scans=3, archive_file=archive)
+
+    assert sorted(archived) == ["old_auto", "old_fixed"]
+    assert sorted(state["work_items"]) == ["old_review", "old_wontfix", "open", "recent_fixed"]
+    assert state["tombstones"]["old_fixed"] == {
+        "detector": "smells",
+        "file": "src/a.py",
+        "status": "fixed",
+        "tier": 2,
+        "confidence": "high",
+        "first_seen": "2026-01-01T00:00:00+00:00",
+        "resolved_at": "2026-01-15T00:00:00+00:00",
+        "reopen_count": 1,
+    }
+    records = [json.loads(line) for line in archive.read_text().splitlines()]
+    assert [record["id"] for record in records] == archived
+    assert records[0]["summary"].startswith("issue ")
+    assert "archived_at" in records[0]
+
+    assert compact_state(state, after_scans=3, archive_file=archive) == []
+    assert len(archive.read_text().splitlines()) == 2
+
+
+def test_compaction_needs_enough_scan_history(tmp_path):
+    state = _state_with_history(2)
+    assert compact_state(state, after_scans=3, archive_file=tmp_path / "a.jsonl") == []
+    assert compact_state(state, after_scans=0, archive_file=tmp_path / "a.jsonl") == []
+    assert not (tmp_path / "a.jsonl").exists()
+
+
+def test_scores_and_stats_unchanged_by_compaction(tmp_path):
+    state = _state_with_history(5)
+    recompute_stats(state)
+    before = (
+        dict(state["stats"]),
+        state["strict_score"],
+        state["verified_strict_score"],
+    )
+
+    compact_state(state, after_scans=3, archive_file=tmp_path / "a.jsonl")
+    recompute_stats(state)
+
+    assert (
+        dict(state["stats"]),
+        state["strict_score"],
+        state["verified_strict_score"],
+    ) == before
+
+
+def test_reappearing_archived_issue_reopens_with_history(tmp_path):
+    state = _state_with_history(5)
+    compact_state(state, after_scans=3, archive_file=tmp_path / "a.jsonl")
+    current = _issue("old_fixed", status="open", resolved_at=None)
+    current["first_seen"] = current["last_seen"] = "2026-03-01T00:00:00+00:00"
+
+    merge_scan(state, [current], MergeScanOptions(potentials={"smells": 50}))
+
+    reopened = state["work_items"]["old_fixed"]
+    assert "old_fixed" not in state["tombstones"]
+    assert reopened["status"] == "open"
+    assert reopened["reopen_count"] == 2
+    assert reopened["first_seen"] == "2026-01-01T00:00:00+00:00"
+    assert "was fixed" in reopened["note"]
+
+
+def test_restore_skips_ids_still_live():
+    state = empty_state()
+    state["tombstones"] = {"a": {"status": "fixed", "reopen_count": 4}}
+    state["work_items"]["a"] = _issue("a", status="open", resolved_at=None)
+
+    assert restore_tombstones(state, [{"id": "a"}, {"id": "b"}]) == 0
+    assert state["work_items"]["a"]["reopen_count"] == 1
@@ -0,0 +1,102 @@
+"""Tests for the secondary-index issue query layer."""
+
+from __future__ import annotations
+
+from desloppify.engine._state.query import IssueIndex, top_k
+from desloppify.engine._state.schema import empty_state
+from desloppify.engine._state.scope import path_scoped_issues
+from desloppify.engine._state.views import bump_revision
+from desloppify.engine._work_queue.helpers import scope_matches, status_matches
+
+
+def _issue(detector: str, file: str, name: str, **extra) -> tuple[str, dict]:
+    issue_id = f"{detector}::{file}::{name}"
+    issue = {
+        "id": issue_id,
+        "detector": detector,
+        "file": file,
+        "status": "open",
+        "tier": 2,
+        "zone": "production",
+        **extra,
+    }
+    return issue_id, issue
+
+
+def _issues() -> dict[str, dict]:
+    return dict(
+        [
+            _issue("smells", "src/a.py", "one"),
+            _issue("smells", "src/pkg/b.py", "two", status="fixed"),
+            _issue("unused", "src/a.py", "three", tier=1),
+            _issue("unused", "tests/test_a.py", "four", zone="test"),
+            _issue("structural", "srcx/c.py", "five"),
+            _issue("review", ".", "holistic::abcdef12"),
+        ]
+    )
+
+
+def _brute_force(issues, *, status, scope, scan_path):
+    scoped = path_scoped_issues(issues, scan_path)
+    return [
+        issue_id
+        for issue_id, issue in scoped.items()
+        if status_matches(issue.get("status", "open"), status)
+        and scope_matches({**issue, "kind": "issue"}, scope)
+    ]
+
+
+def test_select_matches_brute_force_filtering():
+    issues = _issues()
+    index = IssueIndex(issues)
+    scopes = [None, "smells", "src", "src/", "src/a.py", "unused::src", "*.py", "abcdef12"]
+    for status in ("open", "fixed", "all"):
+        for scope in scopes:
+            for scan_path in (None, ".", "src", "tests"):
+                candidates = index.select(status=status, scope=scope, scan_path=scan_path)
+                narrowed = [
+                    issue_id
+                    for issue_id, issue in candidates.items()
+                    if scope_matches({**issue, "kind": "issue"}, scope)
+                ]
+                assert narrowed == _brute_force(
+                    issues, status=status, scope=scope, scan_path=scan_path
+                ), (status, scope, scan_path)
+
+
+def test_select_by_zone_tier_and_detector():
+    index = IssueIndex(_issues())
+    assert list(index.select(zone="test")) == ["unused::tests/test_a.py::four"]
+    assert list(index.select(tier=1)) == ["unused::src/a.py::three"]
+    assert list(index.select(detector="smells", status="open")) == [
+        "smells::src/a.py::one"
+    ]
+    assert index.select(detector="missing") == {}
+
+
+def test_top_k_is_stable_and_matches_sorted_prefix():
+    items = [(3, "a"), (1, "b"), (2, "c"), (1, "d"), (5, "e")]
+    assert top_k(items, 3, key=lambda item: item[0]) == [(1, "b"), (1, "d"), (2, "c")]
+    assert top_k(items, None, key=lambda item: item[0]) == sorted(
+        items, key=lambda item: item[0]
+    )
+    assert top_k(items, 99, key=lambda item: item[0])[0] == (1, "b")
+
+
+def test_indexes_are_built_on_first_use():
+    index = IssueIndex(_issues())
+    index.select(status="open")
+    assert "by_status" in vars(index)
+    assert "_paths" not in vars(index)
+    assert "by_detector" not in vars(index)
+
+
+def test_index_is_shared_per_state_revision():
+    state = empty_state()
+    state["work_items"].update(_issues())
+    index = IssueIndex.for_state(state)
+
+    assert IssueIndex.for_state(state) is index
+    assert index.select(status="all") is state["work_items"]
+    bump_revision(state)
+    assert IssueIndex.for_state(state) is not index
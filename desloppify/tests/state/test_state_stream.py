@@ -0,0 +1,72 @@
+"""Tests for the streaming state writer."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import desloppify.engine._state.persistence as persistence_mod
+import desloppify.engine._state.schema as schema_mod
+from desloppify.base.discovery.file_paths import safe_write_chunks
+from desloppify.engine._state.schema import json_default
+from desloppify.engine._state.stream import STATE_FORMAT_ENV, iter_state_json
+
+
+def _legacy_dump(state: dict) -> str:
+    serialized = {key: value for key, value in state.items() if key != "issues"}
+    serialized["work_items"] = dict(state.get("work_items") or state.get("issues", {}))
+    return json.dumps(serialized, indent=2, default=json_default) + "\n"
+
+
+@pytest.mark.parametrize(
+    "state",
+    [
+        {},
+        {"version": 3, "work_items": {}},
+        {
+            "version": 3,
+            "issues": {"a::1": {"detail": {"lines": {3, 1}, "note": "x\ny"}, "path": Path("a")}},
+            "stats": {"open": 1, "nested": [[], {}]},
+        },
+        {"work_items": {"b": {"tags": []}, "c": {}}, "scan_path": "é/src"},
+    ],
+)
+def test_pretty_stream_matches_json_dumps(state):
+    assert "".join(iter_state_json(state)) == _legacy_dump(state)
+
+
+def test_compact_stream_round_trips():
+    state = {"version": 3, "work_items": {"a": {"x": [1, 2]}}, "stats": {}}
+
+    text = "".join(iter_state_json(state, pretty=False))
+
+    assert "\n" not in text.rstrip("\n")
+    assert json.loads(text) == json.loads(_legacy_dump(state))
+
+
+def test_failed_stream_keeps_previous_file(tmp_path):
+    target = tmp_path / "state.json"
+    target.write_text("previous")
+
+    def _chunks():
+        yield "{"
+        raise TypeError("not serializable")
+
+    with pytest.raises(TypeError):
+        safe_write_chunks(target, _chunks())
+
+    assert target.read_text() == "previous"
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_save_state_compact_mode_from_env(monkeypatch, tmp_path):
+    state_file = tmp_path / "state.json"
+    monkeypatch.setenv(STATE_FORMAT_ENV, "compact")
+
+    persistence_mod.save_state(schema_mod.empty_state(), state_file)
+
+    text = state_file.read_text()
+    assert text.count("\n") == 1
+    assert persistence_mod.load_state(state_file)["version"] == schema_mod.CURRENT_VERSION
@@ -0,0 +1,69 @@
+"""Tests for revision-stamped derived state views."""
+
+from __future__ import annotations
+
+from desloppify.engine._concerns.state import _group_by_file
+from desloppify.engine._state.resolution import resolve_issues
+from desloppify.engine._state.schema import empty_state
+from desloppify.engine._state.views import (
+    bump_revision,
+    open_issues,
+    open_issues_by_file,
+    scoped_issues,
+    state_revision,
+)
+
+
+def _state() -> dict:
+    state = empty_state()
+    for issue_id, file, status in (
+        ("smells::src/a.py::x", "src/a.py", "open"),
+        ("smells::src/b.py::y", "src/b.py", "open"),
+        ("unused::lib/c.py::z", "lib/c.py", "fixed"),
+        ("review::.::holistic", ".", "open"),
+    ):
+        state["work_items"][issue_id] = {
+            "id": issue_id,
+            "detector": issue_id.split("::", 1)[0],
+            "file": file,
+            "status": status,
+        }
+    return state
+
+
+def test_views_are_shared_until_the_revision_changes():
+    state = _state()
+    by_file = open_issues_by_file(state)
+
+    assert sorted(by_file) == ["src/a.py", "src/b.py"]
+    assert _group_by_file(state) is by_file
+    assert len(open_issues(state)) == 3
+    assert list(scoped_issues(state, "src")) == [
+        "smells::src/a.py::x",
+        "smells::src/b.py::y",
+        "review::.::holistic",
+    ]
+
+    before = state_revision(state)
+    state["work_items"]["smells::src/a.py::x"]["status"] = "fixed"
+    assert bump_revision(state) == before + 1
+    assert sorted(open_issues_by_file(state)) == ["src/b.py"]
+
+
+def test_mutators_bump_and_issue_map_changes_invalidate():
+    state = _state()
+    assert len(open_issues(state)) == 3
+
+    before = state_revision(state)
+    resolve_issues(state, "smells::src/b.py::y", "fixed", note="done", attestation="x")
+    assert state_revision(state) > before
+    assert len(open_issues(state)) == 2
+
+    # Adding an issue without bumping still invalidates via the map size.
+    state["work_items"]["smells::src/d.py::w"] = {
+        "id": "smells::src/d.py::w",
+        "detector": "smells",
+        "file": "src/d.py",
+        "status": "open",
+    }
+    assert "src/d.py" in open_issues_by_file(state)
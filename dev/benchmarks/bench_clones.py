@@ -0,0 +1,89 @@
+"""Benchmark native clone detection against jscpd on a shared fixture corpus.
+
+Replicates ``desloppify/tests/fixtures/clones`` into a temporary tree and
+times :func:`detect_clones` (cold and with a warm fingerprint cache) next to
+:func:`detect_with_jscpd` when ``npx`` is available.
+
+Usage::
+
+    python dev/benchmarks/bench_clones.py --copies 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from desloppify.engine.detectors.clones import detect_clones
+from desloppify.engine.detectors.jscpd_adapter import detect_with_jscpd
+
+FIXTURES = (
+    Path(__file__).resolve().parents[2] / "desloppify" / "tests" / "fixtures" / "clones"
+)
+
+
+def _build_corpus(root: Path, copies: int) -> list[str]:
+    files: list[str] = []
+    for index in range(copies):
+        target = root / f"pkg_{index:04d}"
+        shutil.copytree(FIXTURES, target)
+        files.extend(str(p) for p in sorted(target.glob("*.py")))
+    return files
+
+
+def _timed(label: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    clusters = "n/a" if result is None else len(result)
+    print(f"{label:<24} {elapsed * 1000:10.1f} ms  clusters={clusters}")
+    return result
+
+
+def _cluster_files(entries: list[dict] | None, root: Path) -> set[frozenset[str]]:
+    clusters: set[frozenset[str]] = set()
+    for entry in entries or []:
+        clusters.add(
+            frozenset(
+                str(Path(loc["file"]).resolve().relative_to(root.resolve()))
+                for loc in entry["locations"]
+            )
+        )
+    return clusters
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=100)
+    parser.add_argument("--skip-jscpd", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        files = _build_corpus(root, args.copies)
+        print(f"corpus: {len(files)} files in {args.copies} copies")
+
+        cache: dict[str, object] = {}
+        native = _timed("native (cold)", lambda: detect_clones(root, files, cache=cache))
+        _timed("native (warm cache)", lambda: detect_clones(root, files, cache=cache))
+        if args.skip_jscpd:
+            return
+        jscpd = _timed("jscpd", lambda: detect_with_jscpd(root))
+        if jscpd is None:
+            print("jscpd unavailable; skipped comparison")
+            return
+        native_clusters = _cluster_files(native, root)
+        jscpd_clusters = _cluster_files(jscpd, root)
+        shared = len(native_clusters & jscpd_clusters)
+        print(
+            f"cluster overlap: {shared} shared, "
+            f"{len(native_clusters - jscpd_clusters)} native-only, "
+            f"{len(jscpd_clusters - native_clusters)} jscpd-only"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark combined multi-pattern scanning for line-based rule catalogs.
+
+For each catalog (Python smells, TypeScript smells, generic security rule
+prefilters) this scans every line of a source corpus twice: once with one
+``re.search`` per rule per line (the previous behaviour) and once with
+:class:`MultiPatternScanner` and its literal-anchor prefilter.  It reports
+regex passes and wall time for both.
+
+Usage::
+
+    python dev/benchmarks/bench_line_rules.py [corpus_dir]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+from desloppify.engine.detectors.patterns.multi import MultiPatternScanner
+from desloppify.engine.detectors.security.scanner import (
+    _LINE_SCANNER as SECURITY_SCANNER,
+)
+from desloppify.languages.python.detectors.smells import SMELL_CHECKS
+from desloppify.languages.typescript.detectors.smells import TS_SMELL_CHECKS
+
+_SUFFIXES = (".py", ".ts", ".tsx", ".js", ".jsx")
+
+
+def _corpus_files(root: Path) -> list[list[str]]:
+    return [
+        path.read_text(errors="replace").splitlines()
+        for path in sorted(root.rglob("*"))
+        if path.suffix in _SUFFIXES and path.is_file()
+    ]
+
+
+def _catalog_rules(checks: list[dict]) -> list[tuple[str, str]]:
+    return [(c["id"], c["pattern"]) for c in checks if c["pattern"] is not None]
+
+
+def _bench(
+    name: str,
+    rules: list[tuple[object, re.Pattern[str] | str]],
+    files: list[list[str]],
+) -> None:
+    compiled = [(key, re.compile(pattern)) for key, pattern in rules]
+    start = time.perf_counter()
+    naive_hits = sum(
+        1
+        for lines in files
+        for line in lines
+        for _key, pattern in compiled
+        if pattern.search(line)
+    )
+    naive_seconds = time.perf_counter() - start
+
+    scanner = MultiPatternScanner(compiled)
+    start = time.perf_counter()
+    combined_hits = sum(sum(1 for _ in scanner.scan_lines(lines)) for lines in files)
+    combined_seconds = time.perf_counter() - start
+
+    stats = scanner.stats
+    assert naive_hits == combined_hits, (name, naive_hits, combined_hits)
+    print(
+        f"{name:<14} rules={len(compiled):>3} "
+        f"passes {stats.naive_searches:>9} -> {stats.searches:>8} "
+        f"({stats.passes_saved / max(stats.naive_searches, 1):6.1%} saved)  "
+        f"{naive_seconds * 1000:8.1f} ms -> {combined_seconds * 1000:8.1f} ms  "
+        f"hits={combined_hits}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "corpus",
+        nargs="?",
+        type=Path,
+        default=Path(__file__).resolve().parents[2] / "desloppify",
+    )
+    args = parser.parse_args()
+
+    files = _corpus_files(args.corpus)
+    total_lines = sum(len(lines) for lines in files)
+    print(f"corpus: {len(files)} files, {total_lines} lines from {args.corpus}")
+    _bench("python smells", _catalog_rules(SMELL_CHECKS), files)
+    _bench("ts smells", _catalog_rules(TS_SMELL_CHECKS), files)
+    _bench("security", SECURITY_SCANNER.rules, files)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark state saves for large synthetic states.
+
+Builds a state with ``--issues`` work items and saves it three ways, each in
+a fresh subprocess so peak RSS is not shared between runs: the previous
+single ``json.dumps(indent=2)`` string, the streaming writer in pretty mode,
+and the streaming writer in compact mode.  It reports wall time, peak RSS
+growth during the save, and the resulting file size.
+
+Usage::
+
+    python dev/benchmarks/bench_state_save.py [--issues N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic_repo import synthetic_state
+
+from desloppify.base.discovery.file_paths import safe_write_chunks, safe_write_text
+from desloppify.engine._state.schema import json_default
+from desloppify.engine._state.stream import iter_state_json
+
+_MODES = ("legacy", "stream-pretty", "stream-compact")
+
+
+def _peak_rss_kib() -> int:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _run_mode(mode: str, issue_count: int, target: Path) -> dict:
+    state = synthetic_state(issue_count)
+    before = _peak_rss_kib()
+    start = time.perf_counter()
+    if mode == "legacy":
+        serialized = {key: value for key, value in state.items() if key != "issues"}
+        safe_write_text(target, json.dumps(serialized, indent=2, default=json_default) + "\n")
+    else:
+        safe_write_chunks(target, iter_state_json(state, pretty=mode == "stream-pretty"))
+    seconds = time.perf_counter() - start
+    return {
+        "seconds": seconds,
+        "rss_growth_kib": _peak_rss_kib() - before,
+        "bytes": target.stat().st_size,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=200_000)
+    parser.add_argument("--mode", choices=_MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(tmp) / "state.json"
+        if args.mode:
+            print(json.dumps(_run_mode(args.mode, args.issues, target)))
+            return
+        print(f"state: {args.issues} work items")
+        for mode in _MODES:
+            output = subprocess.run(
+                [sys.executable, __file__, "--issues", str(args.issues), "--mode", mode],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = json.loads(output)
+            print(
+                f"{mode:<15} {result['seconds'] * 1000:9.1f} ms  "
+                f"peak RSS +{result['rss_growth_kib'] / 1024:7.1f} MiB  "
+                f"{result['bytes'] / (1024 * 1024):7.1f} MiB on disk"
+            )
+
+
+if __name__ == "__main__":
+    main()
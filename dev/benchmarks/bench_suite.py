@@ -0,0 +1,290 @@
+"""Time desloppify's key entry points on a synthetic repository.
+
+Generates a multi-language tree plus a large synthetic state and plan (see
+``synthetic_repo.py``), then times every scan phase per language,
+``detect_duplicates``, ``recompute_stats``, ``build_queue_snapshot`` and
+``save_state``/``load_state``.  Each benchmark runs ``--repeat`` times; the
+JSON report keeps every run plus the median and minimum, along with the
+parameters, desloppify version and git commit, so reports from different
+versions can be compared with ``--compare``.
+
+This is separate from the unit tests and is never collected by pytest.
+
+Usage::
+
+    python dev/benchmarks/bench_suite.py [--files N] [--issues N] [--repeat N]
+        [--only scan,state] [--skip-phase tsc] [--output report.json]
+        [--compare baseline.json]
+
+Phases that shell out to external tools (ruff, tsc, bandit, ...) time the
+tool as installed on the machine; skip them with ``--skip-phase`` when
+comparing across environments.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import copy
+import io
+import json
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from importlib import metadata
+from pathlib import Path
+
+from synthetic_repo import RepoSpec, generate_repo, synthetic_plan, synthetic_state
+
+from desloppify.base.discovery.source import disable_file_cache, enable_file_cache
+from desloppify.base.profiling import ScanProfiler
+from desloppify.base.runtime_state import make_runtime_context, runtime_scope
+from desloppify.engine._scoring.state_integration import recompute_stats
+from desloppify.engine._state.persistence import load_state, save_state
+from desloppify.engine._work_queue.snapshot import build_queue_snapshot
+from desloppify.engine.detectors.dupes import detect_duplicates
+from desloppify.engine.planning.scan import PlanScanOptions, generate_issues
+from desloppify.languages.framework import (
+    disable_parse_cache,
+    enable_parse_cache,
+    get_lang,
+)
+
+REPORT_SCHEMA = 1
+
+
+@dataclass
+class BenchContext:
+    root: Path
+    spec: RepoSpec
+    state: dict
+    plan: dict
+    state_file: Path
+    skip_phases: tuple[str, ...] = ()
+
+
+def _slug(label: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", label.lower()).strip("_")
+
+
+def _timed(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _lang_config(language: str, skip_phases: tuple[str, ...]):
+    config = get_lang(language)
+    if not skip_phases:
+        return config
+    trimmed = copy.copy(config)
+    trimmed.phases = [
+        phase
+        for phase in config.phases
+        if not any(skip.lower() in phase.label.lower() for skip in skip_phases)
+    ]
+    return trimmed
+
+
+def bench_scan(ctx: BenchContext) -> dict[str, float]:
+    """Full issue generation per language, plus each detector phase."""
+    results: dict[str, float] = {}
+    for language in ctx.spec.languages:
+        config = _lang_config(language, ctx.skip_phases)
+        runtime = make_runtime_context()
+        runtime.project_root = ctx.root
+        profiler = ScanProfiler(runtime=runtime)
+        runtime.profiler = profiler
+        with runtime_scope(runtime), contextlib.redirect_stderr(io.StringIO()):
+            enable_file_cache()
+            enable_parse_cache()
+            try:
+                results[f"scan.{language}"] = _timed(
+                    lambda config=config: generate_issues(
+                        ctx.root,
+                        lang=config,
+                        options=PlanScanOptions(include_slow=True),
+                    )
+                )
+            finally:
+                disable_parse_cache()
+                disable_file_cache()
+        for span in profiler.spans:
+            if span.category == "phase":
+                results[f"scan.{language}.{_slug(span.name)}"] = span.wall_seconds
+    return results
+
+
+def bench_dupes(ctx: BenchContext) -> dict[str, float]:
+    """``detect_duplicates`` over the Python functions (extraction not timed)."""
+    runtime = make_runtime_context()
+    runtime.project_root = ctx.root
+    with runtime_scope(runtime):
+        functions = get_lang("python").extract_functions(ctx.root / "src")
+    return {"detect_duplicates": _timed(lambda: detect_duplicates(functions))}
+
+
+def bench_state(ctx: BenchContext) -> dict[str, float]:
+    """Scoring, queue building and state persistence on the synthetic state."""
+    return {
+        "recompute_stats": _timed(lambda: recompute_stats(ctx.state)),
+        "build_queue_snapshot": _timed(
+            lambda: build_queue_snapshot(ctx.state, plan=ctx.plan)
+        ),
+        "save_state": _timed(lambda: save_state(ctx.state, ctx.state_file)),
+        "load_state": _timed(lambda: load_state(ctx.state_file)),
+    }
+
+
+BENCHMARKS: dict[str, Callable[[BenchContext], dict[str, float]]] = {
+    "scan": bench_scan,
+    "dupes": bench_dupes,
+    "state": bench_state,
+}
+
+
+def _version() -> str:
+    try:
+        return metadata.version("desloppify")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() or None
+
+
+def run_suite(
+    spec: RepoSpec,
+    *,
+    issues: int,
+    repeat: int,
+    only: set[str] | None = None,
+    skip_phases: tuple[str, ...] = (),
+) -> dict[str, object]:
+    """Generate the fixtures, run the selected benchmarks and return a report."""
+    runs: dict[str, list[float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "repo"
+        generate_repo(root, spec)
+        state = synthetic_state(issues, seed=spec.seed)
+        ctx = BenchContext(
+            root=root,
+            spec=spec,
+            state=state,
+            plan=synthetic_plan(state),
+            state_file=Path(tmp) / "state" / "state-python.json",
+            skip_phases=skip_phases,
+        )
+        ctx.state_file.parent.mkdir()
+        for name, bench in BENCHMARKS.items():
+            if only and name not in only:
+                continue
+            for _ in range(repeat):
+                for metric, seconds in bench(ctx).items():
+                    runs.setdefault(metric, []).append(seconds)
+    return {
+        "schema": REPORT_SCHEMA,
+        "desloppify_version": _version(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            **spec.as_dict(),
+            "issues": issues,
+            "repeat": repeat,
+            "skip_phases": list(skip_phases),
+        },
+        "results": {
+            metric: {
+                "median_s": statistics.median(values),
+                "min_s": min(values),
+                "runs": values,
+            }
+            for metric, values in runs.items()
+        },
+    }
+
+
+def _print_report(report: dict, baseline: dict | None) -> None:
+    base_results = (baseline or {}).get("results", {})
+    header = f"{'benchmark':<52} {'median ms':>10} {'min ms':>10}"
+    if baseline:
+        header += f" {'baseline ms':>12} {'change':>8}"
+    print(header)
+    for metric, values in report["results"].items():
+        line = f"{metric:<52} {values['median_s'] * 1000:10.1f} {values['min_s'] * 1000:10.1f}"
+        if baseline:
+            previous = base_results.get(metric, {}).get("median_s")
+            if previous:
+                change = (values["median_s"] - previous) / previous * 100
+                line += f" {previous * 1000:12.1f} {change:+7.1f}%"
+            else:
+                line += f" {'-':>12} {'new':>8}"
+        print(line)
+    if baseline and baseline.get("params") != report["params"]:
+        print("note: baseline was produced with different parameters", file=sys.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=RepoSpec.files, help="files per language")
+    parser.add_argument("--functions", type=int, default=RepoSpec.functions, help="functions per file")
+    parser.add_argument("--duplicate-ratio", type=float, default=RepoSpec.duplicate_ratio)
+    parser.add_argument("--fanout", type=int, default=RepoSpec.fanout, help="imports per file")
+    parser.add_argument("--langs", default=",".join(RepoSpec.languages))
+    parser.add_argument("--issues", type=int, default=20_000, help="work items in the synthetic state")
+    parser.add_argument("--seed", type=int, default=RepoSpec.seed)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", default="", help=f"comma-separated subset of: {', '.join(BENCHMARKS)}")
+    parser.add_argument(
+        "--skip-phase",
+        action="append",
+        default=[],
+        metavar="LABEL",
+        help="skip scan phases whose label contains LABEL (repeatable), e.g. tsc",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="write the JSON report here")
+    parser.add_argument("--compare", type=Path, default=None, help="baseline JSON report")
+    args = parser.parse_args()
+
+    spec = RepoSpec(
+        files=args.files,
+        functions=args.functions,
+        duplicate_ratio=args.duplicate_ratio,
+        fanout=args.fanout,
+        languages=tuple(lang for lang in args.langs.split(",") if lang),
+        seed=args.seed,
+    )
+    only = {name for name in args.only.split(",") if name} or None
+    report = run_suite(
+        spec,
+        issues=args.issues,
+        repeat=max(args.repeat, 1),
+        only=only,
+        skip_phases=tuple(args.skip_phase),
+    )
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    _print_report(report, baseline)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""Deterministic synthetic repositories, states and plans for benchmarks.
+
+Shared by the scripts in this directory.  Everything is generated from a
+seeded ``random.Random`` so two runs with the same parameters produce the
+same tree and the same state, and timings can be compared across versions.
+
+Usage (standalone, to inspect a generated tree)::
+
+    python dev/benchmarks/synthetic_repo.py OUT_DIR [--files N] [--langs python,typescript]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from desloppify.engine._plan.schema import empty_plan
+from desloppify.engine._state.schema import empty_state
+
+_PACKAGE_SIZE = 20
+_DETECTORS = ("smells", "structural", "unused", "dupes", "coupling", "naming")
+_STATUSES = ("open",) * 6 + ("fixed", "wontfix", "auto_resolved", "false_positive")
+
+
+@dataclass(frozen=True)
+class RepoSpec:
+    """Shape of a generated repository."""
+
+    files: int = 200
+    functions: int = 8
+    duplicate_ratio: float = 0.1
+    fanout: int = 4
+    languages: tuple[str, ...] = ("python", "typescript")
+    seed: int = 0
+
+    def as_dict(self) -> dict[str, object]:
+        data = asdict(self)
+        data["languages"] = list(self.languages)
+        return data
+
+
+def _python_body(rng: random.Random, name: str) -> list[str]:
+    threshold, step, scale = rng.randint(2, 9), rng.randint(1, 5), rng.randint(2, 7)
+    return [
+        f"def {name}(items, limit={threshold}):",
+        f'    """Synthetic function {name}."""',
+        "    total = 0",
+        "    for index, item in enumerate(items):",
+        f"        if index % {step + 1} == 0:",
+        f"            total += item * {scale}",
+        "        elif item > limit:",
+        "            total -= limit",
+        "        else:",
+        "            total += index",
+        "    return total",
+        "",
+    ]
+
+
+def _typescript_body(rng: random.Random, name: str) -> list[str]:
+    threshold, step, scale = rng.randint(2, 9), rng.randint(1, 5), rng.randint(2, 7)
+    return [
+        f"export function {name}(items: number[], limit = {threshold}): number {{",
+        "  let total = 0;",
+        "  items.forEach((item, index) => {",
+        f"    if (index % {step + 1} === 0) {{",
+        f"      total += item * {scale};",
+        "    } else if (item > limit) {",
+        "      total -= limit;",
+        "    } else {",
+        "      total += index;",
+        "    }",
+        "  });",
+        "  return total;",
+        "}",
+        "",
+    ]
+
+
+def _module_lines(
+    language: str,
+    index: int,
+    spec: RepoSpec,
+    rng: random.Random,
+    templates: list[int],
+) -> list[str]:
+    body = _python_body if language == "python" else _typescript_body
+    targets = sorted({rng.randrange(spec.files) for _ in range(spec.fanout)} - {index})
+    if language == "python":
+        lines = [f'"""Synthetic module {index}."""', ""]
+        lines += [
+            f"from src.pkg_{target // _PACKAGE_SIZE} import mod_{target}" for target in targets
+        ]
+    else:
+        lines = [
+            f'import {{ fn_{target}_0 }} from "../pkg_{target // _PACKAGE_SIZE}/mod_{target}";'
+            for target in targets
+        ]
+    lines.append("")
+    for position in range(spec.functions):
+        name = f"fn_{index}_{position}"
+        if templates and rng.random() < spec.duplicate_ratio:
+            # Same seed as a shared template: a renamed copy of its body.
+            template_rng = random.Random(rng.choice(templates))
+            lines += body(template_rng, name)
+        else:
+            lines += body(rng, name)
+    return lines
+
+
+def generate_repo(root: Path, spec: RepoSpec) -> dict[str, int]:
+    """Write a synthetic multi-language tree under *root*; returns files per language."""
+    written: dict[str, int] = {}
+    for language in spec.languages:
+        rng = random.Random(f"{spec.seed}:{language}")
+        templates = [rng.randrange(1 << 30) for _ in range(8)]
+        base = root / ("src" if language == "python" else "web/src")
+        suffix = ".py" if language == "python" else ".ts"
+        for index in range(spec.files):
+            package = base / f"pkg_{index // _PACKAGE_SIZE}"
+            package.mkdir(parents=True, exist_ok=True)
+            if language == "python":
+                (package / "__init__.py").touch()
+            lines = _module_lines(language, index, spec, rng, templates)
+            (package / f"mod_{index}{suffix}").write_text("\n".join(lines), encoding="utf-8")
+        written[language] = spec.files
+    if "python" in spec.languages:
+        (root / "src" / "__init__.py").touch()
+    if "typescript" in spec.languages:
+        (root / "web" / "package.json").write_text('{"name": "synthetic"}\n', encoding="utf-8")
+    return written
+
+
+def synthetic_state(issue_count: int, *, scans: int = 20, seed: int = 0) -> dict:
+    """Return a state with *issue_count* work items across detectors and statuses."""
+    rng = random.Random(f"{seed}:state")
+    state = empty_state()
+    state["lang"] = "python"
+    state["scan_path"] = "."
+    state["scan_history"] = [
+        {"timestamp": f"2026-01-{day % 28 + 1:02d}T00:00:00+00:00", "strict_score": 80.0}
+        for day in range(scans)
+    ]
+    state["potentials"] = {
+        "python": {detector: max(issue_count, 1) for detector in _DETECTORS}
+    }
+    work_items = state["work_items"]
+    for index in range(issue_count):
+        detector = _DETECTORS[index % len(_DETECTORS)]
+        path = f"src/pkg_{index % 97}/mod_{index % 1013}.py"
+        issue_id = f"{detector}::{path}::rule_{index}"
+        status = rng.choice(_STATUSES)
+        work_items[issue_id] = {
+            "id": issue_id,
+            "detector": detector,
+            "file": path,
+            "tier": 1 + index % 4,
+            "confidence": ("high", "medium", "low")[index % 3],
+            "summary": f"Synthetic issue {index} in {path}",
+            "detail": {"line": index % 400, "lines": list(range(index % 7)), "snippet": "x = 1" * 8},
+            "status": status,
+            "note": None,
+            "first_seen": "2026-01-01T00:00:00+00:00",
+            "last_seen": "2026-01-02T00:00:00+00:00",
+            "resolved_at": None if status == "open" else "2026-01-02T00:00:00+00:00",
+            "reopen_count": index % 3,
+        }
+    return state
+
+
+def synthetic_plan(state: dict, *, queued: int = 500, clusters: int = 10) -> dict:
+    """Return a plan that queues and clusters the first open issues of *state*."""
+    plan = empty_plan()
+    open_ids = [
+        issue_id
+        for issue_id, issue in state["work_items"].items()
+        if issue.get("status") == "open"
+    ][:queued]
+    plan["queue_order"] = list(open_ids)
+    per_cluster = max(1, len(open_ids) // max(clusters, 1))
+    for number in range(clusters):
+        members = open_ids[number * per_cluster : (number + 1) * per_cluster]
+        if not members:
+            break
+        plan["clusters"][f"cluster-{number}"] = {
+            "name": f"cluster-{number}",
+            "description": f"Synthetic cluster {number}",
+            "issue_ids": members,
+            "auto": False,
+        }
+    return plan
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out_dir", type=Path)
+    parser.add_argument("--files", type=int, default=RepoSpec.files)
+    parser.add_argument("--functions", type=int, default=RepoSpec.functions)
+    parser.add_argument("--duplicate-ratio", type=float, default=RepoSpec.duplicate_ratio)
+    parser.add_argument("--fanout", type=int, default=RepoSpec.fanout)
+    parser.add_argument("--langs", default=",".join(RepoSpec.languages))
+    parser.add_argument("--seed", type=int, default=RepoSpec.seed)
+    args = parser.parse_args()
+    spec = RepoSpec(
+        files=args.files,
+        functions=args.functions,
+        duplicate_ratio=args.duplicate_ratio,
+        fanout=args.fanout,
+        languages=tuple(lang for lang in args.langs.split(",") if lang),
+        seed=args.seed,
+    )
+    written = generate_repo(args.out_dir, spec)
+    print(", ".join(f"{lang}: {count} files" for lang, count in written.items()))
+
+
+if __name__ == "__main__":
+    main()